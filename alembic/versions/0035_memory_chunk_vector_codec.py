@@ -0,0 +1,90 @@
+"""binary vector codec for memory_chunk embeddings
+
+Revision ID: 0035_memory_chunk_vector_codec
+Revises: 1c91f2192fb6
+Create Date: 2026-10-16
+
+Switches memory_chunk.embedding from UTF-8 JSON text to the versioned binary
+codec in backend/search/vector_codec.py (header byte + little-endian float32,
+float16 or int8 payload), roughly 3x smaller and decoded zero-copy.
+
+Changes:
+- Add vec_codec column (header byte of each row; NULL = legacy JSON)
+- Rewrite existing JSON rows in batches (skip with SKIP_VECTOR_CODEC_BACKFILL=1)
+
+Readers accept both formats, so the backfill can also run online after the
+migration with scripts/backfill_vector_codec.py, which commits per batch and
+resumes where it stopped.
+"""
+
+import json
+import logging
+import os
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.search import vector_codec
+
+logger = logging.getLogger("alembic.0035_memory_chunk_vector_codec")
+
+revision = "0035_memory_chunk_vector_codec"
+down_revision = "1c91f2192fb6"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = int(os.getenv("VECTOR_CODEC_BATCH_SIZE", "1000"))
+
+
+def upgrade():
+    op.add_column("memory_chunk", sa.Column("vec_codec", sa.SmallInteger()))
+
+    # For very large tables, skip the in-migration rewrite and run
+    # scripts/backfill_vector_codec.py afterwards (resumable, per-batch commits).
+    if os.getenv("SKIP_VECTOR_CODEC_BACKFILL", "0") == "1":
+        logger.info(
+            "[alembic/0035] Skipping embedding backfill due to SKIP_VECTOR_CODEC_BACKFILL=1. "
+            "Run scripts/backfill_vector_codec.py to convert existing rows."
+        )
+        return
+
+    codec = vector_codec.codec_id(os.getenv("EMBEDDING_STORAGE_FORMAT", "float32"))
+    rewritten = vector_codec.backfill_vector_codec(
+        op.get_bind(), codec=codec, batch_size=BATCH_SIZE
+    )
+    logger.info(f"[alembic/0035] Rewrote {rewritten} memory_chunk embeddings")
+
+
+def downgrade():
+    # Convert binary rows back to JSON so the previous code can read them
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                """
+                SELECT id, embedding FROM memory_chunk
+                WHERE vec_codec IS NOT NULL AND id > :last
+                ORDER BY id
+                LIMIT :lim
+                """
+            ),
+            {"last": last_id, "lim": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            sa.text("UPDATE memory_chunk SET embedding=:emb WHERE id=:id"),
+            [
+                {
+                    "id": chunk_id,
+                    "emb": json.dumps(vector_codec.decode(embedding).tolist()).encode(
+                        "utf-8"
+                    ),
+                }
+                for chunk_id, embedding in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+    op.drop_column("memory_chunk", "vec_codec")
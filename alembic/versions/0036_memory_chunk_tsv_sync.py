@@ -0,0 +1,101 @@
+"""keep memory_chunk.text_tsv in sync with text
+
+Revision ID: 0036_memory_chunk_tsv_sync
+Revises: 0035_memory_chunk_vector_codec
+Create Date: 2026-10-16
+
+Migration 0012 added the precomputed text_tsv column and its GIN index, but
+nothing populated it for rows inserted afterwards, so keyword search had to
+run to_tsvector over every chunk per query. This adds a trigger that sets
+text_tsv whenever a chunk is inserted or its text changes, so
+backends._ts_rank_score can match and rank on the stored column.
+
+Changes (PostgreSQL only):
+- Ensure the text_tsv column and idx_memory_chunk_tsv GIN index exist
+- Add trigger memory_chunk_tsv_sync (BEFORE INSERT OR UPDATE OF text)
+- Backfill rows with NULL text_tsv in batches (skip with SKIP_TSVECTOR_UPDATE=1)
+"""
+
+import logging
+import os
+
+import sqlalchemy as sa
+from alembic import op
+
+logger = logging.getLogger("alembic.0036_memory_chunk_tsv_sync")
+
+revision = "0036_memory_chunk_tsv_sync"
+down_revision = "0035_memory_chunk_vector_codec"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = int(os.getenv("TSVECTOR_BATCH_SIZE", "1000"))
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # Other databases use the in-process BM25 index (backend/search/bm25_index.py)
+        logger.info(f"[alembic/0036] Skipping tsvector trigger for {bind.dialect.name}")
+        return
+
+    op.execute("ALTER TABLE memory_chunk ADD COLUMN IF NOT EXISTS text_tsv tsvector;")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memory_chunk_tsv "
+        "ON memory_chunk USING GIN (text_tsv);"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION memory_chunk_tsv_sync() RETURNS trigger AS $$
+        BEGIN
+            NEW.text_tsv := to_tsvector('english', coalesce(NEW.text, ''));
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS memory_chunk_tsv_sync ON memory_chunk;")
+    op.execute(
+        """
+        CREATE TRIGGER memory_chunk_tsv_sync
+        BEFORE INSERT OR UPDATE OF text ON memory_chunk
+        FOR EACH ROW EXECUTE FUNCTION memory_chunk_tsv_sync();
+        """
+    )
+
+    if os.getenv("SKIP_TSVECTOR_UPDATE", "0") == "1":
+        logger.info(
+            "[alembic/0036] Skipping text_tsv backfill due to SKIP_TSVECTOR_UPDATE=1. "
+            "Rows with NULL text_tsv are not matched by keyword search until backfilled."
+        )
+        return
+
+    updated = 0
+    while True:
+        result = bind.execute(
+            sa.text(
+                """
+                WITH cte AS (
+                    SELECT ctid FROM memory_chunk
+                    WHERE text_tsv IS NULL
+                    LIMIT :batch_size
+                )
+                UPDATE memory_chunk
+                SET text_tsv = to_tsvector('english', coalesce(text, ''))
+                FROM cte
+                WHERE memory_chunk.ctid = cte.ctid
+                """
+            ),
+            {"batch_size": BATCH_SIZE},
+        )
+        if not result.rowcount:
+            break
+        updated += result.rowcount
+    logger.info(f"[alembic/0036] Backfilled text_tsv for {updated} memory_chunk rows")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP TRIGGER IF EXISTS memory_chunk_tsv_sync ON memory_chunk;")
+    op.execute("DROP FUNCTION IF EXISTS memory_chunk_tsv_sync();")
@@ -0,0 +1,59 @@
+"""plan event sequence counters and state snapshots
+
+Revision ID: 0037_plan_event_counters_snapshots
+Revises: 0036_memory_chunk_tsv_sync
+Create Date: 2026-10-16
+
+append_event used to take a pg_advisory_xact_lock and run max(seq) for every
+event. Sequence numbers now come from a per-plan counter row, and a folded
+plan state snapshot is written every PLAN_EVENT_SNAPSHOT_INTERVAL events.
+
+Changes:
+- Add plan_event_counters (plan_id PK, last_seq)
+- Seed counters from existing plan_events
+- Add plan_snapshots with a unique (plan_id, seq) index
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0037_plan_event_counters_snapshots"
+down_revision = "0036_memory_chunk_tsv_sync"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "plan_event_counters",
+        sa.Column("plan_id", sa.String(128), primary_key=True),
+        sa.Column("last_seq", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "INSERT INTO plan_event_counters (plan_id, last_seq) "
+        "SELECT plan_id, MAX(seq) FROM plan_events GROUP BY plan_id"
+    )
+
+    op.create_table(
+        "plan_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("plan_id", sa.String(128), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("state", sa.JSON(), nullable=False),
+        sa.Column("org_key", sa.String(64), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_snapshots_plan_seq", "plan_snapshots", ["plan_id", "seq"], unique=True
+    )
+
+
+def downgrade():
+    op.drop_index("ix_snapshots_plan_seq", table_name="plan_snapshots")
+    op.drop_table("plan_snapshots")
+    op.drop_table("plan_event_counters")
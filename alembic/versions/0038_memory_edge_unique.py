@@ -0,0 +1,39 @@
+"""unique memory edges per (org, src, dst, relation)
+
+Revision ID: 0038_memory_edge_unique
+Revises: 0037_plan_event_counters_snapshots
+Create Date: 2026-10-16
+
+GraphBuilder used to check for an existing edge with one query per edge
+before inserting it. Edges are now bulk inserted with ON CONFLICT DO
+NOTHING, which needs a unique index on the edge key.
+
+Changes:
+- Delete duplicate memory_edge rows, keeping the oldest of each key
+- Add unique index idx_memory_edge_org_src_dst_rel
+"""
+
+from alembic import op
+
+revision = "0038_memory_edge_unique"
+down_revision = "0037_plan_event_counters_snapshots"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "DELETE FROM memory_edge WHERE id NOT IN ("
+        "SELECT MIN(id) FROM memory_edge "
+        "GROUP BY org_id, src_id, dst_id, relation)"
+    )
+    op.create_index(
+        "idx_memory_edge_org_src_dst_rel",
+        "memory_edge",
+        ["org_id", "src_id", "dst_id", "relation"],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index("idx_memory_edge_org_src_dst_rel", table_name="memory_edge")
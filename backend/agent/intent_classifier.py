@@ -9,6 +9,11 @@ This is **rule / heuristic based** so it works out-of-the-box without
 calling an LLM, but the public API is designed so you can later swap in
 an LLM-powered implementation without touching the rest of the system.
 
+The heuristics are ordered keyword rule tables. Every keyword from every
+table is compiled once, at import, into a single matcher that finds all
+keyword hits in a message in one pass; each table then picks its first
+matching rule from that hit set.
+
 Public entry points
 -------------------
 
@@ -25,7 +30,18 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from .intent_schema import (
     AutonomyMode,
@@ -44,6 +60,8 @@ from .intent_schema import (
     FileSelector,
 )
 
+T = TypeVar("T")
+
 
 # ---------------------------------------------------------------------------
 # Small helpers
@@ -68,94 +86,114 @@ def _norm_text(message: Any) -> str:
     return str(message)
 
 
-def _contains_any(text: str, keywords: Iterable[str]) -> bool:
-    return any(k in text for k in keywords)
+def _contains_any(hits: FrozenSet[str], keywords: Iterable[str]) -> bool:
+    """True if any of `keywords` occurs in the message `hits` were taken from."""
+    return not hits.isdisjoint(keywords)
 
 
-def _is_prod_readiness_query(text: str) -> bool:
-    """Detect prod-readiness / go-live verification requests."""
-    readiness_signals = (
-        "prod ready",
-        "production ready",
-        "ready for prod",
-        "ready for production",
-        "prod readiness",
-        "production readiness",
-        "go live",
-        "fully implemented",
-        "end-to-end",
-        "end to end",
-        "ready for prod deployment",
-        "ready for production deployment",
-    )
-    if not _contains_any(text, readiness_signals):
-        return False
-
-    verification_signals = (
-        "check",
-        "verify",
-        "working",
-        "stable",
-        "deployment",
-        "deploy",
-        "?",
-    )
-    return _contains_any(text, verification_signals)
+# ---------------------------------------------------------------------------
+# Rule tables
+# ---------------------------------------------------------------------------
+#
+# Each table is evaluated top to bottom and the first rule whose keywords
+# occur in the (lower-cased) message wins, so order is precedence. A rule
+# with `requires` additionally needs one of those keywords to be present.
+# Keywords are plain substrings, matched anywhere in the message.
+
+
+@dataclass(frozen=True)
+class _Rule(Generic[T]):
+    result: T
+    keywords: Tuple[str, ...]
+    requires: Tuple[str, ...] = ()
+
+
+_READINESS_SIGNALS = (
+    "prod ready",
+    "production ready",
+    "ready for prod",
+    "ready for production",
+    "prod readiness",
+    "production readiness",
+    "go live",
+    "fully implemented",
+    "end-to-end",
+    "end to end",
+    "ready for prod deployment",
+    "ready for production deployment",
+)
 
+_VERIFICATION_SIGNALS = (
+    "check",
+    "verify",
+    "working",
+    "stable",
+    "deployment",
+    "deploy",
+    "?",
+)
 
-def _priority_from_text(text: str) -> IntentPriority:
-    if _contains_any(text, ("p0", "sev0", "sev 0", "production down", "outage")):
-        return IntentPriority.CRITICAL
-    if _contains_any(text, ("urgent", "asap", "p1", "sev1", "blocker")):
-        return IntentPriority.HIGH
-    if _contains_any(text, ("low priority", "whenever", "nice to have")):
-        return IntentPriority.LOW
-    return IntentPriority.NORMAL
+_GREETING_TERMS = (
+    "hi",
+    "hello",
+    "hey",
+    "good morning",
+    "good afternoon",
+    "good evening",
+    "howdy",
+    "greetings",
+)
 
+# A short greeting only counts as one if it mentions none of these
+_WORK_WORDS = ("jira", "code", "help", "task", "work", "project")
 
-def _detect_provider(text: str) -> Optional[Provider]:
-    """
-    Detect which connector/provider the user is asking about.
+_CROSS_REPO_SIGNALS = ("all services", "every repo", "monorepo", "multi repo")
 
-    Returns None if no specific provider is mentioned.
-    """
+_LONG_RUNNING_SIGNALS = ("long running", "background", "overnight", "nightly")
+
+_PRIORITY_RULES = (
+    _Rule(
+        IntentPriority.CRITICAL,
+        ("p0", "sev0", "sev 0", "production down", "outage"),
+    ),
+    _Rule(IntentPriority.HIGH, ("urgent", "asap", "p1", "sev1", "blocker")),
+    _Rule(IntentPriority.LOW, ("low priority", "whenever", "nice to have")),
+)
+
+_PROVIDER_RULES = (
     # -------------------------------------------------------------------------
     # Issue Tracking & Project Management
     # -------------------------------------------------------------------------
-
     # Jira keywords
-    if _contains_any(
-        text, ("jira", "jira ticket", "jira issue", "jira task", "jira sprint")
-    ):
-        return Provider.JIRA
-
+    _Rule(
+        Provider.JIRA,
+        ("jira", "jira ticket", "jira issue", "jira task", "jira sprint"),
+    ),
     # Linear keywords
-    if _contains_any(text, ("linear", "lin-", "linear issue", "linear ticket")):
-        return Provider.LINEAR
-
+    _Rule(Provider.LINEAR, ("linear", "lin-", "linear issue", "linear ticket")),
     # Asana keywords
-    if _contains_any(text, ("asana", "asana task", "asana project")):
-        return Provider.ASANA
-
+    _Rule(Provider.ASANA, ("asana", "asana task", "asana project")),
     # Trello keywords
-    if _contains_any(text, ("trello", "trello board", "trello card", "trello list")):
-        return Provider.TRELLO
-
+    _Rule(
+        Provider.TRELLO,
+        ("trello", "trello board", "trello card", "trello list"),
+    ),
     # Monday.com keywords
-    if _contains_any(text, ("monday", "monday.com", "monday board", "monday item")):
-        return Provider.MONDAY
-
+    _Rule(
+        Provider.MONDAY,
+        ("monday", "monday.com", "monday board", "monday item"),
+    ),
     # ClickUp keywords
-    if _contains_any(text, ("clickup", "click up", "clickup task", "clickup space")):
-        return Provider.CLICKUP
-
+    _Rule(
+        Provider.CLICKUP,
+        ("clickup", "click up", "clickup task", "clickup space"),
+    ),
     # -------------------------------------------------------------------------
     # Code & Version Control
     # -------------------------------------------------------------------------
-
     # GitLab keywords (check before GitHub to handle "merge request" properly)
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.GITLAB,
         (
             "gitlab",
             "merge request",
@@ -164,30 +202,23 @@ def _detect_provider(text: str) -> Optional[Provider]:
             "gitlab pipeline",
             "gitlab ci",
         ),
-    ):
-        return Provider.GITLAB
-
+    ),
     # Bitbucket keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.BITBUCKET,
         ("bitbucket", "bitbucket pr", "bitbucket pipeline", "bitbucket repo"),
-    ):
-        return Provider.BITBUCKET
-
+    ),
     # -------------------------------------------------------------------------
     # CI/CD & Deployment
     # -------------------------------------------------------------------------
-
     # GitHub Actions keywords (check before general GitHub)
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.GITHUB_ACTIONS,
         ("github action", "github actions", "workflow run", "action run", "gh action"),
-    ):
-        return Provider.GITHUB_ACTIONS
-
+    ),
     # GitHub keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.GITHUB,
         (
             "github",
             "gh issue",
@@ -197,92 +228,68 @@ def _detect_provider(text: str) -> Optional[Provider]:
             "pull request",
             " pr ",
         ),
-    ):
-        return Provider.GITHUB
-
+    ),
     # CircleCI keywords
-    if _contains_any(
-        text, ("circleci", "circle ci", "circle pipeline", "circleci job")
-    ):
-        return Provider.CIRCLECI
-
+    _Rule(
+        Provider.CIRCLECI,
+        ("circleci", "circle ci", "circle pipeline", "circleci job"),
+    ),
     # Vercel keywords
-    if _contains_any(
-        text, ("vercel", "vercel deployment", "vercel project", "vercel preview")
-    ):
-        return Provider.VERCEL
-
+    _Rule(
+        Provider.VERCEL,
+        ("vercel", "vercel deployment", "vercel project", "vercel preview"),
+    ),
     # Jenkins keywords
-    if _contains_any(
-        text, ("jenkins", "jenkins job", "jenkins pipeline", "jenkins build")
-    ):
-        return Provider.JENKINS
-
+    _Rule(
+        Provider.JENKINS,
+        ("jenkins", "jenkins job", "jenkins pipeline", "jenkins build"),
+    ),
     # -------------------------------------------------------------------------
     # Communication
     # -------------------------------------------------------------------------
-
     # Slack keywords
-    if _contains_any(
-        text,
-        ("slack", "slack channel", "slack message", "slack dm"),
-    ):
-        return Provider.SLACK
-
+    _Rule(Provider.SLACK, ("slack", "slack channel", "slack message", "slack dm")),
     # Teams keywords
-    if _contains_any(
-        text, ("teams", "microsoft teams", "teams channel", "teams message")
-    ):
-        return Provider.TEAMS
-
+    _Rule(
+        Provider.TEAMS,
+        ("teams", "microsoft teams", "teams channel", "teams message"),
+    ),
     # Discord keywords
-    if _contains_any(
-        text, ("discord", "discord channel", "discord server", "discord message")
-    ):
-        return Provider.DISCORD
-
+    _Rule(
+        Provider.DISCORD,
+        ("discord", "discord channel", "discord server", "discord message"),
+    ),
     # -------------------------------------------------------------------------
     # Documentation & Knowledge
     # -------------------------------------------------------------------------
-
     # Confluence keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.CONFLUENCE,
         ("confluence", "confluence page", "confluence doc", "confluence space"),
-    ):
-        return Provider.CONFLUENCE
-
+    ),
     # Notion keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.NOTION,
         ("notion", "notion page", "notion doc", "notion database"),
-    ):
-        return Provider.NOTION
-
+    ),
     # Google Drive keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.GOOGLE_DRIVE,
         ("google drive", "gdrive", "drive file", "drive folder", "my drive"),
-    ):
-        return Provider.GOOGLE_DRIVE
-
+    ),
     # Google Docs keywords
-    if _contains_any(text, ("google doc", "gdoc", "google docs")):
-        return Provider.GOOGLE_DOCS
-
+    _Rule(Provider.GOOGLE_DOCS, ("google doc", "gdoc", "google docs")),
     # -------------------------------------------------------------------------
     # Meetings & Calendar
     # -------------------------------------------------------------------------
-
     # Zoom keywords
-    if _contains_any(
-        text, ("zoom", "zoom recording", "zoom meeting", "zoom transcript")
-    ):
-        return Provider.ZOOM
-
+    _Rule(
+        Provider.ZOOM,
+        ("zoom", "zoom recording", "zoom meeting", "zoom transcript"),
+    ),
     # Google Calendar keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.GOOGLE_CALENDAR,
         (
             "google calendar",
             "gcal",
@@ -290,20 +297,18 @@ def _detect_provider(text: str) -> Optional[Provider]:
             "my calendar",
             "today's meetings",
         ),
-    ):
-        return Provider.GOOGLE_CALENDAR
-
+    ),
     # Loom keywords
-    if _contains_any(text, ("loom", "loom video", "loom recording", "loom transcript")):
-        return Provider.LOOM
-
+    _Rule(
+        Provider.LOOM,
+        ("loom", "loom video", "loom recording", "loom transcript"),
+    ),
     # -------------------------------------------------------------------------
     # Monitoring & Security
     # -------------------------------------------------------------------------
-
     # Datadog keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.DATADOG,
         (
             "datadog",
             "dd monitor",
@@ -311,60 +316,49 @@ def _detect_provider(text: str) -> Optional[Provider]:
             "datadog incident",
             "datadog dashboard",
         ),
-    ):
-        return Provider.DATADOG
-
+    ),
     # Sentry keywords
-    if _contains_any(
-        text, ("sentry", "sentry issue", "sentry error", "sentry project")
-    ):
-        return Provider.SENTRY
-
+    _Rule(
+        Provider.SENTRY,
+        ("sentry", "sentry issue", "sentry error", "sentry project"),
+    ),
     # PagerDuty keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.PAGERDUTY,
         ("pagerduty", "pager duty", "oncall", "on-call", "pagerduty incident"),
-    ):
-        return Provider.PAGERDUTY
-
+    ),
     # Snyk keywords
-    if _contains_any(
-        text, ("snyk", "snyk vulnerability", "snyk project", "snyk issue")
-    ):
-        return Provider.SNYK
-
+    _Rule(
+        Provider.SNYK,
+        ("snyk", "snyk vulnerability", "snyk project", "snyk issue"),
+    ),
     # SonarQube keywords
-    if _contains_any(
-        text,
+    _Rule(
+        Provider.SONARQUBE,
         ("sonarqube", "sonar", "code quality", "quality gate", "sonar issue"),
-    ):
-        return Provider.SONARQUBE
-
+    ),
     # -------------------------------------------------------------------------
     # Design
     # -------------------------------------------------------------------------
-
     # Figma keywords
-    if _contains_any(text, ("figma", "figma file", "figma design", "figma comment")):
-        return Provider.FIGMA
-
-    return None
-
+    _Rule(
+        Provider.FIGMA,
+        ("figma", "figma file", "figma design", "figma comment"),
+    ),
+)
 
-def _autonomy_from_text(text: str) -> AutonomyMode:
-    if _contains_any(
-        text,
+_AUTONOMY_RULES = (
+    _Rule(
+        AutonomyMode.BATCH,
         (
             "run this in the background",
             "batch of tasks",
             "bulk apply",
             "auto apply everywhere",
         ),
-    ):
-        return AutonomyMode.BATCH
-
-    if _contains_any(
-        text,
+    ),
+    _Rule(
+        AutonomyMode.AUTONOMOUS_SESSION,
         (
             "just do it",
             "don't ask me",
@@ -373,22 +367,1037 @@ def _autonomy_from_text(text: str) -> AutonomyMode:
             "hands free",
             "end to end",
         ),
-    ):
-        return AutonomyMode.AUTONOMOUS_SESSION
-
-    if _contains_any(
-        text,
+    ),
+    _Rule(
+        AutonomyMode.SINGLE_STEP,
         (
             "just run this once",
             "one-off",
             "one time",
             "single command",
         ),
-    ):
-        return AutonomyMode.SINGLE_STEP
+    ),
+)
+
+_FAMILY_RULES = (
+    _Rule(
+        IntentFamily.PROJECT_MANAGEMENT,
+        (
+            # Jira keywords
+            "jira",
+            "ticket",
+            "story",
+            "backlog",
+            "sprint",
+            "epic",
+            "release notes",
+            "changelog",
+            # GitHub/GitLab PR keywords
+            "pull request",
+            "pr ",
+            "merge request",
+            " mr ",
+            # Linear keywords
+            "linear",
+            "lin-",
+            # Asana keywords
+            "asana",
+            "asana task",
+            "asana project",
+            # GitLab keywords
+            "gitlab",
+            "pipeline",
+            # Notion keywords
+            "notion",
+            "notion page",
+            "notion doc",
+            # Trello keywords
+            "trello",
+            "trello board",
+            "trello card",
+            # Monday.com keywords
+            "monday",
+            "monday.com",
+            "monday board",
+            # ClickUp keywords
+            "clickup",
+            "click up",
+            # Bitbucket keywords
+            "bitbucket",
+            # Confluence keywords
+            "confluence",
+            "confluence page",
+            # Google Drive/Docs keywords
+            "google drive",
+            "gdrive",
+            "google doc",
+            # Figma keywords
+            "figma",
+            "figma file",
+            # General issue/task keywords
+            "my issues",
+            "my tasks",
+            "assigned to me",
+            "my open",
+        ),
+    ),
+    # CI/CD and Monitoring intents
+    _Rule(
+        IntentFamily.PROJECT_MANAGEMENT,
+        (
+            # CI/CD keywords
+            "github action",
+            "circleci",
+            "vercel",
+            "deployment",
+            "deploy status",
+            "build status",
+            "workflow run",
+            # Monitoring keywords
+            "datadog",
+            "monitor",
+            "incident",
+            "alerting",
+            "sentry",
+            "sentry issue",
+            "pagerduty",
+            "oncall",
+            "on-call",
+            # Security keywords
+            "snyk",
+            "vulnerability",
+            "sonarqube",
+            "code quality",
+            "quality gate",
+        ),
+    ),
+    # Communication intents
+    _Rule(
+        IntentFamily.PROJECT_MANAGEMENT,
+        (
+            "slack",
+            "slack channel",
+            "discord",
+            "discord channel",
+            "teams",
+            "teams channel",
+        ),
+    ),
+    # Meetings/Calendar intents
+    _Rule(
+        IntentFamily.PROJECT_MANAGEMENT,
+        (
+            "zoom",
+            "zoom recording",
+            "loom",
+            "loom video",
+            "google calendar",
+            "gcal",
+            "calendar event",
+            "today's meetings",
+            "upcoming meetings",
+        ),
+    ),
+    _Rule(
+        IntentFamily.AUTONOMOUS_ORCHESTRATION,
+        (
+            "run this every",
+            "schedule",
+            "nightly",
+            "cron",
+            "background worker",
+            "long running workflow",
+            "auto apply jobs",
+        ),
+    ),
+)
+
+# Engineering intents (after the prod-readiness and greeting checks)
+_ENGINEERING_KIND_RULES = (
+    # Phase 4.1.2: Problems tab / VS Code diagnostics
+    _Rule(
+        IntentKind.FIX_DIAGNOSTICS,
+        (
+            "problems tab",
+            "fix errors",
+            "fix problems",
+            "diagnostics",
+            "errors in problems",
+            "fix all errors",
+            "problems panel",
+            "vs code errors",
+            "compilation errors",
+        ),
+    ),
+    _Rule(
+        IntentKind.FIX_BUG,
+        (
+            "failing test",
+            "tests are failing",
+            "fix the bug",
+            "bug",
+            "bugs",
+            "stack trace",
+            "exception",
+            "runtime error",
+            "compile error",
+            "fix this bug",
+            "error:",
+            "typeerror",
+            "syntaxerror",
+            "referenceerror",
+            "nameerror",
+            "valueerror",
+            "attributeerror",
+            "keyerror",
+            "indexerror",
+            "importerror",
+            "modulenotfounderror",
+            "cannot read property",
+            "undefined is not",
+            "null is not",
+            "is not defined",
+            "is not a function",
+            "how do i fix",
+            "getting this error",
+            "getting an error",
+            "i'm getting",
+            "im getting",
+            "this error",
+            "fix error",
+            "resolve error",
+            "debug",
+            "not working",
+            "doesn't work",
+            "broken",
+            "crash",
+            "fails",
+            "failed",
+        ),
+    ),
+    _Rule(IntentKind.REFACTOR_CODE, ("refactor", "clean up", "cleanup")),
+    _Rule(
+        IntentKind.IMPLEMENT_FEATURE,
+        (
+            "implement feature",
+            "add feature",
+            "new endpoint",
+            "api endpoint",
+            "new api endpoint",
+            "add api",
+            "create endpoint",
+            "support this use case",
+            "create a",
+            "build a",
+            "build the",
+            "write a",
+            "make a",
+            "implement a",
+            "add a new",
+            "create new",
+            "build new",
+            "write new",
+            "implement the",
+            "add functionality",
+            "develop a",
+            "code a",
+            "set up",
+            "setup",
+            "crud",
+            "api for",
+            "component for",
+            "module for",
+            "service for",
+            "function that",
+            "method that",
+            "class that",
+            "authentication",
+            "login",
+            "logout",
+            "signup",
+            "registration",
+            "user management",
+            "form validation",
+            "data validation",
+            "error handling",
+            "logging",
+            "caching",
+            "pagination",
+            "search functionality",
+            "filter",
+            "sort",
+            "export",
+            "import",
+            "upload",
+            "download",
+            "notification",
+            "email",
+            "webhook",
+            "integration",
+        ),
+    ),
+    _Rule(
+        IntentKind.GENERATE_TESTS,
+        (
+            "write tests",
+            "add tests",
+            "generate tests",
+            "unit tests for",
+            "test coverage",
+        ),
+    ),
+    _Rule(
+        IntentKind.RUN_TESTS,
+        (
+            "run tests",
+            "run the tests",
+            "run all unit tests",
+            "execute tests",
+            "execute pytest",
+            "run pytest",
+            "run unit tests",
+            "ci tests",
+        ),
+    ),
+    _Rule(
+        IntentKind.RUN_LINT,
+        (
+            "run lint",
+            "lint the code",
+            "ruff",
+            "flake8",
+            "eslint",
+        ),
+    ),
+    _Rule(
+        IntentKind.RUN_BUILD,
+        (
+            "build the project",
+            "build the app",
+            "run build",
+            "webpack build",
+            "vite build",
+        ),
+    ),
+    _Rule(
+        IntentKind.RUN_CUSTOM_COMMAND,
+        (
+            "run this project",
+            "run the project",
+            "run this app",
+            "run the app",
+            "start the server",
+            "start server",
+            "start the app",
+            "start this",
+            "run this",
+            "execute this",
+            "how do i run",
+            "how to run",
+            "how to start",
+            "npm start",
+            "npm run dev",
+            "python run",
+            "uvicorn",
+            "flask run",
+            "django runserver",
+            "node index",
+            "node server",
+            "yarn start",
+            "yarn dev",
+        ),
+    ),
+    _Rule(
+        IntentKind.EXPLAIN_CODE,
+        (
+            "explain this code",
+            "what does this code do",
+            "explain how this works",
+            "help me understand this function",
+            "what is this",
+            "what does this",
+            "how does this",
+            "what is the purpose",
+            "what are the",
+            "describe this",
+            "tell me about",
+            "explain the",
+            "what is this project",
+            "what does this project",
+            "what framework",
+            "what language",
+            "what technologies",
+            "tech stack",
+            "architecture",
+        ),
+    ),
+    _Rule(
+        IntentKind.SEARCH_CODE,
+        (
+            "search the code",
+            "find usages",
+            "grep for",
+            "where is",
+            "search for",
+        ),
+    ),
+    _Rule(
+        IntentKind.EDIT_INFRA,
+        (
+            "dockerfile",
+            "docker-compose",
+            "helm chart",
+            "kubernetes",
+            "infra",
+            "terraform",
+        ),
+    ),
+    _Rule(
+        IntentKind.UPDATE_DEPENDENCIES,
+        (
+            "upgrade dependencies",
+            "bump versions",
+            "update packages",
+            "dependency update",
+            "update requirements.txt",
+            "update package.json",
+        ),
+    ),
+    # Deployment intents
+    _Rule(
+        IntentKind.DEPLOY,
+        (
+            "deploy",
+            "deploy to",
+            "deploy this",
+            "push to production",
+            "push to prod",
+            "ship to",
+            "ship it",
+            "go live",
+            "release to",
+            "deploy to vercel",
+            "deploy to railway",
+            "deploy to fly",
+            "deploy to netlify",
+            "deploy to heroku",
+            "deploy to render",
+            "deploy to cloudflare",
+            "deploy to aws",
+            "deploy to gcp",
+            "deploy to azure",
+            "vercel deploy",
+            "railway up",
+            "fly deploy",
+            "netlify deploy",
+            "production deployment",
+            "staging deployment",
+        ),
+    ),
+    _Rule(
+        IntentKind.SUMMARIZE_DIFF,
+        (
+            "summarize this diff",
+            "summarise this diff",
+            "explain this diff",
+            "explain this change",
+        ),
+    ),
+    _Rule(IntentKind.SUMMARIZE_FILE, ("summarize file", "explain this file")),
+)
+
+# Project management intents (after the prod-readiness check). Provider
+# specific listings resolve to LIST_MY_ITEMS; the provider itself is
+# detected separately by `_detect_provider`.
+_PROJECT_MANAGEMENT_KIND_RULES = (
+    # Check for Jira "my issues" patterns
+    _Rule(
+        IntentKind.JIRA_LIST_MY_ISSUES,
+        (
+            "list the jira tasks assigned to me",
+            "show my jira tickets",
+            "my jira issues",
+            "jira tasks assigned to me",
+            "list my jira tasks",
+            "show jira issues assigned to me",
+            "what jira tickets am i currently on",
+            "my open jira tickets",
+        ),
+    ),
+    # Check for Linear "my issues" patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my linear issues",
+            "linear issues assigned to me",
+            "show my linear tasks",
+            "list my linear issues",
+            "linear tasks",
+            "lin-",
+        ),
+        requires=("linear",),
+    ),
+    # Check for GitLab "my MRs/issues" patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my gitlab",
+            "my merge requests",
+            "my mrs",
+            "gitlab issues assigned to me",
+            "gitlab mrs",
+            "gitlab merge requests",
+            "my pipelines",
+            "pipeline status",
+        ),
+        requires=("gitlab", "merge request", " mr "),
+    ),
+    # Check for GitHub "my PRs/issues" patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my github issues",
+            "my github prs",
+            "github issues assigned to me",
+            "github prs assigned to me",
+            "my pull requests",
+        ),
+        requires=("github",),
+    ),
+    # Check for Asana "my tasks" patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my asana tasks",
+            "asana tasks assigned to me",
+            "show my asana tasks",
+            "list my asana tasks",
+            "asana projects",
+        ),
+        requires=("asana",),
+    ),
+    # Check for Notion "search/list" patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "search notion",
+            "find notion",
+            "notion pages",
+            "my notion docs",
+            "notion databases",
+            "recent notion pages",
+        ),
+        requires=("notion",),
+    ),
+    # Check for Trello patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my trello cards",
+            "trello boards",
+            "show my trello",
+            "list trello cards",
+            "trello tasks",
+        ),
+        requires=("trello",),
+    ),
+    # Check for Monday.com patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my monday items",
+            "monday boards",
+            "show my monday",
+            "list monday items",
+            "monday tasks",
+        ),
+        requires=("monday",),
+    ),
+    # Check for ClickUp patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my clickup tasks",
+            "clickup spaces",
+            "show my clickup",
+            "list clickup tasks",
+        ),
+        requires=("clickup", "click up"),
+    ),
+    # Check for Bitbucket patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my bitbucket prs",
+            "bitbucket repos",
+            "show my bitbucket",
+            "bitbucket pipelines",
+        ),
+        requires=("bitbucket",),
+    ),
+    # Check for Confluence patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "search confluence",
+            "confluence pages",
+            "confluence spaces",
+            "find confluence",
+        ),
+        requires=("confluence",),
+    ),
+    # Check for Google Drive patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my drive files",
+            "google drive files",
+            "search drive",
+            "list drive files",
+            "recent files",
+        ),
+        requires=("drive", "gdrive"),
+    ),
+    # Check for Figma patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my figma files",
+            "figma projects",
+            "show figma",
+            "list figma files",
+        ),
+        requires=("figma",),
+    ),
+    # Check for Zoom patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "zoom recordings",
+            "my zoom meetings",
+            "zoom transcripts",
+            "list zoom recordings",
+        ),
+        requires=("zoom",),
+    ),
+    # Check for Loom patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "loom videos",
+            "my loom recordings",
+            "loom transcripts",
+            "list loom videos",
+        ),
+        requires=("loom",),
+    ),
+    # Check for Google Calendar patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my calendar events",
+            "today's calendar",
+            "upcoming events",
+            "calendar meetings",
+            "show my calendar",
+        ),
+        requires=("calendar", "gcal"),
+    ),
+    # Check for Datadog patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "datadog monitors",
+            "alerting monitors",
+            "datadog incidents",
+            "datadog dashboards",
+            "show monitors",
+        ),
+        requires=("datadog",),
+    ),
+    # Check for Sentry patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "sentry issues",
+            "sentry errors",
+            "sentry projects",
+            "show sentry",
+            "list sentry issues",
+        ),
+        requires=("sentry",),
+    ),
+    # Check for PagerDuty patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "pagerduty incidents",
+            "who's on call",
+            "oncall schedule",
+            "show oncall",
+            "pagerduty schedule",
+        ),
+        requires=("pagerduty", "oncall", "on-call"),
+    ),
+    # Check for Snyk patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "snyk vulnerabilities",
+            "snyk issues",
+            "snyk projects",
+            "security vulnerabilities",
+        ),
+        requires=("snyk",),
+    ),
+    # Check for SonarQube patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "sonarqube issues",
+            "code quality issues",
+            "quality gate status",
+            "sonar projects",
+        ),
+        requires=("sonarqube", "sonar"),
+    ),
+    # Check for GitHub Actions patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "github actions",
+            "workflow runs",
+            "action status",
+            "list workflows",
+        ),
+        requires=("github action", "workflow"),
+    ),
+    # Check for CircleCI patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "circleci pipelines",
+            "circleci jobs",
+            "circle builds",
+            "circleci status",
+        ),
+        requires=("circleci", "circle ci"),
+    ),
+    # Check for Vercel patterns
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "vercel deployments",
+            "vercel projects",
+            "deployment status",
+            "vercel preview",
+        ),
+        requires=("vercel",),
+    ),
+    # Check for Discord patterns
+    _Rule(
+        IntentKind.SUMMARIZE_CHANNEL,
+        (
+            "discord channels",
+            "discord messages",
+            "discord servers",
+            "show discord",
+        ),
+        requires=("discord",),
+    ),
+    # Check for general "my items" across any provider
+    _Rule(
+        IntentKind.LIST_MY_ITEMS,
+        (
+            "my issues",
+            "my tasks",
+            "assigned to me",
+            "show my",
+            "list my",
+            "what am i working on",
+            "my open issues",
+            "my open tasks",
+        ),
+    ),
+    # Check for Slack channel summary patterns
+    _Rule(
+        IntentKind.SLACK_SUMMARIZE_CHANNEL,
+        (
+            "summarise today's standup channel",
+            "summarize the standup slack channel",
+            "what happened in #standup",
+            "show recent messages from",
+            "what did i miss in #",
+            "summarize slack channel",
+            "slack standup summary",
+            "slack messages",
+            "recent slack",
+        ),
+    ),
+    _Rule(
+        IntentKind.CREATE_TICKET,
+        (
+            "create ticket",
+            "open a ticket",
+            "file a bug",
+            "new jira",
+            "new story",
+            "new issue",
+        ),
+    ),
+    _Rule(
+        IntentKind.UPDATE_TICKET,
+        (
+            "update ticket",
+            "update the jira",
+            "move this to",
+            "transition ticket",
+        ),
+    ),
+    _Rule(
+        IntentKind.SUMMARIZE_TICKETS,
+        (
+            "summarize the sprint",
+            "summarize tickets",
+            "ticket summary",
+            "backlog summary",
+        ),
+    ),
+    # PR requests are reviews when they say so, summaries otherwise
+    _Rule(
+        IntentKind.REVIEW_PR,
+        (
+            "summarize this pr",
+            "summarise this pr",
+            "pr summary",
+            "review this pr",
+            "code review",
+        ),
+        requires=("review",),
+    ),
+    _Rule(
+        IntentKind.SUMMARIZE_PR,
+        (
+            "summarize this pr",
+            "summarise this pr",
+            "pr summary",
+            "review this pr",
+            "code review",
+        ),
+    ),
+    _Rule(
+        IntentKind.GENERATE_RELEASE_NOTES,
+        (
+            "release notes",
+            "changelog",
+            "what changed in this release",
+        ),
+    ),
+)
+
+# Autonomous / orchestration intents
+_AUTONOMOUS_KIND_RULES = (
+    _Rule(
+        IntentKind.CONTINUE_SESSION,
+        (
+            "continue previous session",
+            "continue where we left off",
+            "resume session",
+        ),
+    ),
+    _Rule(
+        IntentKind.CANCEL_WORKFLOW,
+        (
+            "cancel workflow",
+            "stop the agent",
+            "abort run",
+        ),
+    ),
+    _Rule(
+        IntentKind.SCHEDULED_TASK,
+        (
+            "nightly job",
+            "run every day",
+            "run every night",
+            "schedule this task",
+        ),
+    ),
+    _Rule(
+        IntentKind.BACKGROUND_WORKFLOW,
+        (
+            "background job",
+            "batch job",
+            "bulk change",
+            "mass update",
+        ),
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# Compiled matching
+# ---------------------------------------------------------------------------
+
+
+class _KeywordMatcher:
+    """
+    Finds every keyword of a fixed vocabulary that occurs in a text.
+
+    The vocabulary is compiled into one regex shaped like a trie and wrapped
+    in a lookahead, so a single `finditer` pass yields, at each position, the
+    longest keyword starting there. Every shorter keyword starting at the
+    same position is a prefix of that one, so each match expands to a
+    precomputed set of keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        vocabulary = sorted(set(keywords))
+        self._pattern = re.compile("(?=(%s))" % self._trie_pattern(vocabulary))
+        self._expansions: Dict[str, FrozenSet[str]] = {
+            word: frozenset(w for w in vocabulary if word.startswith(w))
+            for word in vocabulary
+        }
+
+    @staticmethod
+    def _trie_pattern(vocabulary: Sequence[str]) -> str:
+        trie: Dict[str, Any] = {}
+        for word in vocabulary:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        def render(node: Dict[str, Any]) -> str:
+            branches = [
+                re.escape(char) + render(child)
+                for char, child in sorted(node.items())
+                if char
+            ]
+            if not branches:
+                return ""
+            body = "|".join(branches)
+            # Greedy optional: prefer the longer keyword, fall back to this one
+            return f"(?:{body})?" if "" in node else f"(?:{body})"
+
+        return render(trie)
+
+    def hits(self, text: str) -> FrozenSet[str]:
+        expansions = self._expansions
+        found: set = set()
+        for match in self._pattern.finditer(text):
+            found.update(expansions[match.group(1)])
+        return frozenset(found)
+
+
+class _RuleTable(Generic[T]):
+    """
+    An ordered rule list compiled to bitmasks over the keyword vocabulary.
+
+    Bit `i` stands for rule `i`; OR-ing the masks of the hit keywords gives
+    every rule that fires, and the lowest set bit is the one that wins.
+    """
+
+    def __init__(self, rules: Sequence[_Rule[T]]) -> None:
+        self.rules = tuple(rules)
+        self._results = [rule.result for rule in self.rules]
+        self._keyword_masks: Dict[str, int] = {}
+        self._required_masks: Dict[str, int] = {}
+        self._unconditional = 0
+        for index, rule in enumerate(self.rules):
+            bit = 1 << index
+            for keyword in rule.keywords:
+                self._keyword_masks[keyword] = self._keyword_masks.get(keyword, 0) | bit
+            for keyword in rule.requires:
+                self._required_masks[keyword] = (
+                    self._required_masks.get(keyword, 0) | bit
+                )
+            if not rule.requires:
+                self._unconditional |= bit
+
+    def keywords(self) -> Iterable[str]:
+        for rule in self.rules:
+            yield from rule.keywords
+            yield from rule.requires
+
+    def first(self, hits: FrozenSet[str]) -> Optional[T]:
+        matched = 0
+        satisfied = self._unconditional
+        for keyword in hits:
+            matched |= self._keyword_masks.get(keyword, 0)
+            satisfied |= self._required_masks.get(keyword, 0)
+        fired = matched & satisfied
+        if not fired:
+            return None
+        return self._results[(fired & -fired).bit_length() - 1]
+
+
+_PRIORITY_TABLE = _RuleTable(_PRIORITY_RULES)
+_PROVIDER_TABLE = _RuleTable(_PROVIDER_RULES)
+_AUTONOMY_TABLE = _RuleTable(_AUTONOMY_RULES)
+_FAMILY_TABLE = _RuleTable(_FAMILY_RULES)
+_ENGINEERING_KIND_TABLE = _RuleTable(_ENGINEERING_KIND_RULES)
+_PROJECT_MANAGEMENT_KIND_TABLE = _RuleTable(_PROJECT_MANAGEMENT_KIND_RULES)
+_AUTONOMOUS_KIND_TABLE = _RuleTable(_AUTONOMOUS_KIND_RULES)
+
+_MATCHER = _KeywordMatcher(
+    [
+        *_READINESS_SIGNALS,
+        *_VERIFICATION_SIGNALS,
+        *_GREETING_TERMS,
+        *_WORK_WORDS,
+        *_CROSS_REPO_SIGNALS,
+        *_LONG_RUNNING_SIGNALS,
+        *_PRIORITY_TABLE.keywords(),
+        *_PROVIDER_TABLE.keywords(),
+        *_AUTONOMY_TABLE.keywords(),
+        *_FAMILY_TABLE.keywords(),
+        *_ENGINEERING_KIND_TABLE.keywords(),
+        *_PROJECT_MANAGEMENT_KIND_TABLE.keywords(),
+        *_AUTONOMOUS_KIND_TABLE.keywords(),
+    ]
+)
+
+# Whole-word greeting check used for GREET, unlike the substring keywords
+_GREETING_RE = re.compile(
+    r"\b(?:%s)\b" % "|".join(re.escape(term) for term in _GREETING_TERMS)
+)
+
+
+@lru_cache(maxsize=64)
+def _keyword_hits(text: str) -> FrozenSet[str]:
+    """Keywords occurring in `text`; cached since one message is scanned once."""
+    return _MATCHER.hits(text)
+
+
+def _is_pure_greeting(text: str, hits: FrozenSet[str]) -> bool:
+    # Only if it's a pure greeting with minimal other words
+    return len(text.split()) <= 3 and not _contains_any(hits, _WORK_WORDS)
+
+
+def _is_prod_readiness_query(text: str) -> bool:
+    """Detect prod-readiness / go-live verification requests."""
+    hits = _keyword_hits(text)
+    return _contains_any(hits, _READINESS_SIGNALS) and _contains_any(
+        hits, _VERIFICATION_SIGNALS
+    )
+
+
+def _priority_from_text(text: str) -> IntentPriority:
+    return _PRIORITY_TABLE.first(_keyword_hits(text)) or IntentPriority.NORMAL
+
+
+def _detect_provider(text: str) -> Optional[Provider]:
+    """
+    Detect which connector/provider the user is asking about.
+
+    Returns None if no specific provider is mentioned.
+    """
+    return _PROVIDER_TABLE.first(_keyword_hits(text))
+
 
+def _autonomy_from_text(text: str) -> AutonomyMode:
     # Default: NAVI proposes and the user approves
-    return AutonomyMode.ASSISTED
+    return _AUTONOMY_TABLE.first(_keyword_hits(text)) or AutonomyMode.ASSISTED
 
 
 # ---------------------------------------------------------------------------
@@ -458,6 +1467,7 @@ class IntentClassifier:
         metadata = metadata or {}
         raw_text = _norm_text(message)
         text = raw_text.lower()
+        hits = _keyword_hits(text)
 
         # --- base metadata -------------------------------------------------
         family = metadata.get("family") or self._infer_family(text)
@@ -471,12 +1481,8 @@ class IntentClassifier:
             autonomy_mode=autonomy_mode,
             max_steps=self._default_max_steps_for_kind(kind),
             auto_run_tests=self._default_auto_run_tests(kind),
-            allow_cross_repo_changes=_contains_any(
-                text, ("all services", "every repo", "monorepo", "multi repo")
-            ),
-            allow_long_running=_contains_any(
-                text, ("long running", "background", "overnight", "nightly")
-            ),
+            allow_cross_repo_changes=_contains_any(hits, _CROSS_REPO_SIGNALS),
+            allow_long_running=_contains_any(hits, _LONG_RUNNING_SIGNALS),
         )
 
         # --- main payloads -------------------------------------------------
@@ -575,1046 +1581,42 @@ class IntentClassifier:
         if _is_prod_readiness_query(text):
             return IntentFamily.ENGINEERING
 
+        hits = _keyword_hits(text)
+
         # Check for simple greetings first (before other classifications)
-        if _contains_any(
-            text,
-            (
-                "hi",
-                "hello",
-                "hey",
-                "good morning",
-                "good afternoon",
-                "good evening",
-                "howdy",
-                "greetings",
-            ),
-        ):
-            # Only if it's a pure greeting with no other intent
-            words = text.strip().split()
-            if len(words) <= 3 and not any(
-                work_word in text
-                for work_word in ["jira", "code", "help", "task", "work", "project"]
-            ):
-                return IntentFamily.ENGINEERING  # Will be handled as GREET in kind
-
-        if _contains_any(
-            text,
-            (
-                # Jira keywords
-                "jira",
-                "ticket",
-                "story",
-                "backlog",
-                "sprint",
-                "epic",
-                "release notes",
-                "changelog",
-                # GitHub/GitLab PR keywords
-                "pull request",
-                "pr ",
-                "merge request",
-                " mr ",
-                # Linear keywords
-                "linear",
-                "lin-",
-                # Asana keywords
-                "asana",
-                "asana task",
-                "asana project",
-                # GitLab keywords
-                "gitlab",
-                "pipeline",
-                # Notion keywords
-                "notion",
-                "notion page",
-                "notion doc",
-                # Trello keywords
-                "trello",
-                "trello board",
-                "trello card",
-                # Monday.com keywords
-                "monday",
-                "monday.com",
-                "monday board",
-                # ClickUp keywords
-                "clickup",
-                "click up",
-                # Bitbucket keywords
-                "bitbucket",
-                # Confluence keywords
-                "confluence",
-                "confluence page",
-                # Google Drive/Docs keywords
-                "google drive",
-                "gdrive",
-                "google doc",
-                # Figma keywords
-                "figma",
-                "figma file",
-                # General issue/task keywords
-                "my issues",
-                "my tasks",
-                "assigned to me",
-                "my open",
-            ),
-        ):
-            return IntentFamily.PROJECT_MANAGEMENT
-
-        # CI/CD and Monitoring intents
-        if _contains_any(
-            text,
-            (
-                # CI/CD keywords
-                "github action",
-                "circleci",
-                "vercel",
-                "deployment",
-                "deploy status",
-                "build status",
-                "workflow run",
-                # Monitoring keywords
-                "datadog",
-                "monitor",
-                "incident",
-                "alerting",
-                "sentry",
-                "sentry issue",
-                "pagerduty",
-                "oncall",
-                "on-call",
-                # Security keywords
-                "snyk",
-                "vulnerability",
-                "sonarqube",
-                "code quality",
-                "quality gate",
-            ),
-        ):
-            return IntentFamily.PROJECT_MANAGEMENT
-
-        # Communication intents
-        if _contains_any(
-            text,
-            (
-                "slack",
-                "slack channel",
-                "discord",
-                "discord channel",
-                "teams",
-                "teams channel",
-            ),
-        ):
-            return IntentFamily.PROJECT_MANAGEMENT
-
-        # Meetings/Calendar intents
-        if _contains_any(
-            text,
-            (
-                "zoom",
-                "zoom recording",
-                "loom",
-                "loom video",
-                "google calendar",
-                "gcal",
-                "calendar event",
-                "today's meetings",
-                "upcoming meetings",
-            ),
-        ):
-            return IntentFamily.PROJECT_MANAGEMENT
-
-        if _contains_any(
-            text,
-            (
-                "run this every",
-                "schedule",
-                "nightly",
-                "cron",
-                "background worker",
-                "long running workflow",
-                "auto apply jobs",
-            ),
-        ):
-            return IntentFamily.AUTONOMOUS_ORCHESTRATION
-
-        return IntentFamily.ENGINEERING
+        if _contains_any(hits, _GREETING_TERMS) and _is_pure_greeting(text, hits):
+            return IntentFamily.ENGINEERING  # Will be handled as GREET in kind
+
+        return _FAMILY_TABLE.first(hits) or IntentFamily.ENGINEERING
 
     def _infer_kind(self, text: str, family: IntentFamily) -> IntentKind:
+        hits = _keyword_hits(text)
+
         # Engineering intents
         if family == IntentFamily.ENGINEERING:
             if _is_prod_readiness_query(text):
                 return IntentKind.PROD_READINESS_AUDIT
 
             # Check for greetings first
-            greeting_terms = (
-                "hi",
-                "hello",
-                "hey",
-                "good morning",
-                "good afternoon",
-                "good evening",
-                "howdy",
-                "greetings",
-            )
-            if any(
-                re.search(rf"\b{re.escape(term)}\b", text) for term in greeting_terms
-            ):
-                # Only if it's a pure greeting with minimal other words
-                words = text.strip().split()
-                if len(words) <= 3 and not any(
-                    work_word in text
-                    for work_word in ["jira", "code", "help", "task", "work", "project"]
-                ):
-                    return IntentKind.GREET
-
-            # Phase 4.1.2: Problems tab / VS Code diagnostics
-            if _contains_any(
-                text,
-                (
-                    "problems tab",
-                    "fix errors",
-                    "fix problems",
-                    "diagnostics",
-                    "errors in problems",
-                    "fix all errors",
-                    "problems panel",
-                    "vs code errors",
-                    "compilation errors",
-                ),
-            ):
-                return IntentKind.FIX_DIAGNOSTICS
-
-            if _contains_any(
-                text,
-                (
-                    "failing test",
-                    "tests are failing",
-                    "fix the bug",
-                    "bug",
-                    "bugs",
-                    "stack trace",
-                    "exception",
-                    "runtime error",
-                    "compile error",
-                    "fix this bug",
-                    "error:",
-                    "typeerror",
-                    "syntaxerror",
-                    "referenceerror",
-                    "nameerror",
-                    "valueerror",
-                    "attributeerror",
-                    "keyerror",
-                    "indexerror",
-                    "importerror",
-                    "modulenotfounderror",
-                    "cannot read property",
-                    "undefined is not",
-                    "null is not",
-                    "is not defined",
-                    "is not a function",
-                    "how do i fix",
-                    "getting this error",
-                    "getting an error",
-                    "i'm getting",
-                    "im getting",
-                    "this error",
-                    "fix error",
-                    "resolve error",
-                    "debug",
-                    "not working",
-                    "doesn't work",
-                    "broken",
-                    "crash",
-                    "fails",
-                    "failed",
-                ),
-            ):
-                return IntentKind.FIX_BUG
-
-            if "refactor" in text or "clean up" in text or "cleanup" in text:
-                return IntentKind.REFACTOR_CODE
-
-            if _contains_any(
-                text,
-                (
-                    "implement feature",
-                    "add feature",
-                    "new endpoint",
-                    "api endpoint",
-                    "new api endpoint",
-                    "add api",
-                    "create endpoint",
-                    "support this use case",
-                    "create a",
-                    "build a",
-                    "build the",
-                    "write a",
-                    "make a",
-                    "implement a",
-                    "add a new",
-                    "create new",
-                    "build new",
-                    "write new",
-                    "implement the",
-                    "add functionality",
-                    "develop a",
-                    "code a",
-                    "set up",
-                    "setup",
-                    "crud",
-                    "api for",
-                    "component for",
-                    "module for",
-                    "service for",
-                    "function that",
-                    "method that",
-                    "class that",
-                    "authentication",
-                    "login",
-                    "logout",
-                    "signup",
-                    "registration",
-                    "user management",
-                    "form validation",
-                    "data validation",
-                    "error handling",
-                    "logging",
-                    "caching",
-                    "pagination",
-                    "search functionality",
-                    "filter",
-                    "sort",
-                    "export",
-                    "import",
-                    "upload",
-                    "download",
-                    "notification",
-                    "email",
-                    "webhook",
-                    "integration",
-                ),
-            ):
-                return IntentKind.IMPLEMENT_FEATURE
-
-            if _contains_any(
-                text,
-                (
-                    "write tests",
-                    "add tests",
-                    "generate tests",
-                    "unit tests for",
-                    "test coverage",
-                ),
-            ):
-                return IntentKind.GENERATE_TESTS
-
-            if _contains_any(
-                text,
-                (
-                    "run tests",
-                    "run the tests",
-                    "run all unit tests",
-                    "execute tests",
-                    "execute pytest",
-                    "run pytest",
-                    "run unit tests",
-                    "ci tests",
-                ),
-            ):
-                return IntentKind.RUN_TESTS
-
-            if _contains_any(
-                text,
-                (
-                    "run lint",
-                    "lint the code",
-                    "ruff",
-                    "flake8",
-                    "eslint",
-                ),
-            ):
-                return IntentKind.RUN_LINT
-
-            if _contains_any(
-                text,
-                (
-                    "build the project",
-                    "build the app",
-                    "run build",
-                    "webpack build",
-                    "vite build",
-                ),
-            ):
-                return IntentKind.RUN_BUILD
-
-            if _contains_any(
-                text,
-                (
-                    "run this project",
-                    "run the project",
-                    "run this app",
-                    "run the app",
-                    "start the server",
-                    "start server",
-                    "start the app",
-                    "start this",
-                    "run this",
-                    "execute this",
-                    "how do i run",
-                    "how to run",
-                    "how to start",
-                    "npm start",
-                    "npm run dev",
-                    "python run",
-                    "uvicorn",
-                    "flask run",
-                    "django runserver",
-                    "node index",
-                    "node server",
-                    "yarn start",
-                    "yarn dev",
-                ),
-            ):
-                return IntentKind.RUN_CUSTOM_COMMAND
-
-            if _contains_any(
-                text,
-                (
-                    "explain this code",
-                    "what does this code do",
-                    "explain how this works",
-                    "help me understand this function",
-                    "what is this",
-                    "what does this",
-                    "how does this",
-                    "what is the purpose",
-                    "what are the",
-                    "describe this",
-                    "tell me about",
-                    "explain the",
-                    "what is this project",
-                    "what does this project",
-                    "what framework",
-                    "what language",
-                    "what technologies",
-                    "tech stack",
-                    "architecture",
-                ),
-            ):
-                return IntentKind.EXPLAIN_CODE
-
-            if _contains_any(
-                text,
-                (
-                    "search the code",
-                    "find usages",
-                    "grep for",
-                    "where is",
-                    "search for",
-                ),
-            ):
-                return IntentKind.SEARCH_CODE
-
-            if _contains_any(
-                text,
-                (
-                    "dockerfile",
-                    "docker-compose",
-                    "helm chart",
-                    "kubernetes",
-                    "infra",
-                    "terraform",
-                ),
-            ):
-                return IntentKind.EDIT_INFRA
-
-            if _contains_any(
-                text,
-                (
-                    "upgrade dependencies",
-                    "bump versions",
-                    "update packages",
-                    "dependency update",
-                    "update requirements.txt",
-                    "update package.json",
-                ),
-            ):
-                return IntentKind.UPDATE_DEPENDENCIES
-
-            # Deployment intents
-            if _contains_any(
-                text,
-                (
-                    "deploy",
-                    "deploy to",
-                    "deploy this",
-                    "push to production",
-                    "push to prod",
-                    "ship to",
-                    "ship it",
-                    "go live",
-                    "release to",
-                    "deploy to vercel",
-                    "deploy to railway",
-                    "deploy to fly",
-                    "deploy to netlify",
-                    "deploy to heroku",
-                    "deploy to render",
-                    "deploy to cloudflare",
-                    "deploy to aws",
-                    "deploy to gcp",
-                    "deploy to azure",
-                    "vercel deploy",
-                    "railway up",
-                    "fly deploy",
-                    "netlify deploy",
-                    "production deployment",
-                    "staging deployment",
-                ),
-            ):
-                return IntentKind.DEPLOY
-
-            if _contains_any(
-                text,
-                (
-                    "summarize this diff",
-                    "summarise this diff",
-                    "explain this diff",
-                    "explain this change",
-                ),
-            ):
-                return IntentKind.SUMMARIZE_DIFF
-
-            if "summarize file" in text or "explain this file" in text:
-                return IntentKind.SUMMARIZE_FILE
+            if _GREETING_RE.search(text) and _is_pure_greeting(text, hits):
+                return IntentKind.GREET
 
             # default engineering intent: inspect repo / context
-            return IntentKind.INSPECT_REPO
+            return _ENGINEERING_KIND_TABLE.first(hits) or IntentKind.INSPECT_REPO
 
         # Project management intents
         if family == IntentFamily.PROJECT_MANAGEMENT:
             if _is_prod_readiness_query(text):
                 return IntentKind.PROD_READINESS_AUDIT
 
-            # Check for Jira "my issues" patterns
-            if _contains_any(
-                text,
-                (
-                    "list the jira tasks assigned to me",
-                    "show my jira tickets",
-                    "my jira issues",
-                    "jira tasks assigned to me",
-                    "list my jira tasks",
-                    "show jira issues assigned to me",
-                    "what jira tickets am i currently on",
-                    "my open jira tickets",
-                ),
-            ):
-                return IntentKind.JIRA_LIST_MY_ISSUES
-
-            # Check for Linear "my issues" patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my linear issues",
-                        "linear issues assigned to me",
-                        "show my linear tasks",
-                        "list my linear issues",
-                        "linear tasks",
-                        "lin-",
-                    ),
-                )
-                and "linear" in text
-            ):
-                return (
-                    IntentKind.LIST_MY_ITEMS
-                )  # Provider detected via _detect_provider
-
-            # Check for GitLab "my MRs/issues" patterns
-            if _contains_any(
-                text,
-                (
-                    "my gitlab",
-                    "my merge requests",
-                    "my mrs",
-                    "gitlab issues assigned to me",
-                    "gitlab mrs",
-                    "gitlab merge requests",
-                    "my pipelines",
-                    "pipeline status",
-                ),
-            ) and ("gitlab" in text or "merge request" in text or " mr " in text):
-                return (
-                    IntentKind.LIST_MY_ITEMS
-                )  # Provider detected via _detect_provider
-
-            # Check for GitHub "my PRs/issues" patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my github issues",
-                        "my github prs",
-                        "github issues assigned to me",
-                        "github prs assigned to me",
-                        "my pull requests",
-                    ),
-                )
-                and "github" in text
-            ):
-                return (
-                    IntentKind.LIST_MY_ITEMS
-                )  # Provider detected via _detect_provider
-
-            # Check for Asana "my tasks" patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my asana tasks",
-                        "asana tasks assigned to me",
-                        "show my asana tasks",
-                        "list my asana tasks",
-                        "asana projects",
-                    ),
-                )
-                and "asana" in text
-            ):
-                return (
-                    IntentKind.LIST_MY_ITEMS
-                )  # Provider detected via _detect_provider
-
-            # Check for Notion "search/list" patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "search notion",
-                        "find notion",
-                        "notion pages",
-                        "my notion docs",
-                        "notion databases",
-                        "recent notion pages",
-                    ),
-                )
-                and "notion" in text
-            ):
-                return (
-                    IntentKind.LIST_MY_ITEMS
-                )  # Provider detected via _detect_provider
-
-            # Check for Trello patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my trello cards",
-                        "trello boards",
-                        "show my trello",
-                        "list trello cards",
-                        "trello tasks",
-                    ),
-                )
-                and "trello" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Monday.com patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my monday items",
-                        "monday boards",
-                        "show my monday",
-                        "list monday items",
-                        "monday tasks",
-                    ),
-                )
-                and "monday" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for ClickUp patterns
-            if _contains_any(
-                text,
-                (
-                    "my clickup tasks",
-                    "clickup spaces",
-                    "show my clickup",
-                    "list clickup tasks",
-                ),
-            ) and ("clickup" in text or "click up" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Bitbucket patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my bitbucket prs",
-                        "bitbucket repos",
-                        "show my bitbucket",
-                        "bitbucket pipelines",
-                    ),
-                )
-                and "bitbucket" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Confluence patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "search confluence",
-                        "confluence pages",
-                        "confluence spaces",
-                        "find confluence",
-                    ),
-                )
-                and "confluence" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Google Drive patterns
-            if _contains_any(
-                text,
-                (
-                    "my drive files",
-                    "google drive files",
-                    "search drive",
-                    "list drive files",
-                    "recent files",
-                ),
-            ) and ("drive" in text or "gdrive" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Figma patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "my figma files",
-                        "figma projects",
-                        "show figma",
-                        "list figma files",
-                    ),
-                )
-                and "figma" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Zoom patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "zoom recordings",
-                        "my zoom meetings",
-                        "zoom transcripts",
-                        "list zoom recordings",
-                    ),
-                )
-                and "zoom" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Loom patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "loom videos",
-                        "my loom recordings",
-                        "loom transcripts",
-                        "list loom videos",
-                    ),
-                )
-                and "loom" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Google Calendar patterns
-            if _contains_any(
-                text,
-                (
-                    "my calendar events",
-                    "today's calendar",
-                    "upcoming events",
-                    "calendar meetings",
-                    "show my calendar",
-                ),
-            ) and ("calendar" in text or "gcal" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Datadog patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "datadog monitors",
-                        "alerting monitors",
-                        "datadog incidents",
-                        "datadog dashboards",
-                        "show monitors",
-                    ),
-                )
-                and "datadog" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Sentry patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "sentry issues",
-                        "sentry errors",
-                        "sentry projects",
-                        "show sentry",
-                        "list sentry issues",
-                    ),
-                )
-                and "sentry" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for PagerDuty patterns
-            if _contains_any(
-                text,
-                (
-                    "pagerduty incidents",
-                    "who's on call",
-                    "oncall schedule",
-                    "show oncall",
-                    "pagerduty schedule",
-                ),
-            ) and ("pagerduty" in text or "oncall" in text or "on-call" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Snyk patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "snyk vulnerabilities",
-                        "snyk issues",
-                        "snyk projects",
-                        "security vulnerabilities",
-                    ),
-                )
-                and "snyk" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for SonarQube patterns
-            if _contains_any(
-                text,
-                (
-                    "sonarqube issues",
-                    "code quality issues",
-                    "quality gate status",
-                    "sonar projects",
-                ),
-            ) and ("sonarqube" in text or "sonar" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for GitHub Actions patterns
-            if _contains_any(
-                text,
-                (
-                    "github actions",
-                    "workflow runs",
-                    "action status",
-                    "list workflows",
-                ),
-            ) and ("github action" in text or "workflow" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for CircleCI patterns
-            if _contains_any(
-                text,
-                (
-                    "circleci pipelines",
-                    "circleci jobs",
-                    "circle builds",
-                    "circleci status",
-                ),
-            ) and ("circleci" in text or "circle ci" in text):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Vercel patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "vercel deployments",
-                        "vercel projects",
-                        "deployment status",
-                        "vercel preview",
-                    ),
-                )
-                and "vercel" in text
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Discord patterns
-            if (
-                _contains_any(
-                    text,
-                    (
-                        "discord channels",
-                        "discord messages",
-                        "discord servers",
-                        "show discord",
-                    ),
-                )
-                and "discord" in text
-            ):
-                return IntentKind.SUMMARIZE_CHANNEL
-
-            # Check for general "my items" across any provider
-            if _contains_any(
-                text,
-                (
-                    "my issues",
-                    "my tasks",
-                    "assigned to me",
-                    "show my",
-                    "list my",
-                    "what am i working on",
-                    "my open issues",
-                    "my open tasks",
-                ),
-            ):
-                return IntentKind.LIST_MY_ITEMS
-
-            # Check for Slack channel summary patterns
-            if _contains_any(
-                text,
-                (
-                    "summarise today's standup channel",
-                    "summarize the standup slack channel",
-                    "what happened in #standup",
-                    "show recent messages from",
-                    "what did i miss in #",
-                    "summarize slack channel",
-                    "slack standup summary",
-                    "slack messages",
-                    "recent slack",
-                ),
-            ):
-                return IntentKind.SLACK_SUMMARIZE_CHANNEL
-
-            if _contains_any(
-                text,
-                (
-                    "create ticket",
-                    "open a ticket",
-                    "file a bug",
-                    "new jira",
-                    "new story",
-                    "new issue",
-                ),
-            ):
-                return IntentKind.CREATE_TICKET
-
-            if _contains_any(
-                text,
-                (
-                    "update ticket",
-                    "update the jira",
-                    "move this to",
-                    "transition ticket",
-                ),
-            ):
-                return IntentKind.UPDATE_TICKET
-
-            if _contains_any(
-                text,
-                (
-                    "summarize the sprint",
-                    "summarize tickets",
-                    "ticket summary",
-                    "backlog summary",
-                ),
-            ):
-                return IntentKind.SUMMARIZE_TICKETS
-
-            if _contains_any(
-                text,
-                (
-                    "summarize this pr",
-                    "summarise this pr",
-                    "pr summary",
-                    "review this pr",
-                    "code review",
-                ),
-            ):
-                if "review" in text:
-                    return IntentKind.REVIEW_PR
-                return IntentKind.SUMMARIZE_PR
-
-            if _contains_any(
-                text,
-                (
-                    "release notes",
-                    "changelog",
-                    "what changed in this release",
-                ),
-            ):
-                return IntentKind.GENERATE_RELEASE_NOTES
-
-            return IntentKind.SUMMARIZE_TICKETS
+            return (
+                _PROJECT_MANAGEMENT_KIND_TABLE.first(hits)
+                or IntentKind.SUMMARIZE_TICKETS
+            )
 
         # Autonomous / orchestration intents
         if family == IntentFamily.AUTONOMOUS_ORCHESTRATION:
-            if _contains_any(
-                text,
-                (
-                    "continue previous session",
-                    "continue where we left off",
-                    "resume session",
-                ),
-            ):
-                return IntentKind.CONTINUE_SESSION
-
-            if _contains_any(
-                text,
-                (
-                    "cancel workflow",
-                    "stop the agent",
-                    "abort run",
-                ),
-            ):
-                return IntentKind.CANCEL_WORKFLOW
-
-            if _contains_any(
-                text,
-                (
-                    "nightly job",
-                    "run every day",
-                    "run every night",
-                    "schedule this task",
-                ),
-            ):
-                return IntentKind.SCHEDULED_TASK
-
-            if _contains_any(
-                text,
-                (
-                    "background job",
-                    "batch job",
-                    "bulk change",
-                    "mass update",
-                ),
-            ):
-                return IntentKind.BACKGROUND_WORKFLOW
-
-            return IntentKind.AUTONOMOUS_SESSION
+            return _AUTONOMOUS_KIND_TABLE.first(hits) or IntentKind.AUTONOMOUS_SESSION
 
         # Fallback
         return IntentKind.UNKNOWN
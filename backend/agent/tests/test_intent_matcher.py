@@ -0,0 +1,230 @@
+"""Tests for the compiled keyword matcher behind the heuristic IntentClassifier."""
+
+import time
+
+import pytest
+
+from backend.agent import intent_classifier as ic
+from backend.agent.intent_schema import (
+    AutonomyMode,
+    IntentFamily,
+    IntentKind,
+    IntentPriority,
+    Provider,
+)
+
+# Real prompts with the classification produced by the sequential-scan rules
+CORPUS = [
+    ("hi", IntentFamily.ENGINEERING, IntentKind.GREET, None),
+    ("Hello there", IntentFamily.ENGINEERING, IntentKind.GREET, None),
+    (
+        "hi, can you help with this code?",
+        IntentFamily.ENGINEERING,
+        IntentKind.INSPECT_REPO,
+        None,
+    ),
+    (
+        "Fix the TypeError in src/api/users.py when the email is missing",
+        IntentFamily.ENGINEERING,
+        IntentKind.FIX_BUG,
+        None,
+    ),
+    (
+        "Is this project production ready? Please verify the deployment end to end.",
+        IntentFamily.ENGINEERING,
+        IntentKind.PROD_READINESS_AUDIT,
+        None,
+    ),
+    (
+        "Please check the problems tab and fix all errors",
+        IntentFamily.ENGINEERING,
+        IntentKind.FIX_DIAGNOSTICS,
+        None,
+    ),
+    (
+        "Refactor the payment service and clean up the old helpers",
+        IntentFamily.ENGINEERING,
+        IntentKind.REFACTOR_CODE,
+        None,
+    ),
+    (
+        "Add a new endpoint for exporting invoices",
+        IntentFamily.ENGINEERING,
+        IntentKind.IMPLEMENT_FEATURE,
+        None,
+    ),
+    (
+        "Write tests for the billing module",
+        IntentFamily.ENGINEERING,
+        IntentKind.GENERATE_TESTS,
+        None,
+    ),
+    ("Run the tests", IntentFamily.ENGINEERING, IntentKind.RUN_TESTS, None),
+    ("run lint with ruff", IntentFamily.ENGINEERING, IntentKind.RUN_LINT, None),
+    (
+        "How do I run this project locally?",
+        IntentFamily.ENGINEERING,
+        IntentKind.RUN_CUSTOM_COMMAND,
+        None,
+    ),
+    (
+        "What framework does this project use?",
+        IntentFamily.ENGINEERING,
+        IntentKind.EXPLAIN_CODE,
+        None,
+    ),
+    (
+        "Where is the rate limiter configured?",
+        IntentFamily.ENGINEERING,
+        IntentKind.SEARCH_CODE,
+        None,
+    ),
+    (
+        "Update the Dockerfile to use python 3.12",
+        IntentFamily.ENGINEERING,
+        IntentKind.EDIT_INFRA,
+        None,
+    ),
+    (
+        "Bump versions and update requirements.txt",
+        IntentFamily.ENGINEERING,
+        IntentKind.UPDATE_DEPENDENCIES,
+        None,
+    ),
+    (
+        "Deploy this to vercel",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.SUMMARIZE_TICKETS,
+        Provider.VERCEL,
+    ),
+    ("Summarize this diff", IntentFamily.ENGINEERING, IntentKind.SUMMARIZE_DIFF, None),
+    (
+        "Show my jira tickets",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.JIRA_LIST_MY_ISSUES,
+        Provider.JIRA,
+    ),
+    (
+        "List my linear issues",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.LIST_MY_ITEMS,
+        Provider.LINEAR,
+    ),
+    (
+        "Show my gitlab merge requests",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.LIST_MY_ITEMS,
+        Provider.GITLAB,
+    ),
+    (
+        "Who's on call this week? check pagerduty",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.LIST_MY_ITEMS,
+        Provider.PAGERDUTY,
+    ),
+    (
+        "Review this PR please",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.REVIEW_PR,
+        Provider.GITHUB,
+    ),
+    (
+        "Give me a PR summary",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.SUMMARIZE_PR,
+        Provider.GITHUB,
+    ),
+    (
+        "Summarize the standup slack channel",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.SLACK_SUMMARIZE_CHANNEL,
+        Provider.SLACK,
+    ),
+    (
+        "Create ticket for the login outage, it's urgent",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.CREATE_TICKET,
+        None,
+    ),
+    (
+        "Generate release notes for v2.3",
+        IntentFamily.PROJECT_MANAGEMENT,
+        IntentKind.GENERATE_RELEASE_NOTES,
+        None,
+    ),
+    (
+        "Schedule this task to run every night with cron",
+        IntentFamily.AUTONOMOUS_ORCHESTRATION,
+        IntentKind.SCHEDULED_TASK,
+        None,
+    ),
+    (
+        "Resume session and continue where we left off via cron",
+        IntentFamily.AUTONOMOUS_ORCHESTRATION,
+        IntentKind.CONTINUE_SESSION,
+        None,
+    ),
+    (
+        "Look around the repository",
+        IntentFamily.ENGINEERING,
+        IntentKind.INSPECT_REPO,
+        None,
+    ),
+]
+
+
+@pytest.mark.parametrize("text,family,kind,provider", CORPUS)
+def test_corpus_classification(text, family, kind, provider):
+    intent = ic.classify_intent(text)
+    assert intent.family == family
+    assert intent.kind == kind
+    assert intent.slots["provider"] == (provider.value if provider else None)
+
+
+def test_matcher_finds_overlapping_and_nested_keywords():
+    hits = ic._MATCHER.hits("deploy to vercel, this debugger fails")
+
+    # Keywords sharing a start ("deploy", "deploy to", "deploy to vercel") and
+    # keywords inside other words ("bug" in "debugger", "hi" in "this")
+    assert {"deploy", "deploy to", "deploy to vercel", "vercel"} <= hits
+    assert {"debug", "bug", "hi", "fails"} <= hits
+    assert "deploy this" not in hits
+    assert all(keyword in "deploy to vercel, this debugger fails" for keyword in hits)
+
+
+def test_rule_table_honours_order_and_requirements():
+    table = ic._RuleTable(
+        [
+            ic._Rule("linear", ("lin-",), requires=("linear",)),
+            ic._Rule("tasks", ("my tasks", "lin-")),
+        ]
+    )
+    assert table.first(frozenset({"lin-", "linear"})) == "linear"
+    assert table.first(frozenset({"lin-"})) == "tasks"
+    assert table.first(frozenset({"linear"})) is None
+
+
+def test_priority_autonomy_and_workflow_hints():
+    intent = ic.classify_intent(
+        "URGENT: production down, just do it across all services overnight"
+    )
+    assert intent.priority == IntentPriority.CRITICAL
+    assert intent.workflow.autonomy_mode == AutonomyMode.AUTONOMOUS_SESSION
+    assert intent.workflow.allow_cross_repo_changes
+    assert intent.workflow.allow_long_running
+
+
+def test_classification_latency_benchmark():
+    texts = [text for text, *_ in CORPUS]
+    classifier = ic.IntentClassifier()
+    rounds = 50
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            ic._keyword_hits.cache_clear()
+            classifier.classify(text)
+    per_message = (time.perf_counter() - started) / (rounds * len(texts))
+
+    # A few tens of microseconds per message; generous bound for slow CI
+    assert per_message < 1e-3
@@ -45,6 +45,8 @@ except ImportError as exc:
         "httpx is required for LLM router. Install it with: pip install httpx"
     ) from exc
 
+from backend.services.http_client import http_client
+
 from .llm_model_registry import (
     get_registry,
     smart_auto_candidates,
@@ -947,7 +949,7 @@ class LLMRouter:
             start_time = time.time()
 
             try:
-                async with httpx.AsyncClient(timeout=self.timeout_sec) as client:
+                async with http_client(timeout=self.timeout_sec) as client:
                     response = await client.post(url, json=payload, headers=headers)
 
                     # Handle different error status codes
@@ -9,9 +9,8 @@ from typing import List, Dict, Any, Optional, Tuple, TypedDict
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-import asyncio
 import logging
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 from sqlalchemy.orm import Session
 from urllib.parse import urlparse
 import os
@@ -76,39 +75,13 @@ SECONDS_PER_MONTH = int(timedelta(days=30.44).total_seconds())
 SECONDS_PER_YEAR = int(timedelta(days=365).total_seconds())
 
 # ------------------------------------------------------------------------------
-# HTTP client management - thread-safe singleton pattern
+# HTTP client management - shared pools from backend.services.http_client
 # ------------------------------------------------------------------------------
-_async_client: Optional[httpx.AsyncClient] = None
-_client_lock: Optional[asyncio.Lock] = None
 
 
-async def get_http_client() -> httpx.AsyncClient:
-    """Get or create httpx.AsyncClient instance with thread-safe initialization"""
-    global _async_client, _client_lock
-
-    if _client_lock is None:
-        _client_lock = asyncio.Lock()
-
-    async with _client_lock:
-        if _async_client is None:
-            _async_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
-                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
-            )
-        return _async_client
-
-
-async def close_http_client():
-    """Close shared httpx client (for use in app lifespan)"""
-    global _async_client, _client_lock
-
-    if _client_lock is None:
-        _client_lock = asyncio.Lock()
-
-    async with _client_lock:
-        if _async_client is not None:
-            await _async_client.aclose()
-            _async_client = None
+async def get_http_client() -> ScopedClient:
+    """Get a client on the shared per-host httpx pools"""
+    return http_client(timeout=30.0)
 
 
 # ------------------------------------------------------------------------------
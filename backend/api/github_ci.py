@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 import httpx
+from backend.services.http_client import http_client
 import os
 import logging
 
@@ -79,7 +80,7 @@ def _resolve_token_and_base(
 
 
 async def _client(base_url: str, token: str):
-    return httpx.AsyncClient(
+    return http_client(
         base_url=base_url,
         headers={
             "Authorization": f"Bearer {token}",
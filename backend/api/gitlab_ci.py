@@ -5,6 +5,8 @@ GitLab CI pipeline control using saved connectors (or PAT from env).
 from typing import Any, Dict, Optional
 
 import httpx
+
+from backend.services.http_client import http_client
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -69,7 +71,7 @@ class GitLabStatus(BaseModel):
 
 
 async def _client(base_url: str, token: str):
-    return httpx.AsyncClient(
+    return http_client(
         base_url=base_url.rstrip("/"),
         headers={
             "Private-Token": token,
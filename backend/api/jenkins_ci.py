@@ -5,6 +5,8 @@ Jenkins CI control using saved connectors (or env JENKINS_* variables).
 from typing import Any, Dict, Optional
 
 import httpx
+
+from backend.services.http_client import http_client
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -68,7 +70,7 @@ class JenkinsStatus(BaseModel):
 
 async def _client(base_url: str, username: str, token: str):
     auth = (username, token) if username else (token, "")
-    return httpx.AsyncClient(
+    return http_client(
         base_url=base_url,
         auth=auth,
         timeout=30.0,
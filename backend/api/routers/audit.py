@@ -18,7 +18,11 @@ from sqlalchemy import select, desc
 from backend.core.db import get_db
 from backend.core.auth.deps import require_role
 from backend.core.auth.models import User, Role
-from backend.core.eventstore.service import replay, get_plan_event_count
+from backend.core.eventstore.service import (
+    replay,
+    get_plan_event_count,
+    plan_state,
+)
 from backend.core.eventstore.models import AuditLog
 from backend.core.crypto import decrypt_audit_payload, AuditEncryptionError
 
@@ -429,3 +433,24 @@ def get_plan_events_count_endpoint(
         raise HTTPException(
             status_code=500, detail=f"Failed to get event count: {str(e)}"
         )
+
+
+@router.get("/plan/{plan_id}/state")
+def get_plan_state_endpoint(
+    plan_id: str,
+    db: Session = Depends(get_db),
+    user: User = Depends(require_role(Role.VIEWER)),
+):
+    """
+    Get a plan's current state folded from its event log.
+
+    Starts from the newest snapshot, so only events after it are replayed.
+    Only returns state for events in the user's organization.
+    """
+    try:
+        state = plan_state(db, plan_id, org_key=user.org_id)
+        return {"plan_id": plan_id, **state}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to build plan state: {str(e)}"
+        )
@@ -10,7 +10,7 @@ import json
 from uuid import uuid4
 import logging
 
-import httpx
+from backend.services.http_client import http_client
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
@@ -260,7 +260,7 @@ async def _refresh_teams_token_if_needed(
         "ChannelMessage.Read.All Group.Read.All Team.ReadBasic.All"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             f"https://login.microsoftonline.com/{tenant}/oauth2/v2.0/token",
             data={
@@ -707,7 +707,7 @@ async def slack_oauth_callback(
         )
 
     redirect_uri = _oauth_redirect("/api/connectors/slack/oauth/callback")
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://slack.com/api/oauth.v2.access",
             data={
@@ -921,7 +921,7 @@ async def confluence_oauth_callback(
         )
 
     redirect_uri = _oauth_redirect("/api/connectors/confluence/oauth/callback")
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://auth.atlassian.com/oauth/token",
             json={
@@ -948,7 +948,7 @@ async def confluence_oauth_callback(
     expires_at = _expires_at_iso(token_data.get("expires_in"))
     scopes = _parse_scopes(token_data.get("scope"), delimiter=" ")
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
+    async with http_client(timeout=20.0) as client:
         res = await client.get(
             "https://api.atlassian.com/oauth/token/accessible-resources",
             headers={"Authorization": f"Bearer {access_token}"},
@@ -1051,7 +1051,7 @@ async def confluence_subscribe(
     if payload.space_key:
         webhook_payload["filters"] = {"space_key": [payload.space_key]}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             f"{base_url}/rest/api/webhook",
             headers={
@@ -1181,7 +1181,7 @@ async def teams_oauth_callback(
         "ChannelMessage.Read.All Group.Read.All Team.ReadBasic.All"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             f"https://login.microsoftonline.com/{tenant}/oauth2/v2.0/token",
             data={
@@ -1353,7 +1353,7 @@ async def teams_subscribe(
         f"/teams/{payload.team_id}/channels/{payload.channel_id}/messages"
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://graph.microsoft.com/v1.0/subscriptions",
             headers={
@@ -1483,7 +1483,7 @@ async def github_oauth_callback(
         )
 
     redirect_uri = _oauth_redirect("/api/connectors/github/oauth/callback")
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://github.com/login/oauth/access_token",
             data={
@@ -1519,7 +1519,7 @@ async def github_oauth_callback(
 
     # Validate token with /user
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        async with http_client(timeout=20.0) as client:
             user_resp = await client.get(
                 "https://api.github.com/user",
                 headers={
@@ -1605,7 +1605,7 @@ async def github_list_repos(
     if not token:
         raise HTTPException(status_code=404, detail="GitHub connector not configured")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.get(
             f"{base_url}/user/repos",
             headers={
@@ -1655,7 +1655,7 @@ async def _ensure_github_webhook(
         "Accept": "application/vnd.github+json",
         "User-Agent": "AutonomousEngineeringPlatform/1.0",
     }
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         hooks = await client.get(
             f"{api_base}/repos/{repo_full_name}/hooks",
             headers=headers,
@@ -1741,7 +1741,7 @@ async def github_index_repo(
         raise HTTPException(status_code=404, detail="GitHub token not found")
 
     # Ensure repo row exists for webhook lookups
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         repo_resp = await client.get(
             f"{base_url}/repos/{payload.repo_full_name}",
             headers={
@@ -1859,7 +1859,7 @@ async def zoom_oauth_callback(
     )
     basic_auth = base64.b64encode(auth_bytes).decode("utf-8")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://zoom.us/oauth/token",
             params={
@@ -1884,7 +1884,7 @@ async def zoom_oauth_callback(
 
     account_id = data.get("account_id")
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        async with http_client(timeout=20.0) as client:
             me_resp = await client.get(
                 "https://api.zoom.us/v2/users/me",
                 headers={"Authorization": f"Bearer {access_token}"},
@@ -2038,7 +2038,7 @@ async def meet_oauth_callback(
         )
 
     redirect_uri = _oauth_redirect("/api/connectors/meet/oauth/callback")
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://oauth2.googleapis.com/token",
             data={
@@ -2363,7 +2363,7 @@ async def gitlab_oauth_callback(
     gitlab_base = settings.gitlab_base_url or "https://gitlab.com"
     redirect_uri = _oauth_redirect("/api/connectors/gitlab/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             f"{gitlab_base}/oauth/token",
             data={
@@ -2390,7 +2390,7 @@ async def gitlab_oauth_callback(
 
     # Validate token
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        async with http_client(timeout=20.0) as client:
             user_resp = await client.get(
                 f"{gitlab_base}/api/v4/user",
                 headers={"Authorization": f"Bearer {access_token}"},
@@ -2602,7 +2602,7 @@ async def linear_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/linear/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://api.linear.app/oauth/token",
             data={
@@ -2834,7 +2834,7 @@ async def notion_oauth_callback(
     )
     basic_auth = base64.b64encode(auth_bytes).decode("utf-8")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://api.notion.com/v1/oauth/token",
             json={
@@ -3094,7 +3094,7 @@ async def bitbucket_oauth_callback(
     )
     basic_auth = base64.b64encode(auth_bytes).decode("utf-8")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(
             "https://bitbucket.org/site/oauth2/access_token",
             data={
@@ -3344,7 +3344,7 @@ async def jira_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/jira/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://auth.atlassian.com/oauth/token",
             json={
@@ -3370,7 +3370,7 @@ async def jira_oauth_callback(
     scopes = _parse_scopes(data.get("scope"), delimiter=" ")
 
     # Get accessible resources
-    async with httpx.AsyncClient(timeout=20.0) as client:
+    async with http_client(timeout=20.0) as client:
         res = await client.get(
             "https://api.atlassian.com/oauth/token/accessible-resources",
             headers={"Authorization": f"Bearer {access_token}"},
@@ -3498,7 +3498,7 @@ async def discord_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/discord/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://discord.com/api/oauth2/token",
             data={
@@ -3637,7 +3637,7 @@ async def figma_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/figma/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://www.figma.com/api/oauth/token",
             data={
@@ -3771,7 +3771,7 @@ async def asana_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/asana/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://app.asana.com/-/oauth_token",
             data={
@@ -3920,7 +3920,7 @@ async def trello_oauth_callback(
         fallback_scopes=settings.trello_oauth_scopes,
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.get(
             "https://api.trello.com/1/members/me",
             params={"key": oauth_cfg["client_id"], "token": token},
@@ -4033,7 +4033,7 @@ async def monday_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/monday/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://auth.monday.com/oauth2/token",
             data={
@@ -4159,7 +4159,7 @@ async def clickup_oauth_callback(
         fallback_scopes=settings.clickup_oauth_scopes,
     )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://api.clickup.com/api/v2/oauth/token",
             params={
@@ -4291,7 +4291,7 @@ async def circleci_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/circleci/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://circleci.com/oauth2/token",
             data={
@@ -4426,7 +4426,7 @@ async def vercel_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/vercel/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://api.vercel.com/v2/oauth/access_token",
             data={
@@ -4561,7 +4561,7 @@ async def sentry_oauth_callback(
 
     redirect_uri = _oauth_redirect("/api/connectors/sentry/oauth/callback")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         token_resp = await client.post(
             "https://sentry.io/oauth/token/",
             data={
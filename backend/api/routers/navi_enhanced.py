@@ -12,12 +12,15 @@ These endpoints enhance NAVI's "world-class pair programmer" capabilities.
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 import logging
 
 # Import services
 from backend.services.workspace_rag import (
     index_workspace,
+    update_workspace_index,
+    watch_workspace,
+    unwatch_workspace,
     search_codebase,
     get_context_for_task,
     get_index,
@@ -61,6 +64,20 @@ class IndexWorkspaceRequest(BaseModel):
     force_reindex: bool = Field(default=False, description="Force re-indexing")
 
 
+class UpdateWorkspaceRequest(BaseModel):
+    workspace_path: str = Field(..., description="Path to workspace")
+    changed_files: Optional[List[str]] = Field(
+        default=None,
+        description="Created, modified or deleted files (None = scan the workspace)",
+    )
+
+
+class WatchWorkspaceRequest(BaseModel):
+    workspace_path: str = Field(..., description="Path to workspace")
+    enabled: bool = Field(default=True, description="Start or stop watching")
+    interval_seconds: float = Field(default=5.0, ge=1.0, description="Poll interval")
+
+
 class SearchCodebaseRequest(BaseModel):
     workspace_path: str = Field(..., description="Path to workspace")
     query: str = Field(..., description="Search query")
@@ -163,6 +180,42 @@ async def index_workspace_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/rag/update")
+async def update_workspace_endpoint(request: UpdateWorkspaceRequest):
+    """
+    Incrementally update a workspace index.
+
+    The IDE extension sends the files it saw change; only those files are
+    re-parsed and re-embedded. Without a file list the workspace is diffed
+    against the index by size, mtime and content hash.
+    """
+    try:
+        result = await update_workspace_index(
+            request.workspace_path,
+            changed_files=request.changed_files,
+        )
+
+        return {
+            "status": "updated",
+            "index": result,
+        }
+
+    except Exception as e:
+        logger.error(f"Index update error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/rag/watch")
+async def watch_workspace_endpoint(request: WatchWorkspaceRequest):
+    """Start or stop keeping a workspace index fresh in the background"""
+    if request.enabled:
+        watch_workspace(request.workspace_path, interval=request.interval_seconds)
+        return {"watching": True}
+
+    await unwatch_workspace(request.workspace_path)
+    return {"watching": False}
+
+
 @router.post("/rag/search")
 async def search_codebase_endpoint(request: SearchCodebaseRequest):
     """
@@ -19,6 +19,7 @@ from backend.core.rate_limit.config import (
     PREMIUM_RATE_LIMITS,
 )
 from backend.core.rate_limit.metrics import rate_limit_metrics
+from backend.core.rate_limit.routes import reload_overrides
 from backend.core.rate_limit.service import rate_limit_service
 
 logger = logging.getLogger(__name__)
@@ -111,6 +112,20 @@ async def reset_rate_limit_stats(
     return {"message": "Rate limiting statistics reset successfully"}
 
 
+@router.post("/overrides/reload")
+async def reload_rate_limit_overrides(
+    user: User = Depends(require_role(Role.ADMIN)),
+) -> Dict[str, str]:
+    """
+    Reload per-endpoint rate limit overrides.
+
+    Admin-only endpoint to re-read the RL_* override environment
+    variables without restarting the server.
+    """
+    reload_overrides()
+    return {"message": "Rate limit overrides reloaded successfully"}
+
+
 @router.get("/quotas", response_model=List[RateLimitQuotaResponse])
 async def get_rate_limit_quotas(
     user: User = Depends(require_role(Role.ADMIN)),
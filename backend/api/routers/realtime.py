@@ -8,7 +8,8 @@ from datetime import datetime, timezone
 
 from typing import Generator, AsyncGenerator, Dict, Any
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -21,6 +22,7 @@ from backend.core.middleware import AuditMiddleware
 from backend.core.middleware import RateLimitMiddleware
 from backend.core.middleware import RequestIDMiddleware
 from backend.core.db import get_db, SessionLocal
+from backend.infra.broadcast.redis import RedisBroadcaster
 from backend.services import meetings as svc
 from backend.services import answers as asvc
 from backend.workers.answers import generate_answer
@@ -30,7 +32,8 @@ ANSWER_GENERATION_INTERVAL = 3  # Generate answer every N captions
 
 # Constants for SSE streaming
 SSE_MAX_DURATION_SECONDS = 3600  # Maximum duration for SSE streams (1 hour)
-SSE_POLL_INTERVAL_SECONDS = 1  # Polling interval for new answers in SSE streams
+SSE_KEEPALIVE_SECONDS = 15  # Idle interval before an SSE keepalive comment
+SSE_LIVE_QUEUE_SIZE = 100  # Live answers buffered per stream while backfill runs
 
 # Constants for rate limiting
 REALTIME_API_RPM = 120  # Requests per minute for realtime API
@@ -125,13 +128,25 @@ def get_redis_client() -> redis.Redis:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def get_answer_broadcaster() -> RedisBroadcaster:
+    """Get the broadcaster that answer workers publish new answers to.
+
+    Pinned to ``settings.redis_url`` (the Dramatiq broker URL) because the
+    workers publish from another process, so an in-memory broadcaster would
+    never see their messages. One shared pub/sub connection serves every
+    SSE stream in the process.
+    """
+    return RedisBroadcaster(settings.redis_url)
+
+
 # Context manager for database sessions in streaming contexts
 @contextmanager
 def db_session() -> Generator[Session, None, None]:
     """Context manager for database sessions with automatic cleanup.
 
-    Used specifically for SSE streaming where we need shorter-lived sessions
-    per poll cycle rather than dependency injection. This is complementary
+    Used specifically for SSE streaming where we need a short-lived session
+    for the backfill query rather than dependency injection. This is complementary
     to get_db() which is used for FastAPI dependency injection.
 
     Yields:
@@ -175,20 +190,6 @@ def _extract_timestamp_from_row(row: Dict[str, Any]) -> str | None:
     return None
 
 
-def _convert_timestamp_to_iso(timestamp: datetime | str | None) -> str | None:
-    """Convert datetime or string timestamp to ISO format string.
-
-    Args:
-        timestamp: Datetime object, ISO string, or None
-
-    Returns:
-        ISO formatted timestamp string or input if already string/None
-    """
-    if isinstance(timestamp, datetime):
-        return timestamp.isoformat()
-    return timestamp
-
-
 app = FastAPI(title=f"{settings.app_name} - Realtime API")
 
 dev_origins = [
@@ -530,107 +531,160 @@ def get_answers(
     return {"answers": asvc.recent_answers(db, session_id, since_ts=since)}
 
 
-def _check_stream_timeout(start_time: datetime) -> bool:
-    """Check if SSE stream has exceeded maximum duration.
+def _stream_time_remaining(start_time: datetime) -> float:
+    """Seconds left before an SSE stream reaches its maximum duration.
 
     Args:
         start_time: When the stream started
 
     Returns:
-        True if timeout exceeded
+        Remaining seconds (zero or negative once the limit is exceeded)
     """
     elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
-    return elapsed > SSE_MAX_DURATION_SECONDS
+    return SSE_MAX_DURATION_SECONDS - elapsed
+
+
+def _format_answer_event(row: Dict[str, Any]) -> str:
+    """Format an answer as an SSE event whose id is its ISO timestamp.
+
+    Clients send the id back as Last-Event-ID on reconnect, which becomes the
+    lower bound of the resume backfill.
+    """
+    ts = _extract_timestamp_from_row(row)
+    prefix = f"id: {ts}\n" if ts else ""
+    return prefix + _format_sse_data(row)
 
 
-def _emit_new_answers(
-    db: Session, session_id: str, last_ts: datetime | str | None
-) -> tuple[list[Dict[str, Any]], str | None]:
-    """Emit new answers and return updated timestamp.
+def _backfill_answers(session_id: str, since_ts: str | None) -> list[Dict[str, Any]]:
+    """Load answers a client has not seen yet.
 
     Args:
-        db: Database session
         session_id: Session identifier
-        last_ts: Last timestamp processed. Can be:
-                 - datetime object (will be converted to ISO string)
-                 - ISO string (passed through as-is)
-                 - None (no filtering applied)
+        since_ts: ISO timestamp of the last answer the client received, or
+                  None for a fresh connection
 
     Returns:
-        Tuple of (new_rows, updated_last_ts as ISO string)
+        Answers in chronological order (oldest first). Rows without
+        'created_at' are skipped, as is the row at ``since_ts`` itself since
+        ``recent_answers`` filters inclusively.
     """
-    # Convert datetime to string for the API call (handles both datetime and str inputs)
-    since_ts = _convert_timestamp_to_iso(last_ts)
-    rows = asvc.recent_answers(db, session_id, since_ts=since_ts)
-
-    # Filter out rows with missing or null 'created_at' to prevent infinite loops
-    if rows:
-        # Filter and extract timestamps in one pass to avoid redundant calls
-        filtered_rows_with_timestamps = []
-        for row in rows:
-            ts = _extract_timestamp_from_row(row)
-            if ts:
-                filtered_rows_with_timestamps.append((row, ts))
-        if filtered_rows_with_timestamps:
-            filtered_rows, timestamps = zip(*filtered_rows_with_timestamps)
-            last_timestamp = timestamps[-1]  # Get timestamp of last row
-            return list(filtered_rows), last_timestamp
-        else:
-            # All rows have missing timestamps - log warning for data integrity issue
+    with db_session() as db:
+        rows = asvc.recent_answers(db, session_id, since_ts=since_ts)
+    backfill = []
+    for row in rows:
+        ts = _extract_timestamp_from_row(row)
+        if ts is None:
             logger.warning(
-                "All recent answer rows for session %s are missing or have null 'created_at'. "
-                "Skipping rows and not updating last_ts. This may indicate a data integrity issue "
-                "in the session_answer table. Preventing infinite polling by not updating last_ts.",
+                "Skipping answer %s for session %s with missing 'created_at'",
+                row.get("id"),
                 session_id,
             )
-            # Do not update last_ts; return previous last_ts to avoid infinite polling
-            return [], _convert_timestamp_to_iso(last_ts)
+            continue
+        if since_ts is not None and ts == since_ts:
+            continue
+        backfill.append(row)
+    return backfill
+
+
+def _resume_timestamp(request: Request, since: str | None) -> str | None:
+    """Resolve the resume point (Last-Event-ID header has precedence over ?since=)."""
+    resume_ts = request.headers.get("Last-Event-ID") or since
+    if not resume_ts:
+        return None
+    try:
+        asvc.parse_iso_timestamp(resume_ts)
+    except ValueError:
+        logger.warning("Ignoring invalid SSE resume timestamp: %r", resume_ts[:64])
+        return None
+    return resume_ts
+
+
+async def _pump_answers(
+    channel: str, queue: "asyncio.Queue[str]", subscribed: asyncio.Event
+) -> None:
+    """Forward live answer messages from the broadcaster into a stream's queue.
+
+    ``subscribed`` is set once Redis has confirmed the channel subscription.
+    """
+    async for msg in get_answer_broadcaster().subscribe(channel, subscribed):
+        await queue.put(msg)
+
 
-    return [], _convert_timestamp_to_iso(last_ts)
+async def _wait_subscribed(pump: asyncio.Task, subscribed: asyncio.Event) -> None:
+    """Wait until the pump's subscription is live; re-raise if the pump failed."""
+    waiter = asyncio.create_task(subscribed.wait())
+    try:
+        await asyncio.wait({pump, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+    if not subscribed.is_set():
+        pump.result()
 
 
 @app.get("/api/sessions/{session_id}/stream")
-def stream_answers(session_id: str) -> StreamingResponse:
+async def stream_answers(
+    session_id: str, request: Request, since: str | None = None
+) -> StreamingResponse:
     """Server-Sent Events stream of real-time answers.
 
     Args:
         session_id: Session identifier
+        request: Incoming request (for the Last-Event-ID header)
+        since: Optional ISO timestamp to resume after when no Last-Event-ID is sent
 
     Returns:
         SSE stream that emits new answers as they're generated
 
     Note:
-        Stream will continue until client disconnects or max duration is reached.
-        Uses short-lived database sessions for each poll to prevent connection exhaustion.
+        Answers are pushed by the answer worker through the broadcaster; the
+        database is read once per connection (backfill on connect or resume),
+        not once per client per poll interval. Stream continues until the
+        client disconnects or max duration is reached.
     """
-    last_ts = None
+    resume_ts = _resume_timestamp(request, since)
+    channel = asvc.answer_channel(session_id)
 
     async def event_stream() -> AsyncGenerator[str, None]:
-        nonlocal last_ts
         start_time = datetime.now(timezone.utc)
-        # Use connection pooling for read-only SSE streaming
-
+        live: asyncio.Queue[str] = asyncio.Queue(maxsize=SSE_LIVE_QUEUE_SIZE)
+        # Subscribe before the backfill query so answers saved while it runs
+        # are not lost; overlap between the two is removed by answer id
+        subscribed = asyncio.Event()
+        pump = asyncio.create_task(_pump_answers(channel, live, subscribed))
         try:
-            # Short-lived sessions are preferred for SSE streams to prevent resource leaks
-            # and connection pool exhaustion with 100+ concurrent streams. Session overhead
-            # is minimal compared to long-held connections in streaming contexts.
-            # Poll continuously until timeout or client disconnect
+            await _wait_subscribed(pump, subscribed)
+            backfilled = await run_in_threadpool(
+                _backfill_answers, session_id, resume_ts
+            )
+            seen = {row["id"] for row in backfilled}
+            for row in backfilled:
+                yield _format_answer_event(row)
+
             while True:
-                # Check if max duration exceeded
-                if _check_stream_timeout(start_time):
+                remaining = _stream_time_remaining(start_time)
+                if remaining <= 0:
                     yield _format_sse_data({"event": "timeout"})
                     break
+                try:
+                    msg = await asyncio.wait_for(
+                        live.get(), timeout=min(remaining, SSE_KEEPALIVE_SECONDS)
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
 
-                # Use short-lived database session for each query to prevent resource exhaustion
-                with db_session() as db:
-                    # Query for new answers and emit them
-                    rows, last_ts = _emit_new_answers(db, session_id, last_ts)
-
-                    # Emit in chronological order (oldest first)
-                    for r in rows:
-                        yield _format_sse_data(r)
-
-                await asyncio.sleep(SSE_POLL_INTERVAL_SECONDS)
+                try:
+                    row = json.loads(msg)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Dropping malformed answer message for session %s", session_id
+                    )
+                    continue
+                if row.get("id") in seen:
+                    # Already sent by the backfill; later ids cannot collide
+                    seen.discard(row["id"])
+                    continue
+                yield _format_answer_event(row)
         except asyncio.CancelledError:
             # Client disconnected - clean shutdown
             logger.info(
@@ -646,6 +700,8 @@ def stream_answers(session_id: str) -> StreamingResponse:
                     "session_id": session_id,
                 }
             )
+        finally:
+            pump.cancel()
 
     return StreamingResponse(event_stream(), media_type="text/event-stream")
 
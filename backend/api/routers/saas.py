@@ -959,6 +959,8 @@ async def get_usage_stats(
             "input_tokens": summary.total_input_tokens,
             "output_tokens": summary.total_output_tokens,
             "total_tokens": summary.total_tokens,
+            "cache_read_tokens": summary.total_cache_read_tokens,
+            "cache_write_tokens": summary.total_cache_write_tokens,
             "cost": f"${summary.total_cost:.4f}",
         },
         "averages": {
@@ -19,7 +19,7 @@ import fnmatch
 import ast
 from pathlib import Path
 from typing import TYPE_CHECKING
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 import git
 from sqlalchemy.orm import Session
 from sqlalchemy import select
@@ -617,7 +617,7 @@ class EnhancedAutonomousCodingEngine:
                     try:
                         decrypted_token = decrypt_token(connection.access_token)
 
-                        async with httpx.AsyncClient(
+                        async with http_client(
                             auth=(connection.user_id or "unknown", decrypted_token),
                             timeout=30,
                         ) as client:
@@ -872,7 +872,7 @@ class EnhancedAutonomousCodingEngine:
         return ""
 
     async def _fetch_jira_comments(
-        self, client: httpx.AsyncClient, base_url: str, issue_key: str
+        self, client: ScopedClient, base_url: str, issue_key: str
     ) -> List[Dict[str, Any]]:
         """Fetch comments for a JIRA issue"""
         try:
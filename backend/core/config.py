@@ -504,22 +504,63 @@ class Settings(BaseSettings):
     vector_db_path: str = "./data/vector_store"
 
     # Vector search backend configuration (PR-16)
-    # Options: pgvector (production, PostgreSQL), faiss (experimental), json (fallback, linear scan)
+    # Options: pgvector (production, PostgreSQL), local-ann (in-process IVF index; "faiss" is an alias),
+    # json (fallback, linear scan)
     vector_backend: str = "pgvector"
     # NOTE: embed_dim must match the actual embedding model's output dimension and must be kept in sync with the EMBED_DIM environment variable used in database migrations.
     embed_dim: int = 1536  # Embedding dimension (OpenAI text-embedding-ada-002 default)
+    # memory_chunk.embedding storage codec: float32 (lossless) | float16 | int8 (quantized)
+    embedding_storage_format: str = "float32"
     pgvector_index: str = "hnsw"  # Options: hnsw | ivfflat
     bm25_enabled: bool = True  # Enable BM25/FTS hybrid ranking
+    bm25_k1: float = 1.2  # In-process BM25 term-frequency saturation (non-PostgreSQL)
+    bm25_b: float = 0.75  # In-process BM25 length normalization (0 = none, 1 = full)
     faiss_index_path: str = "./data/faiss/index.faiss"  # FAISS index file path
+    ann_ivf_threshold: int = 20000  # Vectors per org before local-ann trains IVF
+    ann_nprobe: int = 8  # IVF clusters scanned per local-ann query (recall vs speed)
 
     # NAVI Memory System Configuration
     embedding_model: str = "text-embedding-3-small"  # OpenAI embedding model
     embedding_dimensions: int = 1536  # Embedding vector dimensions
     memory_cache_ttl: int = 3600  # Memory cache TTL in seconds
     memory_index_batch_size: int = 100  # Batch size for codebase indexing
+    search_ingest_batch_size: int = 100  # Documents per BulkIndexer commit
+    search_embed_token_budget: int = 100000  # Max est. tokens per embedding request
     memory_max_context_items: int = 10  # Max items to include in context
     memory_min_similarity: float = 0.5  # Minimum similarity for search results
 
+    # Shared embedding cache (backend/services/embedding_cache.py)
+    embedding_cache_memory_bytes: int = 256 * 1024 * 1024  # In-process LRU byte budget
+    embedding_cache_redis_enabled: bool = True  # Use redis_url as the shared tier
+    embedding_cache_redis_ttl: int = 7 * 24 * 3600  # Redis entry TTL in seconds
+    # Persistent tier ("" disables)
+    embedding_cache_db_url: str = "sqlite:///./data/embedding_cache.db"
+
+    # Workspace RAG index snapshots and resident cache (workspace_rag.py)
+    workspace_snapshot_dir: str = "data/workspace_indexes"  # "" disables snapshots
+    workspace_index_cache_bytes: int = 1024 * 1024 * 1024  # Resident index budget
+
+    # Shared outbound HTTP client pools (backend/services/http_client.py)
+    http_client_max_connections: int = 64  # Concurrent connections per provider/host
+    http_client_max_keepalive: int = 32  # Idle connections kept per provider/host
+    http_client_keepalive_expiry: float = 90.0  # Seconds an idle connection is kept
+    http_client_http2: bool = False  # Requires the optional "h2" package
+
+    # NAVI routing trace sink (backend/services/trace_store.py)
+    trace_store_queue_size: int = 10000  # Queued events; overflow is dropped
+    trace_store_flush_interval_sec: float = 1.0  # Max delay before a write
+    trace_store_flush_batch_size: int = 512  # Queued events that trigger an early write
+    trace_store_rotate_bytes: int = 64 * 1024 * 1024  # Rotate segments at this size
+    trace_store_rotate_interval_sec: float = 24 * 3600  # ...or at this age (0 disables)
+    trace_store_compression: str = "gzip"  # gzip | zstd (needs "zstandard") | none
+    trace_store_max_segments: int = 0  # Rotated segments kept (0 = keep all)
+
+    # Agent conversation compaction (backend/services/context_compaction.py)
+    context_budget_tokens: int = 100000  # Token budget for an agent's message history
+    context_high_watermark: float = 0.8  # Compact once history exceeds this share...
+    context_low_watermark: float = 0.6  # ...down to this share of the budget
+    context_keep_recent: int = 6  # Newest messages never elided or summarized
+
     # MCP (Model Context Protocol) Server Configuration
     mcp_enabled: bool = True  # Enable MCP server
     mcp_server_name: str = "navi-tools"  # MCP server name
@@ -0,0 +1,77 @@
+"""
+In-process ring buffer of recently committed plan events
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+from .models import PlanEvent
+
+
+class RecentEventBuffer:
+    """
+    Last N committed events per plan, for the most recently written plans.
+
+    Only events committed by this process are recorded, so a lookup is given
+    the plan's current last sequence number and answers only when it holds
+    every event up to it; otherwise the caller falls back to the database.
+    """
+
+    def __init__(self, per_plan: int, max_plans: int) -> None:
+        self._per_plan = max(1, per_plan)
+        self._max_plans = max(1, max_plans)
+        self._plans: OrderedDict[str, list[PlanEvent]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, events: Iterable[PlanEvent]) -> None:
+        """Record committed events (any order, any plans)."""
+        with self._lock:
+            for evt in events:
+                buf = self._plans.get(evt.plan_id)
+                if buf is None:
+                    buf = self._plans[evt.plan_id] = []
+                self._plans.move_to_end(evt.plan_id)
+                # Concurrent transactions may commit out of sequence order
+                seqs = [e.seq for e in buf]
+                pos = bisect.bisect_left(seqs, evt.seq)
+                if pos < len(buf) and buf[pos].seq == evt.seq:
+                    continue
+                buf.insert(pos, evt)
+                if len(buf) > self._per_plan:
+                    del buf[: len(buf) - self._per_plan]
+            while len(self._plans) > self._max_plans:
+                self._plans.popitem(last=False)
+
+    def since(
+        self, plan_id: str, since_seq: int, last_seq: int
+    ) -> list[PlanEvent] | None:
+        """
+        Events with seq in (since_seq, last_seq], or None if any are missing.
+        """
+        if since_seq >= last_seq:
+            return []
+        with self._lock:
+            buf = self._plans.get(plan_id)
+            if not buf:
+                return None
+            seqs = [e.seq for e in buf]
+            lo = bisect.bisect_right(seqs, since_seq)
+            hi = bisect.bisect_right(seqs, last_seq)
+            window = buf[lo:hi]
+        # Buffered seqs are unique, so a full window is exactly contiguous
+        if len(window) != last_seq - since_seq or window[0].seq != since_seq + 1:
+            return None
+        return window
+
+    def discard(self, plan_id: str) -> None:
+        """Forget a plan's buffered events."""
+        with self._lock:
+            self._plans.pop(plan_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
@@ -42,6 +42,42 @@ class PlanEvent(Base):
     )
 
 
+class PlanEventCounter(Base):
+    """
+    Last allocated event sequence number per plan.
+
+    Sequence numbers are reserved by incrementing this row, so appends do not
+    scan plan_events for max(seq) and a batch reserves its range in one update.
+    """
+
+    __tablename__ = "plan_event_counters"
+
+    plan_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    last_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class PlanSnapshot(Base):
+    """
+    Folded plan state as of a given event sequence number.
+
+    Written every PLAN_EVENT_SNAPSHOT_INTERVAL events so state can be rebuilt
+    from the newest snapshot plus the events after it.
+    """
+
+    __tablename__ = "plan_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    plan_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    state: Mapped[dict] = mapped_column(JSON, nullable=False)
+    org_key: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+
+    __table_args__ = (Index("ix_snapshots_plan_seq", "plan_id", "seq", unique=True),)
+
+
 class AuditLog(Base):
     """
     Enhanced audit trail for security and forensics.
@@ -3,43 +3,176 @@ Event Store Service for appending and replaying plan events
 """
 
 from __future__ import annotations
+import copy
+from typing import Any, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, text
-from .models import PlanEvent
+from sqlalchemy import event, select, func, text
+from backend.core.settings import settings
+from .buffer import RecentEventBuffer
+from .models import PlanEvent, PlanEventCounter, PlanSnapshot
 
 _CLEARED_TEST_PLANS: set[str] = set()
 
+# Events flushed by a session, moved to the buffer once it commits
+_PENDING_KEY = "plan_events_pending"
 
-def next_seq(session: Session, plan_id: str) -> int:
-    """Get the next sequence number for a plan, using PostgreSQL advisory locks for proper concurrency control."""
-    # Use PostgreSQL's built-in hashtext function for collision-resistant hashing
-    # This ensures even the first insert for a new plan is properly serialized
+recent_events = RecentEventBuffer(
+    settings.PLAN_EVENT_BUFFER_SIZE, settings.PLAN_EVENT_BUFFER_PLANS
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _buffer_committed_events(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        recent_events.add(pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted_events(session: Session, transaction) -> None:
+    # Runs after after_commit, so anything left was rolled back or discarded
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
 
-    # Acquire advisory lock for this plan_id (automatically released at transaction end)
-    # Skip advisory locks for SQLite (not supported).
+
+def _prepare_sqlite_test_tables(session: Session, plan_id: str) -> None:
+    """Create event store tables and reset the plan once per pytest run (SQLite only)."""
+    from os import getenv
+
+    if not getenv("PYTEST_CURRENT_TEST"):
+        return
     bind = session.get_bind()
+    for table in (
+        PlanEvent.__table__,
+        PlanEventCounter.__table__,
+        PlanSnapshot.__table__,
+    ):
+        table.create(bind=bind, checkfirst=True)
+    if plan_id not in _CLEARED_TEST_PLANS:
+        for table in (
+            PlanEvent.__table__,
+            PlanEventCounter.__table__,
+            PlanSnapshot.__table__,
+        ):
+            session.execute(table.delete().where(table.c.plan_id == plan_id))
+        recent_events.discard(plan_id)
+        _CLEARED_TEST_PLANS.add(plan_id)
+
+
+def allocate_seqs(session: Session, plan_id: str, count: int = 1) -> int:
+    """
+    Reserve ``count`` consecutive sequence numbers for a plan.
+
+    Increments the plan's counter row, which stays locked until the
+    transaction ends, so concurrent writers get disjoint ranges and a rolled
+    back transaction leaves no gap. The counter is seeded from max(seq) the
+    first time a plan is seen.
+
+    Returns:
+        The last reserved sequence number; the range is
+        ``last - count + 1 .. last``.
+    """
+    bind = session.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        last = session.execute(
+            text(
+                "UPDATE plan_event_counters SET last_seq = last_seq + :n "
+                "WHERE plan_id = :plan_id RETURNING last_seq"
+            ),
+            {"plan_id": plan_id, "n": count},
+        ).scalar()
+        if last is None:
+            last = session.execute(
+                text(
+                    "INSERT INTO plan_event_counters (plan_id, last_seq) "
+                    "SELECT :plan_id, COALESCE(MAX(seq), 0) + :n "
+                    "FROM plan_events WHERE plan_id = :plan_id "
+                    "ON CONFLICT (plan_id) DO UPDATE "
+                    "SET last_seq = plan_event_counters.last_seq + :n "
+                    "RETURNING last_seq"
+                ),
+                {"plan_id": plan_id, "n": count},
+            ).scalar()
+        return int(last)
+
+    # SQLite and other single-writer databases
     if bind is not None and bind.dialect.name == "sqlite":
-        # Ensure table exists in test mode
-        from os import getenv
-
-        if getenv("PYTEST_CURRENT_TEST"):
-            PlanEvent.__table__.create(bind=bind, checkfirst=True)
-            if plan_id not in _CLEARED_TEST_PLANS:
-                session.execute(
-                    PlanEvent.__table__.delete().where(PlanEvent.plan_id == plan_id)
-                )
-                _CLEARED_TEST_PLANS.add(plan_id)
-    if bind is not None and bind.dialect.name != "sqlite":
-        session.execute(
-            text("SELECT pg_advisory_xact_lock(hashtext(:plan_id))"),
-            {"plan_id": plan_id},
+        _prepare_sqlite_test_tables(session, plan_id)
+    counter = session.get(PlanEventCounter, plan_id)
+    if counter is None:
+        seeded = session.execute(
+            select(func.max(PlanEvent.seq)).where(PlanEvent.plan_id == plan_id)
+        ).scalar()
+        counter = PlanEventCounter(plan_id=plan_id, last_seq=int(seeded or 0))
+        session.add(counter)
+    counter.last_seq += count
+    session.flush()
+    return counter.last_seq
+
+
+def next_seq(session: Session, plan_id: str) -> int:
+    """Reserve and return the next sequence number for a plan."""
+    return allocate_seqs(session, plan_id, 1)
+
+
+def append_events(
+    session: Session,
+    *,
+    plan_id: str,
+    events: Sequence[tuple[str, dict]],
+    user_sub: str | None,
+    org_key: str | None,
+) -> list[PlanEvent]:
+    """
+    Append several events to a plan's log with one sequence allocation.
+
+    Args:
+        session: Database session
+        plan_id: Plan identifier
+        events: (type, payload) pairs in the order they happened
+        user_sub: User subject who triggered the events
+        org_key: Organization key for the events
+
+    Returns:
+        The created PlanEvents in sequence order
+    """
+    if not events:
+        return []
+    last = allocate_seqs(session, plan_id, len(events))
+    first = last - len(events) + 1
+    rows = [
+        PlanEvent(
+            plan_id=plan_id,
+            seq=first + i,
+            type=type,
+            payload=payload,
+            user_sub=user_sub,
+            org_key=org_key,
         )
+        for i, (type, payload) in enumerate(events)
+    ]
+    session.add_all(rows)
+    session.flush()  # Get the IDs immediately
 
-    # Now safely get the max sequence number
-    last = session.execute(
-        select(func.max(PlanEvent.seq)).where(PlanEvent.plan_id == plan_id)
-    ).scalar()
-    return 1 if last is None else int(last) + 1
+    # Detached copies: the ORM rows are expired by the commit that buffers them
+    session.info.setdefault(_PENDING_KEY, []).extend(
+        PlanEvent(
+            id=r.id,
+            plan_id=r.plan_id,
+            seq=r.seq,
+            type=r.type,
+            payload=r.payload,
+            user_sub=r.user_sub,
+            org_key=r.org_key,
+            created_at=r.created_at,
+        )
+        for r in rows
+    )
+
+    interval = settings.PLAN_EVENT_SNAPSHOT_INTERVAL
+    if interval > 0 and (first - 1) // interval != last // interval:
+        write_snapshot(session, plan_id=plan_id, org_key=org_key)
+    return rows
 
 
 def append_event(
@@ -65,18 +198,20 @@ def append_event(
     Returns:
         The created PlanEvent
     """
-    seq = next_seq(session, plan_id)
-    evt = PlanEvent(
+    return append_events(
+        session,
         plan_id=plan_id,
-        seq=seq,
-        type=type,
-        payload=payload,
+        events=[(type, payload)],
         user_sub=user_sub,
         org_key=org_key,
-    )
-    session.add(evt)
-    session.flush()  # Get the ID immediately
-    return evt
+    )[0]
+
+
+def _last_seq(session: Session, plan_id: str) -> int | None:
+    """Current last sequence number from the counter row (primary-key lookup)."""
+    return session.execute(
+        select(PlanEventCounter.last_seq).where(PlanEventCounter.plan_id == plan_id)
+    ).scalar()
 
 
 def replay(
@@ -90,6 +225,10 @@ def replay(
     """
     Replay events for a plan in sequence order.
 
+    Resumes (``since_seq`` set) are served from the in-process buffer when it
+    holds every event after ``since_seq``; checking that costs one counter
+    row lookup instead of a plan_events range scan.
+
     Args:
         session: Database session
         plan_id: Plan identifier
@@ -100,6 +239,15 @@ def replay(
     Returns:
         List of PlanEvent objects in sequence order
     """
+    if since_seq is not None:
+        last = _last_seq(session, plan_id)
+        if last is not None:
+            buffered = recent_events.since(plan_id, since_seq, last)
+            if buffered is not None:
+                if org_key is not None:
+                    buffered = [e for e in buffered if e.org_key in (org_key, None)]
+                return buffered[:limit]
+
     q = select(PlanEvent).where(PlanEvent.plan_id == plan_id)
     if since_seq is not None:
         q = q.where(PlanEvent.seq > since_seq)
@@ -111,6 +259,74 @@ def replay(
     return list(rows)
 
 
+def fold_event(state: dict[str, Any], evt: PlanEvent) -> dict[str, Any]:
+    """
+    Apply one event to a plan state dict (mutates and returns it).
+
+    Steps and notes are kept in order, 'archive' marks the plan archived, and
+    every other type is only counted.
+    """
+    if evt.type == "step":
+        state["steps"].append(evt.payload)
+    elif evt.type == "note":
+        state["notes"].append(evt.payload)
+    elif evt.type == "archive":
+        state["archived"] = True
+    counts = state["event_counts"]
+    counts[evt.type] = counts.get(evt.type, 0) + 1
+    state["seq"] = evt.seq
+    return state
+
+
+def _empty_state() -> dict[str, Any]:
+    return {"seq": 0, "steps": [], "notes": [], "archived": False, "event_counts": {}}
+
+
+def latest_snapshot(
+    session: Session, plan_id: str, org_key: str | None = None
+) -> PlanSnapshot | None:
+    """Newest snapshot for a plan (filtered by org like ``replay``)."""
+    q = select(PlanSnapshot).where(PlanSnapshot.plan_id == plan_id)
+    if org_key is not None:
+        q = q.where(
+            (PlanSnapshot.org_key == org_key) | (PlanSnapshot.org_key.is_(None))
+        )
+    q = q.order_by(PlanSnapshot.seq.desc()).limit(1)
+    return session.execute(q).scalars().first()
+
+
+def plan_state(
+    session: Session, plan_id: str, org_key: str | None = None
+) -> dict[str, Any]:
+    """
+    Rebuild a plan's current state from its newest snapshot plus later events.
+
+    Returns:
+        State dict with seq, steps, notes, archived and event_counts
+    """
+    snap = latest_snapshot(session, plan_id, org_key)
+    state = copy.deepcopy(snap.state) if snap is not None else _empty_state()
+    q = select(PlanEvent).where(PlanEvent.plan_id == plan_id)
+    if snap is not None:
+        q = q.where(PlanEvent.seq > snap.seq)
+    if org_key is not None:
+        q = q.where((PlanEvent.org_key == org_key) | (PlanEvent.org_key.is_(None)))
+    for evt in session.execute(q.order_by(PlanEvent.seq.asc())).scalars():
+        fold_event(state, evt)
+    return state
+
+
+def write_snapshot(
+    session: Session, *, plan_id: str, org_key: str | None = None
+) -> PlanSnapshot:
+    """Persist the plan's current state (including flushed events) as a snapshot."""
+    state = plan_state(session, plan_id)
+    snap = PlanSnapshot(plan_id=plan_id, seq=state["seq"], state=state, org_key=org_key)
+    session.add(snap)
+    session.flush()
+    return snap
+
+
 def get_plan_event_count(session: Session, plan_id: str) -> int:
     """Get the total number of events for a plan"""
     count = session.execute(
@@ -65,11 +65,11 @@ async def on_startup():
 
 
 async def on_shutdown():
-    # graceful close of httpx client
+    # graceful close of the shared outbound httpx pools
     try:
-        from ...api.chat import close_http_client
+        from ...services.http_client import close_http_clients
 
-        await close_http_client()
+        await close_http_clients()
     except Exception:
         # Ignore httpx client cleanup errors during shutdown - non-critical
         pass
@@ -9,12 +9,13 @@ Provides enterprise-grade performance capabilities:
 - Connection pooling and resource management
 """
 
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
 import json
+import time
 import uuid
 from abc import ABC, abstractmethod
 import logging
@@ -126,8 +127,8 @@ class Job:
                 if data.get("completed_at")
                 else None
             ),
-            retry_count=data.get("retry_count", 0),
-            max_retries=data.get("max_retries", 3),
+            retry_count=int(data.get("retry_count", 0)),
+            max_retries=int(data.get("max_retries", 3)),
         )
 
         return cls(
@@ -156,8 +157,12 @@ class JobQueue(ABC):
         pass
 
     @abstractmethod
-    async def dequeue(self, job_type: Optional[str] = None) -> Optional[Job]:
-        """Get next job from queue"""
+    async def dequeue(
+        self,
+        job_type: Optional[Union[str, Sequence[str]]] = None,
+        timeout: float = 0.0,
+    ) -> Optional[Job]:
+        """Get next job from queue, waiting up to ``timeout`` seconds for one"""
         pass
 
     @abstractmethod
@@ -181,36 +186,323 @@ class JobQueue(ABC):
         """Get queue statistics for organization"""
         pass
 
+    async def heartbeat(self, job_id: str) -> bool:
+        """Extend the lease of a job being processed (False if it was lost)"""
+        return True
+
+    async def reclaim_expired(self) -> int:
+        """Requeue jobs whose lease expired; returns the number reclaimed"""
+        return 0
+
+
+DEFAULT_LEASE_SECONDS = 300.0
+
+# Shared Lua helpers. Scores are formatted with %.17g because Lua's default
+# number formatting keeps only 14 significant digits.
+_QUEUE_LUA_LIB = """
+local BAND = 1e13
+local ORG_BAND = 1e12
+
+local function fmt(x)
+  return string.format('%.17g', x)
+end
+
+local function band_of(priority)
+  if priority == 'critical' then return 0 end
+  if priority == 'high' then return 1 end
+  if priority == 'low' then return 3 end
+  return 2
+end
+
+-- Re-score an org in the type's org index from the head of its ready queue
+local function reschedule(p, jtype, org)
+  local ready = p .. ':ready:' .. jtype .. ':' .. org
+  local orgs = p .. ':orgs:' .. jtype
+  local head = redis.call('ZRANGE', ready, 0, 0, 'WITHSCORES')
+  if #head == 0 then
+    redis.call('ZREM', orgs, org)
+    return
+  end
+  local band = math.floor(tonumber(head[2]) / BAND)
+  local vtimes = p .. ':vtime:' .. jtype
+  local vt = tonumber(redis.call('HGET', vtimes, org) or '0')
+  local clock = tonumber(redis.call('GET', p .. ':vclock:' .. jtype) or '0')
+  if vt < clock then
+    -- Orgs returning from idle start at the current virtual time
+    vt = clock
+    redis.call('HSET', vtimes, org, fmt(vt))
+  end
+  redis.call('ZADD', orgs, fmt(band * ORG_BAND + vt), org)
+end
+
+local function remove_ready(p, jtype, org, job_id)
+  local ready = p .. ':ready:' .. jtype .. ':' .. org
+  if redis.call('ZREM', ready, job_id) == 1 then
+    redis.call('HINCRBY', p .. ':stats:' .. org, 'pending', -1)
+    reschedule(p, jtype, org)
+  end
+end
+
+-- Add a job to its ready queue (front = ahead of its priority band)
+local function push_ready(p, dp, job_id, front)
+  local f = redis.call('HMGET', dp .. ':' .. job_id, 'type', 'org_id', 'priority')
+  local jtype, org = f[1], f[2]
+  if not jtype or not org then return 0 end
+  local seq = 0
+  if not front then seq = redis.call('INCR', p .. ':seq') end
+  local ready = p .. ':ready:' .. jtype .. ':' .. org
+  if redis.call('ZADD', ready, fmt(band_of(f[3]) * BAND + seq), job_id) == 1 then
+    redis.call('HINCRBY', p .. ':stats:' .. org, 'pending', 1)
+  end
+  redis.call('SADD', p .. ':types', jtype)
+  reschedule(p, jtype, org)
+  local signal = p .. ':signal:' .. jtype
+  redis.call('LPUSH', signal, '1')
+  redis.call('LTRIM', signal, 0, 999)
+  return 1
+end
+"""
 
-class RedisJobQueue(JobQueue):
-    """Redis-based job queue implementation"""
+# ARGV: prefix, data prefix, job id, due epoch ('' = ready now), field pairs...
+_ENQUEUE_LUA = (
+    _QUEUE_LUA_LIB
+    + """
+local p, dp, job_id, due = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+local key = dp .. ':' .. job_id
+for i = 5, #ARGV, 2 do
+  redis.call('HSET', key, ARGV[i], ARGV[i + 1])
+end
+local f = redis.call('HMGET', key, 'type', 'org_id')
+local stats = p .. ':stats:' .. f[2]
+if redis.call('ZREM', p .. ':leases', job_id) == 1 then
+  redis.call('HINCRBY', stats, 'processing', -1)
+end
+if due ~= '' then
+  remove_ready(p, f[1], f[2], job_id)
+  if redis.call('ZADD', p .. ':delayed', due, job_id) == 1 then
+    redis.call('HINCRBY', stats, 'delayed', 1)
+  end
+else
+  if redis.call('ZREM', p .. ':delayed', job_id) == 1 then
+    redis.call('HINCRBY', stats, 'delayed', -1)
+  end
+  push_ready(p, dp, job_id, false)
+end
+return 1
+"""
+)
+
+# ARGV: prefix, data prefix, now, lease seconds, job types...
+# Picks the best (priority band, org virtual time) head across the types
+_DEQUEUE_LUA = (
+    _QUEUE_LUA_LIB
+    + """
+local p, dp = ARGV[1], ARGV[2]
+local now, lease = tonumber(ARGV[3]), tonumber(ARGV[4])
+local best_type, best_org, best_score
+for i = 5, #ARGV do
+  local top = redis.call('ZRANGE', p .. ':orgs:' .. ARGV[i], 0, 0, 'WITHSCORES')
+  if #top > 0 and (best_score == nil or tonumber(top[2]) < best_score) then
+    best_type, best_org, best_score = ARGV[i], top[1], tonumber(top[2])
+  end
+end
+if best_type == nil then return nil end
+
+local popped = redis.call('ZPOPMIN', p .. ':ready:' .. best_type .. ':' .. best_org)
+if #popped == 0 then
+  redis.call('ZREM', p .. ':orgs:' .. best_type, best_org)
+  return nil
+end
+local job_id = popped[1]
+
+-- Weighted fair queueing: each job advances the org by 1 / weight
+local vtimes = p .. ':vtime:' .. best_type
+local vt = tonumber(redis.call('HGET', vtimes, best_org) or '0')
+local weight = tonumber(redis.call('HGET', p .. ':weights', best_org) or '1')
+if weight == nil or weight <= 0 then weight = 1 end
+redis.call('SET', p .. ':vclock:' .. best_type, fmt(vt))
+redis.call('HSET', vtimes, best_org, fmt(vt + 1 / weight))
+reschedule(p, best_type, best_org)
+
+local stats = p .. ':stats:' .. best_org
+redis.call('HINCRBY', stats, 'pending', -1)
+local key = dp .. ':' .. job_id
+if redis.call('EXISTS', key) == 0 then return nil end
+redis.call('ZADD', p .. ':leases', fmt(now + lease), job_id)
+redis.call('HINCRBY', stats, 'processing', 1)
+redis.call('HSET', key, 'status', 'processing')
+redis.call('HINCRBY', key, 'attempts', 1)
+return redis.call('HGETALL', key)
+"""
+)
+
+# ARGV: prefix, data prefix, job id, final counter ('' = not final), field pairs...
+_UPDATE_LUA = (
+    _QUEUE_LUA_LIB
+    + """
+local p, dp, job_id, final = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+local key = dp .. ':' .. job_id
+if redis.call('EXISTS', key) == 0 then return 0 end
+for i = 5, #ARGV, 2 do
+  redis.call('HSET', key, ARGV[i], ARGV[i + 1])
+end
+if final ~= '' then
+  local f = redis.call('HMGET', key, 'type', 'org_id')
+  local stats = p .. ':stats:' .. f[2]
+  if redis.call('ZREM', p .. ':leases', job_id) == 1 then
+    redis.call('HINCRBY', stats, 'processing', -1)
+  end
+  if redis.call('ZREM', p .. ':delayed', job_id) == 1 then
+    redis.call('HINCRBY', stats, 'delayed', -1)
+  end
+  remove_ready(p, f[1], f[2], job_id)
+  redis.call('HINCRBY', stats, final, 1)
+end
+return 1
+"""
+)
+
+# ARGV: prefix, data prefix, now, batch size
+# Returns {promoted count, next due epoch or ''}
+_PROMOTE_LUA = (
+    _QUEUE_LUA_LIB
+    + """
+local p, dp, now = ARGV[1], ARGV[2], ARGV[3]
+local delayed = p .. ':delayed'
+local due = redis.call('ZRANGEBYSCORE', delayed, '-inf', now, 'LIMIT', 0, tonumber(ARGV[4]))
+for _, job_id in ipairs(due) do
+  redis.call('ZREM', delayed, job_id)
+  local org = redis.call('HGET', dp .. ':' .. job_id, 'org_id')
+  if org then
+    redis.call('HINCRBY', p .. ':stats:' .. org, 'delayed', -1)
+    push_ready(p, dp, job_id, false)
+  end
+end
+local nxt = redis.call('ZRANGE', delayed, 0, 0, 'WITHSCORES')
+if #nxt == 0 then return {#due, ''} end
+return {#due, nxt[2]}
+"""
+)
+
+# ARGV: prefix, data prefix, now, batch size
+# Expired leases go back to the front of their band, or fail once a job has
+# used up its attempts (a job that keeps killing its worker)
+_RECLAIM_LUA = (
+    _QUEUE_LUA_LIB
+    + """
+local p, dp, now = ARGV[1], ARGV[2], ARGV[3]
+local leases = p .. ':leases'
+local expired = redis.call('ZRANGEBYSCORE', leases, '-inf', now, 'LIMIT', 0, tonumber(ARGV[4]))
+for _, job_id in ipairs(expired) do
+  redis.call('ZREM', leases, job_id)
+  local key = dp .. ':' .. job_id
+  local f = redis.call('HMGET', key, 'org_id', 'attempts', 'max_retries')
+  if f[1] then
+    local stats = p .. ':stats:' .. f[1]
+    redis.call('HINCRBY', stats, 'processing', -1)
+    if tonumber(f[2] or '0') > tonumber(f[3] or '3') then
+      redis.call('HSET', key, 'status', 'failed', 'error_message', 'Lease expired too many times')
+      redis.call('HINCRBY', stats, 'failed', 1)
+    else
+      redis.call('HSET', key, 'status', 'pending')
+      push_ready(p, dp, job_id, true)
+    end
+  end
+end
+return #expired
+"""
+)
+
+_FINAL_STATUS_COUNTERS = {
+    JobStatus.COMPLETED: "completed",
+    JobStatus.FAILED: "failed",
+    JobStatus.CANCELLED: "cancelled",
+}
+
+_QUEUE_STAT_FIELDS = (
+    "pending",
+    "delayed",
+    "processing",
+    "completed",
+    "failed",
+    "cancelled",
+)
+
+
+def _flatten_fields(fields: Dict[str, Any]) -> List[str]:
+    """HSET argument pairs, skipping None (Redis hashes cannot store it)"""
+    args: List[str] = []
+    for key, value in fields.items():
+        if value is not None:
+            args.extend((key, str(value)))
+    return args
+
+
+def _tenant_context_for(job_data: Dict[str, Any]) -> TenantContext:
+    # Would fetch roles/permissions from the database
+    return TenantContext(
+        org_id=job_data["org_id"],
+        user_id=job_data["user_id"],
+        roles=[],
+        permissions=[],
+        session_id=str(uuid.uuid4()),
+        encryption_key_id=f"org-{job_data['org_id']}-key",
+    )
 
-    def __init__(self, redis_client):
+
+class RedisJobQueue(JobQueue):
+    """
+    Redis-based priority job queue with leases and per-org fairness.
+
+    Each job type keeps one ready ZSET per org, scored by priority band and
+    an enqueue sequence (FIFO within a priority), plus an org index scored
+    by (head priority band, org virtual time). Dequeue takes the best org
+    head across the requested types, advances that org's virtual time by
+    1 / weight, and leases the job until ``lease_seconds`` from now. Workers
+    extend leases with ``heartbeat``; ``reclaim_expired`` puts jobs from
+    dead workers back on the queue. Jobs with a future ``scheduled_for``
+    wait in a delayed ZSET until they are due.
+
+    Every state change runs as one Lua script, so transitions are atomic and
+    per-org counters for ``get_queue_stats`` stay consistent. Keys are built
+    inside the scripts, so this targets a single (non-cluster) Redis.
+    """
+
+    def __init__(self, redis_client, lease_seconds: float = DEFAULT_LEASE_SECONDS):
         self.redis = redis_client
         self.queue_key = "navi:jobs"
-        self.processing_key = "navi:processing"
         self.job_data_key = "navi:job_data"
+        self.lease_seconds = lease_seconds
+        self.batch_size = 100
+        self._enqueue = redis_client.register_script(_ENQUEUE_LUA)
+        self._dequeue = redis_client.register_script(_DEQUEUE_LUA)
+        self._update = redis_client.register_script(_UPDATE_LUA)
+        self._promote = redis_client.register_script(_PROMOTE_LUA)
+        self._reclaim = redis_client.register_script(_RECLAIM_LUA)
 
-    async def enqueue(self, job: Job) -> bool:
-        """Add job to Redis queue"""
-        try:
-            # Store job data
-            await self.redis.hset(
-                f"{self.job_data_key}:{job.id}", mapping=job.to_dict()
-            )
+    def _signal_key(self, job_type: str) -> str:
+        return f"{self.queue_key}:signal:{job_type}"
 
-            # Add to priority queue
-            priority_scores = {
-                JobPriority.LOW: 1,
-                JobPriority.NORMAL: 2,
-                JobPriority.HIGH: 3,
-                JobPriority.CRITICAL: 4,
-            }
+    def _stats_key(self, org_id: str) -> str:
+        return f"{self.queue_key}:stats:{org_id}"
 
-            queue_name = f"{self.queue_key}:{job.type}"
-            score = priority_scores[job.priority]
+    async def set_org_weight(self, org_id: str, weight: float) -> None:
+        """Give an org a larger (or smaller) share of workers than the default 1"""
+        await self.redis.hset(f"{self.queue_key}:weights", org_id, str(weight))
 
-            await self.redis.zadd(queue_name, {job.id: score})
+    async def enqueue(self, job: Job) -> bool:
+        """Add job to its ready queue, or to the delayed set if scheduled later"""
+        try:
+            due = ""
+            if job.scheduled_for:
+                delay = (job.scheduled_for - datetime.utcnow()).total_seconds()
+                if delay > 0:
+                    due = repr(time.time() + delay)
+
+            await self._enqueue(
+                args=[self.queue_key, self.job_data_key, job.id, due]
+                + _flatten_fields(job.to_dict())
+            )
 
             logger.info(
                 f"Enqueued job {job.id} of type {job.type} for org {job.context.org_id}"
@@ -221,46 +513,99 @@ class RedisJobQueue(JobQueue):
             logger.error(f"Failed to enqueue job {job.id}: {e}")
             return False
 
-    async def dequeue(self, job_type: Optional[str] = None) -> Optional[Job]:
-        """Get highest priority job from queue"""
-        try:
-            if job_type:
-                queue_name = f"{self.queue_key}:{job_type}"
-                result = await self.redis.zpopmax(queue_name)
-            else:
-                # Get from any queue (would need more complex logic)
-                result = await self.redis.zpopmax(f"{self.queue_key}:*")
-
-            if not result:
-                return None
+    async def _job_types(self, job_type) -> List[str]:
+        if isinstance(job_type, str):
+            return [job_type]
+        if job_type:
+            return list(job_type)
+        return sorted(await self.redis.smembers(f"{self.queue_key}:types"))
+
+    async def promote_due(self) -> Optional[float]:
+        """Move due delayed jobs to their ready queues; returns the next due time"""
+        _, next_due = await self._promote(
+            args=[self.queue_key, self.job_data_key, repr(time.time()), self.batch_size]
+        )
+        return float(next_due) if next_due else None
 
-            job_id, _ = result[0]
+    async def dequeue(
+        self,
+        job_type: Optional[Union[str, Sequence[str]]] = None,
+        timeout: float = 0.0,
+    ) -> Optional[Job]:
+        """
+        Lease the next job of the given type(s) (default: every known type).
+
+        With ``timeout`` > 0, blocks on the types' signal lists until a job
+        is enqueued, a delayed job comes due, or the timeout passes.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                types = await self._job_types(job_type)
+                next_due = await self.promote_due()
+                job_data = None
+                if types:
+                    job_data = await self._dequeue(
+                        args=[
+                            self.queue_key,
+                            self.job_data_key,
+                            repr(time.time()),
+                            self.lease_seconds,
+                            *types,
+                        ]
+                    )
+                if job_data:
+                    data = dict(zip(job_data[::2], job_data[1::2]))
+                    return Job.from_dict(data, _tenant_context_for(data))
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                if next_due is not None:
+                    remaining = min(remaining, max(0.01, next_due - time.time()))
+                if types:
+                    await self.redis.blpop(
+                        [self._signal_key(t) for t in types], timeout=remaining
+                    )
+                else:
+                    # Nothing has been enqueued yet, so there is no list to block on
+                    await asyncio.sleep(min(remaining, 1.0))
 
-            # Get job data
-            job_data = await self.redis.hgetall(f"{self.job_data_key}:{job_id}")
-            if not job_data:
-                return None
+        except Exception as e:
+            logger.error(f"Failed to dequeue job: {e}")
+            return None
 
-            # Create tenant context for job execution
-            tenant_context = TenantContext(
-                org_id=job_data["org_id"],
-                user_id=job_data["user_id"],
-                roles=[],  # Would fetch from database
-                permissions=[],
-                session_id=str(uuid.uuid4()),
-                encryption_key_id=f"org-{job_data['org_id']}-key",
+    async def heartbeat(self, job_id: str) -> bool:
+        """Extend a job's lease; False if it expired and was reclaimed"""
+        try:
+            updated = await self.redis.zadd(
+                f"{self.queue_key}:leases",
+                {job_id: time.time() + self.lease_seconds},
+                xx=True,
+                ch=True,
             )
+            return bool(updated)
+        except Exception as e:
+            logger.error(f"Failed to extend lease for job {job_id}: {e}")
+            return False
 
-            job = Job.from_dict(job_data, tenant_context)
-
-            # Mark as processing
-            await self.redis.sadd(self.processing_key, job_id)
-
-            return job
-
+    async def reclaim_expired(self) -> int:
+        """Requeue jobs whose worker stopped heartbeating"""
+        try:
+            reclaimed = await self._reclaim(
+                args=[
+                    self.queue_key,
+                    self.job_data_key,
+                    repr(time.time()),
+                    self.batch_size,
+                ]
+            )
+            if reclaimed:
+                logger.warning(f"Reclaimed {reclaimed} jobs with expired leases")
+            return int(reclaimed)
         except Exception as e:
-            logger.error(f"Failed to dequeue job: {e}")
-            return None
+            logger.error(f"Failed to reclaim expired jobs: {e}")
+            return 0
 
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID"""
@@ -269,17 +614,7 @@ class RedisJobQueue(JobQueue):
             if not job_data:
                 return None
 
-            # Would create proper tenant context
-            tenant_context = TenantContext(
-                org_id=job_data["org_id"],
-                user_id=job_data["user_id"],
-                roles=[],
-                permissions=[],
-                session_id=str(uuid.uuid4()),
-                encryption_key_id=f"org-{job_data['org_id']}-key",
-            )
-
-            return Job.from_dict(job_data, tenant_context)
+            return Job.from_dict(job_data, _tenant_context_for(job_data))
 
         except Exception as e:
             logger.error(f"Failed to get job {job_id}: {e}")
@@ -292,7 +627,7 @@ class RedisJobQueue(JobQueue):
         error_message: Optional[str] = None,
         result: Optional[Dict[str, Any]] = None,
     ) -> bool:
-        """Update job status in Redis"""
+        """Update job status; final statuses also release the job's lease"""
         try:
             updates = {
                 "status": status.value,
@@ -301,24 +636,20 @@ class RedisJobQueue(JobQueue):
                     if status in [JobStatus.COMPLETED, JobStatus.FAILED]
                     else None
                 ),
+                "error_message": error_message or None,
+                "result": json.dumps(result) if result else None,
             }
 
-            if error_message:
-                updates["error_message"] = error_message
-
-            if result:
-                updates["result"] = json.dumps(result)
-
-            # Remove None values
-            updates = {k: v for k, v in updates.items() if v is not None}
-
-            await self.redis.hmset(f"{self.job_data_key}:{job_id}", updates)
-
-            # Remove from processing set if completed
-            if status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                await self.redis.srem(self.processing_key, job_id)
-
-            return True
+            updated = await self._update(
+                args=[
+                    self.queue_key,
+                    self.job_data_key,
+                    job_id,
+                    _FINAL_STATUS_COUNTERS.get(status, ""),
+                ]
+                + _flatten_fields(updates)
+            )
+            return bool(updated)
 
         except Exception as e:
             logger.error(f"Failed to update job {job_id}: {e}")
@@ -327,11 +658,8 @@ class RedisJobQueue(JobQueue):
     async def get_queue_stats(self, org_id: str) -> Dict[str, int]:
         """Get queue statistics for organization"""
         try:
-            # This is a simplified version
-            # Would need to scan through job data to filter by org_id
-            stats = {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
-
-            return stats
+            raw = await self.redis.hgetall(self._stats_key(org_id))
+            return {name: int(raw.get(name, 0)) for name in _QUEUE_STAT_FIELDS}
 
         except Exception as e:
             logger.error(f"Failed to get queue stats: {e}")
@@ -410,33 +738,70 @@ class CacheManager:
 
 
 class BackgroundWorker:
-    """Background worker for job processing"""
+    """
+    Background worker for job processing.
+
+    Runs ``concurrency`` consumers that block on the queue for the handled
+    job types, plus a maintenance loop that requeues jobs whose lease
+    expired (their worker died mid-job).
+    """
 
-    def __init__(self, job_queue: JobQueue, job_handlers: Dict[str, Callable]):
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        job_handlers: Dict[str, Callable],
+        concurrency: int = 4,
+        poll_timeout: float = 5.0,
+    ):
         self.job_queue = job_queue
         self.job_handlers = job_handlers
+        self.concurrency = max(1, concurrency)
+        self.poll_timeout = poll_timeout
+        self.lease_seconds = getattr(job_queue, "lease_seconds", DEFAULT_LEASE_SECONDS)
         self.running = False
 
     async def start(self):
         """Start background worker"""
         self.running = True
-        logger.info("Background worker started")
+        logger.info(f"Background worker started with {self.concurrency} consumers")
+
+        await asyncio.gather(
+            *(self._consume() for _ in range(self.concurrency)),
+            self._maintain(),
+        )
 
+    async def _consume(self):
+        job_types = list(self.job_handlers)
         while self.running:
             try:
-                # Get next job
-                job = await self.job_queue.dequeue()
-                if not job:
-                    await asyncio.sleep(1)  # Wait before checking again
-                    continue
-
-                # Process job
-                await self._process_job(job)
+                # Blocks until a job is ready, so idle workers do not poll
+                job = await self.job_queue.dequeue(job_types, timeout=self.poll_timeout)
+                if job:
+                    await self._process_job(job)
 
             except Exception as e:
                 logger.error(f"Worker error: {e}")
                 await asyncio.sleep(5)  # Wait on error
 
+    async def _maintain(self):
+        interval = max(1.0, self.lease_seconds / 2)
+        while self.running:
+            await self.job_queue.reclaim_expired()
+            # Sleep in short steps so stop() is noticed promptly
+            slept = 0.0
+            while self.running and slept < interval:
+                step = min(self.poll_timeout, interval - slept)
+                await asyncio.sleep(step)
+                slept += step
+
+    async def _heartbeat(self, job_id: str):
+        interval = max(0.1, self.lease_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            if not await self.job_queue.heartbeat(job_id):
+                logger.warning(f"Lost lease for job {job_id}")
+                return
+
     def stop(self):
         """Stop background worker"""
         self.running = False
@@ -459,8 +824,12 @@ class BackgroundWorker:
             if not handler:
                 raise ValueError(f"No handler found for job type: {job.type}")
 
-            # Execute job
-            result = await handler(job.payload)
+            # Execute job, keeping its lease alive while the handler runs
+            heartbeat = asyncio.create_task(self._heartbeat(job.id))
+            try:
+                result = await handler(job.payload)
+            finally:
+                heartbeat.cancel()
 
             # Mark as completed
             job.context.completed_at = datetime.utcnow()
@@ -0,0 +1,258 @@
+"""
+Atomic Redis rate limiting engine.
+
+Evaluates every limit that applies to a request (user minute/hour, org
+minute/hour and the org queue depth) inside one Lua script, so a check is a
+single EVALSHA round trip and concurrent requests cannot all pass before
+any of them is counted.
+
+Limits use GCRA (generic cell rate algorithm): each limit stores one
+"theoretical arrival time" (TAT) in milliseconds. A limit of N requests per
+period P admits a request when, after adding the emission interval P/N, the
+TAT is at most ``capacity * P/N`` ahead of now. This is a smooth sliding
+limit with a burst capacity, not a fixed window that resets on the minute.
+Time comes from Redis (TIME), so all application instances share one clock.
+
+Org limits scale with the org's active users, counted with a Redis
+HyperLogLog (PFADD/PFCOUNT, ~12KB per org regardless of size) over a
+rolling window of two RATE_LIMITING_ACTIVE_USER_WINDOW_SEC buckets. Every
+checked request and every presence heartbeat marks its user active, and
+the count is read inside the same script call.
+
+Hot keys are micro-batched: checks for the same user/org/category issued in
+the same event-loop iteration (or within RATE_LIMITING_BATCH_WINDOW_MS) are
+coalesced into one script call that admits as many of them as the limits
+allow.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from backend.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# KEYS: 1 user minute TAT, 2 user hour TAT, 3 org minute TAT, 4 org hour TAT,
+#       5 queue list, 6 current active-user HLL, 7 previous active-user HLL
+# ARGV: 1 requests to admit, 2-9 (interval_ms, capacity) per TAT key (org
+#       limits are per active user and scaled by the HLL count),
+#       10 queue depth limit, 11 queue member, 12 queue TTL seconds,
+#       13 completed requests to release from the queue,
+#       14 HLL TTL seconds, 15 minimum active users, 16+ users seen active
+# Returns: {admitted, remaining, reset_ms, retry_after_ms, queue_depth,
+#           active_users}
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local count = tonumber(ARGV[1])
+local queue_limit = tonumber(ARGV[10])
+local release = tonumber(ARGV[13])
+
+for _ = 1, release do
+  if not redis.call('RPOP', KEYS[5]) then break end
+end
+
+redis.call('PFADD', KEYS[6], unpack(ARGV, 16))
+redis.call('EXPIRE', KEYS[6], tonumber(ARGV[14]))
+local active = math.max(tonumber(ARGV[15]), redis.call('PFCOUNT', KEYS[6], KEYS[7]))
+
+local tats, intervals, capacities = {}, {}, {}
+for i = 1, 4 do
+  intervals[i] = tonumber(ARGV[2 * i])
+  capacities[i] = tonumber(ARGV[2 * i + 1])
+  if i > 2 then
+    intervals[i] = intervals[i] / active
+    capacities[i] = capacities[i] * active
+  end
+  local tat = tonumber(redis.call('GET', KEYS[i]) or '0')
+  if tat < now then tat = now end
+  tats[i] = tat
+end
+
+local depth = redis.call('LLEN', KEYS[5])
+local admitted = 0
+local retry_after = 0
+while admitted < count do
+  if depth + admitted >= queue_limit then
+    retry_after = 1000
+    break
+  end
+  local wait = 0
+  for i = 1, 4 do
+    local over = tats[i] + intervals[i] - now - intervals[i] * capacities[i]
+    if over > wait then wait = over end
+  end
+  if wait > 0 then
+    retry_after = wait
+    break
+  end
+  for i = 1, 4 do tats[i] = tats[i] + intervals[i] end
+  admitted = admitted + 1
+end
+
+if admitted > 0 then
+  for i = 1, 4 do
+    redis.call('SET', KEYS[i], tostring(tats[i]), 'PX', math.max(1, math.ceil(tats[i] - now)))
+  end
+  for _ = 1, admitted do redis.call('LPUSH', KEYS[5], ARGV[11]) end
+  redis.call('LTRIM', KEYS[5], 0, queue_limit - 1)
+  redis.call('EXPIRE', KEYS[5], tonumber(ARGV[12]))
+end
+
+local remaining = math.floor((intervals[1] * capacities[1] - (tats[1] - now)) / intervals[1])
+return {admitted, math.max(0, remaining), math.ceil(tats[1] - now), math.ceil(retry_after), depth + admitted, active}
+"""
+
+# Seconds an idle queue list is kept
+QUEUE_TTL_SECONDS = 300
+
+# Presence heartbeats buffered per org between checks (extra ones are dropped;
+# the users are counted on their own next request)
+MAX_PENDING_ACTIVE_USERS = 1000
+
+
+@dataclass(frozen=True)
+class LimitSpec:
+    """One GCRA limit: ``capacity`` requests per ``period_seconds``"""
+
+    requests: int
+    period_seconds: int
+    capacity: int
+
+    @property
+    def interval_ms(self) -> float:
+        return self.period_seconds * 1000.0 / max(1, self.requests)
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of one script call for ``count`` coalesced checks"""
+
+    admitted: int
+    remaining: int
+    reset_ms: int
+    retry_after_ms: int
+    queue_depth: int
+    active_users: int
+
+
+class GcraRateLimiter:
+    """Single-round-trip GCRA limiter with hot-key micro-batching."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._script = redis.register_script(GCRA_SCRIPT)
+        self._pending: Dict[Tuple, List[asyncio.Future]] = {}
+        self._pending_releases: Dict[str, int] = {}
+        self._pending_active: Dict[str, Set[str]] = {}
+
+    def release(self, queue_key: str) -> None:
+        """Record a completed request; applied by the next check on the queue
+
+        Piggybacking releases keeps completion off the network. Queue lists
+        of idle keys expire after QUEUE_TTL_SECONDS.
+        """
+        self._pending_releases[queue_key] = self._pending_releases.get(queue_key, 0) + 1
+
+    def note_active(self, org_id: str, user_id: str) -> None:
+        """Record a user seen active outside a rate-limited request
+
+        Added to the org's active-user HLL by the next check for that org.
+        """
+        users = self._pending_active.setdefault(org_id, set())
+        if len(users) < MAX_PENDING_ACTIVE_USERS:
+            users.add(user_id)
+
+    async def check(
+        self,
+        keys: Sequence[str],
+        limits: Sequence[LimitSpec],
+        queue_limit: int,
+        member: str,
+        org_id: str,
+        user_id: str,
+    ) -> Tuple[ScriptResult, int]:
+        """Check one request
+
+        Org limits in ``limits`` are per active user; the script scales them
+        by the org's active-user count, which includes ``user_id``.
+
+        Returns the script result of the batch this request joined and the
+        request's position in that batch; the request was admitted when its
+        position is below ``result.admitted``.
+        """
+        loop = asyncio.get_running_loop()
+        batch_key = (id(loop), tuple(keys))
+        future = loop.create_future()
+        waiters = self._pending.get(batch_key)
+        if waiters is None:
+            waiters = self._pending[batch_key] = []
+            args = (list(keys), list(limits), queue_limit, member, org_id, user_id)
+            delay = settings.RATE_LIMITING_BATCH_WINDOW_MS / 1000.0
+            if delay > 0:
+                loop.call_later(delay, self._start_flush, batch_key, args)
+            else:
+                loop.call_soon(self._start_flush, batch_key, args)
+        waiters.append(future)
+        return await future
+
+    def _start_flush(self, batch_key: Tuple, args: Tuple) -> None:
+        waiters = self._pending.pop(batch_key, [])
+        if waiters:
+            asyncio.ensure_future(self._flush(waiters, *args))
+
+    async def _flush(
+        self,
+        waiters: List[asyncio.Future],
+        keys: List[str],
+        limits: List[LimitSpec],
+        queue_limit: int,
+        member: str,
+        org_id: str,
+        user_id: str,
+    ) -> None:
+        release = self._pending_releases.pop(keys[4], 0)
+        seen = self._pending_active.pop(org_id, set())
+        seen.discard(user_id)
+        window = settings.RATE_LIMITING_ACTIVE_USER_WINDOW_SEC
+        argv: List = [len(waiters)]
+        for limit in limits:
+            argv += [limit.interval_ms, limit.capacity]
+        argv += [queue_limit, member, QUEUE_TTL_SECONDS, release]
+        argv += [2 * window, settings.RATE_LIMITING_MIN_ACTIVE_USERS, user_id, *seen]
+        try:
+            raw = await self._script(keys=keys, args=argv)
+        except Exception as e:
+            # Releases were not applied; keep them for the next call
+            if release:
+                self._pending_releases[keys[4]] = (
+                    self._pending_releases.get(keys[4], 0) + release
+                )
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        result = ScriptResult(*(int(v) for v in raw))
+        for position, future in enumerate(waiters):
+            if not future.done():
+                future.set_result((result, position))
+
+
+def batch_position_result(
+    result: ScriptResult, position: int, interval_ms: float
+) -> Tuple[bool, int, int, Optional[int]]:
+    """Per-request view of a batched result
+
+    Returns (allowed, requests_remaining, reset_ms, retry_after_ms). Earlier
+    admitted requests in a batch see the headroom left by the ones after
+    them; denied requests wait one interval per request ahead of them.
+    """
+    if position < result.admitted:
+        ahead = result.admitted - 1 - position
+        reset_ms = max(0, result.reset_ms - int(ahead * interval_ms))
+        return True, result.remaining + ahead, reset_ms, None
+    behind = position - result.admitted
+    return False, 0, result.reset_ms, result.retry_after_ms + int(behind * interval_ms)
@@ -7,7 +7,6 @@ rate limiting with configurable rules and graceful degradation.
 
 import asyncio
 import logging
-import os
 import time
 from typing import Callable, Dict, Optional, Tuple
 
@@ -20,8 +19,8 @@ from backend.core.rate_limit.config import (
     RateLimitCategory,
     DEFAULT_RATE_LIMITS,
     PREMIUM_RATE_LIMITS,
-    RateLimitRule,
 )
+from backend.core.rate_limit.routes import RouteClass, RouteClassifier, categorize
 from backend.core.rate_limit.service import rate_limit_service
 from backend.core.settings import settings
 from backend.core.rate_limit.metrics import (
@@ -47,136 +46,27 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.track_metrics = track_metrics
         self._request_start_times: Dict[str, float] = {}
         self._override_cache: Dict[str, list[float]] = {}
+        self._routes = RouteClassifier()
 
     def _categorize_endpoint(self, method: str, path: str) -> RateLimitCategory:
         """Categorize an endpoint for rate limiting rules."""
+        return categorize(method, path)
 
-        # Authentication endpoints
-        if any(
-            auth_path in path for auth_path in ["/auth/", "/login", "/token", "/logout"]
-        ):
-            return RateLimitCategory.AUTH
-
-        # Admin endpoints
-        if "/admin/" in path or "/rbac/" in path:
-            return RateLimitCategory.ADMIN
-
-        # AI feedback endpoints (PR-32) - treat as write operations due to learning implications
-        if "/api/feedback/" in path:
-            return RateLimitCategory.WRITE
-
-        # AI code generation endpoints (PR-31/32) - treat as upload due to computational cost
-        if path == "/api/ai/generate-diff" or path == "/api/ai/apply-patch":
-            return RateLimitCategory.UPLOAD
-
-        # Presence/heartbeat endpoints
-        if any(
-            presence_path in path
-            for presence_path in ["/presence", "/heartbeat", "/cursor"]
-        ):
-            return RateLimitCategory.PRESENCE
-
-        # Upload/file endpoints
-        if any(
-            upload_path in path for upload_path in ["/upload", "/file", "/attachment"]
-        ):
-            return RateLimitCategory.UPLOAD
-
-        # Export/reporting endpoints
-        if any(
-            export_path in path for export_path in ["/export", "/report", "/download"]
-        ):
-            return RateLimitCategory.EXPORT
-
-        # Search endpoints
-        if any(search_path in path for search_path in ["/search", "/query", "/find"]):
-            return RateLimitCategory.SEARCH
-
-        # Categorize by HTTP method
-        if method in ["GET", "HEAD", "OPTIONS"]:
-            # Health checks and status endpoints get read category
-            if any(
-                health_path in path for health_path in ["/health", "/status", "/ping"]
-            ):
-                return RateLimitCategory.READ
-            return RateLimitCategory.READ
-
-        elif method in ["POST", "PUT", "PATCH", "DELETE"]:
-            return RateLimitCategory.WRITE
-
-        # Default to read for unknown methods
-        return RateLimitCategory.READ
-
-    def _override_rule_from_env(self, path: str, rule: RateLimitRule) -> RateLimitRule:
-        """Apply per-endpoint env overrides for tests/dev."""
-        if path == "/api/ai/generate-diff" or path == "/api/ai/apply-patch":
-            try:
-                rpm = int(os.getenv("RL_AI_GEN_PM", rule.requests_per_minute))
-            except ValueError:
-                rpm = rule.requests_per_minute
-            try:
-                burst = int(os.getenv("RL_AI_GEN_BURST", rule.burst_allowance))
-            except ValueError:
-                burst = rule.burst_allowance
-            if burst < rpm:
-                rpm = burst
-            return RateLimitRule(
-                requests_per_minute=rpm,
-                requests_per_hour=rpm * 60,
-                burst_allowance=burst,
-                queue_depth_limit=rule.queue_depth_limit,
-                enable_graceful_degradation=rule.enable_graceful_degradation,
-            )
-
-        if path.startswith("/api/feedback/"):
-            try:
-                rpm = int(os.getenv("RL_FB_PM", rule.requests_per_minute))
-            except ValueError:
-                rpm = rule.requests_per_minute
-            try:
-                burst = int(os.getenv("RL_FB_BURST", rule.burst_allowance))
-            except ValueError:
-                burst = rule.burst_allowance
-            if burst < rpm:
-                rpm = burst
-            return RateLimitRule(
-                requests_per_minute=rpm,
-                requests_per_hour=rpm * 60,
-                burst_allowance=burst,
-                queue_depth_limit=rule.queue_depth_limit,
-                enable_graceful_degradation=rule.enable_graceful_degradation,
-            )
-
-        return rule
+    def _route_class(self, request: Request) -> RouteClass:
+        """Classify a request, compiling the app's routes on first use."""
+        if not self._routes.built:
+            app = request.scope.get("app")
+            self._routes.build(getattr(app, "routes", None) or [])
+        return self._routes.classify(request.method, request.url.path)
 
     def _apply_override_bucket(
-        self, user_id: str, path: str
+        self, user_id: str, path: str, route: RouteClass
     ) -> tuple[bool, Optional[JSONResponse]]:
         """Apply a lightweight 1s bucket for test overrides."""
         # Only active when override env vars are set
-        if path in ("/api/ai/generate-diff", "/api/ai/apply-patch"):
-            burst_raw = os.getenv("RL_AI_GEN_BURST")
-            rpm_raw = os.getenv("RL_AI_GEN_PM")
-        elif path.startswith("/api/feedback/"):
-            burst_raw = os.getenv("RL_FB_BURST")
-            rpm_raw = os.getenv("RL_FB_PM")
-        else:
-            burst_raw = None
-            rpm_raw = None
-
-        if not burst_raw and not rpm_raw:
+        if route.override is None or route.override.bucket_limit is None:
             return False, None
-
-        try:
-            burst_val = int(burst_raw) if burst_raw else 1
-        except ValueError:
-            burst_val = 1
-        try:
-            rpm_val = int(rpm_raw) if rpm_raw else burst_val
-        except ValueError:
-            rpm_val = burst_val
-
-        limit = max(1, min(burst_val, rpm_val))
+        limit = route.override.bucket_limit
 
         now = time.time()
         window_start = now - 1.0
@@ -196,7 +86,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                         "allowed": False,
                     },
                 )(),
-                category=self._categorize_endpoint("POST", path),
+                category=route.category,
                 path=path,
                 limit=limit,
             )
@@ -283,14 +173,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Skip rate limiting for certain paths
         path = request.url.path
-        if any(
-            skip_path in path
-            for skip_path in ["/health", "/metrics", "/docs", "/openapi.json"]
-        ):
+        route = self._route_class(request)
+        if route.skip:
             return await call_next(request)
 
         method = request.method
-        category = self._categorize_endpoint(method, path)
+        category = route.category
         user_id, org_id, is_premium = self._extract_user_info(request)
 
         # Skip rate limiting if we can't identify the user/org
@@ -299,13 +187,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Separate AI/feedback endpoint buckets so they don't share limits
-        if path in ("/api/ai/generate-diff", "/api/ai/apply-patch") or path.startswith(
-            "/api/feedback/"
-        ):
+        if route.own_bucket:
             user_id = f"{user_id}:{path}"
 
         try:
-            override_active, override_resp = self._apply_override_bucket(user_id, path)
+            override_active, override_resp = self._apply_override_bucket(
+                user_id, path, route
+            )
             if override_resp is not None:
                 return override_resp
             if override_active:
@@ -315,7 +203,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             start_time = time.time()
             quota = PREMIUM_RATE_LIMITS if is_premium else DEFAULT_RATE_LIMITS
             base_rule = quota.user_rules[category]
-            override_rule = self._override_rule_from_env(path, base_rule)
+            override_rule = (
+                route.override.apply(base_rule) if route.override else base_rule
+            )
             result = await rate_limit_service.check_rate_limit(
                 user_id=user_id,
                 org_id=org_id,
@@ -0,0 +1,293 @@
+"""
+Precompiled route classification for rate limiting.
+
+RateLimitMiddleware needs, for every request, the endpoint's rate limit
+category, whether it bypasses rate limiting, whether it gets its own bucket,
+and any per-endpoint rule override. This module computes all of that once
+per route template from the app's router and looks requests up in a
+segment trie, with an LRU of recently seen concrete paths in front of it,
+so per-request work is proportional to the path length.
+
+Paths that match no route (404s, mounted sub-apps) fall back to the same
+substring rules, compiled into one regular expression per category.
+
+Per-endpoint overrides (RL_AI_GEN_PM/RL_AI_GEN_BURST for the AI codegen
+endpoints, RL_FB_PM/RL_FB_BURST for feedback) are parsed from the
+environment once; call ``reload_overrides()`` to pick up changes.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from backend.core.rate_limit.config import RateLimitCategory, RateLimitRule
+
+# Concrete (method, path) classifications kept in the LRU
+ROUTE_CACHE_SIZE = 4096
+
+# Paths that bypass rate limiting (substring match)
+SKIP_PATHS = ("/health", "/metrics", "/docs", "/openapi.json")
+
+# Endpoints with their own buckets and env-overridable rules
+AI_CODEGEN_PATHS = ("/api/ai/generate-diff", "/api/ai/apply-patch")
+FEEDBACK_PREFIX = "/api/feedback/"
+
+# Substring rules in priority order; methods fall back to READ/WRITE
+_CATEGORY_PATTERNS: List[Tuple[RateLimitCategory, "re.Pattern[str]"]] = [
+    (category, re.compile("|".join(re.escape(p) for p in parts)))
+    for category, parts in (
+        (RateLimitCategory.AUTH, ("/auth/", "/login", "/token", "/logout")),
+        (RateLimitCategory.ADMIN, ("/admin/", "/rbac/")),
+        # AI feedback endpoints (PR-32) - write operations due to learning implications
+        (RateLimitCategory.WRITE, (FEEDBACK_PREFIX,)),
+    )
+]
+_LATE_CATEGORY_PATTERNS: List[Tuple[RateLimitCategory, "re.Pattern[str]"]] = [
+    (category, re.compile("|".join(re.escape(p) for p in parts)))
+    for category, parts in (
+        (RateLimitCategory.PRESENCE, ("/presence", "/heartbeat", "/cursor")),
+        (RateLimitCategory.UPLOAD, ("/upload", "/file", "/attachment")),
+        (RateLimitCategory.EXPORT, ("/export", "/report", "/download")),
+        (RateLimitCategory.SEARCH, ("/search", "/query", "/find")),
+    )
+]
+_SKIP_PATTERN = re.compile("|".join(re.escape(p) for p in SKIP_PATHS))
+_WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+def categorize(method: str, path: str) -> RateLimitCategory:
+    """Rate limit category of an endpoint from its method and path."""
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(path):
+            return category
+
+    # AI code generation endpoints (PR-31/32) - upload due to computational cost
+    if path in AI_CODEGEN_PATHS:
+        return RateLimitCategory.UPLOAD
+
+    for category, pattern in _LATE_CATEGORY_PATTERNS:
+        if pattern.search(path):
+            return category
+
+    if method in _WRITE_METHODS:
+        return RateLimitCategory.WRITE
+    # GET/HEAD/OPTIONS and unknown methods
+    return RateLimitCategory.READ
+
+
+@dataclass(frozen=True)
+class EndpointOverride:
+    """Per-endpoint rule override parsed from the environment."""
+
+    requests_per_minute: Optional[int]
+    burst_allowance: Optional[int]
+    # Limit of the 1s test/dev bucket, None when no override env var is set
+    bucket_limit: Optional[int]
+
+    def apply(self, rule: RateLimitRule) -> RateLimitRule:
+        rpm = (
+            self.requests_per_minute
+            if self.requests_per_minute is not None
+            else rule.requests_per_minute
+        )
+        burst = (
+            self.burst_allowance
+            if self.burst_allowance is not None
+            else rule.burst_allowance
+        )
+        if burst < rpm:
+            rpm = burst
+        return replace(
+            rule,
+            requests_per_minute=rpm,
+            requests_per_hour=rpm * 60,
+            burst_allowance=burst,
+        )
+
+
+def _parse_int(raw: Optional[str]) -> Optional[int]:
+    try:
+        return int(raw) if raw is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_override(environ: Mapping[str, str], prefix: str) -> EndpointOverride:
+    rpm_raw = environ.get(f"{prefix}_PM")
+    burst_raw = environ.get(f"{prefix}_BURST")
+    bucket_limit = None
+    if rpm_raw or burst_raw:
+        burst = _parse_int(burst_raw) if burst_raw else 1
+        burst = 1 if burst is None else burst
+        rpm = _parse_int(rpm_raw) if rpm_raw else burst
+        rpm = burst if rpm is None else rpm
+        bucket_limit = max(1, min(burst, rpm))
+    return EndpointOverride(
+        requests_per_minute=_parse_int(rpm_raw),
+        burst_allowance=_parse_int(burst_raw),
+        bucket_limit=bucket_limit,
+    )
+
+
+@dataclass(frozen=True)
+class RouteClass:
+    """Everything the middleware needs to know about an endpoint."""
+
+    category: RateLimitCategory
+    skip: bool = False
+    # Endpoint gets its own bucket (user id is suffixed with the path)
+    own_bucket: bool = False
+    override: Optional[EndpointOverride] = None
+
+
+class _TrieNode:
+    __slots__ = ("children", "param", "catch_all", "methods")
+
+    def __init__(self):
+        self.children: Dict[str, _TrieNode] = {}
+        self.param: Optional[_TrieNode] = None
+        # Method -> template of a "{name:path}" route ending at this node
+        self.catch_all: Dict[str, str] = {}
+        self.methods: Dict[str, str] = {}
+
+
+# Live classifiers, for reload_overrides()
+_classifiers: "weakref.WeakSet[RouteClassifier]" = weakref.WeakSet()
+
+
+def _segments(path: str) -> List[str]:
+    return path.strip("/").split("/") if path.strip("/") else []
+
+
+class RouteClassifier:
+    """Classifies requests by matching them to route templates."""
+
+    def __init__(self, cache_size: int = ROUTE_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._root = _TrieNode()
+        self._templates: Dict[Tuple[str, str], RateLimitCategory] = {}
+        self._cache: "OrderedDict[Tuple[str, str], RouteClass]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._overrides = self._load_overrides(os.environ)
+        self.built = False
+        _classifiers.add(self)
+
+    @staticmethod
+    def _load_overrides(environ: Mapping[str, str]) -> Dict[str, EndpointOverride]:
+        return {
+            "ai": _parse_override(environ, "RL_AI_GEN"),
+            "feedback": _parse_override(environ, "RL_FB"),
+        }
+
+    def reload_overrides(self, environ: Optional[Mapping[str, str]] = None) -> None:
+        """Re-read per-endpoint overrides from the environment."""
+        overrides = self._load_overrides(os.environ if environ is None else environ)
+        with self._lock:
+            self._overrides = overrides
+            self._cache.clear()
+
+    def build(self, routes: Iterable) -> None:
+        """Compile route templates (e.g. ``app.routes``) into the trie."""
+        root = _TrieNode()
+        templates: Dict[Tuple[str, str], RateLimitCategory] = {}
+        for route in routes:
+            path = getattr(route, "path", None)
+            if not path:
+                continue
+            methods = getattr(route, "methods", None) or ("*",)
+            node = root
+            catch_all = False
+            for segment in _segments(path):
+                if segment.startswith("{") and segment.endswith("}"):
+                    if segment.endswith(":path}"):
+                        catch_all = True
+                        break
+                    if node.param is None:
+                        node.param = _TrieNode()
+                    node = node.param
+                else:
+                    node = node.children.setdefault(segment, _TrieNode())
+            for method in methods:
+                target = node.catch_all if catch_all else node.methods
+                target.setdefault(method, path)
+                templates.setdefault((method, path), categorize(method, path))
+        with self._lock:
+            self._root = root
+            self._templates = templates
+            self._cache.clear()
+            self.built = True
+
+    def _classify_path(self, method: str, path: str) -> RouteClass:
+        override = None
+        own_bucket = False
+        if path in AI_CODEGEN_PATHS:
+            override, own_bucket = self._overrides["ai"], True
+        elif path.startswith(FEEDBACK_PREFIX):
+            override, own_bucket = self._overrides["feedback"], True
+        return RouteClass(
+            category=categorize(method, path),
+            skip=bool(_SKIP_PATTERN.search(path)),
+            own_bucket=own_bucket,
+            override=override,
+        )
+
+    def _match(self, method: str, segments: List[str]) -> Optional[str]:
+        """Template matching the path segments, preferring literal segments."""
+
+        def walk(node: _TrieNode, i: int) -> Optional[str]:
+            if i == len(segments):
+                template = node.methods.get(method) or node.methods.get("*")
+                if template:
+                    return template
+            else:
+                child = node.children.get(segments[i])
+                if child is not None:
+                    found = walk(child, i + 1)
+                    if found:
+                        return found
+                if node.param is not None:
+                    found = walk(node.param, i + 1)
+                    if found:
+                        return found
+            return node.catch_all.get(method) or node.catch_all.get("*")
+
+        return walk(self._root, 0)
+
+    def classify(self, method: str, path: str) -> RouteClass:
+        """Classification of a concrete request path."""
+        key = (method, path)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        # Categories come from the matched template so that path parameter
+        # values cannot change them; the skip check and per-endpoint
+        # buckets look at the concrete path like before
+        template = self._match(method, _segments(path))
+        route_class = self._classify_path(method, path)
+        if template is not None:
+            category = self._templates.get((method, template)) or self._templates.get(
+                ("*", template)
+            )
+            if category is not None:
+                route_class = replace(route_class, category=category)
+
+        with self._lock:
+            self._cache[key] = route_class
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return route_class
+
+
+def reload_overrides(environ: Optional[Mapping[str, str]] = None) -> None:
+    """Re-read per-endpoint rate limit overrides in every classifier."""
+    for classifier in list(_classifiers):
+        classifier.reload_overrides(environ)
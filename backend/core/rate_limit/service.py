@@ -1,8 +1,9 @@
 """
-Redis-based rate limiting service with sliding window algorithm.
+Redis-based rate limiting service.
 
-Implements token bucket and sliding window rate limiting using Redis
-for distributed rate limiting across multiple application instances.
+Uses the atomic GCRA script in engine.py (one Redis round trip per check)
+for distributed rate limiting across multiple application instances, with
+an in-memory sliding window fallback when Redis is unavailable.
 """
 
 import logging
@@ -16,13 +17,15 @@ from backend.core.rate_limit.config import (
     RateLimitQuota,
     RateLimitRule,
 )
+from backend.core.rate_limit.engine import (
+    GcraRateLimiter,
+    LimitSpec,
+    batch_position_result,
+)
 from backend.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Module-level flag to ensure critical limitation warning is only logged once
-_limitation_warning_logged = False
-
 try:
     from redis import asyncio as aioredis
 
@@ -57,23 +60,12 @@ class RateLimitService:
     """Redis-based distributed rate limiting service."""
 
     def __init__(self):
-        global _limitation_warning_logged
-
         self._redis: Optional["Redis"] = None
+        self._limiter: Optional[GcraRateLimiter] = None
+        self._limiter_redis: Optional["Redis"] = None
         self._fallback_cache: Dict[str, Dict] = {}
         self._last_cleanup = int(time.time())  # Use integer timestamp for consistency
 
-        # CRITICAL LIMITATION WARNING: Log only once to avoid spam
-        if not _limitation_warning_logged:
-            logger.warning(
-                "RATE LIMITING CRITICAL LIMITATION: Using estimated active users "
-                f"({settings.RATE_LIMITING_ESTIMATED_ACTIVE_USERS}) for org-level rate limits. "
-                "This may cause incorrect rate limiting for organizations with different user counts. "
-                "This is a temporary solution - implement presence-based user tracking for production use. "
-                "See TODO comments in check_rate_limit method for implementation details."
-            )
-            _limitation_warning_logged = True
-
     async def _get_redis(self) -> Optional["Redis"]:
         """Get Redis connection, creating if needed."""
         if not HAS_REDIS or not settings.REDIS_URL:
@@ -110,24 +102,43 @@ class RateLimitService:
         category: RateLimitCategory,
         window_type: str = "minute",
     ) -> Tuple[str, str, str]:
-        """Generate Redis keys for rate limiting."""
-        timestamp = int(time.time())
-
-        if window_type == "minute":
-            window = timestamp // 60  # 1-minute windows
-        elif window_type == "hour":
-            window = timestamp // 3600  # 1-hour windows
-        else:
-            window = timestamp // 60  # Default to minute
-
-        user_key = f"{settings.RATE_LIMITING_REDIS_KEY_PREFIX}user:{user_id}:{category.value}:{window_type}:{window}"
-        org_key = f"{settings.RATE_LIMITING_REDIS_KEY_PREFIX}org:{org_id}:{category.value}:{window_type}:{window}"
-        queue_key = (
-            f"{settings.RATE_LIMITING_REDIS_KEY_PREFIX}queue:{org_id}:{category.value}"
-        )
+        """Generate Redis keys for rate limiting.
+
+        User and org keys hold the GCRA theoretical arrival time for the
+        window type (see engine.py), so they do not roll over per window.
+        """
+        prefix = settings.RATE_LIMITING_REDIS_KEY_PREFIX
+        user_key = f"{prefix}user:{user_id}:{category.value}:{window_type}"
+        org_key = f"{prefix}org:{org_id}:{category.value}:{window_type}"
+        queue_key = f"{prefix}queue:{org_id}:{category.value}"
 
         return user_key, org_key, queue_key
 
+    def _active_user_keys(self, org_id: str) -> Tuple[str, str]:
+        """HyperLogLog keys for the org's current and previous activity buckets."""
+        bucket = int(time.time()) // settings.RATE_LIMITING_ACTIVE_USER_WINDOW_SEC
+        prefix = f"{settings.RATE_LIMITING_REDIS_KEY_PREFIX}active:{org_id}"
+        return f"{prefix}:{bucket}", f"{prefix}:{bucket - 1}"
+
+    def note_active_user(self, org_id: str, user_id: str) -> None:
+        """Count a user as active in their org (e.g. from presence heartbeats).
+
+        No-op until the Redis limiter is in use; rate-limited requests
+        always count their own user.
+        """
+        if self._limiter is not None:
+            self._limiter.note_active(org_id, user_id)
+
+    async def _get_limiter(self) -> Optional[GcraRateLimiter]:
+        """Get the scripted limiter bound to the current Redis connection."""
+        redis = await self._get_redis()
+        if redis is None:
+            return None
+        if self._limiter is None or self._limiter_redis is not redis:
+            self._limiter = GcraRateLimiter(redis)
+            self._limiter_redis = redis
+        return self._limiter
+
     async def _check_redis_rate_limit(
         self,
         user_id: str,
@@ -136,15 +147,14 @@ class RateLimitService:
         rule: RateLimitRule,
         is_premium: bool = False,
     ) -> RateLimitResult:
-        """Check rate limit using Redis sliding window."""
-        redis = await self._get_redis()
-        if not redis:
+        """Check rate limit with one atomic GCRA script call (see engine.py)."""
+        limiter = await self._get_limiter()
+        if not limiter:
             return await self._check_fallback_rate_limit(
                 user_id, org_id, category, rule, is_premium
             )
 
         try:
-            # Check both minute and hour windows
             minute_user_key, minute_org_key, queue_key = self._generate_keys(
                 user_id, org_id, category, "minute"
             )
@@ -152,126 +162,60 @@ class RateLimitService:
                 user_id, org_id, category, "hour"
             )
 
-            # Use Redis pipeline for atomic operations
-            pipe = redis.pipeline()
-
-            # Get current counts
-            pipe.get(minute_user_key)
-            pipe.get(hour_user_key)
-            pipe.get(minute_org_key)
-            pipe.get(hour_org_key)
-            pipe.llen(queue_key)
-
-            results = await pipe.execute()
-
-            minute_user_count = int(results[0] or 0)
-            hour_user_count = int(results[1] or 0)
-            minute_org_count = int(results[2] or 0)
-            hour_org_count = int(results[3] or 0)
-            queue_depth = int(results[4] or 0)
-
-            # Calculate org limits (simplified - uses configurable estimate)
+            # Org limits are per active user; the script scales them by the
+            # org's active-user count (HyperLogLog, see engine.py)
             quota = self._get_rate_quota(is_premium)
-            # CRITICAL LIMITATION: Using estimated active users instead of actual count
-            # TODO: HIGH PRIORITY - Replace with actual active user tracking from presence system
-            # Current implementation may cause incorrect rate limiting for orgs with
-            # significantly different user counts. This is a known limitation that should
-            # be addressed before production use. Consider implementing:
-            # 1. Active user tracking via presence system
-            # 2. Session-based user counting
-            # 3. Configurable org-specific multipliers
-            # 4. Real-time user activity monitoring
-            # Configuration: RATE_LIMITING_ESTIMATED_ACTIVE_USERS={settings.RATE_LIMITING_ESTIMATED_ACTIVE_USERS}
-            estimated_active_users = settings.RATE_LIMITING_ESTIMATED_ACTIVE_USERS
-            org_minute_limit = int(
-                rule.requests_per_minute * quota.org_multiplier * estimated_active_users
+            org_minute_per_user = max(
+                1, int(rule.requests_per_minute * quota.org_multiplier)
             )
-            org_hour_limit = int(
-                rule.requests_per_hour * quota.org_multiplier * estimated_active_users
+            org_hour_per_user = max(
+                1, int(rule.requests_per_hour * quota.org_multiplier)
             )
 
-            # Check if request would exceed limits
-            would_exceed_user_minute = minute_user_count >= rule.requests_per_minute
-            would_exceed_user_hour = hour_user_count >= rule.requests_per_hour
-            would_exceed_org_minute = minute_org_count >= org_minute_limit
-            would_exceed_org_hour = hour_org_count >= org_hour_limit
-            would_exceed_queue = queue_depth >= rule.queue_depth_limit
-
-            # Allow burst if within burst allowance (only for user limits)
-            burst_allowed = (
-                minute_user_count < rule.requests_per_minute + rule.burst_allowance
-                and hour_user_count < rule.requests_per_hour
+            # Only the user minute limit gets the burst allowance; org and
+            # queue limits are hard limits
+            user_minute = LimitSpec(
+                rule.requests_per_minute,
+                60,
+                rule.requests_per_minute + rule.burst_allowance,
             )
+            limits = [
+                user_minute,
+                LimitSpec(rule.requests_per_hour, 3600, rule.requests_per_hour),
+                LimitSpec(org_minute_per_user, 60, org_minute_per_user),
+                LimitSpec(org_hour_per_user, 3600, org_hour_per_user),
+            ]
 
-            # Org and queue limits are hard limits - no burst allowed
-            if would_exceed_org_minute or would_exceed_org_hour or would_exceed_queue:
-                # Calculate retry after (time until next window)
-                current_time = int(time.time())
-                next_minute_window = ((current_time // 60) + 1) * 60
-                retry_after = next_minute_window - current_time
-
-                return RateLimitResult(
-                    allowed=False,
-                    requests_remaining=max(
-                        0, rule.requests_per_minute - minute_user_count
-                    ),
-                    reset_time=next_minute_window,
-                    retry_after=retry_after,
-                    queue_depth=queue_depth,
-                )
-
-            # User limits can use burst allowance
-            if (
-                would_exceed_user_minute or would_exceed_user_hour
-            ) and not burst_allowed:
-                # Calculate retry after (time until next window)
-                current_time = int(time.time())
-                next_minute_window = ((current_time // 60) + 1) * 60
-                retry_after = next_minute_window - current_time
-
-                return RateLimitResult(
-                    allowed=False,
-                    requests_remaining=max(
-                        0, rule.requests_per_minute - minute_user_count
-                    ),
-                    reset_time=next_minute_window,
-                    retry_after=retry_after,
-                    queue_depth=queue_depth,
-                )
-
-            # Request allowed - increment counters atomically
-            pipe = redis.pipeline()
-
-            # Increment user counters
-            pipe.incr(minute_user_key)
-            pipe.expire(minute_user_key, 120)  # Keep for 2 minutes
-            pipe.incr(hour_user_key)
-            pipe.expire(hour_user_key, 7200)  # Keep for 2 hours
-
-            # Increment org counters
-            pipe.incr(minute_org_key)
-            pipe.expire(minute_org_key, 120)
-            pipe.incr(hour_org_key)
-            pipe.expire(hour_org_key, 7200)
-
-            # Track in processing queue
-            pipe.lpush(queue_key, f"{user_id}:{int(time.time())}")
-            pipe.ltrim(queue_key, 0, rule.queue_depth_limit - 1)
-            pipe.expire(queue_key, 300)  # Keep queue for 5 minutes
-
-            await pipe.execute()
-
-            # Calculate remaining requests
-            requests_remaining = max(
-                0, rule.requests_per_minute - (minute_user_count + 1)
+            result, position = await limiter.check(
+                [
+                    minute_user_key,
+                    hour_user_key,
+                    minute_org_key,
+                    hour_org_key,
+                    queue_key,
+                    *self._active_user_keys(org_id),
+                ],
+                limits,
+                rule.queue_depth_limit,
+                f"{user_id}:{int(time.time())}",
+                org_id=org_id,
+                user_id=user_id,
+            )
+            allowed, remaining, reset_ms, retry_after_ms = batch_position_result(
+                result, position, user_minute.interval_ms
             )
-            reset_time = ((int(time.time()) // 60) + 1) * 60
 
+            now = time.time()
             return RateLimitResult(
-                allowed=True,
-                requests_remaining=requests_remaining,
-                reset_time=reset_time,
-                queue_depth=queue_depth + 1,
+                allowed=allowed,
+                requests_remaining=min(remaining, rule.requests_per_minute),
+                reset_time=int(now + reset_ms / 1000.0) + 1,
+                retry_after=(
+                    max(1, -(-retry_after_ms // 1000))
+                    if retry_after_ms is not None
+                    else None
+                ),
+                queue_depth=result.queue_depth,
             )
 
         except Exception as e:
@@ -375,6 +319,7 @@ class RateLimitService:
         org_id: str,
         category: RateLimitCategory,
         is_premium: bool = False,
+        override_rule: Optional[RateLimitRule] = None,
     ) -> RateLimitResult:
         """
         Check if a request is allowed under rate limiting rules.
@@ -384,12 +329,13 @@ class RateLimitService:
             org_id: Organization identifier
             category: Rate limit category for the endpoint
             is_premium: Whether this is a premium user/org
+            override_rule: Rule to apply instead of the category default
 
         Returns:
             RateLimitResult with allowed status and metadata
         """
         quota = self._get_rate_quota(is_premium)
-        rule = quota.user_rules.get(category)
+        rule = override_rule or quota.user_rules.get(category)
 
         if not rule:
             logger.warning(f"No rate limit rule found for category: {category}")
@@ -411,20 +357,16 @@ class RateLimitService:
         category: RateLimitCategory,
         success: bool = True,
     ):
-        """Record completion of a request for queue management."""
-        redis = await self._get_redis()
-        if not redis:
-            return
+        """Record completion of a request for queue management.
 
-        try:
-            _, _, queue_key = self._generate_keys(user_id, org_id, category)
-
-            # Remove completed request from queue
-            # In a more sophisticated implementation, we'd track specific request IDs
-            redis.rpop(queue_key)
+        The queue slot is released by the next scripted check on the same
+        queue, so completion costs no extra Redis round trip.
+        """
+        if self._limiter is None:
+            return
 
-        except Exception as e:
-            logger.error(f"Error recording request completion: {e}")
+        _, _, queue_key = self._generate_keys(user_id, org_id, category)
+        self._limiter.release(queue_key)
 
 
 # Global rate limiting service instance
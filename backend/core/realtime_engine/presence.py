@@ -139,11 +139,18 @@ def note_heartbeat(plan_id: str, user_id: str) -> None:
 
 
 def note_org_heartbeat(org_id: str, user_id: str) -> None:
-    """Record heartbeat timestamp for a user at the org level."""
+    """Record heartbeat timestamp for a user at the org level.
+
+    Also counts the user toward the org's active users for rate limiting.
+    """
     with _cache_lock:
         org_users = _org_presence_cache.setdefault(org_id, {})
         org_users[user_id] = int(time.time())
 
+    from backend.core.rate_limit.service import rate_limit_service
+
+    rate_limit_service.note_active_user(org_id, user_id)
+
 
 def remove_org_user(org_id: str, user_id: str) -> None:
     """Remove a user's org-level presence entry."""
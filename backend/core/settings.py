@@ -68,6 +68,17 @@ class Settings(BaseSettings):
 
     # Channel namespace for plan streams
     PLAN_CHANNEL_PREFIX: str = "plan:"
+    # Channel namespace for realtime answer streams
+    ANSWER_CHANNEL_PREFIX: str = "answers:"
+    # Messages buffered per SSE subscriber; a slow subscriber loses its oldest
+    # buffered messages first and can resume from the event store via Last-Event-ID
+    BROADCAST_SUBSCRIBER_QUEUE_SIZE: int = 256
+
+    # Plan event store: a state snapshot is written every N events per plan;
+    # recent committed events are kept in-process for cheap SSE resume
+    PLAN_EVENT_SNAPSHOT_INTERVAL: int = 200
+    PLAN_EVENT_BUFFER_SIZE: int = 256  # events kept per plan
+    PLAN_EVENT_BUFFER_PLANS: int = 1024  # plans kept, least recently used evicted
 
     # Presence/cursor configuration
     # NOTE: HEARTBEAT_SEC should be significantly smaller than PRESENCE_TTL_SEC
@@ -97,12 +108,13 @@ class Settings(BaseSettings):
     RATE_LIMITING_FALLBACK_ENABLED: bool = (
         True  # Use in-memory fallback when Redis unavailable
     )
-    # CRITICAL LIMITATION: Estimated active users per org for rate limiting calculations
-    # TODO: HIGH PRIORITY - Replace with actual active user tracking from presence system
-    # This is a temporary workaround that may cause incorrect rate limiting for orgs
-    # with significantly different user counts. Production deployments should monitor
-    # and adjust this value based on actual org sizes.
-    RATE_LIMITING_ESTIMATED_ACTIVE_USERS: int = 5
+    # Org rate limits scale with the org's active users, counted with a Redis
+    # HyperLogLog over the last one to two windows of this length
+    RATE_LIMITING_ACTIVE_USER_WINDOW_SEC: int = 900
+    RATE_LIMITING_MIN_ACTIVE_USERS: int = 1  # Floor for the active-user count
+    # Coalesce Redis checks for the same user/org/category issued within this
+    # window into one script call (0 = only checks in the same event-loop iteration)
+    RATE_LIMITING_BATCH_WINDOW_MS: int = 0
 
     # CORS configuration
     CORS_ORIGINS: str = (
@@ -198,6 +198,14 @@ class MemoryEdge(Base):
         Index("idx_memory_edge_org_rel", "org_id", "relation"),
         Index("idx_memory_edge_src", "src_id"),
         Index("idx_memory_edge_dst", "dst_id"),
+        Index(
+            "idx_memory_edge_org_src_dst_rel",
+            "org_id",
+            "src_id",
+            "dst_id",
+            "relation",
+            unique=True,
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,15 +1,77 @@
-"""Redis broadcaster implementation for production use."""
+"""Redis broadcaster implementation for production use.
+
+All subscriptions in a process share one Redis pub/sub connection. Channels
+are subscribed on demand and unsubscribed when their last local subscriber
+leaves; a single listener task reads the connection and fans each message
+out to bounded per-subscriber buffers, so the number of SSE clients a
+worker can serve is not tied to the Redis connection pool.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import AsyncIterator
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional, Set
+
+from backend.core.settings import settings
+from backend.telemetry.metrics import (
+    BROADCAST_CHANNELS,
+    BROADCAST_DROPPED,
+    BROADCAST_FANOUT_LATENCY,
+    BROADCAST_SUBSCRIBERS,
+)
 
 from .base import Broadcast
 
 logger = logging.getLogger(__name__)
 
+METRICS_LABEL = "redis"
+
+
+@functools.lru_cache(maxsize=None)
+def _sync_client(url: str):
+    """Blocking Redis client for publishers that run outside an event loop."""
+    import redis
+
+    return redis.Redis.from_url(
+        url,
+        decode_responses=True,
+        socket_timeout=5,
+        socket_connect_timeout=5,
+    )
+
+
+def publish_sync(url: str, channel: str, message: str) -> None:
+    """Publish to RedisBroadcaster subscribers from synchronous code.
+
+    Used by Dramatiq workers, which have no event loop to drive the async
+    ``publish``. Errors are logged, not raised, matching ``publish``.
+    """
+    try:
+        _sync_client(url).publish(channel, message)
+    except Exception as e:
+        logger.error(f"Failed to publish to channel {channel}: {e}")
+
+
+class _Subscriber:
+    """Bounded message buffer for one local subscriber."""
+
+    __slots__ = ("messages", "ready")
+
+    def __init__(self, maxsize: int) -> None:
+        self.messages: Deque[str] = deque(maxlen=max(1, maxsize))
+        self.ready = asyncio.Event()
+
+    def push(self, message: str) -> bool:
+        """Buffer a message; returns False when the oldest one was dropped."""
+        kept = len(self.messages) < self.messages.maxlen
+        self.messages.append(message)
+        self.ready.set()
+        return kept
+
 
 class RedisBroadcaster(Broadcast):
     """Redis Pub/Sub broadcaster using redis.asyncio."""
@@ -18,6 +80,13 @@ class RedisBroadcaster(Broadcast):
         self._url = url
         self._pool = None
         self._closed = False
+        # Shared subscriber connection and its listener task
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._channels: Dict[str, Set[_Subscriber]] = {}
+        # Set when Redis confirms a channel's SUBSCRIBE
+        self._confirmed: Dict[str, asyncio.Event] = {}
+        self._lock: Optional[asyncio.Lock] = None
 
     async def _ensure(self):
         """Ensure Redis connection pool is initialized."""
@@ -51,46 +120,153 @@ class RedisBroadcaster(Broadcast):
         except Exception as e:
             logger.error(f"Failed to publish to channel {channel}: {e}")
 
-    async def subscribe(self, channel: str) -> AsyncIterator[str]:
-        """Subscribe to a Redis channel and yield messages."""
-        redis = await self._ensure()
-        pubsub = redis.pubsub()
+    async def _attach(self, channel: str, subscriber: _Subscriber) -> asyncio.Event:
+        """Add a local subscriber, subscribing the shared connection if needed.
 
-        try:
-            await pubsub.subscribe(channel)
-            logger.debug(f"Subscribed to Redis channel: {channel}")
+        Returns the channel's confirmation event.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            subscribers = self._channels.get(channel)
+            if subscribers is None:
+                if self._pubsub is None:
+                    redis = await self._ensure()
+                    # Subscribe replies are read by _listen to confirm channels
+                    self._pubsub = redis.pubsub()
+                self._confirmed[channel] = asyncio.Event()
+                await self._pubsub.subscribe(channel)
+                subscribers = self._channels[channel] = set()
+                BROADCAST_CHANNELS.labels(METRICS_LABEL).inc()
+                logger.debug(f"Subscribed to Redis channel: {channel}")
+            subscribers.add(subscriber)
+            BROADCAST_SUBSCRIBERS.labels(METRICS_LABEL).inc()
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+            return self._confirmed[channel]
 
-            while not self._closed:
-                try:
-                    # timeout=1.0: Balance between responsiveness (check _closed flag)
-                    # and CPU efficiency (avoid tight polling loop). 1s is reasonable
-                    # for graceful shutdown without excessive resource usage.
-                    # If get_message returns None after timeout, the loop continues,
-                    # allowing the _closed flag to be checked for graceful shutdown.
-                    message = await pubsub.get_message(
-                        ignore_subscribe_messages=True, timeout=1.0
-                    )
-                    if message and message.get("type") == "message":
-                        data = message.get("data")
-                        if data is not None:
-                            yield str(data)
-                    # No sleep needed after timeout - get_message already waited
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(f"Error receiving from channel {channel}: {e}")
-                    await asyncio.sleep(0.1)
-        finally:
+    def _detach(self, channel: str, subscriber: _Subscriber) -> None:
+        """Remove a local subscriber; the last one out unsubscribes the channel.
+
+        Synchronous so it is safe in an async generator's ``finally`` that
+        may run during garbage collection.
+        """
+        subscribers = self._channels.get(channel)
+        if subscribers is None or subscriber not in subscribers:
+            return
+        subscribers.discard(subscriber)
+        BROADCAST_SUBSCRIBERS.labels(METRICS_LABEL).dec()
+        if not subscribers and not self._closed:
+            try:
+                asyncio.get_running_loop().create_task(self._unsubscribe(channel))
+            except RuntimeError:
+                pass
+
+    async def _unsubscribe(self, channel: str) -> None:
+        async with self._lock:
+            # A new subscriber may have arrived in the meantime
+            if self._channels.get(channel) or channel not in self._channels:
+                return
+            del self._channels[channel]
+            self._confirmed.pop(channel, None)
+            BROADCAST_CHANNELS.labels(METRICS_LABEL).dec()
             try:
-                await pubsub.unsubscribe(channel)
-                await pubsub.close()
+                await self._pubsub.unsubscribe(channel)
                 logger.debug(f"Unsubscribed from Redis channel: {channel}")
             except Exception as e:
                 logger.error(f"Error unsubscribing from {channel}: {e}")
 
+    def _fan_out(self, channel: str, data: str) -> None:
+        """Deliver one message to every local subscriber of the channel."""
+        start = time.perf_counter()
+        dropped = 0
+        for subscriber in self._channels.get(channel, ()):
+            if not subscriber.push(data):
+                dropped += 1
+        if dropped:
+            BROADCAST_DROPPED.labels(METRICS_LABEL).inc(dropped)
+            logger.warning(
+                f"Dropped oldest buffered message for {dropped} slow subscriber(s) "
+                f"on channel {channel}"
+            )
+        BROADCAST_FANOUT_LATENCY.labels(METRICS_LABEL).observe(
+            (time.perf_counter() - start) * 1000
+        )
+
+    async def _listen(self) -> None:
+        """Read the shared connection and fan messages out until closed."""
+        while not self._closed:
+            try:
+                # timeout=1.0: lets the loop notice close() without a busy poll;
+                # it is one loop per process, not one per subscriber
+                message = await self._pubsub.get_message(timeout=1.0)
+                if not message:
+                    continue
+                kind = message.get("type")
+                if kind == "message":
+                    data = message.get("data")
+                    if data is not None:
+                        self._fan_out(str(message.get("channel")), str(data))
+                elif kind == "subscribe":
+                    confirmed = self._confirmed.get(str(message.get("channel")))
+                    if confirmed is not None:
+                        confirmed.set()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # redis-py re-subscribes the connection's channels on reconnect
+                logger.error(f"Error receiving from Redis pub/sub: {e}")
+                await asyncio.sleep(0.1)
+
+    async def subscribe(
+        self, channel: str, subscribed: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[str]:
+        """Subscribe to a Redis channel and yield messages.
+
+        ``subscribed``, if given, is set once Redis has confirmed the
+        subscription; every message published after that is delivered.
+        """
+        subscriber = _Subscriber(settings.BROADCAST_SUBSCRIBER_QUEUE_SIZE)
+        confirmed = await self._attach(channel, subscriber)
+        try:
+            if subscribed is not None:
+                await confirmed.wait()
+                subscribed.set()
+            while not self._closed:
+                while subscriber.messages:
+                    yield subscriber.messages.popleft()
+                subscriber.ready.clear()
+                await subscriber.ready.wait()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._detach(channel, subscriber)
+
     async def close(self) -> None:
-        """Close the Redis connection pool."""
+        """Close the shared subscription and the Redis connection pool."""
         self._closed = True
+        channels, self._channels = self._channels, {}
+        confirmed, self._confirmed = self._confirmed, {}
+        for event in confirmed.values():
+            event.set()  # Release subscribers still waiting for a confirmation
+        BROADCAST_CHANNELS.labels(METRICS_LABEL).dec(len(channels))
+        for subscribers in channels.values():
+            BROADCAST_SUBSCRIBERS.labels(METRICS_LABEL).dec(len(subscribers))
+            for subscriber in subscribers:
+                subscriber.ready.set()
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.error(f"Error closing Redis pub/sub: {e}")
+            self._pubsub = None
         if self._pool is not None:
             try:
                 await self._pool.close()
@@ -11,7 +11,7 @@ Supports:
 """
 
 from typing import Any, Dict, List, Optional
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -35,11 +35,11 @@ class BitbucketClient:
         self.access_token = access_token
         self.api_url = base_url.rstrip("/") if base_url else self.CLOUD_API_URL
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
         logger.info("BitbucketClient initialized", api_url=self.api_url)
 
     async def __aenter__(self) -> "BitbucketClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             timeout=self.timeout,
             headers=self._headers(),
         )
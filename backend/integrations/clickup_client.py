@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 import structlog
 
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -35,10 +35,10 @@ class ClickUpClient:
     ):
         self.access_token = access_token
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
 
     async def __aenter__(self) -> "ClickUpClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             base_url=self.BASE_URL,
             headers={
                 "Authorization": self.access_token,
@@ -54,7 +54,7 @@ class ClickUpClient:
             self._client = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> ScopedClient:
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
         return self._client
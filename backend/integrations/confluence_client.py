@@ -9,6 +9,8 @@ import re
 from typing import List, Dict, Any, Optional
 
 import httpx
+
+from backend.services.http_client import http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -50,7 +52,7 @@ class ConfluenceClient:
                 raise RuntimeError(
                     "ConfluenceClient requires base_url or cloud_id for OAuth access."
                 )
-            self.client = httpx.AsyncClient(
+            self.client = http_client(
                 headers={
                     "Accept": "application/json",
                     "Authorization": f"Bearer {self.access_token}",
@@ -63,7 +65,7 @@ class ConfluenceClient:
                     "ConfluenceClient is not configured. "
                     "Set AEP_CONFLUENCE_BASE_URL, AEP_CONFLUENCE_EMAIL, AEP_CONFLUENCE_API_TOKEN."
                 )
-            self.client = httpx.AsyncClient(
+            self.client = http_client(
                 auth=(self.email, self.api_token),
                 headers={"Accept": "application/json"},
                 timeout=30.0,
@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 import structlog
 
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -47,10 +47,10 @@ class DatadogClient:
         self.site = site
         self.base_url = f"https://api.{site}"
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
 
     async def __aenter__(self) -> "DatadogClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             base_url=self.base_url,
             headers={
                 "DD-API-KEY": self.api_key,
@@ -67,7 +67,7 @@ class DatadogClient:
             self._client = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> ScopedClient:
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
         return self._client
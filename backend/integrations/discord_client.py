@@ -11,7 +11,7 @@ Supports:
 """
 
 from typing import Any, Dict, List, Optional
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -33,11 +33,11 @@ class DiscordClient:
     ):
         self.bot_token = bot_token
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
         logger.info("DiscordClient initialized")
 
     async def __aenter__(self) -> "DiscordClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             timeout=self.timeout,
             headers=self._headers(),
         )
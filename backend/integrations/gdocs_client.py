@@ -10,7 +10,7 @@ Supports:
 """
 
 from typing import Any, Dict, List, Optional
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -37,11 +37,11 @@ class GoogleDocsClient:
     ):
         self.access_token = access_token
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
         logger.info("GoogleDocsClient initialized")
 
     async def __aenter__(self) -> "GoogleDocsClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             timeout=self.timeout,
             headers=self._headers(),
         )
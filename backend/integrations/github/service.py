@@ -9,7 +9,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
-import httpx
+from backend.services.http_client import http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -53,7 +53,7 @@ class GitHubService:
         self.timeout = timeout
         self.base_url = "https://api.github.com"
 
-        self.client = httpx.AsyncClient(
+        self.client = http_client(
             headers={
                 "Authorization": f"token {token}",
                 "Accept": "application/vnd.github.v3+json",
@@ -9,7 +9,7 @@ Supports:
 """
 
 from typing import Any, Dict, List, Optional
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -34,11 +34,11 @@ class GitLabClient:
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.api_url = f"{self.base_url}/api/v4"
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
         logger.info("GitLabClient initialized", base_url=self.base_url)
 
     async def __aenter__(self) -> "GitLabClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             timeout=self.timeout,
             headers=self._headers(),
         )
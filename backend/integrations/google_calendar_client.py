@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
 
-import httpx
+from backend.services.http_client import http_client
 
 
 class GoogleCalendarClient:
@@ -47,7 +47,7 @@ class GoogleCalendarClient:
                 "Google token refresh requires client_id, client_secret, refresh_token"
             )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client(timeout=30.0) as client:
             resp = await client.post(
                 "https://oauth2.googleapis.com/token",
                 data={
@@ -90,7 +90,7 @@ class GoogleCalendarClient:
     ) -> Dict[str, Any]:
         token = await self._get_token()
         url = f"https://www.googleapis.com/calendar/v3{path}"
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client(timeout=30.0) as client:
             resp = await client.get(
                 url,
                 params=params or {},
@@ -105,7 +105,7 @@ class GoogleCalendarClient:
     async def _post(self, path: str, json_body: Dict[str, Any]) -> Dict[str, Any]:
         token = await self._get_token()
         url = f"https://www.googleapis.com/calendar/v3{path}"
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client(timeout=30.0) as client:
             resp = await client.post(
                 url,
                 json=json_body,
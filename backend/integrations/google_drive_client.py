@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
 
-import httpx
+from backend.services.http_client import http_client
 
 
 class GoogleDriveClient:
@@ -47,7 +47,7 @@ class GoogleDriveClient:
                 "Google token refresh requires client_id, client_secret, refresh_token"
             )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client(timeout=30.0) as client:
             resp = await client.post(
                 "https://oauth2.googleapis.com/token",
                 data={
@@ -92,7 +92,7 @@ class GoogleDriveClient:
         page_size: int = 20,
     ) -> List[Dict[str, Any]]:
         token = await self._get_token()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client(timeout=30.0) as client:
             resp = await client.get(
                 "https://www.googleapis.com/drive/v3/files",
                 params={
@@ -119,7 +119,7 @@ class GoogleDriveClient:
             url = f"https://www.googleapis.com/drive/v3/files/{file_id}"
             params = {"alt": "media"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client(timeout=30.0) as client:
             resp = await client.get(
                 url,
                 params=params,
@@ -9,7 +9,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
-import httpx
+from backend.services.http_client import http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -40,7 +40,7 @@ class JiraService:
         self.email = email
         self.token = token
 
-        self.client = httpx.AsyncClient(
+        self.client = http_client(
             auth=(email, token), headers={"Accept": "application/json"}, timeout=30
         )
 
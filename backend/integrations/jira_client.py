@@ -8,6 +8,8 @@ import os
 from typing import List, Dict, Any, Optional
 
 import httpx
+
+from backend.services.http_client import http_client
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -54,7 +56,7 @@ class JiraClient:
         else:
             auth = (self.email, self.api_token)
 
-        self.client = httpx.AsyncClient(headers=headers, auth=auth, timeout=30.0)
+        self.client = http_client(headers=headers, auth=auth, timeout=30.0)
 
         logger.info("JiraClient initialized", base_url=self.base_url)
 
@@ -8,7 +8,7 @@ import os
 import asyncio
 from typing import List, Dict, Any, Optional
 
-import httpx
+from backend.services.http_client import http_client
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -307,7 +307,7 @@ class SlackClient:
             logger.info("Skipping Slack file (too large)", size=size)
             return None
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client(timeout=30.0) as client:
                 resp = await client.get(
                     url,
                     headers={"Authorization": f"Bearer {self.token}"},
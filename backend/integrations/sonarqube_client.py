@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 import structlog
 
-import httpx
+from backend.services.http_client import ScopedClient, http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -44,10 +44,10 @@ class SonarQubeClient:
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[ScopedClient] = None
 
     async def __aenter__(self) -> "SonarQubeClient":
-        self._client = httpx.AsyncClient(
+        self._client = http_client(
             base_url=f"{self.base_url}/api",
             auth=(self.token, ""),  # Token as username, empty password
             timeout=self.timeout,
@@ -60,7 +60,7 @@ class SonarQubeClient:
             self._client = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
+    def client(self) -> ScopedClient:
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
         return self._client
@@ -78,6 +78,7 @@ class VectorStore:
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
         self.dimension = dimension
+        self.embedding_model = embedding_model
         self.metadata: List[Dict[str, Any]] = []
         self.texts: List[str] = []
 
@@ -132,8 +133,19 @@ class VectorStore:
             Embedding vector as numpy array
         """
         if self.encoder is not None:
-            # Use SentenceTransformers for high-quality embeddings
-            return self.encoder.encode([text])[0].astype("float32")
+            # Use SentenceTransformers for high-quality embeddings, reusing
+            # vectors already computed by this or another process
+            from backend.services.embedding_cache import get_embedding_cache
+
+            return np.array(
+                get_embedding_cache().get_or_embed(
+                    self.embedding_model,
+                    self.dimension,
+                    [text],
+                    lambda texts: self.encoder.encode(texts),
+                )[0],
+                dtype="float32",
+            )
         else:
             # Fallback: simple hash-based pseudo-embedding
             hash_val = hash(text.lower())
@@ -0,0 +1,379 @@
+"""In-process ANN index for memory chunk retrieval
+
+Provides the "local-ann" vector backend (also selected by "faiss") for
+deployments without pgvector. Each org gets its own index holding:
+- A contiguous, L2-normalized float32 matrix of chunk embeddings
+- An IVF (inverted file) coarse quantizer trained with k-means once the
+  index grows past ``settings.ann_ivf_threshold`` vectors, and retrained as
+  it grows; training runs in a background thread and is swapped in when
+  done, while queries keep using the previous lists (or exact search)
+
+Below the threshold queries are an exact matrix-vector product. Above it,
+only the ``settings.ann_nprobe`` closest clusters are scored, keeping top-k
+latency flat as the corpus grows.
+
+Indexes are built lazily from ``memory_chunk.embedding`` on first query and
+kept in sync incrementally by ``indexer.upsert_memory_object``; each query
+also catches up on chunks indexed by other processes (see index_registry.py).
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from . import vector_codec
+from .index_registry import OrgIndexRegistry
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per page when building an org index from the database
+BUILD_PAGE_SIZE = 5000
+
+# Initial row capacity of the vector matrix (grows geometrically)
+INITIAL_CAPACITY = 1024
+
+# k-means parameters for IVF training
+KMEANS_ITERATIONS = 8
+KMEANS_MAX_TRAINING_SAMPLES = 50000
+
+# Retrain the coarse quantizer once the index has grown by this factor
+# since the last training, so cluster sizes stay balanced.
+RETRAIN_GROWTH_FACTOR = 2.0
+
+# Backend names that select this index in settings.vector_backend
+ANN_BACKENDS = frozenset(("faiss", "local-ann"))
+
+
+def is_enabled() -> bool:
+    """Return True when settings.vector_backend selects the in-process index"""
+    return settings.vector_backend.lower() in ANN_BACKENDS
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place; zero rows are left as zeros"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _kmeans(data: np.ndarray, nlist: int) -> np.ndarray:
+    """Spherical k-means centroids (nlist x dim) for L2-normalized rows"""
+    n = len(data)
+    rng = np.random.default_rng(0)
+    sample_size = min(n, KMEANS_MAX_TRAINING_SAMPLES)
+    sample = data[rng.choice(n, size=sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+    for _ in range(KMEANS_ITERATIONS):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        for cluster in range(nlist):
+            members = sample[assignment == cluster]
+            if len(members):
+                centroids[cluster] = members.mean(axis=0)
+        _normalize_rows(centroids)
+    return centroids
+
+
+def _assign_rows(
+    lists: List[List[int]], centroids: np.ndarray, batch: np.ndarray, start: int
+) -> None:
+    """Append rows [start, start+len(batch)) to their nearest IVF list"""
+    nearest = np.argmax(batch @ centroids.T, axis=1)
+    for offset, cluster in enumerate(nearest):
+        lists[int(cluster)].append(start + offset)
+
+
+class OrgVectorIndex:
+    """Vector index for a single org
+
+    Thread-safe: all mutation and search happens under an instance lock,
+    except IVF training, which reads rows that never change again without
+    it. Chunk ids are deduplicated, so adding an id that is already present
+    (e.g. a chunk committed while the index was being built) is a no-op.
+    """
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self._lock = threading.RLock()
+        self._vectors = np.zeros((INITIAL_CAPACITY, dim), dtype=np.float32)
+        self._ids = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._source_codes = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._size = 0
+        self._id_set: set = set()
+        self._source_to_code: Dict[str, int] = {}
+        # IVF state: centroids (nlist x dim) and per-cluster row positions
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self._trained_size = 0
+        self._trainer: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        ids = np.zeros(new_capacity, dtype=np.int64)
+        ids[: self._size] = self._ids[: self._size]
+        codes = np.zeros(new_capacity, dtype=np.int32)
+        codes[: self._size] = self._source_codes[: self._size]
+        self._vectors, self._ids, self._source_codes = vectors, ids, codes
+
+    def _source_code(self, source: str) -> int:
+        code = self._source_to_code.get(source)
+        if code is None:
+            code = len(self._source_to_code)
+            self._source_to_code[source] = code
+        return code
+
+    def add(
+        self,
+        ids: Sequence[int],
+        vectors: Sequence[Sequence[float]],
+        sources: Sequence[str],
+    ) -> int:
+        """Add vectors to the index
+
+        Args:
+            ids: memory_chunk ids
+            vectors: Embedding vectors (same order as ids)
+            sources: memory_object source for each chunk (for source filters)
+
+        Returns:
+            Number of vectors actually added (duplicates and dimension
+            mismatches are skipped)
+        """
+        with self._lock:
+            keep = [
+                i
+                for i, (chunk_id, vec) in enumerate(zip(ids, vectors))
+                if chunk_id not in self._id_set and len(vec) == self.dim
+            ]
+            if not keep:
+                return 0
+
+            batch = np.asarray([vectors[i] for i in keep], dtype=np.float32)
+            _normalize_rows(batch)
+
+            start = self._size
+            end = start + len(keep)
+            self._ensure_capacity(end)
+            self._vectors[start:end] = batch
+            for offset, i in enumerate(keep):
+                chunk_id = int(ids[i])
+                self._ids[start + offset] = chunk_id
+                self._source_codes[start + offset] = self._source_code(sources[i])
+                self._id_set.add(chunk_id)
+            self._size = end
+
+            if self.is_trained:
+                _assign_rows(self._lists, self._centroids, batch, start)
+                due = self._size >= self._trained_size * RETRAIN_GROWTH_FACTOR
+            else:
+                due = self._size >= settings.ann_ivf_threshold
+            if due and self._trainer is None:
+                # Rows [0, end) are never written again (growing the matrix
+                # copies them), so training can read them without the lock
+                self._trainer = threading.Thread(
+                    target=self._train,
+                    args=(self._vectors, end),
+                    name="ann-ivf-train",
+                    daemon=True,
+                )
+                self._trainer.start()
+
+            return len(keep)
+
+    def _train(self, vectors: np.ndarray, n: int) -> None:
+        """Train an IVF coarse quantizer on rows [0, n) and swap it in
+
+        Runs in a background thread without the lock; rows added meanwhile
+        are assigned to the new lists when they replace the current ones.
+        """
+        try:
+            nlist = max(1, int(np.sqrt(n)))
+            data = vectors[:n]
+            centroids = _kmeans(data, nlist)
+            lists: List[List[int]] = [[] for _ in range(nlist)]
+            _assign_rows(lists, centroids, data, 0)
+
+            with self._lock:
+                if self._size > n:
+                    _assign_rows(lists, centroids, self._vectors[n : self._size], n)
+                self._centroids = centroids
+                self._lists = lists
+                self._trained_size = n
+            logger.info("Trained IVF quantizer: vectors=%d nlist=%d", n, nlist)
+        except Exception:
+            logger.exception("IVF training failed: vectors=%d", n)
+        finally:
+            with self._lock:
+                self._trainer = None
+
+    def wait_for_training(self, timeout: Optional[float] = None) -> bool:
+        """Wait for background IVF training, if any, to be swapped in
+
+        Returns:
+            True when no training is in progress
+        """
+        trainer = self._trainer
+        if trainer is not None:
+            trainer.join(timeout)
+        return self._trainer is None
+
+    def _candidate_positions(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Row positions to score for the query, or None for all rows"""
+        if not self.is_trained:
+            return None
+        nprobe = min(settings.ann_nprobe, len(self._lists))
+        closest = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        positions = [p for cluster in closest for p in self._lists[int(cluster)]]
+        return np.asarray(positions, dtype=np.int64)
+
+    def search(
+        self,
+        query_vec: Sequence[float],
+        k: int,
+        sources: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[float, int]]:
+        """Return the top-k (cosine similarity, chunk id) pairs
+
+        Args:
+            query_vec: Query embedding
+            k: Number of results
+            sources: Optional source filter
+
+        Returns:
+            List of (similarity, chunk_id) sorted by similarity descending
+        """
+        query = np.asarray(query_vec, dtype=np.float32)
+        if query.shape != (self.dim,) or k <= 0:
+            return []
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            query = query / norm
+
+        with self._lock:
+            if self._size == 0:
+                return []
+
+            positions = self._candidate_positions(query)
+            if sources is not None:
+                codes = [
+                    self._source_to_code[s]
+                    for s in sources
+                    if s in self._source_to_code
+                ]
+                if not codes:
+                    return []
+                candidate_codes = (
+                    self._source_codes[: self._size]
+                    if positions is None
+                    else self._source_codes[positions]
+                )
+                mask = np.isin(candidate_codes, codes)
+                positions = (
+                    np.flatnonzero(mask) if positions is None else positions[mask]
+                )
+
+            if positions is None:
+                scores = self._vectors[: self._size] @ query
+                row_ids = self._ids[: self._size]
+            else:
+                if len(positions) == 0:
+                    return []
+                scores = self._vectors[positions] @ query
+                row_ids = self._ids[positions]
+
+            k = min(k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(float(scores[i]), int(row_ids[i])) for i in top]
+
+
+def _load_org_vectors(
+    db: Session, org_id: str, index: OrgVectorIndex, after_id: int = 0
+) -> int:
+    """Add the org's chunks with id > after_id using keyset pagination
+
+    Returns:
+        The highest chunk id read (after_id when there were none)
+    """
+    last_id = after_id
+    while True:
+        rows = db.execute(
+            text(
+                """
+          SELECT mc.id, mo.source, mc.embedding
+          FROM memory_chunk mc
+          JOIN memory_object mo ON mo.id = mc.object_id
+          WHERE mo.org_id = :o AND mc.embedding IS NOT NULL AND mc.id > :last
+          ORDER BY mc.id
+          LIMIT :lim
+        """
+            ),
+            {"o": org_id, "last": last_id, "lim": BUILD_PAGE_SIZE},
+        ).all()
+        if not rows:
+            break
+        index.add(
+            [r[0] for r in rows],
+            [vector_codec.decode(r[2]) for r in rows],
+            [r[1] for r in rows],
+        )
+        last_id = rows[-1][0]
+    return last_id
+
+
+# Process-wide registry of per-org indexes
+_registry: OrgIndexRegistry[OrgVectorIndex] = OrgIndexRegistry(
+    "ANN", lambda: OrgVectorIndex(settings.embed_dim), _load_org_vectors
+)
+
+
+def get_org_index(db: Session, org_id: str) -> OrgVectorIndex:
+    """Get the index for an org, building it from the database on first use
+
+    Later calls first add chunks indexed since the last call, including
+    those written by other processes.
+    """
+    return _registry.get(db, org_id)
+
+
+def is_resident(org_id: str) -> bool:
+    """Return True if the org's index has been built in this process"""
+    return _registry.resident(org_id) is not None
+
+
+def add_vectors(
+    org_id: str,
+    ids: Sequence[int],
+    vectors: Sequence[Sequence[float]],
+    sources: Sequence[str],
+) -> None:
+    """Incrementally add newly committed chunks to a resident org index
+
+    No-op when the org's index has not been built yet; it will include these
+    chunks when it is first loaded.
+    """
+    index = _registry.resident(org_id)
+    if index is not None and ids:
+        index.add(ids, vectors, sources)
+
+
+def reset_indexes() -> None:
+    """Drop all resident indexes (tests and administrative rebuilds)"""
+    _registry.reset()
@@ -3,7 +3,7 @@ Vector search backends with hybrid ranking (PR-16)
 
 Supports multiple vector search backends:
 - pgvector: PostgreSQL extension for ANN search (production-ready)
-- faiss: Facebook AI Similarity Search (optional, for local development)
+- local-ann: In-process per-org IVF index (see ann_index.py; "faiss" is an alias)
 - json: Fallback to JSON-stored vectors with linear scan
 
 Implements hybrid ranking with configurable weights:
@@ -15,14 +15,20 @@ Implements hybrid ranking with configurable weights:
 
 import json
 import logging
-import math
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import text
+import numpy as np
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
+from ..telemetry.vector_metrics import (
+    ANN_LATENCY_MS,
+    BM25_LATENCY_MS,
+    SEARCH_BACKEND_CALLS,
+)
+from . import ann_index, bm25_index, vector_codec
 
 # Import embeddings at module level to avoid circular dependency
 # This is safe because embeddings.py doesn't import from backends
@@ -73,7 +79,7 @@ EXCERPT_MAX_LENGTH = 700  # Maximum excerpt length in characters
 EPSILON = 1e-8  # Small value to prevent division by zero in cosine similarity
 
 
-def _cosine_similarity(a: List[float], b: List[float]) -> float:
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
     """Compute cosine similarity between two vectors
 
     Args:
@@ -89,9 +95,11 @@ def _cosine_similarity(a: List[float], b: List[float]) -> float:
     if len(a) != len(b):
         raise ValueError(f"Vectors must have same dimension, got {len(a)} and {len(b)}")
 
-    dot_product = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
+    va = np.asarray(a, dtype=np.float32)
+    vb = np.asarray(b, dtype=np.float32)
+    dot_product = float(np.dot(va, vb))
+    norm_a = float(np.linalg.norm(va))
+    norm_b = float(np.linalg.norm(vb))
     # Return 0.0 for zero vectors instead of masking with 1.0
     if norm_a <= EPSILON or norm_b <= EPSILON:
         logger.warning(
@@ -169,12 +177,15 @@ def _normalize_bm25_score(score: float) -> float:
 def _ts_rank_score(
     db: Session, org_id: str, query: str, sources: Optional[List[str]], limit: int
 ) -> Dict[Tuple[str, str], float]:
-    """Full-text search using PostgreSQL's ts_rank (BM25 approximation)
+    """Keyword (BM25) scores for the query, keyed by document
 
-    Note: This uses ts_rank as an approximation of BM25. While BM25 has built-in
-    length normalization, ts_rank uses a different algorithm. The scores are
-    normalized using x/(1+x) transformation to [0, 1) for consistent weighting
-    with other hybrid ranking components.
+    PostgreSQL ranks with ts_rank over the precomputed memory_chunk.text_tsv
+    column (GIN-indexed, kept in sync by a trigger; see migration
+    0036_memory_chunk_tsv_sync), using rank normalization 1 to divide by
+    document length the way BM25 does. Other databases use the in-process
+    BM25 index in bm25_index.py. A document scores as its best chunk, and
+    raw scores are normalized with the x/(1+x) transformation to [0, 1) for
+    consistent weighting with the other hybrid ranking components.
 
     Args:
         db: Database session
@@ -184,26 +195,27 @@ def _ts_rank_score(
         limit: Maximum number of results
 
     Returns:
-        Dictionary mapping (source, foreign_id) tuples to normalized ts_rank scores in [0, 1)
+        Dictionary mapping (source, foreign_id) tuples to normalized scores in [0, 1)
     """
     # Early return if BM25 is disabled - avoid unnecessary processing
     if not settings.bm25_enabled:
         return {}
 
-    dialect = db.bind.dialect.name
-
-    if dialect == "postgresql":
-        # Use PostgreSQL native full-text search with ts_rank
+    start = time.perf_counter()
+    if db.bind.dialect.name == "postgresql":
+        # Use PostgreSQL native full-text search; the @@ match uses the GIN index
         source_filter = "AND mo.source = ANY(:src)" if sources else ""
         rows = (
             db.execute(
                 text(
                     f"""
           SELECT mo.source, mo.foreign_id,
-                 ts_rank(to_tsvector('english', mc.text), plainto_tsquery('english', :q)) AS rnk
+                 MAX(ts_rank(mc.text_tsv, q.query, 1)) AS rnk
           FROM memory_chunk mc
-          JOIN memory_object mo ON mo.id = mc.object_id
-          WHERE mo.org_id = :o {source_filter}
+          JOIN memory_object mo ON mo.id = mc.object_id,
+               plainto_tsquery('english', :q) AS q(query)
+          WHERE mo.org_id = :o AND mc.text_tsv @@ q.query {source_filter}
+          GROUP BY mo.source, mo.foreign_id
           ORDER BY rnk DESC
           LIMIT :lim
         """
@@ -213,16 +225,13 @@ def _ts_rank_score(
             .mappings()
             .all()
         )
-        # Normalize ts_rank scores using x/(1+x) transformation
-        return {
-            (r["source"], r["foreign_id"]): _normalize_bm25_score(
-                float(r["rnk"] or 0.0)
-            )
-            for r in rows
-        }
+        hits = [(float(r["rnk"] or 0.0), (r["source"], r["foreign_id"])) for r in rows]
     else:
-        # SQLite fallback: simple keyword overlap scoring
-        return {}
+        index = bm25_index.get_org_index(db, org_id)
+        hits = index.search(query, limit, sources)
+    BM25_LATENCY_MS.observe((time.perf_counter() - start) * 1000.0)
+
+    return {key: _normalize_bm25_score(score) for score, key in hits}
 
 
 def semantic_pgvector(
@@ -345,25 +354,8 @@ def semantic_json(
 
     scored = []
     for r in rows:
-        # Handle different types returned by database (str, bytes, memoryview)
-        embedding_data = r["embedding"]
-        if isinstance(embedding_data, str):
-            vec = json.loads(embedding_data)
-        elif isinstance(embedding_data, memoryview):
-            vec = json.loads(embedding_data.tobytes().decode("utf-8"))
-        elif isinstance(embedding_data, bytes):
-            vec = json.loads(embedding_data.decode("utf-8"))
-        elif isinstance(embedding_data, dict):
-            vec = embedding_data
-        else:
-            # Unsupported type - raise exception
-            raise TypeError(
-                f"Cannot parse embedding_data of type {type(embedding_data).__name__}. "
-                f"Expected str, bytes, memoryview, or dict. "
-                f"This may indicate a database configuration issue. "
-                f"Check that the embedding column is defined as TEXT, BLOB, or JSON/JSONB in your database schema."
-            )
-
+        # Binary codec rows decode zero-copy; legacy JSON rows are still accepted
+        vec = vector_codec.decode(r["embedding"])
         similarity = _cosine_similarity(query_vec, vec)
         scored.append((similarity, dict(r)))
 
@@ -372,6 +364,121 @@ def semantic_json(
     return scored[:limit]
 
 
+def _epoch_sql(db: Session, column: str) -> str:
+    """SQL expression converting a timestamp column to unix epoch seconds"""
+    if db.bind.dialect.name == "sqlite":
+        return f"CAST(strftime('%s', {column}) AS REAL)"
+    return f"EXTRACT(EPOCH FROM {column})"
+
+
+def semantic_ann(
+    db: Session,
+    org_id: str,
+    query_vec: List[float],
+    sources: Optional[List[str]],
+    limit: int,
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """Semantic search using the in-process per-org ANN index
+
+    Top-k ids come from the index (no scan limit); row data is then fetched
+    for those ids only.
+
+    Args:
+        db: Database session
+        org_id: Organization ID
+        query_vec: Query embedding vector
+        sources: Optional source filters
+        limit: Maximum results
+
+    Returns:
+        List of (similarity_score, row_dict) tuples sorted by similarity
+    """
+    start = time.perf_counter()
+    index = ann_index.get_org_index(db, org_id)
+    hits = index.search(query_vec, limit, sources)
+    ANN_LATENCY_MS.observe((time.perf_counter() - start) * 1000.0)
+    if not hits:
+        return []
+
+    rows = (
+        db.execute(
+            text(
+                f"""
+      SELECT mc.id AS chunk_id, mo.id AS obj_id, mo.source, mo.foreign_id,
+             mo.title, mo.url, mo.meta_json, mc.text, mc.seq,
+             {_epoch_sql(db, "mc.created_at")} AS cts
+      FROM memory_chunk mc
+      JOIN memory_object mo ON mo.id = mc.object_id
+      WHERE mo.org_id = :o AND mc.id IN :ids
+    """
+            ).bindparams(bindparam("ids", expanding=True)),
+            {"o": org_id, "ids": [chunk_id for _, chunk_id in hits]},
+        )
+        .mappings()
+        .all()
+    )
+    by_id = {r["chunk_id"]: dict(r) for r in rows}
+
+    # Preserve index ordering; ids deleted since indexing are skipped
+    return [(score, by_id[cid]) for score, cid in hits if cid in by_id]
+
+
+def _keyword_only_rows(
+    db: Session,
+    org_id: str,
+    keys: List[Tuple[str, str]],
+    query_vec: List[float],
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """Chunk rows for documents matched by keyword but not by semantic search
+
+    Each row is scored by cosine similarity to the query (0.0 when the chunk
+    has no embedding of the query's dimension) so it can be ranked alongside
+    semantic results.
+
+    Args:
+        db: Database session
+        org_id: Organization ID
+        keys: (source, foreign_id) of the documents to fetch
+        query_vec: Query embedding vector
+
+    Returns:
+        List of (similarity_score, row_dict) tuples
+    """
+    wanted = set(keys)
+    rows = (
+        db.execute(
+            text(
+                f"""
+      SELECT mo.source, mo.foreign_id, mo.title, mo.url, mo.meta_json,
+             mc.text, mc.seq, mc.embedding,
+             {_epoch_sql(db, "mc.created_at")} AS cts
+      FROM memory_chunk mc
+      JOIN memory_object mo ON mo.id = mc.object_id
+      WHERE mo.org_id = :o AND mo.foreign_id IN :fids
+    """
+            ).bindparams(bindparam("fids", expanding=True)),
+            {"o": org_id, "fids": list({foreign_id for _, foreign_id in keys})},
+        )
+        .mappings()
+        .all()
+    )
+
+    results = []
+    for r in rows:
+        if (r["source"], r["foreign_id"]) not in wanted:
+            continue
+        row = dict(r)
+        embedding = row.pop("embedding")
+        vec = vector_codec.decode(embedding) if embedding is not None else None
+        similarity = (
+            _cosine_similarity(query_vec, vec)
+            if vec is not None and len(vec) == len(query_vec)
+            else 0.0
+        )
+        results.append((similarity, row))
+    return results
+
+
 def semantic(
     db: Session,
     org_id: str,
@@ -394,16 +501,14 @@ def semantic(
     backend = settings.vector_backend.lower()
 
     if backend == "pgvector":
+        SEARCH_BACKEND_CALLS.labels(backend="pgvector").inc()
         return semantic_pgvector(db, org_id, query_vec, sources, limit)
-    elif backend == "faiss":
-        # FAISS backend is recognized but not yet implemented
-        logger.warning(
-            "FAISS backend is recognized but not yet implemented. "
-            "Falling back to JSON vector search. For better performance, consider installing and configuring the 'pgvector' backend, or update the VECTOR_BACKEND configuration setting."
-        )
-        return semantic_json(db, org_id, query_vec, sources, limit)
+    elif backend in ann_index.ANN_BACKENDS:
+        SEARCH_BACKEND_CALLS.labels(backend="local-ann").inc()
+        return semantic_ann(db, org_id, query_vec, sources, limit)
     else:
         # Default to JSON backend
+        SEARCH_BACKEND_CALLS.labels(backend="json").inc()
         return semantic_json(db, org_id, query_vec, sources, limit)
 
 
@@ -436,7 +541,7 @@ def hybrid_search(
         db, org_id, query_vec, sources, limit=HYBRID_OVERFETCH_MULTIPLIER * k
     )
 
-    # Fetch BM25 keyword scores (using ts_rank as approximation)
+    # Fetch BM25 keyword scores (ts_rank on PostgreSQL, in-process BM25 elsewhere)
     bm25_scores = _ts_rank_score(
         db, org_id, query, sources, limit=HYBRID_OVERFETCH_MULTIPLIER * k
     )
@@ -444,6 +549,15 @@ def hybrid_search(
     # Group results by (source, foreign_id) for deduplication
     buckets: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
+    # Documents found only by keyword still compete, scored against their
+    # own embeddings, so keyword recall does not depend on the semantic top-k
+    sem_keys = {(row["source"], row["foreign_id"]) for _, row in sem_results}
+    keyword_only = [key for key in bm25_scores if key not in sem_keys]
+    if keyword_only:
+        sem_results = list(sem_results) + _keyword_only_rows(
+            db, org_id, keyword_only, query_vec
+        )
+
     for similarity, row in sem_results:
         key = (row["source"], row["foreign_id"])
         if key not in buckets:
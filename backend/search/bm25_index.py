@@ -0,0 +1,272 @@
+"""In-process BM25 keyword index for memory chunk retrieval
+
+Provides the keyword component of ``backends.hybrid_search`` on databases
+without PostgreSQL full-text search (SQLite and others). Each org gets an
+inverted index over ``memory_chunk.text`` holding:
+- Per-term postings (chunk positions and term frequencies) in compact arrays
+- Chunk lengths in tokens, for BM25 length normalization
+- The (source, foreign_id) document each chunk belongs to
+
+Scoring is Okapi BM25 with ``settings.bm25_k1`` / ``settings.bm25_b``;
+chunk scores are reduced to a per-document maximum so they key the same
+way as the PostgreSQL ts_rank path.
+
+Indexes are built lazily from ``memory_chunk`` on first query and kept in
+sync incrementally by ``indexer.upsert_memory_object`` (chunks are
+append-only, so there is nothing to delete); each query also catches up on
+chunks indexed by other processes (see index_registry.py).
+"""
+
+import logging
+import math
+import re
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from .index_registry import OrgIndexRegistry
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per page when building an org index from the database
+BUILD_PAGE_SIZE = 5000
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Common English words carrying no ranking signal (mirrors the intent of
+# PostgreSQL's 'english' configuration, which also drops stop words)
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be but by for from has have in is it its of on or
+    that the their there these this to was were will with
+    """.split()
+)
+
+
+def tokenize(value: str) -> List[str]:
+    """Lowercase alphanumeric tokens with stop words removed"""
+    return [t for t in TOKEN_PATTERN.findall(value.lower()) if t not in STOP_WORDS]
+
+
+class OrgKeywordIndex:
+    """BM25 inverted index for a single org
+
+    Thread-safe: all mutation and search happens under an instance lock.
+    Chunk ids are deduplicated, so adding an id that is already present is a
+    no-op.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # term -> (chunk positions, term frequencies)
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._lengths = array("i")
+        self._doc_codes = array("i")
+        self._source_codes = array("i")
+        self._total_length = 0
+        self._id_set: set = set()
+        self._doc_to_code: Dict[Tuple[str, str], int] = {}
+        self._docs: List[Tuple[str, str]] = []
+        self._source_to_code: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def _doc_code(self, doc: Tuple[str, str]) -> int:
+        code = self._doc_to_code.get(doc)
+        if code is None:
+            code = len(self._docs)
+            self._doc_to_code[doc] = code
+            self._docs.append(doc)
+        return code
+
+    def _source_code(self, source: str) -> int:
+        code = self._source_to_code.get(source)
+        if code is None:
+            code = len(self._source_to_code)
+            self._source_to_code[source] = code
+        return code
+
+    def add(
+        self,
+        ids: Sequence[int],
+        texts: Sequence[str],
+        docs: Sequence[Tuple[str, str]],
+    ) -> int:
+        """Add chunks to the index
+
+        Args:
+            ids: memory_chunk ids
+            texts: Chunk text (same order as ids)
+            docs: (source, foreign_id) of the memory_object each chunk belongs to
+
+        Returns:
+            Number of chunks actually added (duplicates are skipped)
+        """
+        added = 0
+        with self._lock:
+            for chunk_id, chunk_text, doc in zip(ids, texts, docs):
+                if chunk_id in self._id_set:
+                    continue
+                self._id_set.add(chunk_id)
+                position = len(self._lengths)
+                tokens = tokenize(chunk_text or "")
+                counts: Dict[str, int] = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                for term, tf in counts.items():
+                    postings = self._postings.get(term)
+                    if postings is None:
+                        postings = self._postings[term] = (array("i"), array("i"))
+                    postings[0].append(position)
+                    postings[1].append(tf)
+                self._lengths.append(len(tokens))
+                self._doc_codes.append(self._doc_code(doc))
+                self._source_codes.append(self._source_code(doc[0]))
+                self._total_length += len(tokens)
+                added += 1
+        return added
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        sources: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[float, Tuple[str, str]]]:
+        """Return the top-k (BM25 score, (source, foreign_id)) pairs
+
+        A document scores as its best-matching chunk.
+
+        Args:
+            query: Free-text query
+            k: Number of documents
+            sources: Optional source filter
+
+        Returns:
+            List of (score, document key) sorted by score descending; only
+            documents matching at least one query term are returned
+        """
+        terms = set(tokenize(query))
+        if not terms or k <= 0:
+            return []
+        k1 = settings.bm25_k1
+        b = settings.bm25_b
+
+        with self._lock:
+            n = len(self._lengths)
+            if n == 0:
+                return []
+            lengths = np.frombuffer(self._lengths, dtype=np.int32)
+            avg_length = max(self._total_length / n, 1e-9)
+            scores = np.zeros(n, dtype=np.float64)
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                positions = np.frombuffer(postings[0], dtype=np.int32)
+                tf = np.frombuffer(postings[1], dtype=np.int32).astype(np.float64)
+                df = len(positions)
+                idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+                norm = k1 * (1.0 - b + b * lengths[positions] / avg_length)
+                scores[positions] += idf * tf * (k1 + 1.0) / (tf + norm)
+
+            matched = np.flatnonzero(scores)
+            if sources is not None and len(matched):
+                codes = [
+                    self._source_to_code[s]
+                    for s in sources
+                    if s in self._source_to_code
+                ]
+                source_codes = np.frombuffer(self._source_codes, dtype=np.int32)
+                matched = matched[np.isin(source_codes[matched], codes)]
+            if not len(matched):
+                return []
+
+            doc_codes = np.frombuffer(self._doc_codes, dtype=np.int32)[matched]
+            best = np.zeros(len(self._docs), dtype=np.float64)
+            np.maximum.at(best, doc_codes, scores[matched])
+            candidates = np.unique(doc_codes)
+            k = min(k, len(candidates))
+            top = candidates[np.argpartition(-best[candidates], k - 1)[:k]]
+            top = top[np.argsort(-best[top], kind="stable")]
+            return [(float(best[code]), self._docs[code]) for code in top]
+
+
+def _load_org_chunks(
+    db: Session, org_id: str, index: OrgKeywordIndex, after_id: int = 0
+) -> int:
+    """Add the org's chunks with id > after_id using keyset pagination
+
+    Returns:
+        The highest chunk id read (after_id when there were none)
+    """
+    last_id = after_id
+    while True:
+        rows = db.execute(
+            text(
+                """
+          SELECT mc.id, mo.source, mo.foreign_id, mc.text
+          FROM memory_chunk mc
+          JOIN memory_object mo ON mo.id = mc.object_id
+          WHERE mo.org_id = :o AND mc.id > :last
+          ORDER BY mc.id
+          LIMIT :lim
+        """
+            ),
+            {"o": org_id, "last": last_id, "lim": BUILD_PAGE_SIZE},
+        ).all()
+        if not rows:
+            break
+        index.add(
+            [r[0] for r in rows],
+            [r[3] for r in rows],
+            [(r[1], r[2]) for r in rows],
+        )
+        last_id = rows[-1][0]
+    return last_id
+
+
+# Process-wide registry of per-org indexes
+_registry: OrgIndexRegistry[OrgKeywordIndex] = OrgIndexRegistry(
+    "BM25", OrgKeywordIndex, _load_org_chunks
+)
+
+
+def get_org_index(db: Session, org_id: str) -> OrgKeywordIndex:
+    """Get the index for an org, building it from the database on first use
+
+    Later calls first add chunks indexed since the last call, including
+    those written by other processes.
+    """
+    return _registry.get(db, org_id)
+
+
+def is_resident(org_id: str) -> bool:
+    """Return True if the org's index has been built in this process"""
+    return _registry.resident(org_id) is not None
+
+
+def add_chunks(
+    org_id: str,
+    ids: Sequence[int],
+    texts: Sequence[str],
+    docs: Sequence[Tuple[str, str]],
+) -> None:
+    """Incrementally add newly committed chunks to a resident org index
+
+    No-op when the org's index has not been built yet; it will include these
+    chunks when it is first loaded.
+    """
+    index = _registry.resident(org_id)
+    if index is not None and ids:
+        index.add(ids, texts, docs)
+
+
+def reset_indexes() -> None:
+    """Drop all resident indexes (tests and administrative rebuilds)"""
+    _registry.reset()
@@ -18,10 +18,16 @@ def embed_texts(texts: List[str]) -> List[List[float]]:
     if p == "openai":
         from openai import OpenAI
 
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        from backend.services.embedding_cache import get_embedding_cache
+
         model = os.getenv("OPENAI_EMBED_MODEL", "text-embedding-3-small")
-        r = client.embeddings.create(model=model, input=texts)
-        return [d.embedding for d in r.data]
+
+        def _embed(batch: List[str]) -> List[List[float]]:
+            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            r = client.embeddings.create(model=model, input=batch)
+            return [d.embedding for d in r.data]
+
+        return get_embedding_cache().get_or_embed(model, dim(), texts, _embed)
     # Dev fallback without external calls
     out = []
     D = dim()
@@ -0,0 +1,161 @@
+"""Process-wide registry of lazily built per-org search indexes
+
+Shared by the in-process ANN (ann_index.py) and BM25 (bm25_index.py)
+indexes. An org's index is built from ``memory_chunk`` on first use. Every
+later lookup first catches up on chunks with an id above the highest one
+already read from the database, so chunks indexed by other processes (other
+API workers, background indexers) become searchable on the next query
+instead of after a restart.
+
+Ids are assigned when a transaction inserts a chunk but only become
+visible when it commits, so on PostgreSQL a chunk can appear after one with
+a higher id was already read. Every ``CATCHUP_RESCAN_INTERVAL_SECONDS`` the
+catch-up therefore also re-reads a trailing window of ids: from the highest
+id that had been read ``CATCHUP_COMMIT_LAG_SECONDS`` before the previous
+rescan (from the start, once, after the initial build). Any chunk committed
+within that long of its insert is picked up by the first rescan after its
+commit.
+
+Chunks committed by this process are also added directly through
+``add``-style hooks called from ``indexer.upsert_memory_object``; indexes
+deduplicate chunk ids, so reading such a chunk again during catch-up is a
+no-op.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Generic, Optional, Tuple, TypeVar
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+IndexT = TypeVar("IndexT")
+
+# loader(db, org_id, index, after_id) adds the org's chunks with
+# id > after_id to the index and returns the highest chunk id it read
+# (after_id when there were none)
+IndexLoader = Callable[[Session, str, Any, int], int]
+
+# Longest expected gap between a chunk's insert and its commit; chunks
+# committed later than that may be missed until the index is rebuilt
+CATCHUP_COMMIT_LAG_SECONDS = 60.0
+# Minimum time between catch-ups that re-read the trailing window
+CATCHUP_RESCAN_INTERVAL_SECONDS = 10.0
+
+
+class OrgIndexRegistry(Generic[IndexT]):
+    """Per-org indexes built on first use and caught up before each query
+
+    Indexes must guard their state with a re-entrant lock exposed as
+    ``_lock``; the registry holds it while building or catching up so
+    concurrent searches wait instead of seeing a partial index.
+    """
+
+    def __init__(
+        self, kind: str, factory: Callable[[], IndexT], loader: IndexLoader
+    ) -> None:
+        self.kind = kind
+        self._factory = factory
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, IndexT] = {}
+        # Highest memory_chunk.id read from the database, per org
+        self._loaded_through: Dict[str, int] = {}
+        # (monotonic time, highest id read by then) per org, oldest first:
+        # chunks inserted after that time have higher ids
+        self._watermarks: Dict[str, Deque[Tuple[float, int]]] = {}
+        # When the next trailing-window rescan is due, per org
+        self._rescan_due: Dict[str, float] = {}
+        # Chunks inserted before this time (per org) and committed before the
+        # last rescan have been read; later ones may still be committed
+        self._settled_before: Dict[str, float] = {}
+
+    def get(self, db: Session, org_id: str) -> IndexT:
+        """Get the index for an org, building it or catching it up first"""
+        with self._lock:
+            index = self._indexes.get(org_id)
+            building = index is None
+            if building:
+                index = self._factory()
+                # Registered before loading, so take the index lock now
+                index._lock.acquire()
+                self._indexes[org_id] = index
+
+        if building:
+            try:
+                through = self._loader(db, org_id, index, 0)
+                built = time.monotonic()
+                self._loaded_through[org_id] = through
+                # Chunks inserted before or during the build may still commit
+                # for up to the lag, so the first rescan starts from id 0
+                self._watermarks[org_id] = deque([(float("-inf"), 0), (built, through)])
+                self._settled_before[org_id] = float("-inf")
+                self._rescan_due[org_id] = built + CATCHUP_COMMIT_LAG_SECONDS
+                logger.info(
+                    "Built %s index for org %s: entries=%d",
+                    self.kind,
+                    org_id,
+                    len(index),
+                )
+            except Exception:
+                with self._lock:
+                    self._indexes.pop(org_id, None)
+                raise
+            finally:
+                index._lock.release()
+            return index
+
+        with index._lock:
+            loaded = self._loaded_through.get(org_id, 0)
+            rescan_from = self._rescan_from(org_id)
+            after_id = loaded if rescan_from is None else min(rescan_from, loaded)
+            through = max(loaded, self._loader(db, org_id, index, after_id))
+            self._loaded_through[org_id] = through
+            if through > loaded:
+                self._watermarks.setdefault(org_id, deque()).append(
+                    (time.monotonic(), through)
+                )
+        if through > loaded:
+            logger.debug(
+                "Caught up %s index for org %s: chunks %d..%d",
+                self.kind,
+                org_id,
+                loaded + 1,
+                through,
+            )
+        return index
+
+    def _rescan_from(self, org_id: str) -> Optional[int]:
+        """Id to re-read the trailing window from, when a rescan is due
+
+        Caller must hold the org index's lock.
+        """
+        now = time.monotonic()
+        marks = self._watermarks.get(org_id)
+        if not marks or now < self._rescan_due.get(org_id, 0.0):
+            return None
+        # Chunks committed since the last rescan were inserted after
+        # settled_before, so above the last id read by then
+        settled_before = self._settled_before.get(org_id, float("-inf"))
+        while len(marks) > 1 and marks[1][0] <= settled_before:
+            marks.popleft()
+        self._settled_before[org_id] = now - CATCHUP_COMMIT_LAG_SECONDS
+        self._rescan_due[org_id] = now + CATCHUP_RESCAN_INTERVAL_SECONDS
+        return marks[0][1]
+
+    def resident(self, org_id: str) -> Optional[IndexT]:
+        """The org's index if it has been built in this process"""
+        with self._lock:
+            return self._indexes.get(org_id)
+
+    def reset(self) -> None:
+        """Drop all resident indexes (tests and administrative rebuilds)"""
+        with self._lock:
+            self._indexes.clear()
+            self._loaded_through.clear()
+            self._watermarks.clear()
+            self._rescan_due.clear()
+            self._settled_before.clear()
@@ -1,25 +1,43 @@
 """Memory indexing - chunk and embed content from various sources"""
 
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from ..core.config import settings
+from . import ann_index, bm25_index, vector_codec
 from .embeddings import embed_texts
+from dataclasses import dataclass, field
 import hashlib
 import json
-from typing import Dict, List
+import logging
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 CHUNK = 1200
 OVERLAP = 150
 
+# Rough characters-per-token ratio used to size embedding requests
+CHARS_PER_TOKEN = 4
+# Hard cap on inputs per embedding request (OpenAI rejects more than 2048)
+MAX_EMBED_INPUTS = 2048
+
+
+def _storage_codec() -> int:
+    """Codec header byte for new rows (settings.embedding_storage_format)"""
+    return vector_codec.codec_id(settings.embedding_storage_format)
 
-def encode_vector_as_bytes(vec: List[float]) -> memoryview:
+
+def encode_vector_as_bytes(vec: List[float]) -> bytes:
     """Encode a vector as bytes for storage in LargeBinary column.
-    Uses JSON encoding for SQLite compatibility and easy migration to pgvector."""
-    return memoryview(bytearray(json.dumps(vec), "utf-8"))
+    Uses the versioned binary codec (see vector_codec.py)."""
+    return vector_codec.encode(vec, _storage_codec())
 
 
-def decode_vector_from_bytes(data: bytes) -> List[float]:
-    """Decode a vector from bytes stored in LargeBinary column."""
-    return json.loads(bytes(data).decode("utf-8"))
+def decode_vector_from_bytes(data: bytes) -> np.ndarray:
+    """Decode a vector from bytes stored in LargeBinary column.
+    Reads both binary codec rows and legacy JSON rows."""
+    return vector_codec.decode(data)
 
 
 def _chunks(s: str, n: int = CHUNK, overlap: int = OVERLAP):
@@ -33,87 +51,331 @@ def _chunks(s: str, n: int = CHUNK, overlap: int = OVERLAP):
     return out or [""]
 
 
-def upsert_memory_object(
-    db: Session,
-    org_id: str,
-    source: str,
-    foreign_id: str,
-    title: str,
-    url: str,
-    lang: str,
-    meta: Dict,
-    content: str,
-):
-    """Index a content object into memory with embeddings"""
-    # Insert or get existing object
-    row = (
-        db.execute(
-            text(
-                """
+@dataclass
+class MemoryDocument:
+    """A content object to index into memory"""
+
+    source: str
+    foreign_id: str
+    title: str
+    url: Optional[str]
+    lang: str
+    meta: Dict
+    content: str
+
+
+@dataclass
+class BulkIndexStats:
+    """Progress of a bulk indexing run (reported after every committed batch)"""
+
+    documents: int = 0
+    chunks_inserted: int = 0
+    chunks_skipped: int = 0
+    batches: int = 0
+    failed: List[str] = field(default_factory=list)
+
+
+def _estimate_tokens(s: str) -> int:
+    return len(s) // CHARS_PER_TOKEN + 1
+
+
+def _embed_batched(texts: List[str], token_budget: int) -> List[List[float]]:
+    """Embed texts in as few requests as the token budget allows"""
+    vecs: List[List[float]] = []
+    batch: List[str] = []
+    batch_tokens = 0
+    for t in texts:
+        tokens = _estimate_tokens(t)
+        if batch and (
+            batch_tokens + tokens > token_budget or len(batch) >= MAX_EMBED_INPUTS
+        ):
+            vecs.extend(embed_texts(batch))
+            batch, batch_tokens = [], 0
+        batch.append(t)
+        batch_tokens += tokens
+    if batch:
+        vecs.extend(embed_texts(batch))
+    return vecs
+
+
+def _upsert_objects(
+    db: Session, org_id: str, docs: List[MemoryDocument]
+) -> Dict[Tuple[str, str], int]:
+    """Insert missing memory_object rows; return ids keyed by (source, foreign_id)"""
+    db.execute(
+        text(
+            """
         INSERT INTO memory_object (org_id,source,foreign_id,title,url,lang,meta_json)
         VALUES (:o,:s,:f,:t,:u,:l,:m)
         ON CONFLICT (org_id, source, foreign_id) DO NOTHING
-        RETURNING id
     """
-            ),
+        ),
+        [
             {
                 "o": org_id,
-                "s": source,
-                "f": foreign_id,
-                "t": title,
-                "u": url,
-                "l": lang,
-                "m": json.dumps(meta),
-            },
-        )
-        .mappings()
-        .first()
+                "s": d.source,
+                "f": d.foreign_id,
+                "t": d.title,
+                "u": d.url,
+                "l": d.lang,
+                "m": json.dumps(d.meta),
+            }
+            for d in docs
+        ],
     )
+    rows = db.execute(
+        text(
+            "SELECT id, source, foreign_id FROM memory_object "
+            "WHERE org_id=:o AND foreign_id IN :fids"
+        ).bindparams(bindparam("fids", expanding=True)),
+        {"o": org_id, "fids": list({d.foreign_id for d in docs})},
+    ).all()
+    return {(r[1], r[2]): r[0] for r in rows}
+
 
-    if row is None:
-        row = (
-            db.execute(
+def _index_documents(
+    db: Session,
+    org_id: str,
+    docs: List[MemoryDocument],
+    token_budget: int,
+    stats: BulkIndexStats,
+) -> Tuple[Dict[Tuple[str, str], int], List[Tuple[int, str, str, List[float]]]]:
+    """Write objects and new chunks for a batch of documents (no commit)
+
+    Chunk hashes are deduplicated with one set-based query, only new chunks
+    are embedded, and chunks are written with a single multi-row insert.
+
+    Returns:
+        Object ids keyed by (source, foreign_id), and (object_id, chunk hash,
+        text, vector) for each inserted chunk, for syncing the in-process
+        ANN and BM25 indexes
+    """
+    obj_ids = _upsert_objects(db, org_id, docs)
+
+    existing = set()
+    if obj_ids:
+        existing = {
+            (r[0], r[1])
+            for r in db.execute(
                 text(
-                    "SELECT id FROM memory_object WHERE org_id=:o AND source=:s AND foreign_id=:f"
-                ),
-                {"o": org_id, "s": source, "f": foreign_id},
-            )
-            .mappings()
-            .first()
-        )
+                    "SELECT object_id, hash FROM memory_chunk WHERE object_id IN :ids"
+                ).bindparams(bindparam("ids", expanding=True)),
+                {"ids": list(set(obj_ids.values()))},
+            ).all()
+        }
+
+    pending = []  # (object_id, seq, text, hash)
+    for d in docs:
+        obj_id = obj_ids[(d.source, d.foreign_id)]
+        for i, chunk in enumerate(_chunks(d.content)):
+            # Use blake2b for faster hashing (deduplication purposes only)
+            h = hashlib.blake2b(chunk.encode()).hexdigest()
+            if (obj_id, h) in existing:
+                stats.chunks_skipped += 1
+                continue
+            existing.add((obj_id, h))
+            pending.append((obj_id, i, chunk, h))
 
-    obj_id = row["id"]
-
-    # Chunk and embed
-    parts = _chunks(content)
-    vecs = embed_texts(parts)
-
-    for i, (chunk, vec) in enumerate(zip(parts, vecs)):
-        # Use blake2b for faster hashing (deduplication purposes only)
-        h = hashlib.blake2b(chunk.encode()).hexdigest()
-        # Skip if chunk already indexed
-        if db.execute(
-            text("SELECT 1 FROM memory_chunk WHERE object_id=:id AND hash=:h"),
-            {"id": obj_id, "h": h},
-        ).fetchone():
-            continue
-
-        db.execute(
-            text(
-                """
-            INSERT INTO memory_chunk (object_id,seq,text,embedding,vec_dim,hash)
-            VALUES (:id,:seq,:text,:emb,:dim,:h)
-        """
-            ),
+    if not pending:
+        return obj_ids, []
+
+    vecs = _embed_batched([p[2] for p in pending], token_budget)
+    codec = _storage_codec()
+    db.execute(
+        text(
+            """
+        INSERT INTO memory_chunk (object_id,seq,text,embedding,vec_codec,vec_dim,hash)
+        VALUES (:id,:seq,:text,:emb,:codec,:dim,:h)
+    """
+        ),
+        [
             {
                 "id": obj_id,
-                "seq": i,
+                "seq": seq,
                 "text": chunk,
-                "emb": encode_vector_as_bytes(vec),
+                "emb": vector_codec.encode(vec, codec),
+                "codec": codec,
                 "dim": len(vec),
                 "h": h,
-            },
+            }
+            for (obj_id, seq, chunk, h), vec in zip(pending, vecs)
+        ],
+    )
+    stats.chunks_inserted += len(pending)
+    return obj_ids, [(p[0], p[3], p[2], v) for p, v in zip(pending, vecs)]
+
+
+def _sync_resident_indexes(
+    db: Session,
+    org_id: str,
+    obj_ids: Dict[Tuple[str, str], int],
+    inserted: List[Tuple[int, str, str, List[float]]],
+) -> None:
+    """Add newly committed chunks to the org's resident ANN and BM25 indexes, if any"""
+    sync_ann = ann_index.is_resident(org_id)
+    sync_bm25 = bm25_index.is_resident(org_id)
+    if not inserted or not (sync_ann or sync_bm25):
+        return
+    rows = db.execute(
+        text(
+            "SELECT id, object_id, hash FROM memory_chunk WHERE object_id IN :ids"
+        ).bindparams(bindparam("ids", expanding=True)),
+        {"ids": list({row[0] for row in inserted})},
+    ).all()
+    chunk_ids = {(r[1], r[2]): r[0] for r in rows}
+    docs = {obj_id: key for key, obj_id in obj_ids.items()}
+    ids = [chunk_ids[(obj_id, h)] for obj_id, h, _, _ in inserted]
+    if sync_ann:
+        ann_index.add_vectors(
+            org_id,
+            ids,
+            [vec for _, _, _, vec in inserted],
+            [docs[obj_id][0] for obj_id, _, _, _ in inserted],
         )
+    if sync_bm25:
+        bm25_index.add_chunks(
+            org_id,
+            ids,
+            [chunk for _, _, chunk, _ in inserted],
+            [docs[obj_id] for obj_id, _, _, _ in inserted],
+        )
+
+
+class BulkIndexer:
+    """Streaming bulk ingestion into memory_object/memory_chunk
+
+    Documents are buffered and flushed in batches of ``batch_size`` documents
+    (or earlier once their estimated tokens reach ``token_budget``). Each
+    flush upserts objects, dedups chunk hashes with one query, embeds new
+    chunks in as few requests as the token budget allows, inserts them with
+    a multi-row insert and commits. ``on_commit`` receives the documents of
+    each committed batch so callers can advance sync checkpoints, and
+    ``on_progress`` receives the running stats.
+
+    If a batch fails it is rolled back and retried one document at a time so
+    a single bad document does not lose the rest; failed foreign ids are
+    reported in ``stats.failed``.
+
+    Usage:
+        with BulkIndexer(db, org_id) as bulk:
+            for doc in docs:
+                bulk.add(doc)
+        stats = bulk.stats
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        org_id: str,
+        batch_size: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        on_commit: Optional[Callable[[List[MemoryDocument]], None]] = None,
+        on_progress: Optional[Callable[[BulkIndexStats], None]] = None,
+    ):
+        self.db = db
+        self.org_id = org_id
+        self.batch_size = batch_size or settings.search_ingest_batch_size
+        self.token_budget = token_budget or settings.search_embed_token_budget
+        self.on_commit = on_commit
+        self.on_progress = on_progress
+        self.stats = BulkIndexStats()
+        self._buffer: List[MemoryDocument] = []
+        self._buffer_tokens = 0
+
+    def __enter__(self) -> "BulkIndexer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def add(self, doc: MemoryDocument) -> None:
+        """Buffer a document, flushing when the batch is full"""
+        self._buffer.append(doc)
+        self._buffer_tokens += _estimate_tokens(doc.content or "")
+        if (
+            len(self._buffer) >= self.batch_size
+            or self._buffer_tokens >= self.token_budget
+        ):
+            self.flush()
+
+    def add_all(self, docs: Iterable[MemoryDocument]) -> BulkIndexStats:
+        """Index every document from an iterable and flush"""
+        for doc in docs:
+            self.add(doc)
+        self.flush()
+        return self.stats
+
+    def flush(self) -> None:
+        """Write and commit all buffered documents"""
+        docs, self._buffer, self._buffer_tokens = self._buffer, [], 0
+        if not docs:
+            return
+        try:
+            self._commit_batch(docs)
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(
+                "Bulk index batch of %d documents failed (%s); retrying individually",
+                len(docs),
+                e,
+            )
+            committed = []
+            for doc in docs:
+                try:
+                    self._commit_batch([doc], notify=False)
+                    committed.append(doc)
+                except Exception as doc_error:
+                    self.db.rollback()
+                    logger.error(
+                        "Failed to index %s document %r: %s",
+                        doc.source,
+                        doc.foreign_id,
+                        doc_error,
+                    )
+                    self.stats.failed.append(doc.foreign_id)
+            if committed and self.on_commit:
+                self.on_commit(committed)
 
+        self.stats.batches += 1
+        if self.on_progress:
+            self.on_progress(self.stats)
+
+    def _commit_batch(self, docs: List[MemoryDocument], notify: bool = True) -> None:
+        batch = BulkIndexStats()
+        obj_ids, inserted = _index_documents(
+            self.db, self.org_id, docs, self.token_budget, batch
+        )
+        self.db.commit()
+        self.stats.documents += len(docs)
+        self.stats.chunks_inserted += batch.chunks_inserted
+        self.stats.chunks_skipped += batch.chunks_skipped
+        _sync_resident_indexes(self.db, self.org_id, obj_ids, inserted)
+        if notify and self.on_commit:
+            self.on_commit(docs)
+
+
+def upsert_memory_object(
+    db: Session,
+    org_id: str,
+    source: str,
+    foreign_id: str,
+    title: str,
+    url: str,
+    lang: str,
+    meta: Dict,
+    content: str,
+):
+    """Index a content object into memory with embeddings
+
+    For many documents use BulkIndexer, which batches queries, embedding
+    requests and commits across documents.
+    """
+    doc = MemoryDocument(source, foreign_id, title, url, lang, meta, content)
+    stats = BulkIndexStats()
+    obj_ids, inserted = _index_documents(
+        db, org_id, [doc], settings.search_embed_token_budget, stats
+    )
     db.commit()
-    return obj_id
+    _sync_resident_indexes(db, org_id, obj_ids, inserted)
+    return obj_ids[(source, foreign_id)]
@@ -2,12 +2,15 @@
 
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from . import ann_index
+from .backends import semantic_ann
 from .embeddings import embed_texts
 from .indexer import decode_vector_from_bytes
 import json
-import math
 import os
-from typing import List, Dict
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 # Configurable limit for chunk retrieval (can be overridden via env var)
 MAX_CHUNKS = int(os.getenv("AEP_SEARCH_MAX_CHUNKS", "6000"))
@@ -24,31 +27,30 @@ def _truncate_excerpt(text: str, max_len: int = EXCERPT_LENGTH) -> str:
     return text[:max_len].rstrip() + "..."
 
 
-def cosine(a: List[float], b: List[float]) -> float:
-    """Cosine similarity between two vectors - single-pass calculation"""
-    dot = mag_a = mag_b = 0.0
-    for x, y in zip(a, b):
-        dot += x * y
-        mag_a += x * x
-        mag_b += y * y
-    na = math.sqrt(mag_a)
-    nb = math.sqrt(mag_b)
+def cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity between two vectors (compared over the shorter length)"""
+    n = min(len(a), len(b))
+    va = np.asarray(a[:n], dtype=np.float32)
+    vb = np.asarray(b[:n], dtype=np.float32)
+    na = float(np.linalg.norm(va))
+    nb = float(np.linalg.norm(vb))
     if na == 0.0 or nb == 0.0:
         return 0.0
-    return dot / (na * nb)
+    return float(np.dot(va, vb)) / (na * nb)
 
 
 def search(db: Session, org_id: str, query: str, k: int = 8) -> List[Dict]:
     """Semantic search across memory chunks
 
-    Note: This implementation loads all chunks into memory and computes similarity in Python.
-    For production deployments with >10k chunks, consider:
-    - Vector database with native similarity search (pgvector, Pinecone, Weaviate)
-    - Pagination and filtering by source type before retrieval
-    - Pre-computed index structures (FAISS, Annoy)
+    When settings.vector_backend selects the in-process ANN index ("local-ann"
+    or "faiss"), top-k comes from the per-org index with no scan limit.
+    Otherwise this loads up to MAX_CHUNKS chunks and computes similarity in Python.
     """
     qv = embed_texts([query])[0]
 
+    if ann_index.is_enabled():
+        return [_format_hit(s, r) for s, r in semantic_ann(db, org_id, qv, None, k)]
+
     # Fetch all chunks for this org (limit configurable via env var)
     rows = (
         db.execute(
@@ -77,16 +79,18 @@ def search(db: Session, org_id: str, query: str, k: int = 8) -> List[Dict]:
     # Return top-k
     top = sorted(scored, key=lambda x: x[0], reverse=True)[:k]
 
-    return [
-        {
-            "score": float(f"{s:.4f}"),
-            "source": r["source"],
-            "title": r["title"],
-            "foreign_id": r["foreign_id"],
-            "url": r["url"],
-            "meta": json.loads(r["meta_json"] or "{}"),
-            "chunk_seq": r["seq"],
-            "excerpt": _truncate_excerpt(r["text"]),
-        }
-        for s, r in top
-    ]
+    return [_format_hit(s, r) for s, r in top]
+
+
+def _format_hit(score: float, r) -> Dict:
+    """Format a scored chunk row as a search hit"""
+    return {
+        "score": float(f"{score:.4f}"),
+        "source": r["source"],
+        "title": r["title"],
+        "foreign_id": r["foreign_id"],
+        "url": r["url"],
+        "meta": json.loads(r["meta_json"] or "{}"),
+        "chunk_seq": r["seq"],
+        "excerpt": _truncate_excerpt(r["text"]),
+    }
@@ -6,7 +6,7 @@ import logging
 import re
 from importlib.util import find_spec
 
-import httpx
+from ..services.http_client import closing_http_clients, http_client
 from bs4 import BeautifulSoup
 from fastapi import APIRouter, Depends, Body, Request, HTTPException
 from sqlalchemy import text
@@ -22,7 +22,7 @@ from .constants import (
     MAX_MEETINGS_PER_SYNC,
     HTML_OVERHEAD_MULTIPLIER,
 )
-from .indexer import upsert_memory_object
+from .indexer import BulkIndexer, MemoryDocument
 from .retriever import search as do_search
 from .schemas import SearchRequest, SearchResponse
 
@@ -143,18 +143,19 @@ def reindex_jira(request: Request = None, db: Session = Depends(get_db)):
         .all()
     )
 
-    for r in rows:
-        upsert_memory_object(
-            db,
-            org,
-            "jira",
-            r["issue_key"],
-            r["summary"] or r["issue_key"],
-            r["url"],
-            "en",
-            {"status": r["status"]},
-            r["summary"] or r["issue_key"],
-        )
+    with BulkIndexer(db, org) as bulk:
+        for r in rows:
+            bulk.add(
+                MemoryDocument(
+                    "jira",
+                    r["issue_key"],
+                    r["summary"] or r["issue_key"],
+                    r["url"],
+                    "en",
+                    {"status": r["status"]},
+                    r["summary"] or r["issue_key"],
+                )
+            )
 
     return {"ok": True, "count": len(rows)}
 
@@ -186,19 +187,14 @@ def reindex_meetings(request: Request = None, db: Session = Depends(get_db)):
         .all()
     )
 
-    for r in rows:
-        txt = r["s"] if isinstance(r["s"], str) else json.dumps(r["s"])
-        upsert_memory_object(
-            db,
-            org,
-            "meeting",
-            str(r["mid"]),
-            f"Meeting {r['mid']}",
-            None,
-            "en",
-            {},
-            txt,
-        )
+    with BulkIndexer(db, org) as bulk:
+        for r in rows:
+            txt = r["s"] if isinstance(r["s"], str) else json.dumps(r["s"])
+            bulk.add(
+                MemoryDocument(
+                    "meeting", str(r["mid"]), f"Meeting {r['mid']}", None, "en", {}, txt
+                )
+            )
 
     return {"ok": True, "count": len(rows)}
 
@@ -228,19 +224,20 @@ def reindex_code(request: Request = None, db: Session = Depends(get_db)):
         .all()
     )
 
-    for r in rows:
-        url = f"https://github.com/{r['repo']}/blob/HEAD/{r['path']}"
-        upsert_memory_object(
-            db,
-            org,
-            "code",
-            f"{r['repo']}::{r['path']}",
-            r["path"],
-            url,
-            "code",
-            {"repo": r["repo"], "path": r["path"]},
-            r["blob_text"] or "",
-        )
+    with BulkIndexer(db, org) as bulk:
+        for r in rows:
+            url = f"https://github.com/{r['repo']}/blob/HEAD/{r['path']}"
+            bulk.add(
+                MemoryDocument(
+                    "code",
+                    f"{r['repo']}::{r['path']}",
+                    r["path"],
+                    url,
+                    "code",
+                    {"repo": r["repo"], "path": r["path"]},
+                    r["blob_text"] or "",
+                )
+            )
 
     return {"ok": True, "count": len(rows)}
 
@@ -277,7 +274,7 @@ def reindex_slack(request: Request = None, db: Session = Depends(get_db)):
     async def run():
         from ..integrations_ext.slack_read import SlackReader
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with http_client(timeout=30) as client:
             sr = SlackReader(token)
             chans = await sr.list_channels(client)
             # incremental cursor
@@ -303,44 +300,48 @@ def reindex_slack(request: Request = None, db: Session = Depends(get_db)):
                     MAX_CHANNELS_PER_SYNC,
                     org,
                 )
-            # Count of successfully indexed messages (reset per sync run)
-            count = 0
+            # All channel histories are read with the cursor from the previous sync
+            oldest = newest
+            # Message timestamps by foreign id, used to advance the cursor on commit
+            ts_by_id = {}
+
+            def on_commit(docs):
+                # Advance the cursor only for committed messages, preventing
+                # re-processing of already-indexed messages on next sync.
+                nonlocal newest
+                for d in docs:
+                    newest = safe_update_newest(newest, ts_by_id[d.foreign_id])
+
+            bulk = BulkIndexer(db, org, on_commit=on_commit)
             for c in chans[:MAX_CHANNELS_PER_SYNC]:
                 msgs = await sr.history(
-                    client, c["id"], oldest=newest, limit=SLACK_HISTORY_LIMIT
+                    client, c["id"], oldest=oldest, limit=SLACK_HISTORY_LIMIT
                 )
                 for m in msgs:
-                    try:
-                        ts = m.get("ts")
-                        text_content = m.get("text", "")
-                        if not ts:
-                            raise ValueError("missing timestamp in Slack message")
-                        title = f"#{c['name']} {ts}"
-                        upsert_memory_object(
-                            db,
+                    ts = m.get("ts")
+                    if not ts:
+                        logger.error(
+                            "Skipping Slack message without timestamp (channel_id=%r, org_id=%r)",
+                            c.get("id"),
                             org,
+                        )
+                        continue
+                    foreign_id = f"{c['id']}::{ts}"
+                    ts_by_id[foreign_id] = ts
+                    bulk.add(
+                        MemoryDocument(
                             "slack",
-                            f"{c['id']}::{ts}",
-                            title,
+                            foreign_id,
+                            f"#{c['name']} {ts}",
                             None,
                             "en",
                             {"channel": c["name"]},
-                            text_content,
+                            m.get("text", ""),
                         )
-                        # Update newest timestamp INSIDE try block to track successful upserts.
-                        # This ensures cursor advances only for successfully indexed messages,
-                        # preventing re-processing of already-indexed messages on next sync.
-                        newest = safe_update_newest(newest, ts)
-                        count += 1
-                    except Exception as e:
-                        logger.error(
-                            "Failed to upsert Slack message (channel_id=%r, ts=%r, org_id=%r): %s",
-                            c.get("id"),
-                            m.get("ts"),
-                            org,
-                            e,
-                        )
-                        continue
+                    )
+            bulk.flush()
+            # Count of successfully indexed messages (reset per sync run)
+            count = bulk.stats.documents
             # Only update cursor if we have a valid timestamp.
             # Note: newest will be None only if no messages with valid timestamps were processed.
             if newest:
@@ -359,7 +360,7 @@ def reindex_slack(request: Request = None, db: Session = Depends(get_db)):
                 db.commit()
             return count
 
-    count = asyncio.run(run())
+    count = asyncio.run(closing_http_clients(run))
     return {"ok": True, "count": count}
 
 
@@ -405,12 +406,12 @@ def reindex_confluence(
     async def run():
         from ..integrations_ext.confluence_read import ConfluenceReader
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with http_client(timeout=30) as client:
             cr = ConfluenceReader(conf_base, conf_token, conf_email)
             pages = await cr.pages(
                 client, space_key=space_key, start=0, limit=CONFLUENCE_PAGE_LIMIT
             )
-            count = 0
+            bulk = BulkIndexer(db, org)
             for p in pages:
                 text_html = p["html"]
                 # Truncate raw HTML before parsing for performance (avoid memory/CPU issues with large pages).
@@ -433,10 +434,8 @@ def reindex_confluence(
                 text_clean = re.sub(r"\s+", " ", text_clean).strip()[
                     :MAX_CONTENT_LENGTH
                 ]
-                try:
-                    upsert_memory_object(
-                        db,
-                        org,
+                bulk.add(
+                    MemoryDocument(
                         "confluence",
                         p["id"],
                         p["title"],
@@ -445,17 +444,11 @@ def reindex_confluence(
                         {"version": p["version"]},
                         text_clean,
                     )
-                    count += 1
-                except Exception as e:
-                    logger.error(
-                        "Failed to index Confluence page id=%r title=%r: %s",
-                        p.get("id"),
-                        p.get("title"),
-                        e,
-                    )
-            return count
+                )
+            bulk.flush()
+            return bulk.stats.documents
 
-    count = asyncio.run(run())
+    count = asyncio.run(closing_http_clients(run))
     return {"ok": True, "count": count}
 
 
@@ -469,24 +462,11 @@ def reindex_wiki(request: Request = None, db: Session = Depends(get_db)):
     from ..integrations_ext.wiki_read import scan_docs
 
     docs = scan_docs("docs")
-    failed = []
-    for d in docs:
-        try:
-            upsert_memory_object(
-                db,
-                org,
-                "wiki",
-                d["title"],
-                d["title"],
-                d["url"],
-                "en",
-                {},
-                d["content"],
-            )
-        except Exception as e:
-            logger.error("Failed to index wiki document '%s': %s", d["title"], e)
-            failed.append(d["title"])
-    return {"ok": True, "count": len(docs), "failed": failed}
+    stats = BulkIndexer(db, org).add_all(
+        MemoryDocument("wiki", d["title"], d["title"], d["url"], "en", {}, d["content"])
+        for d in docs
+    )
+    return {"ok": True, "count": len(docs), "failed": stats.failed}
 
 
 @router.post("/reindex/zoom_teams")
@@ -512,20 +492,18 @@ def reindex_zoom_teams(request: Request = None, db: Session = Depends(get_db)):
         .mappings()
         .all()
     )
-    for r in rows:
-        txt = r["s"] if isinstance(r["s"], str) else json.dumps(r["s"])
-        try:
-            upsert_memory_object(
-                db,
-                org,
-                "meeting",
-                str(r["mid"]),
-                f"Meeting {r['mid']}",
-                None,
-                "en",
-                {"provider": "zoom/teams"},
-                txt,
+    with BulkIndexer(db, org) as bulk:
+        for r in rows:
+            txt = r["s"] if isinstance(r["s"], str) else json.dumps(r["s"])
+            bulk.add(
+                MemoryDocument(
+                    "meeting",
+                    str(r["mid"]),
+                    f"Meeting {r['mid']}",
+                    None,
+                    "en",
+                    {"provider": "zoom/teams"},
+                    txt,
+                )
             )
-        except Exception as e:
-            logger.error("Failed to index meeting ID %s: %s", r["mid"], e)
     return {"ok": True, "count": len(rows)}
@@ -0,0 +1,187 @@
+"""Binary embedding codec for memory_chunk.embedding
+
+Vectors are stored as a one-byte header followed by a little-endian payload:
+- 0x01 float32: raw float32 values (decoded zero-copy with numpy.frombuffer)
+- 0x02 float16: half-precision values (half the size, ~3 significant digits)
+- 0x03 int8:    float32 scale followed by symmetric int8 codes (quarter size)
+
+Legacy rows written before the codec existed hold UTF-8 JSON text
+(``[0.1, 0.2, ...]``). Their first byte is ``[`` or whitespace, which never
+collides with a header byte, so ``decode`` reads both formats transparently.
+
+The ``memory_chunk.vec_codec`` column records the header byte of each row
+(NULL = legacy JSON) so ``backfill_vector_codec`` can find and rewrite the
+remaining JSON rows in resumable batches.
+"""
+
+import json
+import logging
+from typing import Sequence, Union
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+CODEC_FLOAT32 = 0x01
+CODEC_FLOAT16 = 0x02
+CODEC_INT8 = 0x03
+
+CODECS_BY_NAME = {
+    "float32": CODEC_FLOAT32,
+    "float16": CODEC_FLOAT16,
+    "int8": CODEC_INT8,
+}
+
+# Size in bytes of the float32 scale stored after the int8 header
+_INT8_SCALE_BYTES = 4
+
+VectorBytes = Union[bytes, bytearray, memoryview, str]
+
+
+def codec_id(name: str) -> int:
+    """Resolve a codec name (float32 | float16 | int8) to its header byte"""
+    try:
+        return CODECS_BY_NAME[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown embedding storage format {name!r}. "
+            f"Expected one of: {', '.join(CODECS_BY_NAME)}"
+        ) from None
+
+
+def encode(vec: Sequence[float], codec: int = CODEC_FLOAT32) -> bytes:
+    """Encode a vector with the given codec
+
+    Args:
+        vec: Embedding vector
+        codec: One of CODEC_FLOAT32, CODEC_FLOAT16, CODEC_INT8
+
+    Returns:
+        Header byte followed by the little-endian payload
+    """
+    arr = np.asarray(vec, dtype=np.float32)
+    if codec == CODEC_FLOAT32:
+        payload = arr.astype("<f4", copy=False).tobytes()
+    elif codec == CODEC_FLOAT16:
+        payload = arr.astype("<f2").tobytes()
+    elif codec == CODEC_INT8:
+        max_abs = float(np.max(np.abs(arr))) if arr.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        codes = np.clip(np.rint(arr / scale), -127, 127).astype(np.int8)
+        payload = np.float32(scale).astype("<f4").tobytes() + codes.tobytes()
+    else:
+        raise ValueError(f"Unknown vector codec: {codec!r}")
+    return bytes((codec,)) + payload
+
+
+def decode(data: VectorBytes) -> np.ndarray:
+    """Decode a stored vector into a float32 numpy array
+
+    float32 payloads are returned as a read-only zero-copy view over ``data``.
+
+    Args:
+        data: Column value (bytes, memoryview or legacy JSON text)
+
+    Returns:
+        1-D float32 array
+
+    Raises:
+        TypeError: If data is not a supported column type
+        ValueError: If the header byte is unknown
+    """
+    if isinstance(data, str):
+        return np.asarray(json.loads(data), dtype=np.float32)
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError(
+            f"Cannot decode embedding of type {type(data).__name__}. "
+            f"Expected bytes, memoryview or str. Check that the embedding column "
+            f"is defined as BLOB/BYTEA in your database schema."
+        )
+
+    buf = memoryview(data)
+    if len(buf) == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    header = buf[0]
+    if header == CODEC_FLOAT32:
+        return np.frombuffer(buf, dtype="<f4", offset=1)
+    if header == CODEC_FLOAT16:
+        return np.frombuffer(buf, dtype="<f2", offset=1).astype(np.float32)
+    if header == CODEC_INT8:
+        scale = np.frombuffer(buf, dtype="<f4", count=1, offset=1)[0]
+        codes = np.frombuffer(buf, dtype=np.int8, offset=1 + _INT8_SCALE_BYTES)
+        return codes.astype(np.float32) * scale
+    if header == ord("[") or chr(header).isspace():
+        return np.asarray(json.loads(buf.tobytes().decode("utf-8")), dtype=np.float32)
+    raise ValueError(f"Unknown vector codec header byte: 0x{header:02x}")
+
+
+def backfill_vector_codec(
+    conn: Connection,
+    codec: int = CODEC_FLOAT32,
+    batch_size: int = 1000,
+    max_batches: int = 0,
+    commit_each_batch: bool = False,
+) -> int:
+    """Rewrite legacy JSON embeddings in binary form
+
+    Resumable: rows are selected by ``vec_codec IS NULL`` in id order, so an
+    interrupted run picks up where it stopped. Rows that fail to decode are
+    logged and left untouched.
+
+    Args:
+        conn: SQLAlchemy connection
+        codec: Target codec header byte
+        batch_size: Rows rewritten per batch
+        max_batches: Stop after this many batches (0 = until done)
+        commit_each_batch: Commit after every batch (online backfill). Leave
+            False when running inside a migration transaction.
+
+    Returns:
+        Number of rows rewritten
+    """
+    total = 0
+    batches = 0
+    last_id = 0
+    while not max_batches or batches < max_batches:
+        rows = conn.execute(
+            text(
+                """
+            SELECT id, embedding FROM memory_chunk
+            WHERE vec_codec IS NULL AND embedding IS NOT NULL AND id > :last
+            ORDER BY id
+            LIMIT :lim
+        """
+            ),
+            {"last": last_id, "lim": batch_size},
+        ).all()
+        if not rows:
+            break
+
+        updates = []
+        for chunk_id, embedding in rows:
+            try:
+                vec = decode(embedding)
+            except (TypeError, ValueError) as e:
+                logger.warning("Skipping memory_chunk %s: %s", chunk_id, e)
+                continue
+            updates.append({"id": chunk_id, "emb": encode(vec, codec), "c": codec})
+
+        if updates:
+            conn.execute(
+                text(
+                    "UPDATE memory_chunk SET embedding=:emb, vec_codec=:c WHERE id=:id"
+                ),
+                updates,
+            )
+        if commit_each_batch:
+            conn.commit()
+
+        total += len(updates)
+        batches += 1
+        last_id = rows[-1][0]
+        logger.info("Backfilled %d memory_chunk vectors (last id %s)", total, last_id)
+
+    return total
@@ -1,3 +1,4 @@
+import json
 import re
 import uuid
 from datetime import datetime, timezone
@@ -5,6 +6,7 @@ from typing import Any, Dict
 
 from sqlalchemy.orm import Session
 
+from ..core.settings import settings
 from ..models.answers import SessionAnswer
 
 # Constants for answer generation
@@ -402,6 +404,23 @@ def _format_answer_row(row: SessionAnswer) -> dict[str, Any]:
     }
 
 
+def answer_channel(session_id: str) -> str:
+    """Broadcast channel carrying newly generated answers for a session."""
+    return f"{settings.ANSWER_CHANNEL_PREFIX}{session_id}"
+
+
+def serialize_answer(row: SessionAnswer) -> str:
+    """Serialize an answer row as a broadcast message.
+
+    Uses the same shape as ``recent_answers`` so SSE clients see identical
+    events from the live channel and from backfill.
+    """
+    data = _format_answer_row(row)
+    if isinstance(data["created_at"], datetime):
+        data["created_at"] = data["created_at"].isoformat()
+    return json.dumps(data)
+
+
 def recent_answers(
     db: Session, session_id_param: str, since_ts: str | None = None
 ) -> list[Dict[str, Any]]:
@@ -44,6 +44,7 @@ from backend.telemetry.metrics import (
     LLM_LATENCY,
     LLM_TOKENS,
     LLM_COST,
+    LLM_CACHE_TOKENS,
     RAG_RETRIEVAL_LATENCY,
     RAG_CHUNKS_RETRIEVED,
 )
@@ -51,6 +52,19 @@ from backend.telemetry.metrics import (
 # RAG system for codebase understanding
 from backend.services.workspace_rag import get_context_for_task
 
+from backend.services.context_compaction import ConversationCompactor
+from backend.services.prompt_cache import (
+    anthropic_cache_usage,
+    anthropic_request_parts,
+    openai_cached_tokens,
+    prompt_cache_key,
+    stable_tools,
+)
+from backend.services.token_tracking import (
+    CACHE_READ_MULTIPLIER,
+    CACHE_WRITE_MULTIPLIER,
+)
+
 # Feedback system for generation logging
 from backend.services.feedback_service import FeedbackService
 from backend.services.feedback_learning import (
@@ -3928,9 +3942,17 @@ class AutonomousAgent:
         return False
 
     def _calculate_llm_cost(
-        self, model: str, input_tokens: int, output_tokens: int
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
-        """Calculate LLM API cost in USD based on model and token usage."""
+        """Calculate LLM API cost in USD based on model and token usage.
+
+        ``input_tokens`` excludes prompt-cache reads and writes.
+        """
         # Pricing as of 2024-2026 (per million tokens)
         pricing = {
             # Anthropic Claude models
@@ -3940,8 +3962,8 @@ class AutonomousAgent:
             "claude-3-sonnet-20240229": {"input": 3.00, "output": 15.00},
             "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25},
             # OpenAI GPT models
-            "gpt-4o": {"input": 2.50, "output": 10.00},
-            "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+            "gpt-4o": {"input": 2.50, "output": 10.00, "cache_read": 1.25},
+            "gpt-4o-mini": {"input": 0.15, "output": 0.60, "cache_read": 0.075},
             "gpt-4-turbo": {"input": 10.00, "output": 30.00},
             "gpt-4": {"input": 30.00, "output": 60.00},
             "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
@@ -3950,13 +3972,54 @@ class AutonomousAgent:
         # Default pricing if model not found
         default = {"input": 3.00, "output": 15.00}
         rates = pricing.get(model, default)
+        cache_read_rate = rates.get(
+            "cache_read", rates["input"] * CACHE_READ_MULTIPLIER
+        )
+        cache_write_rate = rates.get(
+            "cache_write", rates["input"] * CACHE_WRITE_MULTIPLIER
+        )
 
         # Calculate cost (price is per million tokens)
-        input_cost = (input_tokens / 1_000_000) * rates["input"]
+        input_cost = (
+            input_tokens * rates["input"]
+            + cache_read_tokens * cache_read_rate
+            + cache_write_tokens * cache_write_rate
+        ) / 1_000_000
         output_cost = (output_tokens / 1_000_000) * rates["output"]
 
         return input_cost + output_cost
 
+    def _compact_history(self, messages: List[Dict[str, Any]]) -> None:
+        """Keep the message history within the context budget (in place)."""
+        compactor = getattr(self, "_compactor", None)
+        if compactor is None:
+            compactor = self._compactor = ConversationCompactor(
+                model=self.model, component="autonomous_agent"
+            )
+        stats = compactor.compact(messages)
+        if stats.compacted:
+            logger.info(
+                f"[AutonomousAgent] 🗜️ Compacted history: saved "
+                f"{stats.tokens_saved} tokens ({compactor.total_tokens_saved} "
+                f"so far)"
+            )
+
+    def _record_cache_tokens(self, read_tokens: int, write_tokens: int) -> None:
+        """Count prompt-cache tokens reported for one LLM call."""
+        if read_tokens:
+            LLM_CACHE_TOKENS.labels(
+                phase="autonomous", model=self.model, kind="read"
+            ).inc(read_tokens)
+        if write_tokens:
+            LLM_CACHE_TOKENS.labels(
+                phase="autonomous", model=self.model, kind="write"
+            ).inc(write_tokens)
+        if read_tokens or write_tokens:
+            logger.info(
+                f"[AutonomousAgent] 🗄️ Prompt cache: {read_tokens} read, "
+                f"{write_tokens} written"
+            )
+
     async def _persist_llm_metrics(
         self,
         model: str,
@@ -4008,13 +4071,18 @@ class AutonomousAgent:
         self, context: TaskContext, rag_context: Optional[str] = None
     ) -> str:
         """Build system prompt with current context and optional RAG context."""
-        base_prompt = AUTONOMOUS_SYSTEM_PROMPT
+        return "\n\n".join(self._build_system_blocks(context, rag_context))
+
+    def _build_system_blocks(
+        self, context: TaskContext, rag_context: Optional[str] = None
+    ) -> List[str]:
+        """System prompt parts, static prompt first so it can be prompt-cached."""
+        blocks = [AUTONOMOUS_SYSTEM_PROMPT]
 
         # Inject RAG context if available
         if rag_context and rag_context.strip():
-            base_prompt = f"""{base_prompt}
-
-## CODEBASE CONTEXT
+            blocks.append(
+                f"""## CODEBASE CONTEXT
 
 You have access to relevant codebase context retrieved via semantic search:
 
@@ -4022,8 +4090,9 @@ You have access to relevant codebase context retrieved via semantic search:
 
 Use this context to understand existing patterns, dependencies, and architecture when completing the task.
 """
+            )
 
-        return base_prompt
+        return blocks
 
     async def _log_generation(self, context: TaskContext, prompt: str) -> Optional[int]:
         """Log LLM generation to database for feedback tracking. Returns gen_id."""
@@ -6990,19 +7059,31 @@ Respond with ONLY a JSON object:
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Call LLM with tools and stream the response."""
 
-        system_prompt = self._build_system_prompt(context, rag_context=rag_context)
+        system_blocks = self._build_system_blocks(context, rag_context=rag_context)
+        system_prompt = "\n\n".join(system_blocks)
 
         if self.provider == "anthropic":
-            async for event in self._call_anthropic(messages, system_prompt, context):
+            async for event in self._call_anthropic(
+                messages, system_prompt, context, system_blocks=system_blocks
+            ):
                 yield event
         else:
             async for event in self._call_openai(messages, system_prompt, context):
                 yield event
 
     async def _call_anthropic(
-        self, messages: List[Dict[str, Any]], system_prompt: str, context: TaskContext
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: str,
+        context: TaskContext,
+        system_blocks: Optional[List[str]] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Call Anthropic Claude with tools."""
+        """Call Anthropic Claude with tools.
+
+        Tool schemas, the static system prompt and the latest turn carry
+        prompt-cache breakpoints, so each tool round-trip re-reads the
+        previous request's prefix from cache instead of prefilling it.
+        """
         import aiohttp
         from backend.services.streaming_agent import NAVI_TOOLS
 
@@ -7042,12 +7123,13 @@ Respond with ONLY a JSON object:
 
         async with aiohttp.ClientSession() as session:
             while True:
+                self._compact_history(messages)
                 payload = {
                     "model": self.model,
                     "max_tokens": max_tokens,
-                    "system": system_prompt,
-                    "messages": messages,
-                    "tools": NAVI_TOOLS,
+                    **anthropic_request_parts(
+                        system_blocks or [system_prompt], NAVI_TOOLS, messages
+                    ),
                     "stream": True,
                 }
 
@@ -7116,6 +7198,8 @@ Respond with ONLY a JSON object:
                     stop_reason = None
                     input_tokens = 0
                     output_tokens = 0
+                    cache_read_tokens = 0
+                    cache_write_tokens = 0
 
                     async for line in response.content:
                         line = line.decode("utf-8").strip()
@@ -7134,8 +7218,14 @@ Respond with ONLY a JSON object:
                             if event_type == "message_start":
                                 usage = data.get("message", {}).get("usage", {})
                                 input_tokens = usage.get("input_tokens", 0)
+                                (
+                                    cache_read_tokens,
+                                    cache_write_tokens,
+                                ) = anthropic_cache_usage(usage)
                                 logger.info(
-                                    f"[AutonomousAgent] 📊 Input tokens: {input_tokens}"
+                                    f"[AutonomousAgent] 📊 Input tokens: {input_tokens} "
+                                    f"(cache read {cache_read_tokens}, "
+                                    f"cache write {cache_write_tokens})"
                                 )
 
                             # Capture output tokens from message_delta event
@@ -7398,6 +7488,7 @@ Respond with ONLY a JSON object:
                     LLM_LATENCY.labels(phase="autonomous", model=self.model).observe(
                         call_duration_ms
                     )
+                    self._record_cache_tokens(cache_read_tokens, cache_write_tokens)
 
                     # Log stop reason
                     logger.info(f"[AutonomousAgent] 🛑 LLM Stop Reason: {stop_reason}")
@@ -7446,7 +7537,12 @@ Respond with ONLY a JSON object:
                         ).inc()
 
                         # === METRICS: Record token usage ===
-                        total_tokens = input_tokens + output_tokens
+                        total_tokens = (
+                            input_tokens
+                            + output_tokens
+                            + cache_read_tokens
+                            + cache_write_tokens
+                        )
                         if total_tokens > 0:
                             LLM_TOKENS.labels(phase="autonomous", model=self.model).inc(
                                 total_tokens
@@ -7454,7 +7550,11 @@ Respond with ONLY a JSON object:
 
                             # Calculate and record cost
                             cost_usd = self._calculate_llm_cost(
-                                self.model, input_tokens, output_tokens
+                                self.model,
+                                input_tokens,
+                                output_tokens,
+                                cache_read_tokens,
+                                cache_write_tokens,
                             )
                             LLM_COST.labels(phase="autonomous", model=self.model).inc(
                                 cost_usd
@@ -7512,18 +7612,26 @@ Respond with ONLY a JSON object:
         logger.info("=" * 60)
 
         full_messages = [{"role": "system", "content": system_prompt}] + messages
+        # OpenAI caches identical prompt prefixes automatically; keep the tool
+        # order stable and route requests sharing this prefix to one cache
+        tools = stable_tools(NAVI_FUNCTIONS_OPENAI)
 
         async with aiohttp.ClientSession() as session:
             while True:
+                self._compact_history(full_messages)
                 payload = {
                     "model": self._normalize_openai_compatible_model_name(self.model),
                     "messages": full_messages,
-                    "tools": NAVI_FUNCTIONS_OPENAI,
+                    "tools": tools,
                     "stream": True,
                     "stream_options": {
                         "include_usage": True
                     },  # Enable token usage in stream
                 }
+                if self.provider == "openai":
+                    payload["prompt_cache_key"] = prompt_cache_key(
+                        self.model, AUTONOMOUS_SYSTEM_PROMPT, tools
+                    )
 
                 headers = {
                     "Authorization": f"Bearer {self.api_key}",
@@ -7604,6 +7712,7 @@ Respond with ONLY a JSON object:
                     finish_reason = None
                     prompt_tokens = 0
                     completion_tokens = 0
+                    cached_tokens = 0
 
                     async for line in response.content:
                         line = line.decode("utf-8").strip()
@@ -7626,6 +7735,7 @@ Respond with ONLY a JSON object:
                                 completion_tokens = usage.get(
                                     "completion_tokens", completion_tokens
                                 )
+                                cached_tokens = openai_cached_tokens(usage)
                                 logger.info(
                                     f"[AutonomousAgent] 📊 Usage received: prompt={prompt_tokens}, completion={completion_tokens}"
                                 )
@@ -7707,6 +7817,7 @@ Respond with ONLY a JSON object:
                     LLM_LATENCY.labels(phase="autonomous", model=self.model).observe(
                         call_duration_ms
                     )
+                    self._record_cache_tokens(cached_tokens, 0)
 
                     if finish_reason == "tool_calls" and tool_calls:
                         assistant_tool_calls = []
@@ -8059,9 +8170,13 @@ Respond with ONLY a JSON object:
                                 total_tokens
                             )
 
-                            # Calculate and record cost
+                            # Calculate and record cost (cached tokens are
+                            # included in prompt_tokens)
                             cost_usd = self._calculate_llm_cost(
-                                self.model, prompt_tokens, completion_tokens
+                                self.model,
+                                prompt_tokens - cached_tokens,
+                                completion_tokens,
+                                cache_read_tokens=cached_tokens,
                             )
                             LLM_COST.labels(phase="autonomous", model=self.model).inc(
                                 cost_usd
@@ -8,7 +8,7 @@ Reduces API calls and improves performance for memory operations.
 import logging
 from typing import List
 from openai import AsyncOpenAI
-from backend.services.cache_manager import cache_manager
+from backend.services.embedding_cache import get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +27,15 @@ class BatchEmbeddingService:
         self.model = model
         self.dimensions = dimensions
         self.batch_size = batch_size
+        self.cache = get_embedding_cache()
 
     async def embed_single(self, text: str) -> List[float]:
         """Generate embedding for a single text with caching"""
         # Check cache first
-        cached_embeddings, uncached_texts = cache_manager.get_cached_embeddings([text])
-        if cached_embeddings[0] is not None:
+        (cached,) = await self.cache.aget_many(self.model, self.dimensions, [text])
+        if cached is not None:
             logger.debug(f"[EMBED] Cache HIT for text: {text[:50]}...")
-            return cached_embeddings[0]
+            return cached.tolist()
 
         # Generate embedding via API
         embeddings = await self.embed_batch([text])
@@ -55,15 +56,21 @@ class BatchEmbeddingService:
             return []
 
         # Check cache for existing embeddings
-        cached_embeddings, uncached_texts = cache_manager.get_cached_embeddings(texts)
+        cached_embeddings = await self.cache.aget_many(
+            self.model, self.dimensions, texts
+        )
+        # Duplicate inputs are embedded once
+        uncached_texts = list(
+            dict.fromkeys(t for t, e in zip(texts, cached_embeddings) if e is None)
+        )
 
         if not uncached_texts:
             # All embeddings found in cache
             logger.info(f"[EMBED] All {len(texts)} embeddings found in cache")
-            return [emb for emb in cached_embeddings if emb is not None]
+            return [emb.tolist() for emb in cached_embeddings]
 
         logger.info(
-            f"[EMBED] Cache hit: {len(texts) - len(uncached_texts)}/{len(texts)}, generating {len(uncached_texts)} new embeddings"
+            f"[EMBED] Cache hit: {len(texts) - sum(e is None for e in cached_embeddings)}/{len(texts)}, generating {len(uncached_texts)} new embeddings"
         )
 
         # Generate embeddings for uncached texts in batches
@@ -75,21 +82,17 @@ class BatchEmbeddingService:
 
         # Cache the newly generated embeddings
         if new_embeddings:
-            cache_manager.cache_embeddings(uncached_texts, new_embeddings)
+            await self.cache.aput_many(
+                self.model, self.dimensions, uncached_texts, new_embeddings
+            )
             logger.debug(f"[EMBED] Cached {len(new_embeddings)} new embeddings")
 
         # Merge cached and new embeddings in original order
-        result = []
-        new_idx = 0
-
-        for cached_emb in cached_embeddings:
-            if cached_emb is not None:
-                result.append(cached_emb)
-            else:
-                result.append(new_embeddings[new_idx])
-                new_idx += 1
-
-        return result
+        fresh = dict(zip(uncached_texts, new_embeddings))
+        return [
+            cached_emb.tolist() if cached_emb is not None else fresh[text]
+            for text, cached_emb in zip(texts, cached_embeddings)
+        ]
 
     async def _generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings via OpenAI API in a single batch request"""
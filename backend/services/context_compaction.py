@@ -0,0 +1,432 @@
+"""
+Token-budgeted compaction of agent conversation histories.
+
+Agent loops append every assistant turn and tool result to their message
+list, so late iterations resend whole files and command logs on every call.
+``ConversationCompactor`` counts tokens per message (with
+``core.tokenizer.get_tokenizer``) and, once the history passes the high
+watermark of its budget, shrinks it back under the low watermark:
+
+1. Stale tool outputs (everything but the most recent messages) are replaced
+   by a short stub naming the call that produced them, so the model can
+   re-run the tool if it needs the output again.
+2. If that is not enough, the oldest turns are folded into a running summary
+   appended to the first user message, so user and assistant turns still
+   alternate. Later compactions extend that summary instead of
+   re-summarizing it.
+
+Leading system messages and the first user message's own text are never
+rewritten, and compaction only runs past the high watermark, so the provider
+prompt cache is invalidated rarely rather than on every call.
+
+Messages may be in Anthropic form (``tool_use`` / ``tool_result`` content
+blocks) or OpenAI form (``tool_calls`` / ``role: tool``). Turns are only
+dropped at assistant-message boundaries, so every remaining tool result keeps
+its tool call.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.tokenizer import get_tokenizer
+from backend.telemetry.metrics import CONTEXT_COMPACTIONS, CONTEXT_TOKENS_SAVED
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_HEADER = "[Summary of earlier conversation]"
+SUMMARY_OMITTED = "- (older steps omitted)"
+# Between the first user message's text and the summary appended to it
+SUMMARY_SEPARATOR = "\n\n"
+ELIDED_PREFIX = "[Output elided to save context"
+
+# Per-message overhead (role, separators) added to the content token count
+_MESSAGE_OVERHEAD = 4
+
+
+@dataclass
+class CompactionStats:
+    """Outcome of one ``compact`` call."""
+
+    tokens_before: int = 0
+    tokens_after: int = 0
+    elided_outputs: int = 0
+    summarized_messages: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    @property
+    def compacted(self) -> bool:
+        return self.tokens_saved > 0
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def _block_text(block: Any) -> str:
+    if not isinstance(block, dict):
+        return str(block)
+    kind = block.get("type")
+    if kind == "text":
+        return block.get("text", "")
+    if kind == "tool_use":
+        return f"{block.get('name', '')} {json.dumps(block.get('input', {}))}"
+    if kind == "tool_result":
+        content = block.get("content", "")
+        if isinstance(content, list):
+            return "\n".join(_block_text(b) for b in content)
+        return str(content)
+    return json.dumps(block, default=str)
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    """Flatten a message's content (and OpenAI tool calls) to plain text."""
+    content = message.get("content")
+    if isinstance(content, list):
+        text = "\n".join(_block_text(b) for b in content)
+    else:
+        text = "" if content is None else str(content)
+    for call in message.get("tool_calls") or []:
+        fn = call.get("function", {})
+        text += f"\n{fn.get('name', '')} {fn.get('arguments', '')}"
+    return text
+
+
+def _is_tool_result(message: Dict[str, Any]) -> bool:
+    if message.get("role") == "tool":
+        return True
+    content = message.get("content")
+    return isinstance(content, list) and any(
+        isinstance(b, dict) and b.get("type") == "tool_result" for b in content
+    )
+
+
+def _tool_calls(message: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """(call id, tool name, arguments) for each tool call in an assistant message."""
+    calls = []
+    content = message.get("content")
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "tool_use":
+                calls.append(
+                    (
+                        block.get("id", ""),
+                        block.get("name", ""),
+                        json.dumps(block.get("input", {}), default=str),
+                    )
+                )
+    for call in message.get("tool_calls") or []:
+        fn = call.get("function", {})
+        calls.append((call.get("id", ""), fn.get("name", ""), fn.get("arguments", "")))
+    return calls
+
+
+def _split_summary(message: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+    """A message's own content and the summary appended to it, if any."""
+    content = message.get("content")
+    if isinstance(content, str):
+        at = content.rfind(SUMMARY_SEPARATOR + SUMMARY_HEADER)
+        if at >= 0:
+            return content[:at], content[at + len(SUMMARY_SEPARATOR) :]
+    elif isinstance(content, list) and content:
+        last = content[-1]
+        if (
+            isinstance(last, dict)
+            and last.get("type") == "text"
+            and str(last.get("text", "")).startswith(SUMMARY_HEADER)
+        ):
+            return content[:-1], last["text"]
+    return content, None
+
+
+def _with_summary(
+    message: Dict[str, Any], content: Any, summary: str
+) -> Dict[str, Any]:
+    """Copy of ``message`` with ``summary`` appended to ``content``."""
+    if isinstance(content, list):
+        return {**message, "content": content + [{"type": "text", "text": summary}]}
+    text = "" if content is None else str(content)
+    return {**message, "content": text + SUMMARY_SEPARATOR + summary}
+
+
+@lru_cache(maxsize=16)
+def _encoder_for(model: Optional[str]) -> Optional[Callable[[str], list]]:
+    try:
+        encoder = get_tokenizer(model)
+    except Exception as e:
+        # No tokenizer available: estimate ~4 characters per token
+        logger.warning(f"Context compaction using estimated token counts: {e}")
+        return None
+    # Tool output may contain special-token text; count it as plain text
+    return getattr(encoder, "encode_ordinary", encoder.encode)
+
+
+class ConversationCompactor:
+    """
+    Keeps a message history within a token budget.
+
+    ``compact`` edits the list in place (so callers that keep appending to it
+    carry on with the compacted history) and returns ``CompactionStats``;
+    ``total_tokens_saved`` accumulates across calls.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        budget_tokens: Optional[int] = None,
+        high_watermark: Optional[float] = None,
+        low_watermark: Optional[float] = None,
+        keep_recent: Optional[int] = None,
+        summary_max_tokens: int = 2000,
+        summarizer: Optional[Callable[[List[Dict[str, Any]]], List[str]]] = None,
+        component: str = "agent",
+    ):
+        self.budget_tokens = budget_tokens or settings.context_budget_tokens
+        self.high_watermark = high_watermark or settings.context_high_watermark
+        self.low_watermark = low_watermark or settings.context_low_watermark
+        self.keep_recent = (
+            keep_recent if keep_recent is not None else settings.context_keep_recent
+        )
+        self.summary_max_tokens = summary_max_tokens
+        self.summarizer = summarizer or self._summarize_lines
+        self.component = component
+        self.total_tokens_saved = 0
+        self._encode = _encoder_for(model)
+        # id(message) -> (message, tokens); holding the message keeps ids unique
+        self._counts: Dict[int, Tuple[Dict[str, Any], int]] = {}
+
+    # ------------------------------------------------------------------
+    # Token accounting
+    # ------------------------------------------------------------------
+
+    def count_text(self, text: str) -> int:
+        if self._encode is None:
+            return (len(text) + 3) // 4
+        return len(self._encode(text))
+
+    def count(self, message: Dict[str, Any]) -> int:
+        """Tokens for one message, memoized while the message is in use."""
+        cached = self._counts.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+        tokens = self.count_text(message_text(message)) + _MESSAGE_OVERHEAD
+        self._counts[id(message)] = (message, tokens)
+        return tokens
+
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        return sum(self.count(m) for m in messages)
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def _pinned(self, messages: List[Dict[str, Any]]) -> int:
+        """Leading system messages plus the first user message."""
+        i = 0
+        while i < len(messages) and messages[i].get("role") == "system":
+            i += 1
+        return min(i + 1, len(messages))
+
+    def compact(self, messages: List[Dict[str, Any]]) -> CompactionStats:
+        """Shrink ``messages`` in place if it is over the high watermark."""
+        total = self.count_messages(messages)
+        stats = CompactionStats(tokens_before=total, tokens_after=total)
+        if total <= self.budget_tokens * self.high_watermark:
+            return stats
+
+        target = int(self.budget_tokens * self.low_watermark)
+        pinned = self._pinned(messages)
+        recent_start = max(pinned, len(messages) - self.keep_recent)
+
+        total = self._elide_tool_outputs(
+            messages, pinned, recent_start, total, target, stats
+        )
+        if total > target:
+            total = self._summarize_turns(
+                messages, pinned, recent_start, total, target, stats
+            )
+
+        stats.tokens_after = total
+        # Forget counts for messages that are no longer in the history
+        live = {id(m) for m in messages}
+        self._counts = {k: v for k, v in self._counts.items() if k in live}
+
+        if stats.compacted:
+            self.total_tokens_saved += stats.tokens_saved
+            CONTEXT_COMPACTIONS.labels(component=self.component).inc()
+            CONTEXT_TOKENS_SAVED.labels(component=self.component).inc(
+                stats.tokens_saved
+            )
+            logger.info(
+                f"[Compaction] {self.component}: {stats.tokens_before} -> "
+                f"{stats.tokens_after} tokens ({stats.elided_outputs} outputs "
+                f"elided, {stats.summarized_messages} messages summarized)"
+            )
+        return stats
+
+    def _stub(self, call: Optional[Tuple[str, str, str]], tokens: int) -> str:
+        if call is None:
+            return f"{ELIDED_PREFIX}: ~{tokens} tokens of tool output.]"
+        _, name, args = call
+        return (
+            f"{ELIDED_PREFIX}: {name}({_clip(args, 200)}) returned ~{tokens} "
+            "tokens. Call the tool again if you need this output.]"
+        )
+
+    def _elide_tool_outputs(
+        self,
+        messages: List[Dict[str, Any]],
+        pinned: int,
+        recent_start: int,
+        total: int,
+        target: int,
+        stats: CompactionStats,
+    ) -> int:
+        calls: Dict[str, Tuple[str, str, str]] = {}
+        for i in range(pinned, recent_start):
+            if total <= target:
+                break
+            message = messages[i]
+            for call in _tool_calls(message):
+                calls[call[0]] = call
+            if not _is_tool_result(message):
+                continue
+
+            if message.get("role") == "tool":
+                if str(message.get("content", "")).startswith(ELIDED_PREFIX):
+                    continue
+                tokens = self.count(message)
+                replacement = {
+                    **message,
+                    "content": self._stub(
+                        calls.get(message.get("tool_call_id")), tokens
+                    ),
+                }
+                stats.elided_outputs += 1
+            else:
+                blocks = []
+                for block in message["content"]:
+                    content = block.get("content") if isinstance(block, dict) else None
+                    if (
+                        not isinstance(block, dict)
+                        or block.get("type") != "tool_result"
+                        or (
+                            isinstance(content, str)
+                            and content.startswith(ELIDED_PREFIX)
+                        )
+                    ):
+                        blocks.append(block)
+                        continue
+                    tokens = self.count_text(_block_text(block))
+                    blocks.append(
+                        {
+                            **block,
+                            "content": self._stub(
+                                calls.get(block.get("tool_use_id")), tokens
+                            ),
+                        }
+                    )
+                    stats.elided_outputs += 1
+                replacement = {**message, "content": blocks}
+
+            total += self.count(replacement) - self.count(message)
+            messages[i] = replacement
+        return total
+
+    def _summarize_turns(
+        self,
+        messages: List[Dict[str, Any]],
+        pinned: int,
+        recent_start: int,
+        total: int,
+        target: int,
+        stats: CompactionStats,
+    ) -> int:
+        # The summary goes on the first user message, which the first kept
+        # assistant message then follows
+        anchor = pinned - 1
+        if anchor < 0 or messages[anchor].get("role") != "user":
+            return total
+        content, old_summary = _split_summary(messages[anchor])
+
+        # Drop whole turns: the cut must land on an assistant message so no
+        # tool result loses its tool call
+        dropped_tokens = 0
+        best = None
+        for i in range(pinned, recent_start):
+            dropped_tokens += self.count(messages[i])
+            nxt = i + 1
+            if nxt < len(messages) and messages[nxt].get("role") == "assistant":
+                best = (nxt, dropped_tokens)
+                if total - dropped_tokens <= target:
+                    break
+        if best is None:
+            return total
+        cut, dropped_tokens = best
+
+        dropped = messages[pinned:cut]
+        lines = []
+        if old_summary is not None:
+            lines = [
+                line for line in old_summary.split("\n")[1:] if line != SUMMARY_OMITTED
+            ]
+        lines += self.summarizer(dropped)
+        first = _with_summary(messages[anchor], content, self._fit_summary(lines))
+
+        old_tokens = self.count(messages[anchor])
+        messages[anchor] = first
+        del messages[pinned:cut]
+        stats.summarized_messages += len(dropped)
+        return total - dropped_tokens - old_tokens + self.count(first)
+
+    def _fit_summary(self, lines: List[str]) -> str:
+        # Keep the newest lines within the summary budget
+        kept: List[str] = []
+        used = self.count_text(SUMMARY_HEADER)
+        for line in reversed(lines):
+            cost = self.count_text(line) + 1
+            if used + cost > self.summary_max_tokens:
+                kept.append(SUMMARY_OMITTED)
+                break
+            kept.append(line)
+            used += cost
+        kept.reverse()
+        return "\n".join([SUMMARY_HEADER] + kept)
+
+    @staticmethod
+    def _summarize_lines(dropped: List[Dict[str, Any]]) -> List[str]:
+        """Extractive one-line-per-step summary (no LLM call)."""
+        lines = []
+        for message in dropped:
+            role = message.get("role")
+            calls = _tool_calls(message)
+            if calls:
+                for _, name, args in calls:
+                    lines.append(f"- called {name}({_clip(args, 120)})")
+                content = message.get("content")
+                if isinstance(content, list):
+                    text = " ".join(
+                        b.get("text", "")
+                        for b in content
+                        if isinstance(b, dict) and b.get("type") == "text"
+                    )
+                else:
+                    text = content or ""
+                if text.strip():
+                    lines.append(f"- assistant: {_clip(text, 200)}")
+            elif _is_tool_result(message):
+                text = message_text(message)
+                if not text.startswith(ELIDED_PREFIX):
+                    lines.append(f"  -> {_clip(text, 120)}")
+            else:
+                text = message_text(message).strip()
+                if text:
+                    lines.append(f"- {role}: {_clip(text, 200)}")
+        return lines
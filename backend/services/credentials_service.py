@@ -521,7 +521,7 @@ class CredentialsService:
         Returns:
             True if credentials are valid
         """
-        import httpx
+        from backend.services.http_client import http_client
 
         if isinstance(provider, str):
             provider = CredentialProvider(provider)
@@ -533,7 +533,7 @@ class CredentialsService:
             # Provider-specific validation
             if provider == CredentialProvider.OPENAI:
                 api_key = self.get_credential(provider, "api_key")
-                async with httpx.AsyncClient() as client:
+                async with http_client() as client:
                     resp = await client.get(
                         "https://api.openai.com/v1/models",
                         headers={"Authorization": f"Bearer {api_key}"},
@@ -542,7 +542,7 @@ class CredentialsService:
 
             elif provider == CredentialProvider.ANTHROPIC:
                 api_key = self.get_credential(provider, "api_key")
-                async with httpx.AsyncClient() as client:
+                async with http_client() as client:
                     resp = await client.post(
                         "https://api.anthropic.com/v1/messages",
                         headers={
@@ -561,7 +561,7 @@ class CredentialsService:
 
             elif provider == CredentialProvider.GITHUB:
                 token = self.get_credential(provider, "token")
-                async with httpx.AsyncClient() as client:
+                async with http_client() as client:
                     resp = await client.get(
                         "https://api.github.com/user",
                         headers={"Authorization": f"token {token}"},
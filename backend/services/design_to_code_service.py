@@ -24,7 +24,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-import httpx
+from backend.services.http_client import http_client
 
 
 logger = logging.getLogger(__name__)
@@ -225,7 +225,7 @@ class DesignToCodeService:
         # Set default vision models
         self.model = model or self._get_default_model()
 
-        self.client = httpx.AsyncClient(timeout=120)
+        self.client = http_client(timeout=120)
 
     def _get_api_key(self) -> str:
         """Get API key from environment"""
@@ -0,0 +1,384 @@
+"""
+Shared Embedding Cache
+
+Tiered content-hash cache for embedding vectors, shared by every embedding
+call site (search indexer, memory EmbeddingService, BatchEmbeddingService,
+workspace RAG and the long-term VectorStore) so identical text is embedded
+and billed once per (model, dimensions) rather than once per provider,
+reindex or process restart.
+
+Tiers (checked in order, hits are promoted to the faster tiers):
+1. In-process LRU bounded by a byte budget
+2. Redis (shared across workers, TTL-based)
+3. Persistent SQL table (SQLite file by default, any SQLAlchemy URL)
+
+Vectors are stored with the binary float32 codec from backend/search/vector_codec.py.
+Hit/miss/bytes metrics are exported via backend/telemetry/vector_metrics.py.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    func,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.core.config import settings
+from backend.search import vector_codec
+from backend.telemetry.vector_metrics import (
+    EMBED_CACHE_BYTES,
+    EMBED_CACHE_HITS,
+    EMBED_CACHE_MISSES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to stop using a remote tier after it fails (avoids per-call timeouts)
+TIER_RETRY_SECONDS = 30.0
+
+# Approximate per-entry overhead (key string, OrderedDict node, ndarray header)
+ENTRY_OVERHEAD_BYTES = 200
+
+_metadata = MetaData()
+
+embedding_cache_table = Table(
+    "embedding_cache",
+    _metadata,
+    Column("cache_key", String(160), primary_key=True),
+    Column("model", String(128), nullable=False),
+    Column("dim", Integer, nullable=False),
+    Column("vector", LargeBinary, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+def cache_key(model: str, dim: int, text: str) -> str:
+    """Cache key for a text embedded by model at dim dimensions"""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+    return f"emb:{model}:{dim}:{digest}"
+
+
+class _MemoryTier:
+    """Thread-safe LRU of float32 vectors bounded by total bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is not None:
+                self._entries.move_to_end(key)
+            return vec
+
+    def put(self, key: str, vec: np.ndarray) -> None:
+        # Cached arrays are shared between callers
+        vec.setflags(write=False)
+        size = vec.nbytes + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.nbytes + ENTRY_OVERHEAD_BYTES
+            self._entries[key] = vec
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.nbytes + ENTRY_OVERHEAD_BYTES
+        EMBED_CACHE_BYTES.set(self.bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+        EMBED_CACHE_BYTES.set(0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _RemoteTier:
+    """Base for tiers that may be unavailable; backs off after failures"""
+
+    name = "remote"
+
+    def __init__(self):
+        self._disabled_until = 0.0
+
+    def available(self) -> bool:
+        return time.monotonic() >= self._disabled_until
+
+    def _fail(self, op: str, error: Exception) -> None:
+        logger.warning(
+            "[EMBED_CACHE] %s %s failed, bypassing for %.0fs: %s",
+            self.name,
+            op,
+            TIER_RETRY_SECONDS,
+            error,
+        )
+        self._disabled_until = time.monotonic() + TIER_RETRY_SECONDS
+
+
+class _RedisTier(_RemoteTier):
+    name = "redis"
+
+    def __init__(self, url: str, ttl_seconds: int):
+        super().__init__()
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+
+    def _redis(self):
+        if self._client is None:
+            import redis
+
+            self._client = redis.from_url(
+                self.url, socket_connect_timeout=0.5, socket_timeout=0.5
+            )
+        return self._client
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        try:
+            return self._redis().mget(keys)
+        except Exception as e:
+            self._fail("get", e)
+            return [None] * len(keys)
+
+    def put_many(self, items: List[tuple], model: str, dim: int) -> None:
+        try:
+            pipe = self._redis().pipeline(transaction=False)
+            for key, data in items:
+                pipe.set(key, data, ex=self.ttl_seconds)
+            pipe.execute()
+        except Exception as e:
+            self._fail("put", e)
+
+
+class _SqlTier(_RemoteTier):
+    name = "db"
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self._engine = None
+
+    def _get_engine(self):
+        if self._engine is None:
+            if self.url.startswith("sqlite:///"):
+                Path(self.url[len("sqlite:///") :]).parent.mkdir(
+                    parents=True, exist_ok=True
+                )
+            self._engine = create_engine(self.url, pool_pre_ping=True)
+            _metadata.create_all(self._engine, checkfirst=True)
+        return self._engine
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        try:
+            with self._get_engine().connect() as conn:
+                rows = conn.execute(
+                    select(
+                        embedding_cache_table.c.cache_key,
+                        embedding_cache_table.c.vector,
+                    ).where(embedding_cache_table.c.cache_key.in_(keys))
+                ).all()
+        except Exception as e:
+            self._fail("get", e)
+            return [None] * len(keys)
+        found = {k: bytes(v) for k, v in rows}
+        return [found.get(k) for k in keys]
+
+    def put_many(self, items: List[tuple], model: str, dim: int) -> None:
+        try:
+            engine = self._get_engine()
+            dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+            rows = [
+                {"cache_key": key, "model": model, "dim": dim, "vector": data}
+                for key, data in items
+            ]
+            with engine.begin() as conn:
+                conn.execute(
+                    dialect.insert(embedding_cache_table).on_conflict_do_nothing(),
+                    rows,
+                )
+        except Exception as e:
+            self._fail("put", e)
+
+
+class EmbeddingCache:
+    """Tiered embedding cache keyed by (model, dimensions, content hash)"""
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 7 * 24 * 3600,
+        db_url: Optional[str] = None,
+    ):
+        self.memory = _MemoryTier(max_memory_bytes)
+        self.remote_tiers: List[_RemoteTier] = []
+        if redis_url:
+            self.remote_tiers.append(_RedisTier(redis_url, redis_ttl_seconds))
+        if db_url:
+            self.remote_tiers.append(_SqlTier(db_url))
+
+    def get_many(
+        self, model: str, dim: int, texts: Sequence[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Look up cached vectors; returns None for misses (same order as texts)"""
+        keys = [cache_key(model, dim, t) for t in texts]
+        results: List[Optional[np.ndarray]] = [self.memory.get(k) for k in keys]
+        memory_hits = sum(r is not None for r in results)
+        if memory_hits:
+            EMBED_CACHE_HITS.labels(tier="memory").inc(memory_hits)
+
+        promote: List[tuple] = []
+        for tier_pos, tier in enumerate(self.remote_tiers):
+            missing = [i for i, r in enumerate(results) if r is None]
+            if not missing or not tier.available():
+                continue
+            found = tier.get_many([keys[i] for i in missing])
+            hits = 0
+            for i, data in zip(missing, found):
+                if data is None:
+                    continue
+                vec = np.array(vector_codec.decode(data), dtype=np.float32)
+                results[i] = vec
+                self.memory.put(keys[i], vec)
+                promote.append((tier_pos, keys[i], data))
+                hits += 1
+            if hits:
+                EMBED_CACHE_HITS.labels(tier=tier.name).inc(hits)
+
+        # Backfill faster remote tiers (e.g. Redis) with hits from slower ones
+        for tier_pos, key, data in promote:
+            for faster in self.remote_tiers[:tier_pos]:
+                if faster.available():
+                    faster.put_many([(key, data)], model, dim)
+
+        misses = sum(r is None for r in results)
+        if misses:
+            EMBED_CACHE_MISSES.inc(misses)
+        return results
+
+    def put_many(
+        self,
+        model: str,
+        dim: int,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        """Store vectors in every tier
+
+        All-zero vectors are the placeholder callers return when a provider
+        call fails, so they are never cached.
+        """
+        items = []
+        for text, vec in zip(texts, vectors):
+            arr = np.array(vec, dtype=np.float32)
+            if not arr.any():
+                continue
+            key = cache_key(model, dim, text)
+            self.memory.put(key, arr)
+            items.append((key, vector_codec.encode(arr)))
+        for tier in self.remote_tiers:
+            if items and tier.available():
+                tier.put_many(items, model, dim)
+
+    def get_or_embed(
+        self,
+        model: str,
+        dim: int,
+        texts: Sequence[str],
+        embed: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """Return vectors for texts, calling embed() only for cache misses
+
+        Duplicate texts within one call are embedded once.
+        """
+        cached = self.get_many(model, dim, texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, cached) if v is None))
+        fresh = {}
+        if missing:
+            vectors = embed(missing)
+            self.put_many(model, dim, missing, vectors)
+            fresh = dict(zip(missing, vectors))
+        return [
+            v.tolist() if v is not None else list(fresh[t])
+            for t, v in zip(texts, cached)
+        ]
+
+    async def aget_many(
+        self, model: str, dim: int, texts: Sequence[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Async get_many; remote tiers run off the event loop"""
+        if self.remote_tiers:
+            return await asyncio.to_thread(self.get_many, model, dim, texts)
+        return self.get_many(model, dim, texts)
+
+    async def aput_many(
+        self,
+        model: str,
+        dim: int,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        """Async put_many; remote tiers run off the event loop"""
+        if self.remote_tiers:
+            await asyncio.to_thread(self.put_many, model, dim, texts, vectors)
+        else:
+            self.put_many(model, dim, texts, vectors)
+
+    def clear_memory(self) -> None:
+        """Drop the in-process tier (remote tiers are left intact)"""
+        self.memory.clear()
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache configured from settings"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(
+                    max_memory_bytes=settings.embedding_cache_memory_bytes,
+                    redis_url=(
+                        settings.redis_url
+                        if settings.embedding_cache_redis_enabled
+                        else None
+                    ),
+                    redis_ttl_seconds=settings.embedding_cache_redis_ttl,
+                    db_url=settings.embedding_cache_db_url or None,
+                )
+    return _cache
+
+
+def reset_embedding_cache() -> None:
+    """Discard the process-wide cache (tests and reconfiguration)"""
+    global _cache
+    with _cache_lock:
+        _cache = None
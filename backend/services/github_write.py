@@ -7,6 +7,7 @@ import re
 from typing import Optional, Dict, Any
 from contextlib import asynccontextmanager
 import httpx
+from backend.services.http_client import http_client
 
 # GitHub username/organization validation pattern
 # Allows: alphanumeric at start, hyphens anywhere (including start/end for legacy), max 39 chars total
@@ -52,7 +53,7 @@ class GitHubWriteService:
     @asynccontextmanager
     async def _client(self):
         """Create configured HTTP client for GitHub API with automatic resource cleanup"""
-        async with httpx.AsyncClient(
+        async with http_client(
             base_url=self.base_url,
             headers={
                 "Authorization": f"Bearer {self.token}",
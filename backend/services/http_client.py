@@ -0,0 +1,269 @@
+"""
+Shared outbound HTTP client pools for LLM providers and connectors.
+
+Creating an ``httpx.AsyncClient`` per call pays a fresh TCP+TLS handshake
+every time. Instead, each host (or explicitly named provider) gets one pooled
+client per event loop, created on first use and closed at app shutdown (sync
+code that runs its own short-lived loop wraps it in ``closing_http_clients``),
+so connection limits are per host. Call sites take a ``ScopedClient`` from
+``http_client()``: it carries their own base URL, headers, auth and timeout
+and forwards requests to the shared pool, so
+``async with http_client(...) as client`` is a drop-in replacement for
+``async with httpx.AsyncClient(...) as client`` that does not close the pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+try:
+    from backend.core.config import settings
+except ImportError:
+    from core.config import settings  # fallback for local dev
+
+from backend.telemetry.metrics import (
+    HTTP_CLIENT_CONNECTIONS_OPENED,
+    HTTP_CLIENT_POOLS,
+    HTTP_CLIENT_REQUESTS,
+)
+
+logger = logging.getLogger(__name__)
+
+# httpx's own default, so migrated call sites that passed no timeout keep theirs
+DEFAULT_TIMEOUT = 5.0
+
+_UNSET: Any = object()
+
+T = TypeVar("T")
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """One pooled ``httpx.AsyncClient`` per (event loop, client key)."""
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self._transport = transport  # Override for tests
+        # Pools are bound to the loop that opened their connections
+        self._pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._warned_http2 = False
+
+    def _limits(self, max_connections: Optional[int]) -> httpx.Limits:
+        cap = max_connections or settings.http_client_max_connections
+        return httpx.Limits(
+            max_connections=cap,
+            max_keepalive_connections=min(cap, settings.http_client_max_keepalive),
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+        )
+
+    def _use_http2(self) -> bool:
+        if not settings.http_client_http2:
+            return False
+        if _http2_available():
+            return True
+        if not self._warned_http2:
+            logger.warning(
+                "http_client_http2 is enabled but the h2 package is not installed; "
+                "using HTTP/1.1"
+            )
+            self._warned_http2 = True
+        return False
+
+    def _build(self, key: str, max_connections: Optional[int]) -> httpx.AsyncClient:
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                HTTP_CLIENT_CONNECTIONS_OPENED.labels(key).inc()
+
+        async def on_request(request: httpx.Request) -> None:
+            HTTP_CLIENT_REQUESTS.labels(key).inc()
+            request.extensions["trace"] = trace
+
+        HTTP_CLIENT_POOLS.inc()
+        return httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=self._limits(max_connections),
+            http2=self._use_http2(),
+            event_hooks={"request": [on_request]},
+            transport=self._transport,
+        )
+
+    def pool(
+        self, key: str, max_connections: Optional[int] = None
+    ) -> httpx.AsyncClient:
+        """Get (or create) the pooled client for ``key`` on the running loop.
+
+        ``max_connections`` caps concurrent connections to this provider; it
+        only takes effect for the call that creates the pool.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._pools.get(loop)
+            if pools is None:
+                pools = self._pools[loop] = {}
+            client = pools.get(key)
+            if client is None or client.is_closed:
+                client = pools[key] = self._build(key, max_connections)
+            return client
+
+    async def aclose(self) -> None:
+        """Close every pool owned by the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._pools.pop(loop, {})
+        for key, client in pools.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Error closing HTTP client pool %s: %s", key, e)
+            HTTP_CLIENT_POOLS.dec()
+
+
+registry = HttpClientRegistry()
+
+
+def _join_url(base_url: str, url: str) -> str:
+    if not base_url or "://" in url:
+        return url
+    return base_url.rstrip("/") + "/" + url.lstrip("/")
+
+
+def _pool_key(key: Optional[str], url: str) -> str:
+    return key or httpx.URL(url).host or "default"
+
+
+class ScopedClient:
+    """Per-call-site view of a shared pool (base URL, headers, auth, timeout)."""
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        *,
+        base_url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Any = DEFAULT_TIMEOUT,
+        auth: Any = None,
+        follow_redirects: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+    ) -> None:
+        self.key = key
+        self.base_url = str(base_url)
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.auth = auth
+        self.follow_redirects = follow_redirects
+        self._max_connections = max_connections
+
+    @property
+    def is_closed(self) -> bool:
+        return False
+
+    def _kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.headers:
+            headers = dict(self.headers)
+            headers.update(kwargs.get("headers") or {})
+            kwargs["headers"] = headers
+        if kwargs.get("timeout", _UNSET) is _UNSET:
+            kwargs["timeout"] = self.timeout
+        if self.auth is not None and "auth" not in kwargs:
+            kwargs["auth"] = self.auth
+        if self.follow_redirects is not None and "follow_redirects" not in kwargs:
+            kwargs["follow_redirects"] = self.follow_redirects
+        return kwargs
+
+    def _pool(self, url: str) -> httpx.AsyncClient:
+        return registry.pool(_pool_key(self.key, url), self._max_connections)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        url = _join_url(self.base_url, str(url))
+        return await self._pool(url).request(method, url, **self._kwargs(kwargs))
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+    def stream(self, method: str, url: str, **kwargs: Any):
+        """Streaming request; use as ``async with client.stream(...) as resp``."""
+        url = _join_url(self.base_url, str(url))
+        return self._pool(url).stream(method, url, **self._kwargs(kwargs))
+
+    async def aclose(self) -> None:
+        """No-op: the shared pool is closed by ``close_http_clients`` at shutdown."""
+
+    async def __aenter__(self) -> "ScopedClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+def http_client(
+    key: Optional[str] = None,
+    *,
+    base_url: str = "",
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Any = DEFAULT_TIMEOUT,
+    auth: Any = None,
+    follow_redirects: Optional[bool] = None,
+    max_connections: Optional[int] = None,
+) -> ScopedClient:
+    """
+    Get a client backed by the shared pools.
+
+    Requests go to the pool named ``key`` or, by default, to the pool of the
+    request URL's host.
+
+    Accepts the ``httpx.AsyncClient`` options call sites use (base_url,
+    headers, timeout, auth, follow_redirects) and applies them per request.
+    """
+    return ScopedClient(
+        key,
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        follow_redirects=follow_redirects,
+        max_connections=max_connections,
+    )
+
+
+async def close_http_clients() -> None:
+    """Close the shared pools of the running loop (called at app shutdown)."""
+    await registry.aclose()
+
+
+async def closing_http_clients(fn: Callable[[], Awaitable[T]]) -> T:
+    """
+    Await ``fn()``, then close the running loop's pools.
+
+    For sync code that runs async work on a short-lived loop
+    (``asyncio.run``/``anyio.run``): pools are bound to their loop, and
+    nothing else closes them once it is gone.
+    """
+    try:
+        return await fn()
+    finally:
+        await close_http_clients()
@@ -1,7 +1,7 @@
 import uuid
 import datetime as dt
 from typing import List, Dict, Any, Optional
-import httpx
+from .http_client import http_client
 
 from sqlalchemy.orm import Session
 from sqlalchemy import select, text
@@ -247,7 +247,7 @@ class JiraService:
 
         token = decrypt_token(conn.access_token)
         url = f"{conn.cloud_base_url}/rest/api/3/issue/{issue_key}/comment"
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with http_client(timeout=15) as client:
             resp = await client.post(
                 url,
                 headers={
@@ -277,7 +277,7 @@ class JiraService:
 
         token = decrypt_token(conn.access_token)
         url = f"{conn.cloud_base_url}/rest/api/3/issue/{issue_key}/transitions"
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with http_client(timeout=15) as client:
             resp = await client.post(
                 url,
                 headers={
@@ -317,7 +317,7 @@ class JiraService:
 
         token = decrypt_token(conn.access_token)
         url = f"{conn.cloud_base_url}/rest/api/3/issue/{issue_key}/assignee"
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with http_client(timeout=15) as client:
             resp = await client.put(
                 url,
                 headers={
@@ -350,7 +350,7 @@ class JiraService:
         token = decrypt_token(conn.access_token)
 
         # Fetch parent issue to get project key
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with http_client(timeout=15) as client:
             parent_resp = await client.get(
                 f"{conn.cloud_base_url}/rest/api/3/issue/{parent_key}",
                 headers={
@@ -410,7 +410,7 @@ class JiraService:
             "outwardIssue": {"key": target_key},
         }
 
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with http_client(timeout=15) as client:
             resp = await client.post(
                 f"{conn.cloud_base_url}/rest/api/3/issueLink",
                 headers={
@@ -7,6 +7,7 @@ import base64
 from typing import Dict, Any
 from contextlib import asynccontextmanager
 import httpx
+from backend.services.http_client import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ class JiraWriteService:
     @asynccontextmanager
     async def _client(self):
         """Create configured HTTP client for JIRA API with automatic resource cleanup"""
-        async with httpx.AsyncClient(
+        async with http_client(
             base_url=self.base_url,
             headers={
                 "Authorization": self.auth_header,
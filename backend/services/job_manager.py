@@ -9,6 +9,12 @@ Features:
 State model:
 - Execution control (`task`, `condition`) is process-local.
 - Job metadata/events are mirrored to Redis when available.
+
+Redis layout (per job, all keys expire after NAVI_JOB_TTL_SECONDS):
+- `{ns}:{job_id}:record`: full job record JSON, written on state changes.
+- `{ns}:{job_id}:stream`: event stream (XADD MAXLEN), one entry per event.
+- `{ns}:{job_id}:progress`: next_sequence/updated_at, written with each event
+  so appends never rewrite the full record.
 """
 
 from __future__ import annotations
@@ -18,8 +24,9 @@ import json
 import logging
 import os
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
 from uuid import uuid4
 
 import redis.asyncio as redis
@@ -53,6 +60,71 @@ end
 """
 
 
+def _serialize_event(event_payload: Dict[str, Any]) -> str:
+    return json.dumps(
+        event_payload, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+
+
+def _encoded_size(line: str) -> int:
+    return len(line.encode("utf-8"))
+
+
+class JobEventLog:
+    """
+    Retained job events in sequence order with a running byte total.
+
+    Each event's serialized size is measured once, when it is appended or
+    loaded, so evicting from the front never re-serializes anything.
+    """
+
+    __slots__ = ("_events", "_sizes", "total_bytes")
+
+    def __init__(self) -> None:
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._sizes: Deque[int] = deque()
+        self.total_bytes = 0
+
+    @classmethod
+    def from_raw(cls, rows: Iterable[str], limit: int) -> "JobEventLog":
+        """Build a log from serialized events, keeping the newest ``limit``."""
+        log = cls()
+        for row in rows:
+            try:
+                event = json.loads(row)
+            except Exception:
+                continue
+            if isinstance(event, dict):
+                log.append(event, _encoded_size(row))
+                if len(log) > limit:
+                    log.popleft()
+        return log
+
+    def append(self, event: Dict[str, Any], size: int) -> None:
+        self._events.append(event)
+        self._sizes.append(size)
+        self.total_bytes += size
+
+    def popleft(self) -> int:
+        """Drop the oldest event and return its serialized size."""
+        self._events.popleft()
+        size = self._sizes.popleft()
+        self.total_bytes -= size
+        return size
+
+    def last_sequence(self) -> int:
+        return max((int(evt.get("sequence", 0)) for evt in self._events), default=0)
+
+    def after(self, sequence: int) -> List[Dict[str, Any]]:
+        return [evt for evt in self._events if int(evt.get("sequence", 0)) > sequence]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._events)
+
+
 @dataclass
 class JobRecord:
     job_id: str
@@ -66,7 +138,7 @@ class JobRecord:
     metadata: Dict[str, Any] = field(default_factory=dict)
     pending_approval: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    events: List[Dict[str, Any]] = field(default_factory=list)
+    events: JobEventLog = field(default_factory=JobEventLog)
     next_sequence: int = 1
     task: Optional[asyncio.Task] = None
     local_runner_token: Optional[
@@ -200,25 +272,25 @@ class JobManager:
         return f"{self._namespace}:{job_id}:record"
 
     def _events_key(self, job_id: str) -> str:
+        # Pre-stream list of events; still read for jobs written before the move
         return f"{self._namespace}:{job_id}:events"
 
+    def _stream_key(self, job_id: str) -> str:
+        return f"{self._namespace}:{job_id}:stream"
+
+    def _progress_key(self, job_id: str) -> str:
+        return f"{self._namespace}:{job_id}:progress"
+
     def _lock_key(self, job_id: str) -> str:
         return f"{self._namespace}:{job_id}:runner_lock"
 
     @staticmethod
     def _event_size_bytes(event_payload: Dict[str, Any]) -> int:
         try:
-            return len(
-                json.dumps(
-                    event_payload, ensure_ascii=False, separators=(",", ":")
-                ).encode("utf-8")
-            )
+            return _encoded_size(_serialize_event(event_payload))
         except Exception:
             return len(str(event_payload).encode("utf-8"))
 
-    def _current_events_size(self, events: List[Dict[str, Any]]) -> int:
-        return sum(self._event_size_bytes(evt) for evt in events)
-
     @staticmethod
     def _normalize_redis_token(value: Any) -> str:
         if isinstance(value, bytes):
@@ -379,25 +451,40 @@ class JobManager:
             return
         try:
             await self._redis.set(
-                self._record_key(record.job_id), json.dumps(record.to_serializable())
+                self._record_key(record.job_id),
+                json.dumps(record.to_serializable()),
+                ex=self._ttl_seconds,
             )
-            await self._redis.expire(self._record_key(record.job_id), self._ttl_seconds)
         except Exception as exc:
             logger.warning(
                 "[JobManager] Failed to persist job record %s: %s", record.job_id, exc
             )
 
-    async def _append_event_redis(
-        self, job_id: str, event_payload: Dict[str, Any]
-    ) -> None:
+    async def _append_event_redis(self, record: JobRecord, line: str) -> None:
+        """Persist one serialized event and the record's progress in one MULTI."""
         if not self._redis_available or not self._redis:
             return
+        job_id = record.job_id
         try:
-            key = self._events_key(job_id)
-            await self._redis.rpush(key, json.dumps(event_payload))
-            # Trim oldest events.
-            await self._redis.ltrim(key, -self._max_events, -1)
-            await self._redis.expire(key, self._ttl_seconds)
+            stream_key = self._stream_key(job_id)
+            progress = json.dumps(
+                {
+                    "next_sequence": record.next_sequence,
+                    "updated_at": record.updated_at,
+                }
+            )
+            async with self._redis.pipeline(transaction=True) as pipe:
+                # Approximate MAXLEN lets Redis trim whole macro nodes
+                pipe.xadd(
+                    stream_key,
+                    {"e": line},
+                    maxlen=self._max_events,
+                    approximate=True,
+                )
+                pipe.expire(stream_key, self._ttl_seconds)
+                pipe.set(self._progress_key(job_id), progress, ex=self._ttl_seconds)
+                pipe.expire(self._record_key(job_id), self._ttl_seconds)
+                await pipe.execute()
         except Exception as exc:
             logger.warning(
                 "[JobManager] Failed to persist job event %s: %s", job_id, exc
@@ -407,32 +494,39 @@ class JobManager:
         if not self._redis_available or not self._redis:
             return None
         try:
-            raw = await self._redis.get(self._record_key(job_id))
+            raw, progress = await self._redis.mget(
+                self._record_key(job_id), self._progress_key(job_id)
+            )
             if not raw:
                 return None
-            payload = json.loads(raw)
-            return JobRecord.from_serializable(payload)
+            record = JobRecord.from_serializable(json.loads(raw))
+            if progress:
+                # Event appends only update the progress key
+                data = json.loads(progress)
+                record.next_sequence = max(
+                    record.next_sequence, int(data.get("next_sequence", 1))
+                )
+                record.updated_at = max(
+                    record.updated_at, float(data.get("updated_at", 0))
+                )
+            return record
         except Exception as exc:
             logger.warning("[JobManager] Failed loading job record %s: %s", job_id, exc)
             return None
 
-    async def _load_events_redis(self, job_id: str) -> List[Dict[str, Any]]:
+    async def _load_events_redis(self, job_id: str) -> Optional[JobEventLog]:
         if not self._redis_available or not self._redis:
-            return []
+            return None
         try:
-            rows = await self._redis.lrange(self._events_key(job_id), 0, -1)
-            events: List[Dict[str, Any]] = []
-            for row in rows:
-                try:
-                    payload = json.loads(row)
-                except Exception:
-                    continue
-                if isinstance(payload, dict):
-                    events.append(payload)
-            return events
+            entries = await self._redis.xrange(self._stream_key(job_id))
+            rows = [fields.get("e", "") for _, fields in entries]
+            if not rows:
+                rows = await self._redis.lrange(self._events_key(job_id), 0, -1)
         except Exception as exc:
             logger.warning("[JobManager] Failed loading job events %s: %s", job_id, exc)
-            return []
+            return None
+        events = JobEventLog.from_raw(rows, self._max_events)
+        return events if len(events) else None
 
     async def _hydrate_from_redis(self, job_id: str) -> Optional[JobRecord]:
         record = await self._load_record_redis(job_id)
@@ -440,8 +534,8 @@ class JobManager:
             return None
         events = await self._load_events_redis(job_id)
         if events:
-            record.events = events[-self._max_events :]
-            max_seq = max(int(evt.get("sequence", 0)) for evt in record.events)
+            record.events = events
+            max_seq = events.last_sequence()
             if max_seq >= record.next_sequence:
                 record.next_sequence = max_seq + 1
         async with self._jobs_lock:
@@ -506,7 +600,7 @@ class JobManager:
             # Refresh metadata from Redis for cross-worker visibility.
             refreshed = await self._load_record_redis(job_id)
             if refreshed:
-                refreshed_events: Optional[List[Dict[str, Any]]] = None
+                refreshed_events: Optional[JobEventLog] = None
                 if refreshed.next_sequence > record.next_sequence:
                     refreshed_events = await self._load_events_redis(job_id)
                 async with record.condition:
@@ -524,10 +618,8 @@ class JobManager:
                     if refreshed.next_sequence > record.next_sequence:
                         record.next_sequence = refreshed.next_sequence
                     if refreshed_events:
-                        record.events = refreshed_events[-self._max_events :]
-                        max_seq = max(
-                            int(evt.get("sequence", 0)) for evt in record.events
-                        )
+                        record.events = refreshed_events
+                        max_seq = refreshed_events.last_sequence()
                         if max_seq >= record.next_sequence:
                             record.next_sequence = max_seq + 1
             return record
@@ -545,40 +637,40 @@ class JobManager:
             sequence = record.next_sequence
             record.next_sequence += 1
             record.updated_at = time.time()
-            event_payload = self._sanitize_event_payload(event)
+            event_payload = dict(event)
             event_payload["sequence"] = sequence
             event_payload["job_id"] = record.job_id
             event_payload["job_status"] = record.status
             event_payload.setdefault("timestamp", int(record.updated_at * 1000))
-            record.events.append(event_payload)
+            # Serialized once: the same line sizes the event and goes to Redis
+            line = _serialize_event(event_payload)
+            size = _encoded_size(line)
+            if size > self._max_event_payload_bytes:
+                event_payload = self._sanitize_event_payload(event_payload)
+                line = _serialize_event(event_payload)
+                size = _encoded_size(line)
+
+            events = record.events
+            events.append(event_payload, size)
             truncated_count = 0
             truncated_bytes = 0
-            if len(record.events) > self._max_events:
-                excess = len(record.events) - self._max_events
-                truncated_count += excess
-                trimmed = record.events[:excess]
-                truncated_bytes += self._current_events_size(trimmed)
-                record.events = record.events[-self._max_events :]
-
-            total_bytes = self._current_events_size(record.events)
-            while len(record.events) > 1 and total_bytes > self._max_event_bytes:
-                removed = record.events.pop(0)
+            while len(events) > self._max_events:
                 truncated_count += 1
-                removed_size = self._event_size_bytes(removed)
-                truncated_bytes += removed_size
-                total_bytes -= removed_size
-
-            if truncated_count > 0:
-                event_payload.setdefault(
-                    "truncation",
-                    {
-                        "truncated_events": truncated_count,
-                        "truncated_bytes": truncated_bytes,
-                        "reason": "older_events_dropped",
-                    },
-                )
-            await self._persist_record(record)
-            await self._append_event_redis(record.job_id, event_payload)
+                truncated_bytes += events.popleft()
+            while len(events) > 1 and events.total_bytes > self._max_event_bytes:
+                truncated_count += 1
+                truncated_bytes += events.popleft()
+
+            if truncated_count > 0 and "truncation" not in event_payload:
+                truncation = {
+                    "truncated_events": truncated_count,
+                    "truncated_bytes": truncated_bytes,
+                    "reason": "older_events_dropped",
+                }
+                event_payload["truncation"] = truncation
+                # Splice into the serialized object instead of re-serializing
+                line = f'{line[:-1]},"truncation":{json.dumps(truncation)}}}'
+            await self._append_event_redis(record, line)
             record.condition.notify_all()
             return event_payload
 
@@ -706,18 +798,12 @@ class JobManager:
         redis_events = await self._load_events_redis(job_id)
         if redis_events:
             async with record.lock:
-                record.events = redis_events[-self._max_events :]
-                max_seq = max(
-                    (int(evt.get("sequence", 0)) for evt in record.events), default=0
-                )
+                record.events = redis_events
+                max_seq = redis_events.last_sequence()
                 if max_seq >= record.next_sequence:
                     record.next_sequence = max_seq + 1
         async with record.lock:
-            return [
-                evt
-                for evt in record.events
-                if int(evt.get("sequence", 0)) > after_sequence
-            ]
+            return record.events.after(after_sequence)
 
     async def wait_for_events(
         self,
@@ -33,6 +33,15 @@ from typing import (
 
 import httpx
 
+from backend.services.http_client import http_client
+from backend.services.prompt_cache import (
+    anthropic_cache_usage,
+    anthropic_request_parts,
+    openai_cached_tokens,
+    prompt_cache_key,
+    stable_tools,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +102,10 @@ class LLMConfig:
     tool_choice: Optional[str] = None  # auto, none, or specific tool
     system_prompt: Optional[str] = None
     timeout: int = 120
+    # Stable tool order plus provider prompt-cache hints (Anthropic breakpoints,
+    # OpenAI prompt_cache_key). Off by default: a cache write costs more than
+    # plain input, so only multi-turn callers that resend the prefix opt in.
+    prompt_cache: bool = False
     # Provider-specific options
     extra_params: Dict[str, Any] = field(default_factory=dict)
 
@@ -140,7 +153,7 @@ class BaseLLMAdapter(ABC):
 
     def __init__(self, config: LLMConfig, health_tracker=None, health_provider_id=None):
         self.config = config
-        self.client = httpx.AsyncClient(timeout=config.timeout)
+        self.client = http_client(timeout=config.timeout)
         self.health_tracker = health_tracker
         self.health_provider_id = health_provider_id
 
@@ -338,9 +351,20 @@ class OpenAIAdapter(BaseLLMAdapter):
             payload["max_tokens"] = self.config.max_tokens
 
         if self.config.tools:
-            payload["tools"] = self.config.tools
+            payload["tools"] = (
+                stable_tools(self.config.tools)
+                if self.config.prompt_cache
+                else self.config.tools
+            )
         if self.config.tool_choice:
             payload["tool_choice"] = self.config.tool_choice
+        if self.config.prompt_cache and self.config.provider == LLMProvider.OPENAI:
+            payload.setdefault(
+                "prompt_cache_key",
+                prompt_cache_key(
+                    normalized_model, self.config.system_prompt, payload.get("tools")
+                ),
+            )
 
         endpoint = f"{api_base}/chat/completions"
         logger.info(
@@ -408,12 +432,15 @@ class OpenAIAdapter(BaseLLMAdapter):
             data = response.json()
             choice = data["choices"][0]
             message = choice["message"]
+            usage = data.get("usage") or {}
+            # Cached tokens are included in prompt_tokens
+            usage["cache_read_tokens"] = openai_cached_tokens(usage)
 
             resp = LLMResponse(
                 content=message.get("content", ""),
                 model=data.get("model", self.config.model),
                 provider=self.config.provider.value,
-                usage=data.get("usage", {}),
+                usage=usage,
                 tool_calls=message.get("tool_calls"),
                 finish_reason=choice.get("finish_reason"),
                 raw_response=data,
@@ -597,9 +624,9 @@ class AnthropicAdapter(BaseLLMAdapter):
         if system:
             payload["system"] = system
 
+        anthropic_tools = []
         if self.config.tools:
             # Convert OpenAI tool format to Anthropic format
-            anthropic_tools = []
             for tool in self.config.tools:
                 if tool.get("type") == "function":
                     func = tool["function"]
@@ -613,6 +640,9 @@ class AnthropicAdapter(BaseLLMAdapter):
             if anthropic_tools:
                 payload["tools"] = anthropic_tools
 
+        if self.config.prompt_cache:
+            payload.update(anthropic_request_parts([system], anthropic_tools, msgs))
+
         provider_id = self.health_provider_id or self.config.provider.value
 
         try:
@@ -649,6 +679,8 @@ class AnthropicAdapter(BaseLLMAdapter):
         try:
             data = response.json()
 
+            cache_read, cache_write = anthropic_cache_usage(data.get("usage"))
+
             # Extract content from Anthropic response
             content = ""
             tool_calls = []
@@ -674,6 +706,8 @@ class AnthropicAdapter(BaseLLMAdapter):
                 usage={
                     "prompt_tokens": data.get("usage", {}).get("input_tokens", 0),
                     "completion_tokens": data.get("usage", {}).get("output_tokens", 0),
+                    "cache_read_tokens": cache_read,
+                    "cache_write_tokens": cache_write,
                 },
                 tool_calls=tool_calls if tool_calls else None,
                 finish_reason=data.get("stop_reason"),
@@ -717,6 +751,8 @@ class AnthropicAdapter(BaseLLMAdapter):
         }
         if system:
             payload["system"] = system
+        if self.config.prompt_cache:
+            payload.update(anthropic_request_parts([system], None, msgs))
 
         provider_id = self.health_provider_id or self.config.provider.value
 
@@ -1141,6 +1177,7 @@ class LLMClient:
         tools: Optional[List[Dict]] = None,
         health_tracker=None,
         health_provider_id: Optional[str] = None,
+        prompt_cache: bool = False,
         **kwargs,
     ):
         if isinstance(provider, str):
@@ -1155,6 +1192,7 @@ class LLMClient:
             max_tokens=max_tokens,
             system_prompt=system_prompt,
             tools=tools,
+            prompt_cache=prompt_cache,
             extra_params=kwargs,
         )
 
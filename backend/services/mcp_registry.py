@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Sequence
 from uuid import uuid4
 
-import httpx
+from backend.services.http_client import http_client
 import ipaddress
 from urllib.parse import urlparse
 from sqlalchemy import inspect, or_
@@ -483,7 +483,7 @@ async def _jsonrpc_call(
         payload["params"] = params
 
     headers = _build_headers(server)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+    async with http_client(timeout=timeout, follow_redirects=True) as client:
         async with client.stream(
             "POST", server["url"], json=payload, headers=headers
         ) as resp:
@@ -6,12 +6,12 @@ using OpenAI's text-embedding-3-small model (or configurable alternatives).
 
 Features:
 - Batch embedding generation for efficiency
-- Caching to avoid redundant API calls
+- Shared tiered cache (backend/services/embedding_cache.py) to avoid
+  redundant API calls across services, workers and restarts
 - Configurable embedding dimensions
 - Support for multiple text types (code, conversation, documentation)
 """
 
-import hashlib
 import json
 import logging
 from typing import Dict, List, Optional, Tuple
@@ -19,6 +19,7 @@ from typing import Dict, List, Optional, Tuple
 import tiktoken
 
 from backend.core.config import get_settings
+from backend.services.embedding_cache import get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +55,8 @@ class EmbeddingService:
         self._client = None
         self._tokenizer = None
 
-        # In-memory cache for embeddings (LRU cache)
-        self._cache: Dict[str, List[float]] = {}
-        self._cache_max_size = 10000
+        # Shared across every embedding call site, keyed by (model, dimensions)
+        self._cache = get_embedding_cache()
 
     @property
     def client(self):
@@ -86,10 +86,6 @@ class EmbeddingService:
                 self._tokenizer = tiktoken.get_encoding("cl100k_base")
         return self._tokenizer
 
-    def _get_cache_key(self, text: str) -> str:
-        """Generate cache key for text."""
-        return hashlib.sha256(f"{self.model}:{text}".encode()).hexdigest()
-
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
         return len(self.tokenizer.encode(text))
@@ -134,9 +130,11 @@ class EmbeddingService:
             return [0.0] * self.dimensions
 
         # Check cache
-        cache_key = self._get_cache_key(text)
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        if use_cache:
+            (cached,) = await self._cache.aget_many(self.model, self.dimensions, [text])
+            if cached is not None:
+                return cached.tolist()
+        original_text = text
 
         # Truncate if needed
         text = self.truncate_text(text)
@@ -151,7 +149,9 @@ class EmbeddingService:
 
             # Cache result
             if use_cache:
-                self._add_to_cache(cache_key, embedding)
+                await self._cache.aput_many(
+                    self.model, self.dimensions, [original_text], [embedding]
+                )
 
             return embedding
 
@@ -183,15 +183,16 @@ class EmbeddingService:
         results: List[Optional[List[float]]] = [None] * len(texts)
         texts_to_embed: List[Tuple[int, str]] = []
 
-        # Check cache first
+        # Check cache first (one batched lookup per tier)
+        cached: list = [None] * len(texts)
+        if use_cache:
+            cached = await self._cache.aget_many(self.model, self.dimensions, texts)
+
         for i, text in enumerate(texts):
             if not text or not text.strip():
                 results[i] = [0.0] * self.dimensions
-                continue
-
-            cache_key = self._get_cache_key(text)
-            if use_cache and cache_key in self._cache:
-                results[i] = self._cache[cache_key]
+            elif cached[i] is not None:
+                results[i] = cached[i].tolist()
             else:
                 texts_to_embed.append((i, self.truncate_text(text)))
 
@@ -208,15 +209,20 @@ class EmbeddingService:
                         dimensions=self.dimensions,
                     )
 
+                    embedded = []
                     for j, embedding_data in enumerate(response.data):
                         original_idx = batch[j][0]
-                        embedding = embedding_data.embedding
-                        results[original_idx] = embedding
-
-                        # Cache result
-                        if use_cache:
-                            cache_key = self._get_cache_key(texts[original_idx])
-                            self._add_to_cache(cache_key, embedding)
+                        results[original_idx] = embedding_data.embedding
+                        embedded.append(texts[original_idx])
+
+                    # Cache results
+                    if use_cache:
+                        await self._cache.aput_many(
+                            self.model,
+                            self.dimensions,
+                            embedded,
+                            [e.embedding for e in response.data],
+                        )
 
                 except Exception as e:
                     logger.error(f"Batch embedding failed: {e}")
@@ -232,19 +238,9 @@ class EmbeddingService:
 
         return results  # type: ignore
 
-    def _add_to_cache(self, key: str, embedding: List[float]) -> None:
-        """Add embedding to cache with LRU eviction."""
-        if len(self._cache) >= self._cache_max_size:
-            # Remove oldest entries (simple FIFO, not true LRU)
-            keys_to_remove = list(self._cache.keys())[:1000]
-            for k in keys_to_remove:
-                del self._cache[k]
-
-        self._cache[key] = embedding
-
     def clear_cache(self) -> None:
-        """Clear the embedding cache."""
-        self._cache.clear()
+        """Clear the in-process tier of the shared embedding cache."""
+        self._cache.clear_memory()
 
     async def embed_code(
         self,
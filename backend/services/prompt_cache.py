@@ -0,0 +1,125 @@
+"""
+Prompt-prefix caching helpers for LLM requests.
+
+Providers cache the longest request prefix they have seen recently, in the
+order tools -> system -> messages. A prefix only matches if it is byte-for-byte
+identical, so tool lists are sent in a stable (name-sorted) order and the
+static system prompt is kept apart from per-request context such as RAG
+results.
+
+Anthropic caches only up to explicit ``cache_control`` breakpoints (at most
+four per request). ``anthropic_request_parts`` places three: after the tool
+schemas, after the static system block and on the last message, so each
+round-trip of an agent loop reads the previous turn's prefix from cache.
+OpenAI caches prefixes automatically; ``prompt_cache_key`` helps route
+requests sharing a prefix to the same cache.
+
+Reported cache usage is normalised to ``(read_tokens, write_tokens)``.
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def _tool_name(tool: Dict[str, Any]) -> str:
+    # Anthropic tools carry "name"; OpenAI tools nest it under "function"
+    return tool.get("name") or tool.get("function", {}).get("name", "")
+
+
+def stable_tools(tools: Optional[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Tools sorted by name, so the schema prefix is identical on every call."""
+    return sorted(tools or [], key=_tool_name)
+
+
+def anthropic_tools(tools: Optional[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Stable tool list with a cache breakpoint after the last schema."""
+    ordered = stable_tools(tools)
+    if ordered:
+        ordered[-1] = {**ordered[-1], "cache_control": EPHEMERAL}
+    return ordered
+
+
+def anthropic_system(blocks: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    System prompt as text blocks, with a breakpoint after the first one.
+
+    The first block is the static prompt; later blocks (retrieved context and
+    the like) may change between requests without invalidating it.
+    """
+    system = [{"type": "text", "text": text} for text in blocks if text]
+    if system:
+        system[0]["cache_control"] = EPHEMERAL
+    return system
+
+
+def anthropic_messages(messages: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy of ``messages`` with a breakpoint on the last content block.
+
+    The caller's history is left untouched, so breakpoints never pile up
+    across turns (the API rejects more than four).
+    """
+    marked = list(messages)
+    if not marked:
+        return marked
+
+    last = dict(marked[-1])
+    content = last.get("content")
+    if isinstance(content, str):
+        if not content:
+            return marked
+        blocks = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = copy.copy(content)
+    else:
+        return marked
+
+    blocks[-1] = {**blocks[-1], "cache_control": EPHEMERAL}
+    last["content"] = blocks
+    marked[-1] = last
+    return marked
+
+
+def anthropic_request_parts(
+    system_blocks: Sequence[str],
+    tools: Optional[Sequence[Dict[str, Any]]],
+    messages: Sequence[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """``system``/``tools``/``messages`` payload fields with cache breakpoints."""
+    parts: Dict[str, Any] = {"messages": anthropic_messages(messages)}
+    system = anthropic_system(system_blocks)
+    if system:
+        parts["system"] = system
+    if tools:
+        parts["tools"] = anthropic_tools(tools)
+    return parts
+
+
+def prompt_cache_key(*parts: Any) -> str:
+    """Short stable key for a request prefix (OpenAI ``prompt_cache_key``)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:32]
+
+
+def anthropic_cache_usage(usage: Optional[Dict[str, Any]]) -> Tuple[int, int]:
+    """(cache read, cache write) tokens from an Anthropic ``usage`` object."""
+    usage = usage or {}
+    return (
+        int(usage.get("cache_read_input_tokens") or 0),
+        int(usage.get("cache_creation_input_tokens") or 0),
+    )
+
+
+def openai_cached_tokens(usage: Optional[Dict[str, Any]]) -> int:
+    """Cached prompt tokens from an OpenAI ``usage`` object.
+
+    Unlike Anthropic's, these are included in ``prompt_tokens``.
+    """
+    details = (usage or {}).get("prompt_tokens_details") or {}
+    return int(details.get("cached_tokens") or 0)
@@ -156,6 +156,23 @@ def _get_node_env_setup(workspace_path: str) -> str:
     return ""
 
 
+def _compacted_history(
+    conversation_history: Optional[List[Dict[str, Any]]], model: str
+) -> List[Dict[str, Any]]:
+    """Normalize prior turns and compact them to the context budget."""
+    from backend.services.context_compaction import ConversationCompactor
+
+    history = [
+        {
+            "role": msg.get("role") or msg.get("type") or "user",
+            "content": str(msg.get("content") or ""),
+        }
+        for msg in conversation_history or []
+    ]
+    ConversationCompactor(model=model, component="streaming_agent").compact(history)
+    return history
+
+
 async def stream_with_tools_openai(
     message: str,
     workspace_path: str,
@@ -184,11 +201,8 @@ async def stream_with_tools_openai(
         system_prompt += "\n\nContext:\n" + json.dumps(context, ensure_ascii=False)
 
     messages: List[LLMMessage] = [LLMMessage(role="system", content=system_prompt)]
-    if conversation_history:
-        for msg in conversation_history:
-            role = msg.get("role") or msg.get("type") or "user"
-            content = str(msg.get("content") or "")
-            messages.append(LLMMessage(role=role, content=content))
+    for msg in _compacted_history(conversation_history, model):
+        messages.append(LLMMessage(role=msg["role"], content=msg["content"]))
     messages.append(LLMMessage(role="user", content=message))
 
     # For health tracking, use actual provider
@@ -205,6 +219,8 @@ async def stream_with_tools_openai(
         api_base=base_url,
         health_tracker=router.health_tracker,
         health_provider_id=health_provider,
+        # The history is resent every turn, so cache the shared prefix
+        prompt_cache=True,
     )
 
     async for chunk in client.stream(messages):
@@ -241,11 +257,8 @@ async def stream_with_tools_anthropic(
         system_prompt += "\n\nContext:\n" + json.dumps(context, ensure_ascii=False)
 
     messages: List[LLMMessage] = [LLMMessage(role="system", content=system_prompt)]
-    if conversation_history:
-        for msg in conversation_history:
-            role = msg.get("role") or msg.get("type") or "user"
-            content = str(msg.get("content") or "")
-            messages.append(LLMMessage(role=role, content=content))
+    for msg in _compacted_history(conversation_history, model):
+        messages.append(LLMMessage(role=msg["role"], content=msg["content"]))
     messages.append(LLMMessage(role="user", content=message))
 
     router = get_model_router()
@@ -256,6 +269,7 @@ async def stream_with_tools_anthropic(
         api_key=api_key,
         health_tracker=router.health_tracker,
         health_provider_id="anthropic",
+        prompt_cache=True,
     )
 
     async for chunk in client.stream(messages):
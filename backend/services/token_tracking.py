@@ -13,14 +13,22 @@ This enables transparent pricing for SaaS customers.
 
 import os
 import json
+import atexit
 import logging
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import contextmanager
 import hashlib
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process ledger only
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,8 +44,8 @@ MODEL_PRICING = {
     "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25},
     "claude-3-5-haiku-20241022": {"input": 1.00, "output": 5.00},
     # OpenAI models
-    "gpt-4o": {"input": 2.50, "output": 10.00},
-    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "output": 10.00, "cache_read": 1.25},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60, "cache_read": 0.075},
     "gpt-4-turbo": {"input": 10.00, "output": 30.00},
     "gpt-4": {"input": 30.00, "output": 60.00},
     "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
@@ -63,10 +71,19 @@ MODEL_PRICING = {
     "default": {"input": 3.00, "output": 15.00},
 }
 
+# Prompt-cache pricing relative to the input price, for models without
+# explicit "cache_read" / "cache_write" entries (Anthropic's published rates)
+CACHE_READ_MULTIPLIER = 0.1
+CACHE_WRITE_MULTIPLIER = 1.25
+
 
 @dataclass
 class TokenUsage:
-    """Token usage for a single request."""
+    """Token usage for a single request.
+
+    ``input_tokens`` counts uncached input only; prompt-cache reads and
+    writes are counted separately because they are billed differently.
+    """
 
     input_tokens: int = 0
     output_tokens: int = 0
@@ -78,7 +95,12 @@ class TokenUsage:
 
     def __post_init__(self):
         if self.total_tokens == 0:
-            self.total_tokens = self.input_tokens + self.output_tokens
+            self.total_tokens = (
+                self.input_tokens
+                + self.output_tokens
+                + self.cache_read_tokens
+                + self.cache_write_tokens
+            )
 
 
 @dataclass
@@ -117,6 +139,8 @@ class UsageRecord:
             "input_tokens": self.usage.input_tokens,
             "output_tokens": self.usage.output_tokens,
             "total_tokens": self.usage.total_tokens,
+            "cache_read_tokens": self.usage.cache_read_tokens,
+            "cache_write_tokens": self.usage.cache_write_tokens,
             "input_cost": self.input_cost,
             "output_cost": self.output_cost,
             "total_cost": self.total_cost,
@@ -139,6 +163,8 @@ class UsageSummary:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     total_tokens: int = 0
+    total_cache_read_tokens: int = 0
+    total_cache_write_tokens: int = 0
     total_cost: float = 0.0
 
     # Breakdown by model
@@ -161,8 +187,19 @@ class CostCalculator:
         """Calculate cost for a request."""
         pricing = MODEL_PRICING.get(model, MODEL_PRICING["default"])
 
+        cache_read_price = pricing.get(
+            "cache_read", pricing["input"] * CACHE_READ_MULTIPLIER
+        )
+        cache_write_price = pricing.get(
+            "cache_write", pricing["input"] * CACHE_WRITE_MULTIPLIER
+        )
+
         # Cost per million tokens
-        input_cost = (usage.input_tokens / 1_000_000) * pricing["input"]
+        input_cost = (
+            usage.input_tokens * pricing["input"]
+            + usage.cache_read_tokens * cache_read_price
+            + usage.cache_write_tokens * cache_write_price
+        ) / 1_000_000
         output_cost = (usage.output_tokens / 1_000_000) * pricing["output"]
 
         return {
@@ -187,12 +224,98 @@ class CostCalculator:
         return MODEL_PRICING.get(model, MODEL_PRICING["default"])
 
 
+def _record_from_dict(r: Dict[str, Any]) -> UsageRecord:
+    """Rebuild a UsageRecord from its ``to_dict`` form."""
+    return UsageRecord(
+        id=r["id"],
+        timestamp=datetime.fromisoformat(r["timestamp"]),
+        model=r["model"],
+        provider=r["provider"],
+        usage=TokenUsage(
+            input_tokens=r["input_tokens"],
+            output_tokens=r["output_tokens"],
+            total_tokens=r["total_tokens"],
+            cache_read_tokens=r.get("cache_read_tokens", 0),
+            cache_write_tokens=r.get("cache_write_tokens", 0),
+        ),
+        input_cost=r["input_cost"],
+        output_cost=r["output_cost"],
+        total_cost=r["total_cost"],
+        org_id=r.get("org_id"),
+        team_id=r.get("team_id"),
+        user_id=r.get("user_id"),
+        request_type=r.get("request_type", "chat"),
+        latency_ms=r.get("latency_ms", 0),
+    )
+
+
+# Rollup bucket key: (hour "YYYY-MM-DDTHH", org_id, team_id, user_id, model)
+# Rollup bucket value: [requests, input_tokens, output_tokens, total_tokens,
+#                       cost, latency_ms, cache_read_tokens, cache_write_tokens]
+# (rollups written before the cache fields existed are zero-padded on load)
+_ROLLUP_FIELDS = 8
+
+
+def _hour_key(ts: datetime) -> str:
+    return ts.strftime("%Y-%m-%dT%H")
+
+
+def _bucket_key(record: UsageRecord) -> tuple:
+    return (
+        _hour_key(record.timestamp),
+        record.org_id,
+        record.team_id,
+        record.user_id,
+        record.model,
+    )
+
+
+def _add_to_bucket(buckets: Dict[tuple, List[float]], record: UsageRecord) -> None:
+    values = buckets.get(_bucket_key(record))
+    if values is None:
+        values = buckets[_bucket_key(record)] = [0] * _ROLLUP_FIELDS
+    values[0] += 1
+    values[1] += record.usage.input_tokens
+    values[2] += record.usage.output_tokens
+    values[3] += record.usage.total_tokens
+    values[4] += record.total_cost
+    values[5] += record.latency_ms
+    values[6] += record.usage.cache_read_tokens
+    values[7] += record.usage.cache_write_tokens
+
+
+@dataclass
+class _DayRollup:
+    """Hourly rollups for one day and how much of its ledger segment they cover."""
+
+    buckets: Dict[tuple, List[float]] = field(default_factory=dict)
+    segment_offset: int = 0
+
+
 class TokenTracker:
     """
     Tracks token usage and costs for billing and analytics.
+
+    Records go to an append-only ledger, one JSONL segment per day
+    (``usage_YYYY-MM-DD.jsonl``), written in batches by a background thread.
+    The same thread maintains per-hour rollups by org/team/user/model
+    (``rollup_YYYY-MM-DD.json``), so summaries cost O(buckets), not
+    O(requests). Each rollup file records the segment offset it covers;
+    anything appended after it (e.g. before a crash, or by another process)
+    is replayed on load and before each read. Several processes may share a
+    storage path: appends and rollup saves for a day happen under an
+    exclusive ``flock`` on ``rollup_YYYY-MM-DD.lock``, after reloading the
+    rollup and replaying whatever the other writers appended.
+    Legacy ``usage_YYYY-MM-DD.json`` files are rolled up the first time
+    their day is read.
     """
 
-    def __init__(self, storage_path: str = None):
+    def __init__(
+        self,
+        storage_path: str = None,
+        flush_interval_sec: float = 1.0,
+        flush_batch_size: int = 256,
+    ):
         self.storage_path = Path(
             storage_path
             or os.getenv("NAVI_USAGE_PATH", os.path.expanduser("~/.navi/usage"))
@@ -200,59 +323,245 @@ class TokenTracker:
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
         # In-memory records (recent)
-        self.records: List[UsageRecord] = []
         self.max_memory_records = 10000
+        self.records: Deque[UsageRecord] = deque(maxlen=self.max_memory_records)
+
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_batch_size = flush_batch_size
+
+        # Tracked but not yet written, and being written by flush() (day ->
+        # segment offset its append starts at, once known, and its records);
+        # guarded by _lock with _rollups
+        self._pending: List[UsageRecord] = []
+        self._flushing: Dict[str, Tuple[Optional[int], List[UsageRecord]]] = {}
+        self._rollups: Dict[str, _DayRollup] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
 
         # Load recent records
         self._load_recent()
 
+        self._writer = threading.Thread(
+            target=self._run_writer, name="token-usage-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _segment_path(self, day: str) -> Path:
+        return self.storage_path / f"usage_{day}.jsonl"
+
+    def _rollup_path(self, day: str) -> Path:
+        return self.storage_path / f"rollup_{day}.json"
+
+    def _legacy_path(self, day: str) -> Path:
+        return self.storage_path / f"usage_{day}.json"
+
     def _load_recent(self):
-        """Load recent usage records."""
+        """Load today's records into the recent-records buffer."""
         today = datetime.now().strftime("%Y-%m-%d")
-        today_file = self.storage_path / f"usage_{today}.json"
-
-        if today_file.exists():
+        for path in (self._legacy_path(today), self._segment_path(today)):
+            if not path.exists():
+                continue
             try:
-                data = json.loads(today_file.read_text())
-                for r in data.get("records", []):
-                    record = UsageRecord(
-                        id=r["id"],
-                        timestamp=datetime.fromisoformat(r["timestamp"]),
-                        model=r["model"],
-                        provider=r["provider"],
-                        usage=TokenUsage(
-                            input_tokens=r["input_tokens"],
-                            output_tokens=r["output_tokens"],
-                            total_tokens=r["total_tokens"],
-                        ),
-                        input_cost=r["input_cost"],
-                        output_cost=r["output_cost"],
-                        total_cost=r["total_cost"],
-                        org_id=r.get("org_id"),
-                        team_id=r.get("team_id"),
-                        user_id=r.get("user_id"),
-                        request_type=r.get("request_type", "chat"),
-                        latency_ms=r.get("latency_ms", 0),
-                    )
-                    self.records.append(record)
-                logger.info(f"Loaded {len(self.records)} usage records for today")
+                self.records.extend(self._read_records(path))
             except Exception as e:
                 logger.error(f"Error loading usage records: {e}")
+        if self.records:
+            logger.info(f"Loaded {len(self.records)} usage records for today")
 
-    def _save_records(self):
-        """Save records to disk."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_file = self.storage_path / f"usage_{today}.json"
+    @staticmethod
+    def _read_records(path: Path, offset: int = 0) -> List[UsageRecord]:
+        """Read records from a JSONL segment (from ``offset``) or a legacy file."""
+        if path.suffix == ".json":
+            data = json.loads(path.read_text())
+            return [_record_from_dict(r) for r in data.get("records", [])]
+        records = []
+        with path.open("rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn final write; the rest is rewritten by replay
+                records.append(_record_from_dict(json.loads(line)))
+        return records
+
+    # ------------------------------------------------------------------
+    # Rollups
+    # ------------------------------------------------------------------
+
+    def _day_rollup(self, day: str) -> _DayRollup:
+        """Get a day's rollup, loading (and catching up) from disk on first use.
+
+        Caller must hold ``_lock``.
+        """
+        rollup = self._rollups.get(day)
+        if rollup is None:
+            rollup = self._load_rollup(day, self._flushed_through(day))
+            self._rollups[day] = rollup
+        return rollup
+
+    def _load_rollup(self, day: str, end: Optional[int] = None) -> _DayRollup:
+        """Read a day's rollup from disk and replay the segment up to ``end``."""
+        rollup = _DayRollup()
+        rollup_path = self._rollup_path(day)
+        legacy_path = self._legacy_path(day)
+        segment_path = self._segment_path(day)
+        try:
+            if rollup_path.exists():
+                data = json.loads(rollup_path.read_text())
+                rollup.segment_offset = data.get("segment_offset", 0)
+                for row in data.get("buckets", []):
+                    key, values = row[:5], row[5:]
+                    values += [0] * (_ROLLUP_FIELDS - len(values))
+                    rollup.buckets[tuple(key)] = values
+            elif legacy_path.exists():
+                for record in self._read_records(legacy_path):
+                    _add_to_bucket(rollup.buckets, record)
+            self._replay_segment(segment_path, rollup, end)
+        except Exception as e:
+            logger.warning(f"Error loading usage rollup for {day}: {e}")
+        return rollup
 
-        # Filter to today's records only
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_records = [r for r in self.records if r.timestamp >= today_start]
+    @staticmethod
+    def _replay_segment(
+        segment_path: Path, rollup: _DayRollup, end: Optional[int] = None
+    ) -> None:
+        """Add complete segment lines past ``rollup.segment_offset`` (and
+        before ``end``) to it."""
+        if not segment_path.exists():
+            return
+        if segment_path.stat().st_size <= rollup.segment_offset:
+            return
+        with segment_path.open("rb") as f:
+            f.seek(rollup.segment_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Another writer is mid-append; read it next time
+                if end is not None and rollup.segment_offset + len(line) > end:
+                    break  # This process's flush; counted from _flushing
+                _add_to_bucket(rollup.buckets, _record_from_dict(json.loads(line)))
+                rollup.segment_offset += len(line)
+
+    def _flushed_through(self, day: str) -> Optional[int]:
+        """Segment offset where an in-progress flush of ``day`` appends.
+
+        Caller must hold ``_lock``.
+        """
+        flushing = self._flushing.get(day)
+        return flushing[0] if flushing else None
+
+    def _current_rollup(self, day: str) -> _DayRollup:
+        """A day's rollup including lines other processes have appended.
+
+        Caller must hold ``_lock``.
+        """
+        rollup = self._day_rollup(day)
+        try:
+            self._replay_segment(
+                self._segment_path(day), rollup, self._flushed_through(day)
+            )
+        except Exception as e:
+            logger.warning(f"Error catching up usage rollup for {day}: {e}")
+        return rollup
+
+    @contextmanager
+    def _day_file_lock(self, day: str):
+        """Hold an exclusive lock on a day's ledger across processes."""
+        with (self.storage_path / f"rollup_{day}.lock").open("a") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
+    def _save_rollup(self, day: str, rollup: _DayRollup) -> None:
+        """Atomically persist a day's rollup. Caller must hold its file lock."""
         data = {
-            "date": today,
-            "records": [r.to_dict() for r in today_records],
+            "date": day,
+            "segment_offset": rollup.segment_offset,
+            "buckets": [list(k) + list(v) for k, v in rollup.buckets.items()],
         }
-        today_file.write_text(json.dumps(data, indent=2))
+        path = self._rollup_path(day)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
+
+    def _run_writer(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error writing usage ledger: {e}")
+
+    def flush(self) -> None:
+        """Append pending records to the ledger and persist their rollups.
+
+        ``_lock`` is only held to hand the batch over and to publish each
+        day's new rollup; file locking and I/O happen without it, so
+        ``track()`` and summaries never wait on other processes' writes.
+        """
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    return
+                by_day: Dict[str, List[UsageRecord]] = defaultdict(list)
+                for record in batch:
+                    by_day[record.timestamp.strftime("%Y-%m-%d")].append(record)
+                for day, records in by_day.items():
+                    self._flushing[day] = (None, records)
+
+            try:
+                for day, records in by_day.items():
+                    self._flush_day(day, records)
+            finally:
+                with self._lock:
+                    for day in by_day:
+                        self._flushing.pop(day, None)
+
+    def _flush_day(self, day: str, records: List[UsageRecord]) -> None:
+        """Append one day's records and save its rollup. Caller holds
+        ``_write_lock``."""
+        lines = "".join(json.dumps(r.to_dict()) + "\n" for r in records)
+        data = lines.encode("utf-8")
+        with self._day_file_lock(day):
+            # Other processes may have appended and saved since this one
+            # last did: start from their rollup and replay the rest, so
+            # their usage is neither lost nor counted twice
+            rollup = self._load_rollup(day)
+            with self._segment_path(day).open("ab") as f:
+                with self._lock:
+                    # Summaries replay the segment up to here and count the
+                    # records from _flushing until the rollup is published
+                    self._flushing[day] = (f.tell(), records)
+                if f.tell() > rollup.segment_offset:
+                    # Torn tail left by a crashed writer: end it here
+                    f.write(b"\n")
+                f.write(data)
+                rollup.segment_offset = f.tell()
+            for record in records:
+                _add_to_bucket(rollup.buckets, record)
+            self._save_rollup(day, rollup)
+            with self._lock:
+                self._rollups[day] = rollup
+                del self._flushing[day]
+
+    def close(self) -> None:
+        """Flush pending records and stop the background writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
 
     def track(
         self,
@@ -290,14 +599,17 @@ class TokenTracker:
             latency_ms=latency_ms,
         )
 
+        # The deque drops the oldest in-memory record once full
         self.records.append(record)
 
-        # Trim old records from memory
-        if len(self.records) > self.max_memory_records:
-            self.records = self.records[-self.max_memory_records :]
-
-        # Save to disk
-        self._save_records()
+        # Hand off to the background ledger writer
+        with self._lock:
+            self._pending.append(record)
+            pending = len(self._pending)
+        if pending >= self.flush_batch_size:
+            self._wakeup.set()
+        if self._closed:
+            self.flush()
 
         logger.info(
             f"Tracked usage: {model} | {usage.total_tokens} tokens | ${costs['total_cost']:.6f}"
@@ -312,54 +624,67 @@ class TokenTracker:
         user_id: Optional[str] = None,
         days: int = 30,
     ) -> UsageSummary:
-        """Get usage summary for a time period."""
-        cutoff = datetime.now() - timedelta(days=days)
-        period_start = cutoff
+        """Get usage summary for a time period.
+
+        Reads hourly rollups, so the period starts at the beginning of the
+        hour containing the cutoff.
+        """
         period_end = datetime.now()
+        period_start = period_end - timedelta(days=days)
+        first_hour = _hour_key(period_start)
 
-        # Load records from files if needed
-        all_records = self._load_records_for_period(cutoff, datetime.now())
+        totals = [0] * _ROLLUP_FIELDS
+        by_model = defaultdict(lambda: {"requests": 0, "tokens": 0, "cost": 0.0})
+        by_user = defaultdict(lambda: {"requests": 0, "tokens": 0, "cost": 0.0})
 
-        # Filter by scope
-        filtered = []
-        for record in all_records:
-            if org_id and record.org_id != org_id:
-                continue
-            if team_id and record.team_id != team_id:
-                continue
-            if user_id and record.user_id != user_id:
-                continue
-            filtered.append(record)
+        def add(key: tuple, values: List[float]) -> None:
+            _hour, b_org, b_team, b_user, b_model = key
+            if org_id and b_org != org_id:
+                return
+            if team_id and b_team != team_id:
+                return
+            if user_id and b_user != user_id:
+                return
+            for i, v in enumerate(values):
+                totals[i] += v
+            by_model[b_model]["requests"] += values[0]
+            by_model[b_model]["tokens"] += values[3]
+            by_model[b_model]["cost"] += values[4]
+            if b_user:
+                by_user[b_user]["requests"] += values[0]
+                by_user[b_user]["tokens"] += values[3]
+                by_user[b_user]["cost"] += values[4]
+
+        with self._lock:
+            current = period_start.date()
+            while current <= period_end.date():
+                rollup = self._current_rollup(current.strftime("%Y-%m-%d"))
+                for key, values in rollup.buckets.items():
+                    if key[0] >= first_hour:
+                        add(key, values)
+                current += timedelta(days=1)
+            # Tracked records the writer has not reached yet
+            pending: Dict[tuple, List[float]] = {}
+            unwritten = list(self._pending)
+            for _offset, records in self._flushing.values():
+                unwritten.extend(records)
+            for record in unwritten:
+                if period_start <= record.timestamp <= period_end:
+                    _add_to_bucket(pending, record)
+        for key, values in pending.items():
+            add(key, values)
 
-        # Aggregate
         summary = UsageSummary(
             period_start=period_start,
             period_end=period_end,
-            total_requests=len(filtered),
+            total_requests=int(totals[0]),
+            total_input_tokens=int(totals[1]),
+            total_output_tokens=int(totals[2]),
+            total_tokens=int(totals[3]),
+            total_cache_read_tokens=int(totals[6]),
+            total_cache_write_tokens=int(totals[7]),
+            total_cost=totals[4],
         )
-
-        total_latency = 0.0
-        by_model = defaultdict(lambda: {"requests": 0, "tokens": 0, "cost": 0.0})
-        by_user = defaultdict(lambda: {"requests": 0, "tokens": 0, "cost": 0.0})
-
-        for record in filtered:
-            summary.total_input_tokens += record.usage.input_tokens
-            summary.total_output_tokens += record.usage.output_tokens
-            summary.total_tokens += record.usage.total_tokens
-            summary.total_cost += record.total_cost
-            total_latency += record.latency_ms
-
-            # By model
-            by_model[record.model]["requests"] += 1
-            by_model[record.model]["tokens"] += record.usage.total_tokens
-            by_model[record.model]["cost"] += record.total_cost
-
-            # By user
-            if record.user_id:
-                by_user[record.user_id]["requests"] += 1
-                by_user[record.user_id]["tokens"] += record.usage.total_tokens
-                by_user[record.user_id]["cost"] += record.total_cost
-
         summary.by_model = dict(by_model)
         summary.by_user = dict(by_user)
 
@@ -368,62 +693,10 @@ class TokenTracker:
                 summary.total_tokens / summary.total_requests
             )
             summary.avg_cost_per_request = summary.total_cost / summary.total_requests
-            summary.avg_latency_ms = total_latency / summary.total_requests
+            summary.avg_latency_ms = totals[5] / summary.total_requests
 
         return summary
 
-    def _load_records_for_period(
-        self, start: datetime, end: datetime
-    ) -> List[UsageRecord]:
-        """Load all records for a time period from disk."""
-        records = []
-
-        # Get all days in range
-        current = start.date()
-        end_date = end.date()
-
-        while current <= end_date:
-            date_str = current.strftime("%Y-%m-%d")
-            file_path = self.storage_path / f"usage_{date_str}.json"
-
-            if file_path.exists():
-                try:
-                    data = json.loads(file_path.read_text())
-                    for r in data.get("records", []):
-                        record = UsageRecord(
-                            id=r["id"],
-                            timestamp=datetime.fromisoformat(r["timestamp"]),
-                            model=r["model"],
-                            provider=r["provider"],
-                            usage=TokenUsage(
-                                input_tokens=r["input_tokens"],
-                                output_tokens=r["output_tokens"],
-                                total_tokens=r["total_tokens"],
-                            ),
-                            input_cost=r["input_cost"],
-                            output_cost=r["output_cost"],
-                            total_cost=r["total_cost"],
-                            org_id=r.get("org_id"),
-                            team_id=r.get("team_id"),
-                            user_id=r.get("user_id"),
-                            request_type=r.get("request_type", "chat"),
-                            latency_ms=r.get("latency_ms", 0),
-                        )
-                        if start <= record.timestamp <= end:
-                            records.append(record)
-                except Exception as e:
-                    logger.warning(f"Error loading usage file {file_path}: {e}")
-
-            current += timedelta(days=1)
-
-        # Add in-memory records
-        for record in self.records:
-            if start <= record.timestamp <= end:
-                if record.id not in [r.id for r in records]:
-                    records.append(record)
-
-        return records
-
     def get_recent_usage(
         self,
         limit: int = 10,
@@ -485,6 +758,8 @@ class NaviResponseWithUsage:
                 "input_tokens": self.usage.input_tokens,
                 "output_tokens": self.usage.output_tokens,
                 "total_tokens": self.usage.total_tokens,
+                "cache_read_tokens": self.usage.cache_read_tokens,
+                "cache_write_tokens": self.usage.cache_write_tokens,
             },
             "cost": {
                 "input": f"${self.input_cost:.6f}",
@@ -521,10 +796,17 @@ def track_usage(
     team_id: Optional[str] = None,
     user_id: Optional[str] = None,
     latency_ms: float = 0.0,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> UsageRecord:
     """Convenience function to track usage."""
     tracker = get_token_tracker()
-    usage = TokenUsage(input_tokens=input_tokens, output_tokens=output_tokens)
+    usage = TokenUsage(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
+    )
     return tracker.track(
         model=model,
         provider=provider,
@@ -1,14 +1,45 @@
-"""Append-only JSONL trace logging for NAVI model routing and outcomes."""
+"""Append-only JSONL trace logging for NAVI model routing and outcomes.
+
+``TraceStore.append`` only puts the event on an in-memory queue; a background
+thread writes queued events in batches to the active segment
+(``navi_traces.jsonl``). The active segment is rotated by size or age into
+``navi_traces.<start>-<end>.jsonl[.gz|.zst]`` files, which ``read_traces``
+scans by time range together with the active segment.
+
+Several processes (uvicorn workers) may share the active segment. Batches are
+written under a shared ``flock`` on ``navi_traces.jsonl.lock`` and rotation
+takes it exclusively; before each batch a writer reopens the path if another
+process has rotated the file it holds open.
+"""
 
 from __future__ import annotations
 
+import atexit
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import gzip
+import io
 import json
 import logging
+import os
 from pathlib import Path
 import threading
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.telemetry.metrics import TRACE_STORE_DROPPED
+
+try:
+    import zstandard
+except ImportError:  # Optional: zstd compression falls back to gzip
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process trace file only
+    fcntl = None
 
 
 @dataclass(frozen=True)
@@ -19,35 +50,393 @@ class TraceEvent:
 
 logger = logging.getLogger(__name__)
 
+_STAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+_COMPRESSED_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _iso(value: datetime) -> str:
+    return _utc(value).isoformat(timespec="microseconds")
+
+
+def _stamp(ts: str) -> str:
+    return datetime.fromisoformat(ts).strftime(_STAMP_FORMAT)
+
+
+def _parse_stamp(stamp: str) -> datetime:
+    return datetime.strptime(stamp, _STAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def _parse_segment(
+    path: Path, trace_path: Path
+) -> Optional[Tuple[datetime, datetime, int]]:
+    """(start, end, collision index) from a rotated segment name, or None."""
+    name = path.name
+    prefix = trace_path.stem + "."
+    if not name.startswith(prefix) or name.endswith(".tmp"):
+        return None
+    stamps, _, rest = name[len(prefix) :].partition(".")
+    start, sep, end = stamps.partition("-")
+    if not sep:
+        return None
+    index = rest.split(".", 1)[0]
+    try:
+        return (
+            _parse_stamp(start),
+            _parse_stamp(end),
+            int(index) if index.isdigit() else 0,
+        )
+    except ValueError:
+        return None
+
+
+def rotated_segments(trace_path: Path) -> List[Path]:
+    """Rotated segments of ``trace_path``, oldest first."""
+    if not trace_path.parent.exists():
+        return []
+    segments = []
+    for path in trace_path.parent.glob(f"{trace_path.stem}.*"):
+        parsed = _parse_segment(path, trace_path)
+        if parsed is not None:
+            segments.append((parsed, path))
+    return [path for _, path in sorted(segments)]
+
+
+def _open_segment(path: Path):
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        raw = zstandard.ZstdDecompressor().stream_reader(path.open("rb"))
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def read_traces(
+    trace_path: Path,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    event_types: Optional[Iterable[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate trace records with ``since <= ts < until``, oldest first.
+
+    Rotated segments whose name range falls outside the window are skipped
+    without being opened; the active segment is always scanned.
+    """
+    since_iso = _iso(since) if since is not None else None
+    until_iso = _iso(until) if until is not None else None
+    types = set(event_types) if event_types else None
+
+    paths = []
+    for path in rotated_segments(trace_path):
+        start, end, _ = _parse_segment(path, trace_path)
+        if since is not None and end < _utc(since):
+            continue
+        if until is not None and start >= _utc(until):
+            continue
+        paths.append(path)
+    if trace_path.exists():
+        paths.append(trace_path)
+
+    for path in paths:
+        try:
+            with _open_segment(path) as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    ts = record.get("ts", "")
+                    if since_iso is not None and ts < since_iso:
+                        continue
+                    if until_iso is not None and ts >= until_iso:
+                        continue
+                    if types is not None and record.get("event_type") not in types:
+                        continue
+                    yield record
+        except FileNotFoundError:
+            continue  # Rotated or pruned while scanning
+
 
 class TraceStore:
-    def __init__(self, trace_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        trace_path: Optional[Path] = None,
+        *,
+        queue_size: Optional[int] = None,
+        flush_interval_sec: Optional[float] = None,
+        flush_batch_size: Optional[int] = None,
+        rotate_bytes: Optional[int] = None,
+        rotate_interval_sec: Optional[float] = None,
+        compression: Optional[str] = None,
+        max_segments: Optional[int] = None,
+    ) -> None:
         repo_root = Path(__file__).resolve().parents[2]
         self.trace_path = trace_path or (repo_root / "data" / "navi_traces.jsonl")
         self.trace_path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
+        self._lock_path = self.trace_path.with_name(self.trace_path.name + ".lock")
+
+        def _opt(value, default):
+            return default if value is None else value
+
+        self.queue_size = _opt(queue_size, settings.trace_store_queue_size)
+        self.flush_interval_sec = _opt(
+            flush_interval_sec, settings.trace_store_flush_interval_sec
+        )
+        self.flush_batch_size = _opt(
+            flush_batch_size, settings.trace_store_flush_batch_size
+        )
+        self.rotate_bytes = _opt(rotate_bytes, settings.trace_store_rotate_bytes)
+        self.rotate_interval_sec = _opt(
+            rotate_interval_sec, settings.trace_store_rotate_interval_sec
+        )
+        self.compression = self._resolve_compression(
+            _opt(compression, settings.trace_store_compression)
+        )
+        self.max_segments = _opt(max_segments, settings.trace_store_max_segments)
+
+        # deque.append/popleft are atomic, so producers never take a lock
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self.dropped = 0
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._fh = None
+        # ts of the active segment's first record, read when it is opened
+        self._segment_start: Optional[str] = None
+
+        self._writer = threading.Thread(
+            target=self._run_writer, name="trace-store-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _resolve_compression(name: str) -> Optional[str]:
+        name = (name or "").lower()
+        if name in ("", "none"):
+            return None
+        if name == "zstd" and zstandard is None:
+            logger.warning(
+                "[TraceStore] zstd compression requires the zstandard package; "
+                "using gzip"
+            )
+            return "gzip"
+        if name not in _COMPRESSED_SUFFIXES:
+            logger.warning("[TraceStore] Unknown compression %r; using gzip", name)
+            return "gzip"
+        return name
+
+    @staticmethod
+    def _first_ts(path: Path) -> Optional[str]:
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                return json.loads(fh.readline()).get("ts")
+        except (OSError, ValueError, AttributeError):
+            return None
 
     def append(self, event_type: str, payload: Dict[str, Any]) -> None:
+        if len(self._queue) >= self.queue_size:
+            # Tracing should never slow down or break request handling
+            self.dropped += 1
+            TRACE_STORE_DROPPED.inc()
+            return
+        self._queue.append({"ts": _now_iso(), "event_type": event_type, **payload})
+        if len(self._queue) >= self.flush_batch_size:
+            self._wakeup.set()
+
+    def query(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate written trace records by time range (see ``read_traces``)."""
+        return read_traces(self.trace_path, since, until, event_types)
+
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
+
+    def _run_writer(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.warning("[TraceStore] Failed to write trace batch: %s", exc)
+
+    def flush(self) -> None:
+        """Write queued events and rotate the active segment if it is due."""
+        with self._write_lock:
+            while self._queue:
+                lines = []
+                first_ts = None
+                while self._queue and len(lines) < self.flush_batch_size:
+                    record = self._queue.popleft()
+                    if first_ts is None:
+                        first_ts = record["ts"]
+                    try:
+                        lines.append(json.dumps(record, ensure_ascii=True) + "\n")
+                    except (TypeError, ValueError) as exc:
+                        logger.warning(
+                            "[TraceStore] Dropping unserializable trace event "
+                            "type=%s error=%s",
+                            record.get("event_type"),
+                            exc,
+                        )
+                if not lines:
+                    continue
+                with self._file_lock(exclusive=False):
+                    self._open_active()
+                    self._fh.write("".join(lines))
+                    self._fh.flush()
+                    if self._segment_start is None:
+                        self._segment_start = first_ts
+                    due = self._rotation_due()
+                if due:
+                    self._rotate()
+            if self._rotation_due():
+                self._rotate()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Writers share the lock across processes; rotation holds it alone."""
+        with self._lock_path.open("a") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _holds_active(self) -> bool:
+        """Whether ``_fh`` is still the file at ``trace_path``."""
         try:
-            record = {
-                "ts": datetime.now(timezone.utc).isoformat(),
-                "event_type": event_type,
-                **payload,
-            }
-            line = json.dumps(record, ensure_ascii=True)
-            # V1 keeps writes simple and append-only (open/write/close per event).
-            with self._lock:
-                with self.trace_path.open("a", encoding="utf-8") as fh:
-                    fh.write(line)
-                    fh.write("\n")
+            path = os.stat(self.trace_path)
+        except FileNotFoundError:
+            return False
+        held = os.fstat(self._fh.fileno())
+        return (path.st_dev, path.st_ino) == (held.st_dev, held.st_ino)
+
+    def _open_active(self) -> None:
+        """Open the active segment, reopening it if it was rotated elsewhere."""
+        if self._fh is not None:
+            if self._holds_active():
+                return
+            self._fh.close()
+        self._fh = self.trace_path.open("a", encoding="utf-8")
+        # The segment may already hold other processes' records
+        self._segment_start = self._first_ts(self.trace_path)
+
+    def _rotation_due(self) -> bool:
+        if self._segment_start is None or self._fh is None:
+            return False  # Nothing written to the active segment yet
+        if self.rotate_bytes:
+            if os.fstat(self._fh.fileno()).st_size >= self.rotate_bytes:
+                return True
+        if self.rotate_interval_sec:
+            started = datetime.fromisoformat(self._segment_start)
+            age = (datetime.now(timezone.utc) - started).total_seconds()
+            return age >= self.rotate_interval_sec
+        return False
+
+    def _rotate(self) -> None:
+        """Move the active segment aside (compressed) and start a new one."""
+        with self._file_lock(exclusive=True):
+            # Another process may have rotated it while we waited for the lock
+            stale = self._fh is not None and not self._holds_active()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            start_ts = self._first_ts(self.trace_path) or self._segment_start
+            self._segment_start = None
+            if stale or start_ts is None or not self.trace_path.exists():
+                return
+            self._move_aside(start_ts)
+
+    def _move_aside(self, start_ts: str) -> None:
+        """Rename the active segment by its time range, then compress and prune."""
+        start = _stamp(start_ts)
+        end = _stamp(_now_iso())
+        base = f"{self.trace_path.stem}.{start}-{end}"
+        target = self.trace_path.with_name(base + self.trace_path.suffix)
+        n = 1
+        while any(
+            target.with_name(target.name + s).exists()
+            for s in ("", *_COMPRESSED_SUFFIXES.values())
+        ):
+            # Two rotations within the same microsecond
+            target = self.trace_path.with_name(f"{base}.{n}{self.trace_path.suffix}")
+            n += 1
+        os.replace(self.trace_path, target)
+
+        if self.compression:
+            try:
+                self._compress(target)
+            except Exception as exc:
+                logger.warning(
+                    "[TraceStore] Failed to compress %s, kept uncompressed: %s",
+                    target,
+                    exc,
+                )
+        self._prune()
+
+    def _compress(self, path: Path) -> None:
+        dest = path.with_name(path.name + _COMPRESSED_SUFFIXES[self.compression])
+        tmp = dest.with_name(dest.name + ".tmp")
+        with path.open("rb") as src, tmp.open("wb") as raw:
+            if self.compression == "zstd":
+                with zstandard.ZstdCompressor().stream_writer(raw) as out:
+                    while chunk := src.read(1 << 20):
+                        out.write(chunk)
+            else:
+                with gzip.GzipFile(filename="", fileobj=raw, mode="wb") as out:
+                    while chunk := src.read(1 << 20):
+                        out.write(chunk)
+        os.replace(tmp, dest)
+        path.unlink()
+
+    def _prune(self) -> None:
+        if not self.max_segments:
+            return
+        segments = rotated_segments(self.trace_path)
+        for path in segments[: max(0, len(segments) - self.max_segments)]:
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning("[TraceStore] Failed to prune %s: %s", path, exc)
+
+    def close(self) -> None:
+        """Write queued events and stop the background writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        try:
+            self.flush()
         except Exception as exc:
-            # Tracing should never break user-facing request handling.
-            logger.warning(
-                "[TraceStore] Failed to append trace event type=%s path=%s error=%s",
-                event_type,
-                self.trace_path,
-                exc,
-            )
+            logger.warning("[TraceStore] Failed to write trace batch: %s", exc)
+        with self._write_lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
 
 _default_trace_store: Optional[TraceStore] = None
@@ -24,7 +24,7 @@ import shutil
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
-import httpx
+from backend.services.http_client import http_client
 import structlog
 from dotenv import load_dotenv
 
@@ -448,7 +448,7 @@ async def transcribe_audio_whisper(
         return None
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             with open(audio_path, "rb") as audio_file:
                 response = await client.post(
                     "https://api.openai.com/v1/audio/transcriptions",
@@ -12,7 +12,7 @@ NAVI uses this to understand UI mockups and generate matching code.
 """
 
 import os
-import httpx
+from backend.services.http_client import http_client
 from typing import Dict, List, Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -231,7 +231,7 @@ class VisionClient:
         if image_data.startswith("/9j/"):
             media_type = "image/jpeg"
 
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             response = await client.post(
                 config["url"],
                 headers={
@@ -284,7 +284,7 @@ class VisionClient:
         timeout: int,
     ) -> str:
         """Call OpenAI GPT-4 Vision API"""
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             response = await client.post(
                 config["url"],
                 headers={
@@ -336,7 +336,7 @@ class VisionClient:
         """Call Google Gemini Vision API"""
         url = f"{config['url']}?key={api_key}"
 
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             response = await client.post(
                 url,
                 headers={"Content-Type": "application/json"},
@@ -7,22 +7,41 @@ Provides:
 3. Dependency graph analysis
 4. Context-aware code retrieval
 5. Smart chunking for large files
+6. Incremental re-indexing (changed-files API or polling watcher)
+7. Parallel parsing in a process pool with a bounded embedding pipeline
+8. On-disk snapshots with memory-mapped vectors (workspace_snapshot.py)
+9. Byte-bounded resident index cache with LRU eviction and pinning
 
 This enables NAVI to understand the ENTIRE codebase, not just individual files.
 """
 
+import asyncio
+import multiprocessing
 import os
+import posixpath
 import re
 import hashlib
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import logging
 import fnmatch
 
+import numpy as np
+
+from backend.core.config import settings
+from backend.telemetry.vector_metrics import (
+    WORKSPACE_INDEX_BYTES,
+    WORKSPACE_INDEX_EVICTIONS,
+    WORKSPACE_INDEX_LOAD_MS,
+)
+
 logger = logging.getLogger(__name__)
 
 # Track in-flight background indexing tasks to prevent duplicate indexers
@@ -135,6 +154,28 @@ SKIP_DIRECTORIES = {
 # Max file size to index (1MB)
 MAX_FILE_SIZE = 1024 * 1024
 
+# Parallel indexing: parse in worker processes when at least this many files
+# change (smaller jobs use a thread to avoid process start-up cost)
+PARALLEL_MIN_FILES = 64
+MAX_PARSE_WORKERS = os.cpu_count() or 1
+# Files in flight (parsing or embedding) per worker; bounds memory on huge repos
+PIPELINE_DEPTH_PER_WORKER = 4
+# Remote embeddings: texts per request and concurrent requests per indexing run
+EMBED_BATCH_SIZE = 256
+MAX_EMBED_REQUESTS = 8
+
+# Seconds between polling scans of a watched workspace
+WATCH_INTERVAL_SECONDS = 5.0
+
+# Approximate Python heap cost used for resident index accounting
+CHUNK_OVERHEAD_BYTES = 1024  # CodeChunk object, fields and index entries
+FILE_OVERHEAD_BYTES = 1024  # FileIndex object and index entries
+REFERENCE_BYTES = 96  # token string plus inverted-index set entry
+LIST_FLOAT_BYTES = 32  # list slot plus float object
+
+# Identifier tokens recorded per chunk for reference lookups
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
 # Chunk size for large files
 CHUNK_SIZE = 2000  # characters
 CHUNK_OVERLAP = 200  # overlap between chunks
@@ -213,6 +254,7 @@ class FileIndex:
     chunks: List[CodeChunk] = field(default_factory=list)
     imports: List[str] = field(default_factory=list)
     exports: List[str] = field(default_factory=list)
+    line_count: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -254,6 +296,67 @@ class WorkspaceIndex:
     # Symbol table for quick lookup
     symbols: Dict[str, List[str]] = field(default_factory=dict)  # name -> [file_paths]
 
+    # Estimated heap bytes (maintained by _link_file/_unlink_file)
+    resident_bytes: int = 0
+
+    # Secondary indexes (maintained by _link_file/_unlink_file)
+    chunks_by_id: Dict[str, CodeChunk] = field(default_factory=dict, repr=False)
+    symbol_chunks: Dict[str, List[str]] = field(
+        default_factory=dict, repr=False
+    )  # name -> [chunk ids]
+    token_chunks: Dict[str, Set[str]] = field(
+        default_factory=dict, repr=False
+    )  # identifier -> {chunk ids}
+    module_files: Dict[str, Set[str]] = field(
+        default_factory=dict, repr=False
+    )  # module key -> {file paths}
+    file_imports: Dict[str, List[str]] = field(
+        default_factory=dict, repr=False
+    )  # file path -> [module keys]
+    importers: Dict[str, Set[str]] = field(
+        default_factory=dict, repr=False
+    )  # module key -> {importing file paths}
+
+    def _link_chunk(self, chunk: CodeChunk) -> None:
+        if not chunk.references and chunk.content:
+            chunk.references = sorted(set(IDENTIFIER_PATTERN.findall(chunk.content)))
+        self.chunks_by_id[chunk.id] = chunk
+        self.resident_bytes += _estimate_chunk_bytes(chunk)
+        if chunk.name:
+            self.symbol_chunks.setdefault(chunk.name, []).append(chunk.id)
+        for token in chunk.references:
+            self.token_chunks.setdefault(token, set()).add(chunk.id)
+
+    def _unlink_chunk(self, chunk: CodeChunk) -> None:
+        if self.chunks_by_id.pop(chunk.id, None) is not None:
+            self.resident_bytes -= _estimate_chunk_bytes(chunk)
+        if chunk.name:
+            _discard(self.symbol_chunks, chunk.name, chunk.id)
+        for token in chunk.references:
+            _discard(self.token_chunks, token, chunk.id)
+
+    def _link_file(self, file_index: FileIndex) -> None:
+        path = file_index.path
+        self.resident_bytes += _estimate_file_bytes(file_index)
+        for key in CodeParser.module_keys(file_index.relative_path):
+            self.module_files.setdefault(key, set()).add(path)
+        keys = CodeParser.resolve_imports(file_index.imports, file_index.relative_path)
+        self.file_imports[path] = keys
+        for key in keys:
+            self.importers.setdefault(key, set()).add(path)
+        for chunk in file_index.chunks:
+            self._link_chunk(chunk)
+
+    def _unlink_file(self, file_index: FileIndex) -> None:
+        path = file_index.path
+        self.resident_bytes -= _estimate_file_bytes(file_index)
+        for key in CodeParser.module_keys(file_index.relative_path):
+            _discard(self.module_files, key, path)
+        for key in self.file_imports.pop(path, []):
+            _discard(self.importers, key, path)
+        for chunk in file_index.chunks:
+            self._unlink_chunk(chunk)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "workspace_path": self.workspace_path,
@@ -266,6 +369,39 @@ class WorkspaceIndex:
         }
 
 
+def _estimate_chunk_bytes(chunk: CodeChunk) -> int:
+    """Approximate heap bytes held by a chunk and its index entries"""
+    size = CHUNK_OVERHEAD_BYTES + len(chunk.content)
+    size += REFERENCE_BYTES * len(chunk.references)
+    embedding = chunk.embedding
+    if isinstance(embedding, list):
+        size += LIST_FLOAT_BYTES * len(embedding)
+    elif embedding is not None and not isinstance(embedding, np.memmap):
+        size += embedding.nbytes
+    # Memory-mapped rows live in the shared page cache, not the heap
+    return size
+
+
+def _estimate_file_bytes(file_index: FileIndex) -> int:
+    """Approximate heap bytes held by a file entry (excluding its chunks)"""
+    return FILE_OVERHEAD_BYTES + sum(
+        len(s) for s in file_index.imports + file_index.exports
+    )
+
+
+def _discard(mapping: Dict[str, Any], key: str, value: str) -> None:
+    """Remove value from mapping[key], dropping the key when it empties"""
+    values = mapping.get(key)
+    if values is None:
+        return
+    if isinstance(values, set):
+        values.discard(value)
+    elif value in values:
+        values.remove(value)
+    if not values:
+        del mapping[key]
+
+
 # ============================================================
 # CODE PARSER - Extract semantic chunks from code
 # ============================================================
@@ -408,9 +544,88 @@ class CodeParser:
 
         imports = []
         for match in re.finditer(pattern, content, re.MULTILINE):
-            imports.append(match.group(0).strip())
+            # Patterns may stop at "from"/"require(": keep the module specifier
+            line_end = content.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(content)
+            imports.append(content[match.start() : line_end].strip())
         return imports
 
+    @classmethod
+    def module_keys(cls, relative_path: str) -> List[str]:
+        """Keys (extension-less workspace paths) other files can import this as"""
+        path = Path(relative_path)
+        keys = [path.with_suffix("").as_posix()]
+        if path.stem in ("__init__", "index", "mod") and path.parent != Path("."):
+            keys.append(path.parent.as_posix())
+        return keys
+
+    @classmethod
+    def resolve_imports(cls, statements: List[str], relative_path: str) -> List[str]:
+        """Resolve import statements of a file to module keys
+
+        Relative imports are resolved against the importing file; absolute
+        ones against the workspace root. Package imports that do not name a
+        workspace file keep their module name as key.
+        """
+        language = cls.detect_language(relative_path)
+        source_dir = posixpath.dirname(Path(relative_path).as_posix())
+        keys: List[str] = []
+        for statement in statements:
+            keys.extend(cls._import_keys(statement, language, source_dir))
+        return list(dict.fromkeys(k for k in keys if k))
+
+    @classmethod
+    def _import_keys(cls, statement: str, language: str, source_dir: str) -> List[str]:
+        if language == "python":
+            match = re.match(r"from\s+(\.*)([\w.]*)\s+import\s+(.+)", statement)
+            if match:
+                dots, module, names = match.groups()
+                base = ""
+                if dots:
+                    base = source_dir
+                    for _ in range(len(dots) - 1):
+                        base = posixpath.dirname(base)
+                key = posixpath.join(base, module.replace(".", "/")).strip("/")
+                keys = [key] if module else []
+                # "from pkg import mod" may name a submodule
+                for name in names.strip("()").split(","):
+                    name = name.split(" as ")[0].strip()
+                    if name and name != "*":
+                        keys.append(posixpath.join(key, name))
+                return keys
+            match = re.match(r"import\s+(.+)", statement)
+            if match:
+                return [
+                    part.split(" as ")[0].strip().replace(".", "/")
+                    for part in match.group(1).split(",")
+                ]
+            return []
+
+        if language in ("javascript", "typescript"):
+            match = re.search(r"(?:from|require\()\s*['\"]([^'\"]+)['\"]", statement)
+            if not match:
+                return []
+            spec = match.group(1)
+            if not spec.startswith("."):
+                return [spec]
+            key = posixpath.normpath(posixpath.join(source_dir, spec))
+            stem, ext = posixpath.splitext(key)
+            return [stem if ext in INDEXABLE_EXTENSIONS else key]
+
+        if language == "java":
+            match = re.match(r"import\s+([\w.]+);", statement)
+            return [match.group(1).replace(".", "/")] if match else []
+
+        if language == "rust":
+            match = re.match(r"use\s+(?:crate::)?([\w:]+)", statement)
+            return [match.group(1).replace("::", "/")] if match else []
+
+        if language == "go":
+            return re.findall(r'"([\w/.-]+)"', statement)
+
+        return []
+
     @classmethod
     def _extract_functions(
         cls,
@@ -611,6 +826,9 @@ class EmbeddingProvider:
     # Simple TF-IDF-like scoring for local search (no API needed)
     # For production, use OpenAI embeddings or local model
 
+    OPENAI_MODEL = "text-embedding-ada-002"
+    OPENAI_DIM = 1536
+
     @classmethod
     def generate_embedding(cls, text: str) -> List[float]:
         """Generate a simple embedding (local, no API)"""
@@ -638,40 +856,74 @@ class EmbeddingProvider:
         cls, text: str, provider: str = "local"
     ) -> List[float]:
         """Generate embedding asynchronously"""
-        if provider == "local":
-            return cls.generate_embedding(text)
+        (embedding,) = await cls.generate_embeddings_async([text], provider)
+        return embedding
 
-        elif provider == "openai":
+    @classmethod
+    async def generate_embeddings_async(
+        cls, texts: List[str], provider: str = "local"
+    ) -> List[List[float]]:
+        """Generate embeddings for many texts, one cache lookup and one
+        OpenAI request per EMBED_BATCH_SIZE misses"""
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        if provider == "openai" and texts:
             # Use OpenAI embeddings API
             try:
-                import httpx
+                from backend.services.http_client import http_client
+
+                from backend.services.embedding_cache import get_embedding_cache
 
                 api_key = os.environ.get("OPENAI_API_KEY")
                 if not api_key:
-                    return cls.generate_embedding(text)
-
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        "https://api.openai.com/v1/embeddings",
-                        headers={"Authorization": f"Bearer {api_key}"},
-                        json={
-                            "model": "text-embedding-ada-002",
-                            "input": text[:8000],  # Truncate to token limit
-                        },
-                        timeout=30.0,
-                    )
+                    return [cls.generate_embedding(text) for text in texts]
+
+                cache = get_embedding_cache()
+                cached = await cache.aget_many(cls.OPENAI_MODEL, cls.OPENAI_DIM, texts)
+                misses = []
+                for i, vector in enumerate(cached):
+                    if vector is not None:
+                        embeddings[i] = vector.tolist()
+                    else:
+                        misses.append(i)
+
+                async with http_client() as client:
+                    for start in range(0, len(misses), EMBED_BATCH_SIZE):
+                        batch = misses[start : start + EMBED_BATCH_SIZE]
+                        batch_texts = [texts[i] for i in batch]
+                        response = await client.post(
+                            "https://api.openai.com/v1/embeddings",
+                            headers={"Authorization": f"Bearer {api_key}"},
+                            json={
+                                "model": cls.OPENAI_MODEL,
+                                # Truncate to token limit
+                                "input": [text[:8000] for text in batch_texts],
+                            },
+                            timeout=30.0,
+                        )
+                        if response.status_code != 200:
+                            break
 
-                    if response.status_code == 200:
-                        return response.json()["data"][0]["embedding"]
+                        data = sorted(response.json()["data"], key=lambda d: d["index"])
+                        vectors = [item["embedding"] for item in data]
+                        await cache.aput_many(
+                            cls.OPENAI_MODEL, cls.OPENAI_DIM, batch_texts, vectors
+                        )
+                        for i, vector in zip(batch, vectors):
+                            embeddings[i] = vector
             except Exception as e:
                 logger.warning(f"OpenAI embedding failed: {e}, falling back to local")
 
-        return cls.generate_embedding(text)
+        return [
+            embedding if embedding is not None else cls.generate_embedding(text)
+            for embedding, text in zip(embeddings, texts)
+        ]
 
     @classmethod
     def cosine_similarity(cls, a: List[float], b: List[float]) -> float:
         """Calculate cosine similarity between two embeddings"""
-        if not a or not b or len(a) != len(b):
+        # Embeddings may be lists or (memory-mapped) numpy rows
+        if a is None or b is None or len(a) == 0 or len(a) != len(b):
             return 0.0
 
         dot_product = sum(x * y for x, y in zip(a, b))
@@ -681,7 +933,7 @@ class EmbeddingProvider:
         if norm_a == 0 or norm_b == 0:
             return 0.0
 
-        return dot_product / (norm_a * norm_b)
+        return float(dot_product / (norm_a * norm_b))
 
 
 # ============================================================
@@ -712,52 +964,27 @@ class WorkspaceIndexer:
         index = WorkspaceIndex(workspace_path=workspace_path)
 
         # Find all indexable files
-        files_to_index = cls._find_indexable_files(workspace_path)
+        files_to_index = await asyncio.to_thread(
+            cls._find_indexable_files, workspace_path
+        )
         total_files = len(files_to_index)
 
         if on_progress:
             await on_progress({"type": "start", "total_files": total_files})
 
-        # Index each file
-        for i, file_path in enumerate(files_to_index):
-            try:
-                file_index = await cls._index_file(
-                    file_path, workspace_path, generate_embeddings, embedding_provider
-                )
-                if file_index:
-                    index.files[file_path] = file_index
-                    index.chunks.extend(file_index.chunks)
-                    index.total_lines += len(open(file_path).readlines())
-
-                    # Update symbol table
-                    for chunk in file_index.chunks:
-                        if chunk.name:
-                            if chunk.name not in index.symbols:
-                                index.symbols[chunk.name] = []
-                            index.symbols[chunk.name].append(file_path)
-
-                    # Track dependencies
-                    for imp in file_index.imports:
-                        index.dependencies.append(
-                            DependencyEdge(
-                                source=file_path,
-                                target=imp,
-                                edge_type="import",
-                            )
-                        )
+        results = await cls._index_files(
+            files_to_index,
+            workspace_path,
+            generate_embeddings,
+            embedding_provider,
+            on_progress,
+        )
 
-            except Exception as e:
-                logger.warning(f"Failed to index {file_path}: {e}")
-
-            if on_progress and i % 10 == 0:
-                await on_progress(
-                    {
-                        "type": "progress",
-                        "current": i + 1,
-                        "total": total_files,
-                        "file": file_path,
-                    }
-                )
+        # Add in walk order so the index does not depend on completion order
+        for file_path in files_to_index:
+            file_index = results.get(file_path)
+            if file_index:
+                cls._add_file(index, file_index)
 
         index.total_files = len(index.files)
         index.total_chunks = len(index.chunks)
@@ -774,6 +1001,185 @@ class WorkspaceIndexer:
 
         return index
 
+    @classmethod
+    async def update_workspace(
+        cls,
+        index: WorkspaceIndex,
+        changed_files: Optional[List[str]] = None,
+        generate_embeddings: bool = True,
+        embedding_provider: str = "local",
+        on_progress: Optional[callable] = None,
+    ) -> Dict[str, int]:
+        """
+        Bring an existing index up to date, re-parsing only changed files.
+
+        Files are compared by size and mtime first and by content hash only
+        when those differ, so an unchanged tree costs one stat() per file.
+        Chunks, symbols and dependencies of changed files are patched in place.
+
+        Args:
+            index: Index to update
+            changed_files: Paths reported as changed (created, modified or
+                deleted), absolute or relative to the workspace. None scans
+                the whole tree.
+            generate_embeddings: Whether to generate embeddings for new chunks
+            embedding_provider: "local" or "openai"
+            on_progress: Callback for progress updates
+
+        Returns:
+            Counts of added, modified, removed and unchanged files
+        """
+        workspace_path = index.workspace_path
+
+        # Indexes restored from the database carry chunks but no file entries;
+        # they cannot be diffed, so start from an empty index.
+        if not index.files and index.chunks:
+            for chunk in index.chunks:
+                index._unlink_chunk(chunk)
+            index.chunks = []
+            index.symbols = {}
+            index.dependencies = []
+            index.total_lines = 0
+
+        removed: Set[str] = set()
+        if changed_files is None:
+            candidates = await asyncio.to_thread(
+                cls._find_indexable_files, workspace_path
+            )
+            removed = set(index.files) - set(candidates)
+        else:
+            candidates = []
+            for path in dict.fromkeys(changed_files):
+                if not os.path.isabs(path):
+                    path = os.path.join(workspace_path, path)
+                path = os.path.normpath(path)
+                if cls._is_indexable(path, workspace_path):
+                    candidates.append(path)
+                elif path in index.files:
+                    removed.add(path)
+
+        # stat/hash comparison is blocking I/O; keep it off the event loop
+        known = {
+            path: (f.size, f.last_modified, f.content_hash)
+            for path, f in index.files.items()
+        }
+        to_parse, touched, vanished, unchanged = await asyncio.to_thread(
+            cls._diff_files, known, candidates
+        )
+        removed.update(vanished)
+        for path, size, mtime in touched:
+            index.files[path].size = size
+            index.files[path].last_modified = mtime
+
+        stats = {"added": 0, "modified": 0, "removed": 0, "unchanged": unchanged}
+
+        if on_progress:
+            await on_progress({"type": "start", "total_files": len(to_parse)})
+
+        results = await cls._index_files(
+            to_parse,
+            workspace_path,
+            generate_embeddings,
+            embedding_provider,
+            on_progress,
+        )
+
+        updated: Dict[str, FileIndex] = {}
+        for file_path in to_parse:
+            file_index = results.get(file_path)
+            if file_index:
+                updated[file_path] = file_index
+                stats["modified" if file_path in index.files else "added"] += 1
+            elif file_path in index.files:
+                removed.add(file_path)
+        stats["removed"] = len(removed)
+
+        if updated or removed:
+            cls._replace_files(index, updated, removed)
+
+        if on_progress:
+            await on_progress({"type": "complete", **stats})
+
+        return stats
+
+    @classmethod
+    def _add_file(cls, index: WorkspaceIndex, file_index: FileIndex) -> None:
+        """Add a file's chunks, symbols and dependencies to the index"""
+        file_path = file_index.path
+        index.files[file_path] = file_index
+        index.chunks.extend(file_index.chunks)
+        index.total_lines += file_index.line_count
+        index._link_file(file_index)
+
+        # Update symbol table
+        for chunk in file_index.chunks:
+            if chunk.name:
+                if chunk.name not in index.symbols:
+                    index.symbols[chunk.name] = []
+                index.symbols[chunk.name].append(file_path)
+
+        # Track dependencies
+        for imp in file_index.imports:
+            index.dependencies.append(
+                DependencyEdge(
+                    source=file_path,
+                    target=imp,
+                    edge_type="import",
+                )
+            )
+
+    @classmethod
+    def _replace_files(
+        cls,
+        index: WorkspaceIndex,
+        updated: Dict[str, FileIndex],
+        removed: Set[str],
+    ) -> None:
+        """Drop stale entries for updated/removed files and add the new ones
+
+        Runs without awaiting, and swaps in new chunk/dependency lists rather
+        than mutating them, so concurrent searches see a consistent index.
+        """
+        stale = removed | set(updated)
+
+        for file_path in stale:
+            old = index.files.pop(file_path, None)
+            if not old:
+                continue
+            index.total_lines -= old.line_count
+            index._unlink_file(old)
+            for chunk in old.chunks:
+                paths = index.symbols.get(chunk.name) if chunk.name else None
+                if paths and file_path in paths:
+                    paths.remove(file_path)
+                    if not paths:
+                        del index.symbols[chunk.name]
+
+        index.chunks = [c for c in index.chunks if c.file_path not in stale]
+        index.dependencies = [d for d in index.dependencies if d.source not in stale]
+
+        for file_index in updated.values():
+            cls._add_file(index, file_index)
+
+        index.total_files = len(index.files)
+        index.total_chunks = len(index.chunks)
+        index.updated_at = datetime.utcnow().isoformat()
+
+    @classmethod
+    def _is_indexable(cls, file_path: str, workspace_path: str) -> bool:
+        """Whether a single file would be picked up by _find_indexable_files"""
+        rel_dirs = Path(os.path.relpath(file_path, workspace_path)).parts[:-1]
+        if any(d in SKIP_DIRECTORIES or d.startswith(".") for d in rel_dirs):
+            return False
+        if Path(file_path).suffix.lower() not in INDEXABLE_EXTENSIONS:
+            return False
+        try:
+            return os.path.isfile(file_path) and (
+                os.path.getsize(file_path) <= MAX_FILE_SIZE
+            )
+        except OSError:
+            return False
+
     @classmethod
     def _find_indexable_files(cls, workspace_path: str) -> List[str]:
         """Find all files that should be indexed"""
@@ -805,60 +1211,214 @@ class WorkspaceIndexer:
         return files
 
     @classmethod
-    async def _index_file(
+    def _diff_files(
         cls,
-        file_path: str,
+        known: Dict[str, Tuple[int, str, str]],
+        candidates: List[str],
+    ) -> Tuple[List[str], List[Tuple[str, int, str]], List[str], int]:
+        """
+        Compare candidate files against their indexed (size, mtime, hash).
+
+        Returns (files to parse, touched-but-identical files with their new
+        size/mtime, indexed files that vanished, unchanged count).
+        """
+        to_parse: List[str] = []
+        touched: List[Tuple[str, int, str]] = []
+        vanished: List[str] = []
+        unchanged = 0
+
+        for file_path in candidates:
+            previous = known.get(file_path)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                if previous:
+                    vanished.append(file_path)
+                continue
+            mtime = datetime.fromtimestamp(st.st_mtime).isoformat()
+
+            if previous and previous[0] == st.st_size:
+                if previous[1] == mtime:
+                    unchanged += 1
+                    continue
+
+                # Touched but possibly identical (checkout, save without edits)
+                try:
+                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                        content_hash = hashlib.md5(f.read().encode()).hexdigest()
+                except OSError:
+                    content_hash = None
+                if content_hash == previous[2]:
+                    touched.append((file_path, st.st_size, mtime))
+                    unchanged += 1
+                    continue
+
+            to_parse.append(file_path)
+
+        return to_parse, touched, vanished, unchanged
+
+    @classmethod
+    async def _index_files(
+        cls,
+        file_paths: List[str],
         workspace_path: str,
         generate_embeddings: bool,
         embedding_provider: str,
-    ) -> Optional[FileIndex]:
-        """Index a single file"""
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            # Parse into chunks
-            chunks = CodeParser.parse_file(file_path, content)
-
-            # Generate embeddings if requested
-            if generate_embeddings:
-                for chunk in chunks:
-                    # Create searchable text
-                    search_text = f"{chunk.name or ''} {chunk.signature or ''} {chunk.docstring or ''} {chunk.content[:500]}"
-                    chunk.embedding = await EmbeddingProvider.generate_embedding_async(
-                        search_text,
-                        embedding_provider,
+        on_progress: Optional[callable] = None,
+    ) -> Dict[str, Optional[FileIndex]]:
+        """
+        Parse and embed files through a bounded parallel pipeline.
+
+        Parsing (and local embeddings, which are pure CPU) runs in a process
+        pool; each file's chunks are embedded remotely in one batched request,
+        with at most MAX_EMBED_REQUESTS in flight on the event loop.
+        A fixed number of lanes each pull the next file only after finishing
+        the previous one, so at most MAX_PARSE_WORKERS *
+        PIPELINE_DEPTH_PER_WORKER files are held in memory at a time.
+        """
+        results: Dict[str, Optional[FileIndex]] = {}
+        if not file_paths:
+            return results
+
+        loop = asyncio.get_running_loop()
+        executor = _parse_executor() if len(file_paths) >= PARALLEL_MIN_FILES else None
+        embed_in_worker = generate_embeddings and embedding_provider == "local"
+        total = len(file_paths)
+        pending = iter(file_paths)
+        completed = 0
+        embed_slots = asyncio.Semaphore(MAX_EMBED_REQUESTS)
+
+        async def lane() -> None:
+            nonlocal executor, completed
+            for file_path in pending:
+                args = (file_path, workspace_path, embed_in_worker)
+                try:
+                    try:
+                        file_index = await loop.run_in_executor(
+                            executor, _parse_workspace_file, *args
+                        )
+                    except BrokenProcessPool:
+                        logger.warning("[RAG] Parse worker pool died, using threads")
+                        _reset_parse_executor()
+                        executor = None
+                        file_index = await loop.run_in_executor(
+                            None, _parse_workspace_file, *args
+                        )
+                    if file_index and generate_embeddings and not embed_in_worker:
+                        texts = [_chunk_search_text(c) for c in file_index.chunks]
+                        async with embed_slots:
+                            embeddings = (
+                                await EmbeddingProvider.generate_embeddings_async(
+                                    texts, embedding_provider
+                                )
+                            )
+                        for chunk, embedding in zip(file_index.chunks, embeddings):
+                            chunk.embedding = embedding
+                except Exception as e:
+                    logger.warning(f"Failed to index {file_path}: {e}")
+                    file_index = None
+
+                results[file_path] = file_index
+                completed += 1
+                if on_progress and completed % 10 == 1:
+                    await on_progress(
+                        {
+                            "type": "progress",
+                            "current": completed,
+                            "total": total,
+                            "file": file_path,
+                        }
                     )
 
-            # Get file metadata
-            stat = os.stat(file_path)
-            content_hash = hashlib.md5(content.encode()).hexdigest()
+        workers = MAX_PARSE_WORKERS if executor else 1
+        lanes = min(total, workers * PIPELINE_DEPTH_PER_WORKER)
+        await asyncio.gather(*(lane() for _ in range(lanes)))
+        return results
 
-            # Extract imports/exports
-            language = CodeParser.detect_language(file_path)
-            imports = []
-            exports = []
 
+def _chunk_search_text(chunk: CodeChunk) -> str:
+    """Searchable text used to embed a chunk"""
+    return f"{chunk.name or ''} {chunk.signature or ''} {chunk.docstring or ''} {chunk.content[:500]}"
+
+
+def _parse_workspace_file(
+    file_path: str, workspace_path: str, local_embeddings: bool
+) -> Optional[FileIndex]:
+    """Read, parse and fingerprint one file (runs in a worker process)"""
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+
+        # Parse into chunks
+        chunks = CodeParser.parse_file(file_path, content)
+
+        # Identifier tokens for the reference index
+        for chunk in chunks:
+            chunk.references = sorted(set(IDENTIFIER_PATTERN.findall(chunk.content)))
+
+        # Local embeddings are pure CPU, so compute them with the parse
+        if local_embeddings:
             for chunk in chunks:
-                imports.extend(chunk.imports)
-                if chunk.name:
-                    exports.append(chunk.name)
-
-            return FileIndex(
-                path=file_path,
-                relative_path=os.path.relpath(file_path, workspace_path),
-                language=language,
-                size=stat.st_size,
-                last_modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                content_hash=content_hash,
-                chunks=chunks,
-                imports=list(set(imports)),
-                exports=list(set(exports)),
+                chunk.embedding = EmbeddingProvider.generate_embedding(
+                    _chunk_search_text(chunk)
+                )
+
+        # Get file metadata
+        stat = os.stat(file_path)
+        content_hash = hashlib.md5(content.encode()).hexdigest()
+
+        # Extract imports/exports
+        language = CodeParser.detect_language(file_path)
+        imports = []
+        exports = []
+
+        for chunk in chunks:
+            imports.extend(chunk.imports)
+            if chunk.name:
+                exports.append(chunk.name)
+
+        return FileIndex(
+            path=file_path,
+            relative_path=os.path.relpath(file_path, workspace_path),
+            language=language,
+            size=stat.st_size,
+            last_modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            content_hash=content_hash,
+            chunks=chunks,
+            imports=list(set(imports)),
+            exports=list(set(exports)),
+            line_count=len(content.splitlines()),
+        )
+
+    except Exception as e:
+        logger.warning(f"Failed to index file {file_path}: {e}")
+        return None
+
+
+_parse_pool: Optional[Executor] = None
+
+
+def _parse_executor() -> Optional[Executor]:
+    """Shared process pool for parsing (None = fall back to threads)"""
+    global _parse_pool
+    if _parse_pool is None and MAX_PARSE_WORKERS > 1:
+        try:
+            # spawn: safe with the threads already running in the API process
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=MAX_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
             )
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"[RAG] Process pool unavailable, parsing in threads: {e}")
+    return _parse_pool
 
-        except Exception as e:
-            logger.warning(f"Failed to index file {file_path}: {e}")
-            return None
+
+def _reset_parse_executor() -> None:
+    """Shut down the parse pool (a new one is created on demand)"""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
 
 
 # ============================================================
@@ -911,7 +1471,7 @@ class SemanticSearch:
                     continue
 
             # Calculate similarity
-            if chunk.embedding:
+            if chunk.embedding is not None and len(chunk.embedding):
                 score = EmbeddingProvider.cosine_similarity(
                     query_embedding, chunk.embedding
                 )
@@ -942,25 +1502,32 @@ class SemanticSearch:
     @classmethod
     def find_symbol(cls, symbol_name: str, index: WorkspaceIndex) -> List[CodeChunk]:
         """Find all definitions of a symbol"""
-        chunks = []
-
-        for chunk in index.chunks:
-            if chunk.name == symbol_name:
-                chunks.append(chunk)
-
-        return chunks
+        return [
+            index.chunks_by_id[chunk_id]
+            for chunk_id in index.symbol_chunks.get(symbol_name, [])
+        ]
 
     @classmethod
     def find_references(
         cls, symbol_name: str, index: WorkspaceIndex
     ) -> List[CodeChunk]:
-        """Find all references to a symbol"""
-        chunks = []
-
-        for chunk in index.chunks:
-            if symbol_name in chunk.content and chunk.name != symbol_name:
-                chunks.append(chunk)
+        """Find all references to a symbol (whole identifier matches)"""
+        tokens = IDENTIFIER_PATTERN.findall(symbol_name)
+        if not tokens:
+            return []
 
+        # Intersect posting lists starting from the rarest token
+        postings = sorted(
+            (index.token_chunks.get(t, set()) for t in set(tokens)), key=len
+        )
+        chunk_ids = postings[0].intersection(*postings[1:])
+
+        chunks = [index.chunks_by_id[chunk_id] for chunk_id in chunk_ids]
+        if tokens != [symbol_name]:
+            # Dotted/qualified names: confirm the exact text
+            chunks = [c for c in chunks if symbol_name in c.content]
+        chunks = [c for c in chunks if c.name != symbol_name]
+        chunks.sort(key=lambda c: (c.file_path, c.start_line))
         return chunks
 
     @classmethod
@@ -971,22 +1538,23 @@ class SemanticSearch:
             return {}
 
         # Find files that import this file
-        imported_by = []
-        for dep in index.dependencies:
-            if file_path in dep.target or file_index.relative_path in dep.target:
-                imported_by.append(dep.source)
+        imported_by: Set[str] = set()
+        for key in CodeParser.module_keys(file_index.relative_path):
+            imported_by.update(index.importers.get(key, ()))
+        imported_by.discard(file_path)
 
-        # Find files this file imports
-        imports = []
-        for dep in index.dependencies:
-            if dep.source == file_path:
-                imports.append(dep.target)
+        # Find workspace files this file imports
+        resolved: Set[str] = set()
+        for key in index.file_imports.get(file_path, []):
+            resolved.update(index.module_files.get(key, ()))
+        resolved.discard(file_path)
 
         return {
             "file": file_index.to_dict(),
             "chunks": [c.to_dict() for c in file_index.chunks],
-            "imports": imports,
-            "imported_by": imported_by,
+            "imports": list(file_index.imports),
+            "resolved_imports": sorted(resolved),
+            "imported_by": sorted(imported_by),
         }
 
 
@@ -994,17 +1562,167 @@ class SemanticSearch:
 # STORAGE - Persist index
 # ============================================================
 
-_workspace_indexes: Dict[str, WorkspaceIndex] = {}
+
+class WorkspaceIndexCache:
+    """
+    Resident workspace indexes bounded by estimated heap bytes.
+
+    Least recently used indexes are evicted once the budget is exceeded;
+    pinned workspaces (active sessions, watched workspaces) are never
+    evicted, and neither is the most recently stored index. Evicted
+    indexes are reloaded from their snapshot by get_index.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._indexes: "OrderedDict[str, WorkspaceIndex]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._pins: Counter = Counter()
+        self.resident_bytes = 0
+
+    def get(self, workspace_path: str) -> Optional[WorkspaceIndex]:
+        index = self._indexes.get(workspace_path)
+        if index is not None:
+            self._indexes.move_to_end(workspace_path)
+        return index
+
+    def __getitem__(self, workspace_path: str) -> WorkspaceIndex:
+        return self._indexes[workspace_path]
+
+    def __setitem__(self, workspace_path: str, index: WorkspaceIndex) -> None:
+        self._indexes[workspace_path] = index
+        self._indexes.move_to_end(workspace_path)
+        self.resize(workspace_path)
+
+    def __contains__(self, workspace_path: object) -> bool:
+        return workspace_path in self._indexes
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def keys(self) -> List[str]:
+        return list(self._indexes)
+
+    def pop(self, workspace_path: str) -> Optional[WorkspaceIndex]:
+        index = self._indexes.pop(workspace_path, None)
+        self.resident_bytes -= self._sizes.pop(workspace_path, 0)
+        WORKSPACE_INDEX_BYTES.set(self.resident_bytes)
+        return index
+
+    def resize(self, workspace_path: str) -> None:
+        """Re-account an index after it changed, evicting if over budget"""
+        index = self._indexes.get(workspace_path)
+        if index is None:
+            return
+        size = index.resident_bytes
+        self.resident_bytes += size - self._sizes.get(workspace_path, 0)
+        self._sizes[workspace_path] = size
+        self._evict(keep=workspace_path)
+        WORKSPACE_INDEX_BYTES.set(self.resident_bytes)
+
+    def pin(self, workspace_path: str) -> None:
+        self._pins[workspace_path] += 1
+
+    def unpin(self, workspace_path: str) -> None:
+        if self._pins[workspace_path] <= 1:
+            del self._pins[workspace_path]
+            self._evict()
+        else:
+            self._pins[workspace_path] -= 1
+
+    def is_pinned(self, workspace_path: str) -> bool:
+        return self._pins[workspace_path] > 0
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        if self.resident_bytes <= self.max_bytes:
+            return
+        for workspace_path in list(self._indexes):
+            if self.resident_bytes <= self.max_bytes:
+                break
+            if workspace_path == keep or self._pins[workspace_path] > 0:
+                continue
+            size = self._sizes.get(workspace_path, 0)
+            self.pop(workspace_path)
+            WORKSPACE_INDEX_EVICTIONS.inc()
+            logger.info(
+                f"[RAG] Evicted index for {workspace_path} ({size} bytes, "
+                f"{self.resident_bytes}/{self.max_bytes} resident)"
+            )
+
+
+_workspace_indexes = WorkspaceIndexCache(settings.workspace_index_cache_bytes)
+# Per workspace: the snapshot version (workspace_snapshot.snapshot_version)
+# last loaded or superseded by a local index, and whether it loaded
+_snapshot_seen: Dict[str, Tuple[Optional[Tuple[int, int]], bool]] = {}
+
+
+def _mark_snapshot_seen(workspace_path: str) -> None:
+    """Record that the resident index is at least as new as the snapshot"""
+    from backend.services.workspace_snapshot import snapshot_version
+
+    _snapshot_seen[workspace_path] = (snapshot_version(workspace_path), True)
 
 
 def store_index(index: WorkspaceIndex) -> None:
     """Store a workspace index"""
     _workspace_indexes[index.workspace_path] = index
+    _mark_snapshot_seen(index.workspace_path)
 
 
 def get_index(workspace_path: str) -> Optional[WorkspaceIndex]:
-    """Get a workspace index"""
-    return _workspace_indexes.get(workspace_path)
+    """
+    Get a workspace index, loading its on-disk snapshot if that is newer.
+
+    CURRENT is re-checked on every lookup, so a snapshot published by another
+    worker replaces a missing or older resident index.
+    """
+    from backend.services.workspace_snapshot import load_snapshot, snapshot_version
+
+    index = _workspace_indexes.get(workspace_path)
+    version = snapshot_version(workspace_path)
+    if version is None:
+        return index
+    seen = _snapshot_seen.get(workspace_path)
+    if seen is not None and seen[0] == version and (index is not None or not seen[1]):
+        # Already reflected by the resident index, or known not to load
+        return index
+
+    start = time.perf_counter()
+    loaded = load_snapshot(workspace_path)
+    _snapshot_seen[workspace_path] = (version, loaded is not None)
+    if loaded is None:
+        return index
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    WORKSPACE_INDEX_LOAD_MS.observe(elapsed_ms)
+    logger.info(
+        f"[RAG] Loaded snapshot for {workspace_path} "
+        f"({loaded.total_chunks} chunks, {elapsed_ms:.0f}ms)"
+    )
+    _workspace_indexes[workspace_path] = loaded
+    return loaded
+
+
+def pin_workspace(workspace_path: str) -> None:
+    """Keep a workspace index resident (e.g. while a session is active)"""
+    _workspace_indexes.pin(workspace_path)
+
+
+def unpin_workspace(workspace_path: str) -> None:
+    """Release a pin taken with pin_workspace"""
+    _workspace_indexes.unpin(workspace_path)
+
+
+async def save_snapshot(index: WorkspaceIndex) -> None:
+    """Write an index snapshot off the event loop (errors are logged)"""
+    from backend.services.workspace_snapshot import write_snapshot
+
+    try:
+        await asyncio.to_thread(write_snapshot, index)
+        _mark_snapshot_seen(index.workspace_path)
+    except Exception as e:
+        logger.warning(
+            f"[RAG] Failed to write snapshot for {index.workspace_path}: {e}"
+        )
 
 
 def list_indexes() -> List[str]:
@@ -1025,12 +1743,16 @@ async def index_workspace(
     """
     Index a workspace for RAG search.
 
-    Returns index statistics.
+    Returns index statistics. With force_reindex an existing index is
+    re-checked file by file and only changed files are re-parsed.
     """
     # Check if already indexed
     existing = get_index(workspace_path)
     if existing and not force_reindex:
         return existing.to_dict()
+    if existing:
+        await update_workspace_index(workspace_path, on_progress=on_progress)
+        return existing.to_dict()
 
     # Index the workspace
     index = await WorkspaceIndexer.index_workspace(
@@ -1039,12 +1761,120 @@ async def index_workspace(
         on_progress=on_progress,
     )
 
-    # Store it
-    store_index(index)
+    # Store it (and on disk, for restarts and other workers)
+    lock = _update_locks.setdefault(workspace_path, asyncio.Lock())
+    async with lock:
+        store_index(index)
+        await save_snapshot(index)
 
     return index.to_dict()
 
 
+async def update_workspace_index(
+    workspace_path: str,
+    changed_files: Optional[List[str]] = None,
+    on_progress: Optional[callable] = None,
+) -> Dict[str, Any]:
+    """
+    Incrementally update a workspace index.
+
+    Args:
+        workspace_path: Path to workspace
+        changed_files: Paths reported changed by the client (e.g. the IDE
+            extension); None diffs the whole tree by size/mtime/hash
+        on_progress: Callback for progress updates
+
+    Returns index statistics plus per-file change counts. Builds a full
+    index when the workspace has not been indexed yet.
+    """
+    index = get_index(workspace_path)
+    if not index:
+        stats = await index_workspace(workspace_path, on_progress=on_progress)
+        return {**stats, "changes": None}
+
+    lock = _update_locks.setdefault(workspace_path, asyncio.Lock())
+    async with lock:
+        changes = await WorkspaceIndexer.update_workspace(
+            index,
+            changed_files=changed_files,
+            generate_embeddings=True,
+            on_progress=on_progress,
+        )
+        if changes["added"] or changes["modified"] or changes["removed"]:
+            _workspace_indexes.resize(workspace_path)
+            await save_snapshot(index)
+
+    if changes["added"] or changes["modified"] or changes["removed"]:
+        logger.info(f"[RAG] Updated index for {workspace_path}: {changes}")
+    return {**index.to_dict(), "changes": changes}
+
+
+class WorkspaceWatcher:
+    """Poll a workspace and apply incremental index updates
+
+    Each scan is one stat() per indexable file; files are only read and
+    re-parsed when their size or mtime changed.
+    """
+
+    def __init__(self, workspace_path: str, interval: float = WATCH_INTERVAL_SECONDS):
+        self.workspace_path = workspace_path
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await update_workspace_index(self.workspace_path)
+            except Exception as e:
+                logger.warning(
+                    f"[RAG] Watch update failed for {self.workspace_path}: {e}"
+                )
+
+
+_update_locks: Dict[str, asyncio.Lock] = {}
+_watchers: Dict[str, WorkspaceWatcher] = {}
+
+
+def watch_workspace(
+    workspace_path: str, interval: float = WATCH_INTERVAL_SECONDS
+) -> WorkspaceWatcher:
+    """Start keeping a workspace index fresh in the background"""
+    watcher = _watchers.get(workspace_path)
+    if watcher is None:
+        watcher = _watchers[workspace_path] = WorkspaceWatcher(workspace_path, interval)
+        pin_workspace(workspace_path)
+    watcher.start()
+    return watcher
+
+
+async def unwatch_workspace(workspace_path: str) -> bool:
+    """Stop the background watcher for a workspace"""
+    watcher = _watchers.pop(workspace_path, None)
+    if watcher is None:
+        return False
+    await watcher.stop()
+    unpin_workspace(workspace_path)
+    return True
+
+
 async def search_codebase(
     workspace_path: str,
     query: str,
@@ -1197,8 +2027,6 @@ async def persist_workspace_index(
     Returns:
         True if successful, False otherwise
     """
-    global _workspace_indexes
-
     if workspace_path not in _workspace_indexes:
         logger.warning(f"No index found for {workspace_path}")
         return False
@@ -1282,12 +2110,11 @@ async def load_workspace_index(
     Returns:
         WorkspaceIndex if found, None otherwise
     """
-    global _workspace_indexes
-
-    # Check if already loaded in memory
-    if workspace_path in _workspace_indexes:
+    # Check if already loaded in memory or snapshotted on disk
+    index = get_index(workspace_path)
+    if index is not None:
         logger.info(f"Using in-memory index for {workspace_path}")
-        return _workspace_indexes[workspace_path]
+        return index
 
     if not db:
         logger.warning("No database session provided for loading")
@@ -1354,6 +2181,7 @@ async def load_workspace_index(
                 language=symbol.language or "unknown",
             )
             index.chunks.append(chunk)
+            index._link_chunk(chunk)
 
             # Update symbol table
             if symbol.symbol_name:
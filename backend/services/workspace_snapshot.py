@@ -0,0 +1,306 @@
+"""
+Workspace Index Snapshots
+
+On-disk snapshots of workspace RAG indexes (backend/services/workspace_rag.py)
+so restarts and additional uvicorn workers reuse an index instead of
+re-parsing and re-embedding the workspace.
+
+Layout (one directory per workspace under settings.workspace_snapshot_dir):
+
+    <sha256(workspace_path)[:16]>/
+        CURRENT                 name of the active generation
+        <generation>/
+            index.json          file, chunk, symbol and dependency tables
+            vectors.f32         float32 embedding matrix (chunks x dim)
+
+A snapshot is written into a fresh generation directory and published by
+atomically replacing CURRENT, so readers never observe a partial snapshot.
+Vectors are opened with np.memmap: every process maps the same file and
+shares it through the page cache, and chunk embeddings are row views
+rather than Python float lists.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from backend.core.config import settings
+from backend.services.workspace_rag import (
+    CodeChunk,
+    CodeChunkType,
+    DependencyEdge,
+    FileIndex,
+    WorkspaceIndex,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+CHUNK_COLUMNS = [
+    "id",
+    "content",
+    "chunk_type",
+    "start_line",
+    "end_line",
+    "name",
+    "signature",
+    "docstring",
+    "references",
+    "language",
+    "last_modified",
+    "vector_length",
+]
+
+
+def snapshot_root() -> Optional[Path]:
+    """Directory holding all snapshots (None when snapshots are disabled)"""
+    directory = settings.workspace_snapshot_dir
+    return Path(directory) if directory else None
+
+
+def snapshot_dir(workspace_path: str) -> Optional[Path]:
+    """Snapshot directory for one workspace"""
+    root = snapshot_root()
+    if root is None:
+        return None
+    digest = hashlib.sha256(os.path.abspath(workspace_path).encode()).hexdigest()
+    return root / digest[:16]
+
+
+def snapshot_version(workspace_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Identity of the workspace's CURRENT pointer, or None without a snapshot.
+
+    Publishing replaces CURRENT with a new file, so the identity changes with
+    every generation; one stat is cheap enough to check on each lookup.
+    """
+    target = snapshot_dir(workspace_path)
+    if target is None:
+        return None
+    try:
+        st = os.stat(target / "CURRENT")
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns)
+
+
+def write_snapshot(index: WorkspaceIndex) -> Optional[Path]:
+    """
+    Write an index snapshot and atomically make it the current one.
+
+    Only indexes built from files are written; indexes restored from
+    CodeSymbol rows lack file entries and are skipped.
+
+    Returns the generation directory, or None if nothing was written.
+    """
+    target = snapshot_dir(index.workspace_path)
+    if target is None or not index.files:
+        return None
+
+    generation = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+    gen_dir = target / generation
+    gen_dir.mkdir(parents=True)
+
+    try:
+        files = []
+        chunk_rows = []
+        vector_dim = max(
+            (
+                len(c.embedding)
+                for f in index.files.values()
+                for c in f.chunks
+                if c.embedding is not None
+            ),
+            default=0,
+        )
+
+        with open(gen_dir / "vectors.f32", "wb") as vec_file:
+            for file_index in index.files.values():
+                start = len(chunk_rows)
+                for chunk in file_index.chunks:
+                    length = 0
+                    if vector_dim:
+                        row = np.zeros(vector_dim, dtype=np.float32)
+                        if chunk.embedding is not None:
+                            length = len(chunk.embedding)
+                            row[:length] = chunk.embedding
+                        vec_file.write(row.tobytes())
+                    chunk_rows.append(
+                        [
+                            chunk.id,
+                            chunk.content,
+                            chunk.chunk_type.value,
+                            chunk.start_line,
+                            chunk.end_line,
+                            chunk.name,
+                            chunk.signature,
+                            chunk.docstring,
+                            chunk.references,
+                            chunk.language,
+                            chunk.last_modified,
+                            length,
+                        ]
+                    )
+                files.append(
+                    {
+                        "path": file_index.path,
+                        "relative_path": file_index.relative_path,
+                        "language": file_index.language,
+                        "size": file_index.size,
+                        "last_modified": file_index.last_modified,
+                        "content_hash": file_index.content_hash,
+                        "imports": file_index.imports,
+                        "exports": file_index.exports,
+                        "line_count": file_index.line_count,
+                        "chunks": [start, len(chunk_rows)],
+                    }
+                )
+            vec_file.flush()
+            os.fsync(vec_file.fileno())
+
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "workspace_path": index.workspace_path,
+            "created_at": index.created_at,
+            "updated_at": index.updated_at,
+            "total_lines": index.total_lines,
+            "vector_dim": vector_dim,
+            "files": files,
+            "chunk_columns": CHUNK_COLUMNS,
+            "chunks": chunk_rows,
+            "symbols": index.symbols,
+            "dependencies": [
+                [d.source, d.target, d.edge_type] for d in index.dependencies
+            ],
+        }
+        with open(gen_dir / "index.json", "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Publish: CURRENT is replaced atomically
+        pointer = target / f"CURRENT.{generation}.tmp"
+        pointer.write_text(generation)
+        os.replace(pointer, target / "CURRENT")
+    except Exception:
+        shutil.rmtree(gen_dir, ignore_errors=True)
+        raise
+
+    # Keep the previous generation for readers that resolved CURRENT just
+    # before the swap; older ones go. Processes still mapping removed vectors
+    # keep the unlinked file alive until they drop it.
+    generations = sorted(e.name for e in target.iterdir() if e.is_dir())
+    for name in generations[:-2]:
+        shutil.rmtree(target / name, ignore_errors=True)
+
+    logger.info(
+        f"[RAG] Wrote snapshot for {index.workspace_path}: "
+        f"{len(files)} files, {len(chunk_rows)} chunks"
+    )
+    return gen_dir
+
+
+def load_snapshot(workspace_path: str) -> Optional[WorkspaceIndex]:
+    """Load the current snapshot for a workspace, if one exists"""
+    target = snapshot_dir(workspace_path)
+    if target is None:
+        return None
+    try:
+        generation = (target / "CURRENT").read_text().strip()
+    except FileNotFoundError:
+        return None
+
+    gen_dir = target / generation
+    try:
+        with open(gen_dir / "index.json", encoding="utf-8") as f:
+            payload: Dict[str, Any] = json.load(f)
+        if payload.get("version") != SNAPSHOT_VERSION:
+            logger.info(f"[RAG] Ignoring snapshot v{payload.get('version')}")
+            return None
+
+        chunk_rows = payload["chunks"]
+        vector_dim = payload["vector_dim"]
+        vectors = None
+        if vector_dim and chunk_rows:
+            vectors = np.memmap(
+                gen_dir / "vectors.f32",
+                dtype=np.float32,
+                mode="r",
+                shape=(len(chunk_rows), vector_dim),
+            )
+        return _build_index(payload, vectors)
+    except Exception as e:
+        logger.warning(f"[RAG] Failed to load snapshot for {workspace_path}: {e}")
+        return None
+
+
+def _build_index(
+    payload: Dict[str, Any], vectors: Optional[np.ndarray]
+) -> WorkspaceIndex:
+    index = WorkspaceIndex(
+        workspace_path=payload["workspace_path"],
+        created_at=payload["created_at"],
+        updated_at=payload["updated_at"],
+        total_lines=payload["total_lines"],
+    )
+    column = {name: i for i, name in enumerate(payload["chunk_columns"])}
+    chunk_rows = payload["chunks"]
+
+    for entry in payload["files"]:
+        start, end = entry.pop("chunks")
+        file_index = FileIndex(**entry)
+        for row_id in range(start, end):
+            row = chunk_rows[row_id]
+            length = row[column["vector_length"]]
+            file_index.chunks.append(
+                CodeChunk(
+                    id=row[column["id"]],
+                    file_path=file_index.path,
+                    content=row[column["content"]],
+                    chunk_type=CodeChunkType(row[column["chunk_type"]]),
+                    start_line=row[column["start_line"]],
+                    end_line=row[column["end_line"]],
+                    name=row[column["name"]],
+                    signature=row[column["signature"]],
+                    docstring=row[column["docstring"]],
+                    imports=file_index.imports,
+                    references=row[column["references"]],
+                    embedding=(
+                        vectors[row_id, :length]
+                        if vectors is not None and length
+                        else None
+                    ),
+                    language=row[column["language"]],
+                    last_modified=row[column["last_modified"]],
+                )
+            )
+        index.files[file_index.path] = file_index
+        index.chunks.extend(file_index.chunks)
+        index._link_file(file_index)
+
+    index.symbols = payload["symbols"]
+    index.dependencies = [
+        DependencyEdge(source=s, target=t, edge_type=e)
+        for s, t, e in payload["dependencies"]
+    ]
+    index.total_files = len(index.files)
+    index.total_chunks = len(index.chunks)
+    return index
+
+
+def delete_snapshot(workspace_path: str) -> bool:
+    """Remove all snapshot generations of a workspace"""
+    target = snapshot_dir(workspace_path)
+    if target is None or not target.exists():
+        return False
+    shutil.rmtree(target, ignore_errors=True)
+    return True
@@ -14,6 +14,26 @@ LLM_TOKENS = Counter(
     ["phase", "model"],
 )
 
+# Prompt-cache tokens reported by providers (kind: read | write)
+LLM_CACHE_TOKENS = Counter(
+    "aep_llm_cache_tokens_total",
+    "Prompt-cache tokens read or written by LLM calls",
+    ["phase", "model", "kind"],
+)
+
+# Conversation history compaction (backend/services/context_compaction.py)
+CONTEXT_COMPACTIONS = Counter(
+    "aep_context_compactions_total",
+    "Agent message histories compacted to fit the token budget",
+    ["component"],
+)
+
+CONTEXT_TOKENS_SAVED = Counter(
+    "aep_context_tokens_saved_total",
+    "Prompt tokens removed from agent histories by compaction",
+    ["component"],
+)
+
 # Total USD cost of LLM calls
 LLM_COST = Counter(
     "aep_llm_cost_usd_total",
@@ -133,3 +153,54 @@ BUDGET_OVERSPEND_ANOMALIES = Counter(
 # Redis-polling task (to read hashes across all active scopes), which is
 # planned for a future observability phase. Shipping always-zero gauges
 # would make dashboards and alerts inaccurate.
+
+# Real-time broadcast (SSE) fan-out metrics
+BROADCAST_SUBSCRIBERS = Gauge(
+    "aep_broadcast_subscribers",
+    "Local subscribers attached to broadcast channels",
+    ["backend"],
+)
+
+BROADCAST_CHANNELS = Gauge(
+    "aep_broadcast_channels",
+    "Broadcast channels subscribed on the shared connection",
+    ["backend"],
+)
+
+BROADCAST_FANOUT_LATENCY = Histogram(
+    "aep_broadcast_fanout_latency_ms",
+    "Time to fan one broadcast message out to local subscribers in milliseconds",
+    ["backend"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50),
+)
+
+BROADCAST_DROPPED = Counter(
+    "aep_broadcast_dropped_total",
+    "Broadcast messages dropped because a subscriber was not keeping up",
+    ["backend"],
+)
+
+# Shared outbound HTTP client pools (backend/services/http_client.py)
+HTTP_CLIENT_REQUESTS = Counter(
+    "aep_http_client_requests_total",
+    "Outbound HTTP requests sent through the shared client pools",
+    ["client"],
+)
+
+HTTP_CLIENT_CONNECTIONS_OPENED = Counter(
+    "aep_http_client_connections_opened_total",
+    "New TCP connections opened by the shared client pools (requests minus "
+    "this is the number of reused connections)",
+    ["client"],
+)
+
+HTTP_CLIENT_POOLS = Gauge(
+    "aep_http_client_pools",
+    "Shared outbound HTTP client pools currently open",
+)
+
+# NAVI routing trace sink (backend/services/trace_store.py)
+TRACE_STORE_DROPPED = Counter(
+    "aep_trace_store_dropped_total",
+    "Trace events dropped because the trace writer queue was full",
+)
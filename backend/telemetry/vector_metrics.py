@@ -6,9 +6,11 @@ Prometheus metrics for monitoring vector search performance:
 - Hybrid reranking latency
 - Vector backfill progress
 - Search result quality metrics
+- Shared embedding cache hit/miss/bytes
+- Resident workspace RAG index bytes, evictions and reload latency
 """
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 # ANN query latency histogram
 # Buckets optimized for expected ANN performance (10-800ms)
@@ -42,7 +44,7 @@ BACKFILL_VECTORS_TOTAL = Counter(
 SEARCH_BACKEND_CALLS = Counter(
     "aep_search_backend_calls_total",
     "Total search calls by backend type",
-    ["backend"],  # Labels: pgvector, faiss, json
+    ["backend"],  # Labels: pgvector, local-ann, json
 )
 
 # Search result quality metrics
@@ -69,3 +71,37 @@ CONTEXT_PACK_SIZE_BYTES = Histogram(
     "Size of generated context pack in bytes",
     buckets=(1000, 5000, 10000, 25000, 50000, 100000),
 )
+
+# Shared embedding cache metrics (backend/services/embedding_cache.py)
+EMBED_CACHE_HITS = Counter(
+    "aep_embedding_cache_hits_total",
+    "Embedding cache hits by tier",
+    ["tier"],  # Labels: memory, redis, db
+)
+
+EMBED_CACHE_MISSES = Counter(
+    "aep_embedding_cache_misses_total",
+    "Embedding cache misses (texts sent to an embedding provider)",
+)
+
+EMBED_CACHE_BYTES = Gauge(
+    "aep_embedding_cache_memory_bytes",
+    "Bytes held by the in-process embedding cache tier",
+)
+
+# Workspace RAG index cache metrics (backend/services/workspace_rag.py)
+WORKSPACE_INDEX_BYTES = Gauge(
+    "aep_workspace_index_resident_bytes",
+    "Estimated heap bytes held by resident workspace indexes",
+)
+
+WORKSPACE_INDEX_EVICTIONS = Counter(
+    "aep_workspace_index_evictions_total",
+    "Workspace indexes evicted to stay within the memory budget",
+)
+
+WORKSPACE_INDEX_LOAD_MS = Histogram(
+    "aep_workspace_index_load_ms",
+    "Latency to reload a workspace index from its snapshot (milliseconds)",
+    buckets=[5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000],
+)
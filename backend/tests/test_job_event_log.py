@@ -0,0 +1,116 @@
+import json
+
+import fakeredis.aioredis
+import pytest
+
+from backend.services import job_manager as job_manager_module
+from backend.services.job_manager import JobEventLog, JobManager
+
+
+def _manager(max_events: int = 5000) -> JobManager:
+    manager = JobManager(max_events_per_job=max_events)
+    manager._redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    manager._redis_available = True
+    return manager
+
+
+async def _create(manager: JobManager) -> str:
+    record = await manager.create_job(
+        payload={"message": "event log"}, user_id="user-1", org_id="org-1"
+    )
+    return record.job_id
+
+
+@pytest.mark.asyncio
+async def test_append_serializes_each_event_once(monkeypatch) -> None:
+    manager = _manager(max_events=3)
+    job_id = await _create(manager)
+
+    calls = []
+    real_serialize = job_manager_module._serialize_event
+
+    def counting_serialize(payload):
+        calls.append(payload["sequence"])
+        return real_serialize(payload)
+
+    monkeypatch.setattr(job_manager_module, "_serialize_event", counting_serialize)
+    for i in range(10):
+        await manager.append_event(job_id, {"type": "step", "index": i})
+
+    assert calls == list(range(2, 12))
+
+
+@pytest.mark.asyncio
+async def test_append_does_not_rewrite_record() -> None:
+    manager = _manager()
+    job_id = await _create(manager)
+    record_key = manager._record_key(job_id)
+    before = await manager._redis.get(record_key)
+
+    for i in range(5):
+        await manager.append_event(job_id, {"type": "step", "index": i})
+
+    assert await manager._redis.get(record_key) == before
+    assert await manager._redis.xlen(manager._stream_key(job_id)) == 6
+    progress = json.loads(await manager._redis.get(manager._progress_key(job_id)))
+    assert progress["next_sequence"] == 7
+
+
+@pytest.mark.asyncio
+async def test_other_worker_sees_appended_events() -> None:
+    manager = _manager()
+    job_id = await _create(manager)
+    for i in range(3):
+        await manager.append_event(job_id, {"type": "step", "index": i})
+
+    other = JobManager()
+    other._redis = manager._redis
+    other._redis_available = True
+    record = await other.require_job(job_id)
+
+    assert record.next_sequence == 5
+    events = await other.get_events_after(job_id, 2)
+    assert [e["sequence"] for e in events] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_evicts_oldest_events() -> None:
+    manager = _manager()
+    manager._max_event_bytes = 2000
+    job_id = await _create(manager)
+
+    last = None
+    for i in range(20):
+        last = await manager.append_event(job_id, {"type": "step", "text": "x" * 200})
+
+    record = await manager.require_job(job_id)
+    assert record.events.total_bytes <= 2000 + 200
+    assert last["truncation"]["reason"] == "older_events_dropped"
+    stored = await manager._redis.xrevrange(manager._stream_key(job_id), count=1)
+    assert json.loads(stored[0][1]["e"])["truncation"] == last["truncation"]
+
+
+@pytest.mark.asyncio
+async def test_legacy_event_list_is_still_read() -> None:
+    manager = _manager()
+    job_id = await _create(manager)
+    await manager._redis.delete(manager._stream_key(job_id))
+    await manager._redis.rpush(
+        manager._events_key(job_id),
+        json.dumps({"type": "legacy", "sequence": 1}),
+        json.dumps({"type": "legacy", "sequence": 2}),
+    )
+
+    events = await manager.get_events_after(job_id, 1)
+    assert [e["sequence"] for e in events] == [2]
+
+
+def test_event_log_tracks_running_size() -> None:
+    log = JobEventLog.from_raw(
+        [json.dumps({"sequence": i}) for i in range(1, 6)], limit=3
+    )
+    assert [e["sequence"] for e in log] == [3, 4, 5]
+    assert log.total_bytes == sum(len(json.dumps({"sequence": i})) for i in (3, 4, 5))
+    assert log.popleft() == len(json.dumps({"sequence": 3}))
+    assert log.last_sequence() == 5
+    assert [e["sequence"] for e in log.after(4)] == [5]
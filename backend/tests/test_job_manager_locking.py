@@ -18,6 +18,9 @@ class _FakeRedis:
     async def get(self, key: str):
         return self._data.get(key)
 
+    async def mget(self, *keys: str):
+        return [self._data.get(key) for key in keys]
+
     async def eval(self, script: str, numkeys: int, key: str, *args):
         if numkeys != 1:
             raise AssertionError("Fake redis only supports one key in eval")
@@ -9,6 +9,7 @@ import os
 import time
 from fastapi.testclient import TestClient
 from backend.api.main import app
+from backend.core.rate_limit.routes import reload_overrides
 
 # Rate limiter configuration constants
 # Token bucket refills at 1 token per second, so we need to wait slightly longer
@@ -32,6 +33,8 @@ def setup_module(_):
     os.environ["RL_AI_GEN_BURST"] = "1"
     os.environ["RL_FB_PM"] = "3"
     os.environ["RL_FB_BURST"] = "1"
+    # Overrides are parsed once; pick up the values set above
+    reload_overrides()
 
 
 def test_ai_generate_rate_limited():
@@ -21,11 +21,13 @@ async def test_stream_with_tools_maps_self_hosted_to_openai_provider(
             api_base: str,
             health_tracker=None,
             health_provider_id=None,
+            prompt_cache=False,
         ) -> None:
             captured["provider"] = provider
             captured["model"] = model
             captured["api_key"] = api_key
             captured["api_base"] = api_base
+            captured["prompt_cache"] = prompt_cache
 
         async def stream(self, _messages: List[Any]):
             yield "ok"
@@ -46,5 +48,6 @@ async def test_stream_with_tools_maps_self_hosted_to_openai_provider(
     assert captured["provider"] == "openai"
     assert captured["model"] == "qwen2.5-coder"
     assert captured["api_base"] == "http://localhost:8000/v1"
+    assert captured["prompt_cache"] is True
     assert events[0].type == StreamEventType.TEXT
     assert events[-1].type == StreamEventType.DONE
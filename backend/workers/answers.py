@@ -7,6 +7,7 @@ from dramatiq.brokers.redis import RedisBroker
 from sqlalchemy.orm import Session
 from ..core.config import settings
 from ..core.db import SessionLocal
+from ..infra.broadcast.redis import publish_sync
 from ..models.meetings import TranscriptSegment
 from ..services import answers as asvc
 from ..services import meetings as msvc
@@ -215,6 +216,17 @@ def _search_prs(db: Session, terms: list[str]) -> list[Dict[str, Any]]:
     return GitHubService.search_issues(db, repo=None, q=q, updated_since=None)
 
 
+def _publish_answer(session_id: str, row: Any) -> None:
+    """Push a saved answer to SSE subscribers of the session.
+
+    Best effort: the answer is already persisted, so a lost message is
+    recovered by the stream's backfill on reconnect.
+    """
+    publish_sync(
+        settings.redis_url, asvc.answer_channel(session_id), asvc.serialize_answer(row)
+    )
+
+
 @dramatiq.actor(max_retries=NO_RETRIES)
 def generate_answer(session_id: str) -> None:
     """Generate grounded answer for a session using JIRA and GitHub context.
@@ -243,7 +255,8 @@ def generate_answer(session_id: str) -> None:
         # Calculate latency and save result
         latency_ms = round((time.perf_counter() - t0) * 1000)
         payload["latency_ms"] = latency_ms
-        asvc.save_answer(db, session_id, payload)
+        row = asvc.save_answer(db, session_id, payload)
+        _publish_answer(session_id, row)
     except Exception as e:
         # Log error - no retries configured (max_retries=NO_RETRIES)
         logger.exception("Error generating answer for session %s: %s", session_id, e)
@@ -10,15 +10,24 @@ Heuristics implemented:
 4. Temporal adjacency: Meeting -> PR within TEMPORAL_WINDOW_HOURS with shared terms
 5. Semantic similarity: Embedding cosine > threshold
 6. Commit reverts: Detect git revert commits for 'caused_by' edges
+
+Batch rebuilds do not compare every pair of nodes. Keys, references and terms
+are extracted once per node into inverted indexes (JIRA key, PR number,
+foreign id, Slack ts, and term postings over a time-sorted window), and the
+heuristics only run on pairs that share an entry.
 """
 
 import re
 import json
 import logging
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 
 from backend.database.models.memory_graph import (
     MemoryNode,
@@ -39,6 +48,19 @@ from backend.core.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Columns of the unique edge index (idx_memory_edge_org_src_dst_rel)
+_EDGE_KEY_COLUMNS = ("org_id", "src_id", "dst_id", "relation")
+
+
+@dataclass
+class _NodeFeatures:
+    """Per-node values the heuristics need, extracted once per build"""
+
+    jira_keys: Set[str] = field(default_factory=set)
+    terms: Set[str] = field(default_factory=set)
+    fixes: List[Tuple[str, str]] = field(default_factory=list)  # PR nodes only
+    revert_refs: Set[str] = field(default_factory=set)  # Revert PRs only
+
 
 class GraphBuilder:
     """Builds and maintains the memory graph from artifacts"""
@@ -46,6 +68,7 @@ class GraphBuilder:
     def __init__(self, db: Session, ai_service: AIService):
         self.db = db
         self.ai_service = ai_service
+        self._features: Dict[int, _NodeFeatures] = {}
 
     def rebuild_graph(
         self, org_id: str, since: Optional[datetime] = None
@@ -93,8 +116,6 @@ class GraphBuilder:
             f"Attaching edges for node {node_id} ({node.kind}:{node.foreign_id})"
         )
 
-        edges_created = 0
-
         # Get recent nodes (last 30 days) for potential edges
         recent_cutoff = datetime.now(timezone.utc) - timedelta(days=30)
         recent_nodes = (
@@ -108,11 +129,12 @@ class GraphBuilder:
         )
 
         # Apply all heuristics
+        self._features = {}
+        edges = []
         for other_node in recent_nodes:
-            edges = self._apply_heuristics(node, other_node)
-            for edge_data in edges:
-                self._create_edge_if_not_exists(**edge_data)
-                edges_created += 1
+            edges.extend(self._apply_heuristics(node, other_node))
+        edges_created = self._insert_edges(edges)
+        self._features = {}
 
         self.db.commit()
         logger.info(f"Created {edges_created} edges for node {node_id}")
@@ -186,18 +208,152 @@ class GraphBuilder:
             .all()
         )
 
-        edges_created = 0
-        for i, node1 in enumerate(nodes):
-            for node2 in nodes[i + 1 :]:
-                # Apply bidirectional heuristics
-                edges = self._apply_heuristics(node1, node2)
-                for edge_data in edges:
-                    if self._create_edge_if_not_exists(**edge_data):
-                        edges_created += 1
+        self._features = {}
+        edges = []
+        for i, j in self._candidate_pairs(nodes):
+            # Apply bidirectional heuristics
+            edges.extend(self._apply_heuristics(nodes[i], nodes[j]))
+        edges_created = self._insert_edges(edges)
+        self._features = {}
 
         self.db.commit()
         return edges_created
 
+    def _candidate_pairs(self, nodes: List[MemoryNode]) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) that at least one heuristic could connect
+
+        Every heuristic except temporal adjacency needs an exact match between
+        a value extracted from one node and a key of the other, so those pairs
+        come from dictionary lookups. Temporal adjacency pairs come from term
+        postings restricted to the TEMPORAL_WINDOW_HOURS window around each
+        meeting.
+        """
+        position = {id(node): i for i, node in enumerate(nodes)}
+        pairs: Set[Tuple[int, int]] = set()
+
+        def add(node: MemoryNode, others: List[MemoryNode]) -> None:
+            i = position[id(node)]
+            for other in others:
+                j = position[id(other)]
+                if i != j:
+                    pairs.add((i, j) if i < j else (j, i))
+
+        by_foreign_id: Dict[str, List[MemoryNode]] = defaultdict(list)
+        by_number: Dict[str, List[MemoryNode]] = defaultdict(list)
+        mentions: Dict[str, List[MemoryNode]] = defaultdict(list)
+        slack_by_ts: Dict[Any, List[MemoryNode]] = defaultdict(list)
+        for node in nodes:
+            foreign_id = node.foreign_id or ""
+            by_foreign_id[foreign_id].append(node)
+            by_number[
+                foreign_id[1:] if foreign_id.startswith("#") else foreign_id
+            ].append(node)
+            for key in self._node_features(node).jira_keys:
+                mentions[key].append(node)
+            if node.kind == NodeKind.SLACK_THREAD.value:
+                ts = (node.meta_json or {}).get("ts")
+                if ts is not None:
+                    slack_by_ts[ts].append(node)
+
+        for node in nodes:
+            features = self._node_features(node)
+            # Heuristic 1: JIRA issue mentioned by another node
+            if node.kind == NodeKind.JIRA_ISSUE.value:
+                add(node, mentions.get(node.foreign_id, []))
+            # Heuristic 2: PR fixes/closes a PR number or JIRA key
+            for pr_num, jira_key in features.fixes:
+                if pr_num:
+                    add(node, by_number.get(pr_num, []))
+                else:
+                    add(node, by_foreign_id.get(jira_key, []))
+            # Heuristic 3: Slack reply to a thread
+            if node.kind == NodeKind.SLACK_THREAD.value:
+                thread_ts = (node.meta_json or {}).get("thread_ts")
+                if thread_ts is not None:
+                    add(node, slack_by_ts.get(thread_ts, []))
+            # Heuristic 6: Revert PR referencing the original
+            for ref in features.revert_refs:
+                add(node, by_foreign_id.get(ref, []))
+
+        # Heuristic 4: meetings vs PRs/docs sharing terms within the window
+        artifacts = sorted(
+            (n for n in nodes if n.kind in (NodeKind.PR.value, NodeKind.DOC.value)),
+            key=lambda n: n.created_at,
+        )
+        times = [n.created_at for n in artifacts]
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for k, artifact in enumerate(artifacts):
+            for term in self._node_features(artifact).terms:
+                postings[term].append(k)  # Ascending, so also time-sorted
+
+        window = timedelta(hours=TEMPORAL_WINDOW_HOURS)
+        for node in nodes:
+            if node.kind != NodeKind.MEETING.value:
+                continue
+            lo = bisect_left(times, node.created_at - window)
+            hi = bisect_right(times, node.created_at + window)
+            if lo >= hi:
+                continue
+            shared: Counter = Counter()
+            for term in self._node_features(node).terms:
+                posting = postings.get(term)
+                if posting:
+                    shared.update(
+                        posting[bisect_left(posting, lo) : bisect_left(posting, hi)]
+                    )
+            add(
+                node,
+                [
+                    artifacts[k]
+                    for k, count in shared.items()
+                    if count >= MIN_SHARED_TERMS_COUNT
+                ],
+            )
+
+        return sorted(pairs)
+
+    def _insert_edges(self, edges: List[Dict[str, Any]]) -> int:
+        """Insert edge specifications with one bulk statement, skipping existing
+
+        Returns the number of edges actually created.
+        """
+        rows: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for edge in edges:
+            key = tuple(edge[c] for c in _EDGE_KEY_COLUMNS)
+            if key not in rows:
+                rows[key] = {
+                    "org_id": edge["org_id"],
+                    "src_id": edge["src_id"],
+                    "dst_id": edge["dst_id"],
+                    "relation": edge["relation"],
+                    "weight": edge["weight"],
+                    "confidence": edge["confidence"],
+                    "meta_json": edge["meta"],
+                }
+        if not rows:
+            return 0
+
+        table = MemoryEdge.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = (postgresql if dialect == "postgresql" else sqlite).insert
+            stmt = (
+                insert(table)
+                .on_conflict_do_nothing(index_elements=list(_EDGE_KEY_COLUMNS))
+                .returning(table.c.id)
+            )
+            return len(self.db.execute(stmt, list(rows.values())).all())
+
+        # Other databases: one lookup for the keys that already exist
+        key_cols = tuple_(*(table.c[c] for c in _EDGE_KEY_COLUMNS))
+        existing = set(
+            self.db.execute(select(key_cols).where(key_cols.in_(list(rows)))).all()
+        )
+        new_rows = [row for key, row in rows.items() if key not in existing]
+        if new_rows:
+            self.db.execute(table.insert(), new_rows)
+        return len(new_rows)
+
     def _apply_heuristics(
         self, node1: MemoryNode, node2: MemoryNode
     ) -> List[Dict[str, Any]]:
@@ -234,8 +390,8 @@ class GraphBuilder:
         edges = []
 
         # Extract JIRA keys from both nodes
-        keys1 = self._extract_jira_keys(node1)
-        keys2 = self._extract_jira_keys(node2)
+        keys1 = self._node_features(node1).jira_keys
+        keys2 = self._node_features(node2).jira_keys
 
         # If one is a JIRA issue and the other mentions it
         if node1.kind == NodeKind.JIRA_ISSUE.value and node1.foreign_id in keys2:
@@ -286,8 +442,7 @@ class GraphBuilder:
             return edges
 
         # Look for fixes/closes patterns in PR title and description
-        pr_text = f"{pr_node.title or ''} {pr_node.summary or ''}"
-        matches = FIXES_PATTERN.findall(pr_text)
+        matches = self._node_features(pr_node).fixes
 
         for match in matches:
             # `FIXES_PATTERN.findall` returns tuples like (pr_num, jira_key)
@@ -442,25 +597,42 @@ class GraphBuilder:
             if src_node.kind != NodeKind.PR.value:
                 continue
 
-            title = (src_node.title or "").lower()
-            if REVERT_PATTERN.search(title):
-                # Look for PR number or commit reference in title
-                references = self._extract_references(src_node.title)
-                if dst_node.foreign_id in references:
-                    edges.append(
-                        {
-                            "src_id": dst_node.id,  # Original PR caused issue
-                            "dst_id": src_node.id,  # Revert PR
-                            "relation": EdgeRelation.CAUSED_BY.value,
-                            "weight": 0.9,
-                            "confidence": 0.85,
-                            "org_id": src_node.org_id,
-                            "meta": {"heuristic": "commit_revert"},
-                        }
-                    )
+            # References from the title of a revert PR (empty otherwise)
+            references = self._node_features(src_node).revert_refs
+            if dst_node.foreign_id in references:
+                edges.append(
+                    {
+                        "src_id": dst_node.id,  # Original PR caused issue
+                        "dst_id": src_node.id,  # Revert PR
+                        "relation": EdgeRelation.CAUSED_BY.value,
+                        "weight": 0.9,
+                        "confidence": 0.85,
+                        "org_id": src_node.org_id,
+                        "meta": {"heuristic": "commit_revert"},
+                    }
+                )
 
         return edges
 
+    def _node_features(self, node: MemoryNode) -> _NodeFeatures:
+        """Extract (once per build) the keys, references and terms of a node"""
+        features = self._features.get(id(node))
+        if features is not None:
+            return features
+
+        features = _NodeFeatures(
+            jira_keys=self._extract_jira_keys(node),
+            terms=self._extract_terms(node),
+        )
+        if node.kind == NodeKind.PR.value:
+            pr_text = f"{node.title or ''} {node.summary or ''}"
+            features.fixes = FIXES_PATTERN.findall(pr_text)
+            if REVERT_PATTERN.search((node.title or "").lower()):
+                # Look for PR number or commit reference in title
+                features.revert_refs = self._extract_references(node.title)
+        self._features[id(node)] = features
+        return features
+
     def _extract_jira_keys(self, node: MemoryNode) -> Set[str]:
         """Extract JIRA keys from node text"""
         text = f"{node.title or ''} {node.summary or ''}"
@@ -477,55 +649,20 @@ class GraphBuilder:
         refs.update(JIRA_KEY_PATTERN.findall(text))
         return refs
 
-    def _count_shared_terms(self, node1: MemoryNode, node2: MemoryNode) -> int:
-        """Count shared significant terms between nodes"""
-        text1 = f"{node1.title or ''} {node1.summary or ''}".lower()
-        text2 = f"{node2.title or ''} {node2.summary or ''}".lower()
+    def _extract_terms(self, node: MemoryNode) -> Set[str]:
+        """Extract significant terms from node title and summary"""
+        text = f"{node.title or ''} {node.summary or ''}".lower()
 
         # Simple tokenization (exclude common words using shared STOPWORDS constant)
-        words1 = set(
-            w for w in re.findall(r"\w+", text1) if len(w) > 3 and w not in STOPWORDS
-        )
-        words2 = set(
-            w for w in re.findall(r"\w+", text2) if len(w) > 3 and w not in STOPWORDS
-        )
-
-        return len(words1 & words2)
-
-    def _create_edge_if_not_exists(
-        self,
-        src_id: int,
-        dst_id: int,
-        relation: str,
-        weight: float,
-        confidence: float,
-        org_id: str,
-        meta: Dict[str, Any],
-    ) -> bool:
-        """Create edge if it doesn't already exist
-
-        Returns True if edge was created, False if it already existed
-        """
-        existing = (
-            self.db.query(MemoryEdge)
-            .filter_by(org_id=org_id, src_id=src_id, dst_id=dst_id, relation=relation)
-            .first()
+        return set(
+            w for w in re.findall(r"\w+", text) if len(w) > 3 and w not in STOPWORDS
         )
 
-        if existing:
-            return False
-
-        edge = MemoryEdge(
-            org_id=org_id,
-            src_id=src_id,
-            dst_id=dst_id,
-            relation=relation,
-            weight=weight,
-            confidence=confidence,
-            meta_json=meta,
-        )
-        self.db.add(edge)
-        return True
+    def _count_shared_terms(self, node1: MemoryNode, node2: MemoryNode) -> int:
+        """Count shared significant terms between nodes"""
+        terms1 = self._node_features(node1).terms
+        terms2 = self._node_features(node2).terms
+        return len(terms1 & terms2)
 
     def _map_source_to_kind(
         self,
@@ -1,6 +1,6 @@
 import datetime as dt
 import dramatiq
-import httpx
+from ..services.http_client import closing_http_clients, http_client
 from dramatiq.brokers.redis import RedisBroker
 from sqlalchemy.orm import Session
 from sqlalchemy import select
@@ -36,7 +36,7 @@ def jira_sync(connection_id: str) -> None:
         }
 
         async def fetch():
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with http_client(timeout=30) as client:
                 for key in cfg.project_keys:
                     start_at = 0
                     while True:
@@ -56,7 +56,7 @@ def jira_sync(connection_id: str) -> None:
 
         import anyio
 
-        anyio.run(fetch)
+        anyio.run(closing_http_clients, fetch)
         cfg.last_sync_at = dt.dt.datetime.now(dt.timezone.utc)
         db.commit()
     except Exception:
@@ -78,7 +78,7 @@ def github_index(connection_id: str, repo_full_name: str) -> None:
         }
 
         async def fetch():
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with http_client(timeout=30) as client:
                 # Repo meta
                 r = await client.get(
                     f"https://api.github.com/repos/{repo_full_name}", headers=headers
@@ -159,7 +159,7 @@ def github_index(connection_id: str, repo_full_name: str) -> None:
 
         import anyio
 
-        anyio.run(fetch)
+        anyio.run(closing_http_clients, fetch)
         db.commit()
     except Exception:
         pass
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Backfill binary vector encoding for memory_chunk embeddings
+
+Rewrites embeddings still stored as legacy JSON text into the binary codec
+from backend/search/vector_codec.py. Run after migration
+0035_memory_chunk_vector_codec when it was applied with
+SKIP_VECTOR_CODEC_BACKFILL=1. Safe to run while the application is serving
+traffic: readers accept both formats, each batch commits independently, and
+an interrupted run resumes with the remaining JSON rows.
+
+Usage:
+    python scripts/backfill_vector_codec.py
+
+Environment Variables:
+    DATABASE_URL: Database connection string (default: application settings)
+    EMBEDDING_STORAGE_FORMAT: float32 | float16 | int8 (default: float32)
+    BATCH_SIZE: Number of rows to rewrite per commit (default: 1000)
+    MAX_BATCHES: Stop after this many batches, 0 = run to completion (default: 0)
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from backend.core.config import settings  # noqa: E402
+from backend.search import vector_codec  # noqa: E402
+
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "1000"))
+MAX_BATCHES = int(os.getenv("MAX_BATCHES", "0"))
+
+
+def backfill():
+    """Convert remaining JSON embeddings to the binary codec"""
+    codec = vector_codec.codec_id(
+        os.getenv("EMBEDDING_STORAGE_FORMAT", settings.embedding_storage_format)
+    )
+    engine = create_engine(os.getenv("DATABASE_URL") or settings.sqlalchemy_url)
+
+    with engine.connect() as conn:
+        remaining = conn.execute(
+            text(
+                "SELECT COUNT(*) FROM memory_chunk "
+                "WHERE vec_codec IS NULL AND embedding IS NOT NULL"
+            )
+        ).scalar_one()
+        print(f"Found {remaining} rows to convert (batch size {BATCH_SIZE})")
+        if remaining == 0:
+            return
+
+        rewritten = vector_codec.backfill_vector_codec(
+            conn,
+            codec=codec,
+            batch_size=BATCH_SIZE,
+            max_batches=MAX_BATCHES,
+            commit_each_batch=True,
+        )
+
+    print("\n✅ Backfill complete!" if rewritten == remaining else "\nBackfill paused")
+    print(f"   Converted: {rewritten}/{remaining} rows")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    backfill()
@@ -1,13 +1,23 @@
 #!/usr/bin/env python3
-"""Export NAVI trace events from JSONL with simple filters."""
+"""Export NAVI trace events from JSONL with simple filters.
+
+Reads the active trace file together with its rotated (and compressed)
+segments, oldest first.
+"""
 
 from __future__ import annotations
 
 import argparse
+from datetime import datetime
 import json
 from pathlib import Path
+import sys
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.services.trace_store import read_traces, rotated_segments  # noqa: E402
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Export NAVI traces to JSONL")
@@ -33,14 +43,20 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Filter by endpoint (can be repeated)",
     )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only export events at or after this ISO timestamp (UTC if naive)",
+    )
+    parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        help="Only export events before this ISO timestamp (UTC if naive)",
+    )
     return parser.parse_args()
 
 
-def matches_filters(
-    record: dict[str, Any], event_types: set[str], endpoints: set[str]
-) -> bool:
-    if event_types and record.get("event_type") not in event_types:
-        return False
+def matches_filters(record: dict[str, Any], endpoints: set[str]) -> bool:
     if endpoints and record.get("endpoint") not in endpoints:
         return False
     return True
@@ -53,30 +69,19 @@ def main() -> int:
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if not input_path.exists():
+    if not input_path.exists() and not rotated_segments(input_path):
         raise SystemExit(f"Input trace file not found: {input_path}")
 
-    event_types = set(args.event_type)
     endpoints = set(args.endpoint)
 
     total = 0
     exported = 0
 
-    with (
-        input_path.open("r", encoding="utf-8") as src,
-        output_path.open("w", encoding="utf-8") as dst,
-    ):
-        for line in src:
-            line = line.strip()
-            if not line:
-                continue
+    records = read_traces(input_path, args.since, args.until, args.event_type)
+    with output_path.open("w", encoding="utf-8") as dst:
+        for record in records:
             total += 1
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if not matches_filters(record, event_types, endpoints):
+            if not matches_filters(record, endpoints):
                 continue
 
             dst.write(json.dumps(record, ensure_ascii=True))
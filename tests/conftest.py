@@ -11,13 +11,14 @@ import os
 os.environ.setdefault("TOKENIZER_FALLBACK_ENABLED", "true")
 os.environ.setdefault("REDIS_URL", "")
 os.environ.setdefault("NAVI_DISABLE_LLM", "true")
+os.environ.setdefault("WORKSPACE_SNAPSHOT_DIR", "")
 
 import pytest  # noqa: E402
 import subprocess  # noqa: E402
 import sys  # noqa: E402
 from pathlib import Path  # noqa: E402
 from httpx import Client  # noqa: E402
-from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
 from sqlalchemy.orm import sessionmaker, Session  # noqa: E402
 
 # Add backend to path
@@ -177,6 +178,41 @@ def other_org_client():
         yield client
 
 
+@pytest.fixture
+def memory_search_db():
+    """In-memory SQLite session with the memory_object/memory_chunk search schema"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+            CREATE TABLE memory_object (
+                id INTEGER PRIMARY KEY, org_id TEXT NOT NULL, source TEXT NOT NULL,
+                foreign_id TEXT NOT NULL, title TEXT, url TEXT, lang TEXT, meta_json TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (org_id, source, foreign_id)
+            )"""
+            )
+        )
+        conn.execute(
+            text(
+                """
+            CREATE TABLE memory_chunk (
+                id INTEGER PRIMARY KEY, object_id INTEGER REFERENCES memory_object(id),
+                seq INTEGER NOT NULL DEFAULT 0, text TEXT NOT NULL, embedding BLOB,
+                vec_codec SMALLINT, vec_dim INTEGER, hash TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )"""
+            )
+        )
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
 # Test utilities
 def assert_response_ok(response, expected_status=200):
     """Assert response status and return JSON"""
@@ -0,0 +1,84 @@
+"""Tests for the shared-connection fan-out in RedisBroadcaster (fakeredis)."""
+
+import asyncio
+
+import pytest
+
+from backend.core.settings import settings
+from backend.infra.broadcast.redis import RedisBroadcaster
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+async def bc():
+    bc = RedisBroadcaster("redis://fake")
+    bc._pool = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield bc
+    await bc.close()
+
+
+async def _collect(bc, channel, collected, count, ready):
+    async for msg in bc.subscribe(channel):
+        collected.append(msg)
+        if len(collected) >= count:
+            break
+    ready.set()
+
+
+async def _wait_subscribed(bc, channel, subscribers):
+    for _ in range(200):
+        if len(bc._channels.get(channel, ())) == subscribers:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"{channel} never reached {subscribers} subscribers")
+
+
+async def test_many_subscribers_share_one_connection(bc):
+    results = [[] for _ in range(50)]
+    done = [asyncio.Event() for _ in results]
+    tasks = [
+        asyncio.create_task(_collect(bc, "plan:a", out, 2, ev))
+        for out, ev in zip(results, done)
+    ]
+    await _wait_subscribed(bc, "plan:a", 50)
+
+    await bc.publish("plan:a", "one")
+    await bc.publish("plan:b", "other plan")
+    await bc.publish("plan:a", "two")
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=5)
+
+    assert all(out == ["one", "two"] for out in results)
+    assert bc._pubsub is not None and set(bc._pubsub.channels) == {"plan:a"}
+
+
+async def test_last_subscriber_out_unsubscribes_channel(bc):
+    done = asyncio.Event()
+    task = asyncio.create_task(_collect(bc, "plan:x", [], 1, done))
+    await _wait_subscribed(bc, "plan:x", 1)
+
+    await bc.publish("plan:x", "bye")
+    await asyncio.wait_for(task, timeout=5)
+    for _ in range(200):
+        if "plan:x" not in bc._channels:
+            break
+        await asyncio.sleep(0.005)
+
+    assert "plan:x" not in bc._channels
+    assert not bc._pubsub.channels
+
+
+async def test_slow_subscriber_keeps_newest_messages(bc, monkeypatch):
+    monkeypatch.setattr(settings, "BROADCAST_SUBSCRIBER_QUEUE_SIZE", 3)
+    stream = bc.subscribe("plan:slow")
+    first = asyncio.ensure_future(stream.__anext__())
+    await _wait_subscribed(bc, "plan:slow", 1)
+
+    # Fan out directly: the subscriber does not read in between
+    for i in range(6):
+        bc._fan_out("plan:slow", str(i))
+
+    received = [await first] + [await stream.__anext__() for _ in range(2)]
+    await stream.aclose()
+
+    assert received == ["3", "4", "5"]
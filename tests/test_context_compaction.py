@@ -0,0 +1,194 @@
+"""Tests for token-budgeted compaction of agent message histories."""
+
+import json
+
+from backend.services.context_compaction import (
+    ELIDED_PREFIX,
+    SUMMARY_HEADER,
+    SUMMARY_SEPARATOR,
+    ConversationCompactor,
+)
+
+BIG = "line of build output\n" * 100
+
+
+def _anthropic_history(turns):
+    messages = [{"role": "user", "content": "Fix the failing build"}]
+    for i in range(turns):
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": f"Reading file {i}"},
+                    {
+                        "type": "tool_use",
+                        "id": f"t{i}",
+                        "name": "read_file",
+                        "input": {"path": f"src/f{i}.py"},
+                    },
+                ],
+            }
+        )
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": f"t{i}",
+                        "content": json.dumps({"content": BIG}),
+                    }
+                ],
+            }
+        )
+    return messages
+
+
+def _openai_history(turns):
+    messages = [
+        {"role": "system", "content": "You are NAVI."},
+        {"role": "user", "content": "Fix the failing build"},
+    ]
+    for i in range(turns):
+        messages.append(
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "id": f"c{i}",
+                        "type": "function",
+                        "function": {
+                            "name": "run_command",
+                            "arguments": json.dumps({"command": f"make {i}"}),
+                        },
+                    }
+                ],
+            }
+        )
+        messages.append({"role": "tool", "tool_call_id": f"c{i}", "content": BIG})
+    return messages
+
+
+def _assert_tool_pairs(messages):
+    for prev, message in zip(messages, messages[1:]):
+        content = message.get("content")
+        if isinstance(content, list):
+            ids = {b["tool_use_id"] for b in content if b.get("type") == "tool_result"}
+            blocks = prev.get("content")
+            calls = {
+                b["id"]
+                for b in (blocks if isinstance(blocks, list) else [])
+                if b.get("type") == "tool_use"
+            }
+            assert ids <= calls
+    open_calls = set()
+    for message in messages:
+        if message["role"] == "tool":
+            assert message["tool_call_id"] in open_calls
+        else:
+            open_calls = {c["id"] for c in message.get("tool_calls") or []}
+
+
+def _assert_roles_alternate(messages):
+    roles = [m["role"] for m in messages if m["role"] != "system"]
+    assert all(a != b for a, b in zip(roles, roles[1:])), roles
+
+
+def _summary(message):
+    text, _, summary = message["content"].partition(SUMMARY_SEPARATOR)
+    assert text == "Fix the failing build"
+    assert summary.startswith(SUMMARY_HEADER)
+    return summary
+
+
+def _compactor(messages, **kwargs):
+    probe = ConversationCompactor()
+    budget = probe.count_messages(messages)
+    return ConversationCompactor(budget_tokens=budget, **kwargs)
+
+
+def test_history_under_watermark_is_untouched():
+    messages = _anthropic_history(3)
+    before = list(messages)
+    stats = ConversationCompactor(budget_tokens=10**7).compact(messages)
+
+    assert not stats.compacted
+    assert all(a is b for a, b in zip(messages, before))
+
+
+def test_stale_tool_outputs_are_stubbed_with_a_refetch_reference():
+    messages = _anthropic_history(10)
+    first, recent = messages[0], messages[-4:]
+    compactor = _compactor(messages, keep_recent=4)
+    stats = compactor.compact(messages)
+
+    assert stats.compacted and stats.elided_outputs > 0
+    assert stats.tokens_after <= compactor.budget_tokens * compactor.low_watermark
+    assert stats.tokens_after == compactor.count_messages(messages)
+    assert compactor.total_tokens_saved == stats.tokens_saved
+    assert messages[0] is first
+    assert all(a is b for a, b in zip(messages[-4:], recent))
+    stub = messages[2]["content"][0]["content"]
+    assert stub.startswith(ELIDED_PREFIX)
+    assert "read_file" in stub and "src/f0.py" in stub
+    _assert_tool_pairs(messages)
+
+
+def test_old_turns_fold_into_an_incremental_summary():
+    messages = _anthropic_history(12)
+    compactor = _compactor(messages, keep_recent=2, low_watermark=0.05)
+    stats = compactor.compact(messages)
+
+    assert stats.summarized_messages > 0
+    assert messages[0]["role"] == "user"
+    summary = _summary(messages[0])
+    assert "called read_file" in summary
+    assert messages[1]["role"] == "assistant"
+    _assert_roles_alternate(messages)
+    _assert_tool_pairs(messages)
+    first_lines = summary.split("\n")[1:]
+
+    # New turns push the history over budget again: the summary is extended
+    more = _anthropic_history(24)[25:]
+    messages.extend(more)
+    compactor.compact(messages)
+
+    summaries = [
+        m
+        for m in messages
+        if isinstance(m["content"], str) and SUMMARY_HEADER in m["content"]
+    ]
+    assert summaries == [messages[0]]
+    lines = _summary(messages[0]).split("\n")[1:]
+    assert lines[: len(first_lines)] == first_lines
+    assert len(lines) > len(first_lines)
+    _assert_roles_alternate(messages)
+    _assert_tool_pairs(messages)
+
+
+def test_openai_tool_messages_are_compacted_in_pairs():
+    messages = _openai_history(10)
+    compactor = _compactor(messages, keep_recent=2, low_watermark=0.1)
+    stats = compactor.compact(messages)
+
+    assert stats.compacted
+    assert messages[0]["role"] == "system" and messages[1]["role"] == "user"
+    stubs = [m for m in messages if m["role"] == "tool"]
+    assert any(m["content"].startswith(ELIDED_PREFIX) for m in stubs) or (
+        stats.summarized_messages > 0
+    )
+    _assert_roles_alternate(messages)
+    _assert_tool_pairs(messages)
+
+
+def test_summary_is_capped():
+    messages = _anthropic_history(40)
+    compactor = _compactor(
+        messages, keep_recent=2, low_watermark=0.01, summary_max_tokens=200
+    )
+    compactor.compact(messages)
+
+    summary = _summary(messages[0])
+    assert compactor.count_text(summary) <= 200 + 10
+    assert "(older steps omitted)" in summary
+    _assert_roles_alternate(messages)
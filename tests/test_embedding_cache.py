@@ -0,0 +1,109 @@
+"""Tests for the shared tiered embedding cache."""
+
+import numpy as np
+import pytest
+
+from backend.services import embedding_cache
+from backend.services.embedding_cache import EmbeddingCache, cache_key
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    embedding_cache.reset_embedding_cache()
+    yield
+    embedding_cache.reset_embedding_cache()
+
+
+def _vec(seed, dim=4):
+    return np.random.default_rng(seed).normal(size=dim).astype(np.float32).tolist()
+
+
+def test_keys_separate_models_and_dimensions():
+    assert cache_key("m1", 4, "hello") != cache_key("m2", 4, "hello")
+    assert cache_key("m1", 4, "hello") != cache_key("m1", 8, "hello")
+    assert cache_key("m1", 4, "hello") == cache_key("m1", 4, "hello")
+
+
+def test_get_or_embed_only_embeds_misses_once():
+    cache = EmbeddingCache(max_memory_bytes=1 << 20)
+    calls = []
+
+    def embed(texts):
+        calls.append(list(texts))
+        return [_vec(len(t)) for t in texts]
+
+    first = cache.get_or_embed("m", 4, ["a", "bb", "a"], embed)
+    second = cache.get_or_embed("m", 4, ["bb", "ccc"], embed)
+
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert first[0] == first[2]
+    assert second[0] == pytest.approx(first[1])
+
+
+def test_memory_tier_evicts_least_recently_used_by_bytes():
+    entry = 4 * 4 + embedding_cache.ENTRY_OVERHEAD_BYTES
+    cache = EmbeddingCache(max_memory_bytes=2 * entry)
+    cache.put_many("m", 4, ["a", "b"], [_vec(1), _vec(2)])
+    cache.get_many("m", 4, ["a"])  # touch "a" so "b" is evicted next
+    cache.put_many("m", 4, ["c"], [_vec(3)])
+
+    hits = cache.get_many("m", 4, ["a", "b", "c"])
+    assert [h is not None for h in hits] == [True, False, True]
+    assert cache.memory.bytes == 2 * entry
+
+
+def test_zero_vectors_are_not_cached():
+    cache = EmbeddingCache(max_memory_bytes=1 << 20)
+    cache.put_many("m", 4, ["failed"], [[0.0] * 4])
+    assert cache.get_many("m", 4, ["failed"]) == [None]
+
+
+def test_sql_tier_survives_restart_and_promotes_to_memory(tmp_path):
+    url = f"sqlite:///{tmp_path / 'cache' / 'embeddings.db'}"
+    vector = _vec(7)
+    EmbeddingCache(max_memory_bytes=1 << 20, db_url=url).put_many(
+        "m", 4, ["persisted"], [vector]
+    )
+
+    restarted = EmbeddingCache(max_memory_bytes=1 << 20, db_url=url)
+    (hit,) = restarted.get_many("m", 4, ["persisted"])
+
+    assert hit.tolist() == pytest.approx(vector)
+    assert len(restarted.memory) == 1
+
+
+def test_unreachable_tier_is_bypassed():
+    cache = EmbeddingCache(
+        max_memory_bytes=1 << 20, db_url="postgresql://nobody@127.0.0.1:1/none"
+    )
+    vectors = cache.get_or_embed("m", 4, ["x"], lambda texts: [_vec(1)])
+
+    assert vectors[0] == pytest.approx(_vec(1))
+    assert not cache.remote_tiers[0].available()
+
+
+async def test_embedding_service_shares_process_cache(monkeypatch):
+    from backend.core.config import settings
+    from backend.services.memory.embedding_service import EmbeddingService
+
+    monkeypatch.setattr(settings, "embedding_cache_db_url", "")
+    # Avoid downloading tokenizer files
+    monkeypatch.setattr(EmbeddingService, "truncate_text", lambda self, t: t)
+    requests = []
+
+    class FakeEmbeddings:
+        def create(self, model, input, dimensions):
+            requests.append(list(input))
+            data = [type("D", (), {"embedding": _vec(len(t))}) for t in input]
+            return type("R", (), {"data": data})
+
+    first = EmbeddingService(model="m", dimensions=4)
+    first._client = type("C", (), {"embeddings": FakeEmbeddings()})
+    second = EmbeddingService(model="m", dimensions=4)
+    second._client = first._client
+
+    await first.embed_texts(["alpha", "beta"])
+    vectors = await second.embed_texts(["beta", "gamma"])
+
+    assert requests == [["alpha", "beta"], ["gamma"]]
+    assert vectors[0] == pytest.approx(_vec(4))
@@ -0,0 +1,158 @@
+"""Tests for GraphBuilder candidate generation and bulk edge inserts."""
+
+import itertools
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.models.memory_graph import (
+    Base,
+    MemoryEdge,
+    MemoryNode,
+    NodeKind,
+)
+from backend.workers.graph_builder import GraphBuilder
+
+ORG = "org-1"
+T0 = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=3)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _node(db, kind, foreign_id, title="", hours=0, meta=None):
+    node = MemoryNode(
+        org_id=ORG,
+        kind=kind.value,
+        foreign_id=foreign_id,
+        title=title,
+        meta_json=meta or {},
+        created_at=T0 + timedelta(hours=hours),
+    )
+    db.add(node)
+    return node
+
+
+def _seed(db):
+    _node(db, NodeKind.JIRA_ISSUE, "ENG-1", "Checkout latency regression")
+    _node(db, NodeKind.JIRA_ISSUE, "ENG-2", "Unrelated issue")
+    _node(db, NodeKind.PR, "#10", "ENG-1 cache checkout pricing lookups")
+    _node(db, NodeKind.PR, "#11", "Fixes #10 follow-up, closes ENG-2")
+    _node(db, NodeKind.PR, "#12", "Revert #11 broke deploys")
+    _node(
+        db,
+        NodeKind.MEETING,
+        "mtg-1",
+        "checkout pricing cache latency review",
+        hours=-2,
+    )
+    _node(
+        db,
+        NodeKind.DOC,
+        "doc-far",
+        "checkout pricing cache latency notes",
+        hours=200,
+    )
+    _node(db, NodeKind.SLACK_THREAD, "s-1", "root", meta={"ts": "100.1"})
+    _node(
+        db,
+        NodeKind.SLACK_THREAD,
+        "s-2",
+        "reply",
+        meta={"ts": "100.2", "thread_ts": "100.1"},
+    )
+    _node(db, NodeKind.SLACK_THREAD, "s-3", "no thread metadata")
+    _node(db, NodeKind.SLACK_THREAD, "s-4", "no thread metadata either")
+    db.commit()
+
+
+def _edge_keys(db):
+    return {
+        (e.src_id, e.dst_id, e.relation, e.meta_json["heuristic"])
+        for e in db.query(MemoryEdge).all()
+    }
+
+
+def test_candidates_match_pairwise_heuristics(db):
+    _seed(db)
+    builder = GraphBuilder(db, ai_service=None)
+    nodes = db.query(MemoryNode).all()
+
+    expected = set()
+    for n1, n2 in itertools.combinations(nodes, 2):
+        for edge in builder._apply_heuristics(n1, n2):
+            # Slack nodes without thread metadata no longer match on None
+            src = n1 if edge["src_id"] == n1.id else n2
+            if edge["meta"]["heuristic"] == "slack_thread_reply" and not (
+                src.meta_json.get("thread_ts")
+            ):
+                continue
+            expected.add(
+                (
+                    edge["src_id"],
+                    edge["dst_id"],
+                    edge["relation"],
+                    edge["meta"]["heuristic"],
+                )
+            )
+
+    created = builder._create_edges_batch(ORG, T0 - timedelta(days=1))
+
+    assert created == len(expected)
+    assert _edge_keys(db) == expected
+    heuristics = {key[3] for key in expected}
+    assert heuristics == {
+        "jira_key_match",
+        "pr_fixes",
+        "commit_revert",
+        "temporal_adjacency",
+        "slack_thread_reply",
+    }
+
+
+def test_candidate_pairs_skip_unrelated_nodes(db):
+    _seed(db)
+    for i in range(50):
+        _node(db, NodeKind.DOC, f"doc-{i}", f"standalone topic{i} writeup")
+    db.commit()
+    builder = GraphBuilder(db, ai_service=None)
+    nodes = db.query(MemoryNode).all()
+
+    pairs = builder._candidate_pairs(nodes)
+
+    assert len(pairs) < 10
+    assert all(i < j for i, j in pairs)
+
+
+def test_rebuild_does_not_duplicate_edges(db):
+    _seed(db)
+    builder = GraphBuilder(db, ai_service=None)
+    since = T0 - timedelta(days=1)
+
+    first = builder._create_edges_batch(ORG, since)
+    second = builder._create_edges_batch(ORG, since)
+
+    assert first > 0
+    assert second == 0
+    assert db.query(MemoryEdge).count() == first
+
+
+def test_attach_edges_for_counts_only_new_edges(db):
+    _seed(db)
+    builder = GraphBuilder(db, ai_service=None)
+    pr = db.query(MemoryNode).filter_by(foreign_id="#11").one()
+
+    created = builder.attach_edges_for(pr.id)
+
+    assert created > 0
+    assert builder.attach_edges_for(pr.id) == 0
+    assert db.query(MemoryEdge).count() == created
@@ -0,0 +1,117 @@
+"""Tests for the shared outbound HTTP client pools."""
+
+import datetime as dt
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from backend.services import http_client as hc
+
+
+@pytest.fixture
+def seen(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    registry = hc.HttpClientRegistry(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(hc, "registry", registry)
+    yield requests
+
+
+async def test_pools_are_shared_per_host(seen):
+    async with hc.http_client() as a:
+        await a.get("https://api.example.com/one")
+    async with hc.http_client() as b:
+        await b.get("https://api.example.com/two")
+        await b.get("https://other.example.com/")
+
+    pool = hc.registry.pool("api.example.com")
+    assert not pool.is_closed  # leaving "async with" does not close the pool
+    assert pool is hc.registry.pool("api.example.com")
+    assert pool is not hc.registry.pool("other.example.com")
+    assert len(seen) == 3
+
+
+async def test_explicit_key_shares_one_pool_across_hosts(seen):
+    client = hc.http_client("llm")
+    await client.get("https://a.example.com/")
+    await client.get("https://b.example.com/")
+
+    assert hc.registry.pool("llm") is hc.registry.pool("llm")
+    assert [r.url.host for r in seen] == ["a.example.com", "b.example.com"]
+
+
+async def test_scoped_options_apply_per_request(seen):
+    client = hc.http_client(
+        base_url="https://api.example.com/v1/",
+        headers={"Authorization": "Bearer t", "X-A": "1"},
+        timeout=12.0,
+    )
+    await client.post("/items", json={}, headers={"X-A": "2"})
+    await client.get("https://elsewhere.example.com/abs")
+
+    first, second = seen
+    assert str(first.url) == "https://api.example.com/v1/items"
+    assert first.headers["authorization"] == "Bearer t"
+    assert first.headers["x-a"] == "2"
+    assert first.extensions["timeout"]["read"] == 12.0
+    assert second.url.host == "elsewhere.example.com"
+
+
+async def test_stream_uses_shared_pool(seen):
+    client = hc.http_client(base_url="https://api.example.com")
+    async with client.stream("GET", "/events") as resp:
+        body = await resp.aread()
+    assert resp.status_code == 200 and b"ok" in body
+    assert str(seen[0].url) == "https://api.example.com/events"
+
+
+async def test_close_http_clients_closes_loop_pools(seen):
+    await hc.http_client().get("https://api.example.com/")
+    pool = hc.registry.pool("api.example.com")
+
+    await hc.close_http_clients()
+
+    assert pool.is_closed
+    assert hc.registry.pool("api.example.com") is not pool
+
+
+def test_worker_runs_close_their_pools(seen, monkeypatch):
+    from backend.workers import integrations
+
+    built = []
+    build = hc.registry._build
+
+    def record(key, max_connections):
+        client = build(key, max_connections)
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(hc.registry, "_build", record)
+    conn = SimpleNamespace(
+        id="c1", access_token="t", cloud_base_url="https://jira.example.com"
+    )
+    cfg = SimpleNamespace(
+        project_keys=["AEP"], last_sync_at=dt.datetime.now(dt.timezone.utc)
+    )
+    db = SimpleNamespace(
+        get=lambda *a: conn,
+        scalar=lambda *a: cfg,
+        commit=lambda: None,
+        close=lambda: None,
+    )
+    monkeypatch.setattr(integrations, "SessionLocal", lambda: db)
+    monkeypatch.setattr(integrations, "decrypt_token", lambda token: token)
+
+    # Each actor invocation runs anyio.run on a new event loop
+    integrations.jira_sync.fn("c1")
+    integrations.jira_sync.fn("c1")
+
+    assert len(seen) == 2
+    assert len(built) == 2
+    assert all(client.is_closed for client in built)
+    assert len(hc.registry._pools) == 0
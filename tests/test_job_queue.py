@@ -0,0 +1,202 @@
+"""Tests for the Redis priority job queue: ordering, fairness, delays and leases."""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from backend.core.performance import (  # noqa: E402
+    BackgroundWorker,
+    Job,
+    JobContext,
+    JobPriority,
+    JobStatus,
+    RedisJobQueue,
+)
+from backend.core.tenancy import TenantContext  # noqa: E402
+
+
+@pytest.fixture
+def queue():
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return RedisJobQueue(client, lease_seconds=30)
+
+
+def _job(org="org-1", type="build", priority=JobPriority.NORMAL, **payload):
+    tenant = TenantContext(
+        org_id=org,
+        user_id="u-1",
+        roles=[],
+        permissions=[],
+        session_id="s-1",
+        encryption_key_id=f"org-{org}-key",
+    )
+    return Job(
+        id=str(uuid.uuid4()),
+        type=type,
+        priority=priority,
+        status=JobStatus.PENDING,
+        payload=payload,
+        context=JobContext(
+            job_id=str(uuid.uuid4()), org_id=org, user_id="u-1", tenant_context=tenant
+        ),
+    )
+
+
+async def _drain(queue, job_type="build"):
+    ids = []
+    while (job := await queue.dequeue(job_type)) is not None:
+        ids.append(job.id)
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_priority_order_with_fifo_within_priority(queue):
+    low = _job(priority=JobPriority.LOW)
+    first = _job()
+    second = _job()
+    critical = _job(priority=JobPriority.CRITICAL)
+    for job in (low, first, second, critical):
+        assert await queue.enqueue(job)
+
+    assert await _drain(queue) == [critical.id, first.id, second.id, low.id]
+
+
+@pytest.mark.asyncio
+async def test_orgs_share_workers_by_weight(queue):
+    await queue.set_org_weight("big", 2)
+    big = [_job(org="big") for _ in range(6)]
+    small = [_job(org="small") for _ in range(6)]
+    # The big org floods the queue first; the small org still gets a share
+    for job in big + small:
+        await queue.enqueue(job)
+
+    order = await _drain(queue)
+    small_ids = {job.id for job in small}
+    assert sum(job_id in small_ids for job_id in order[:6]) == 2
+    assert len(order) == 12
+
+
+@pytest.mark.asyncio
+async def test_delayed_job_waits_until_due(queue):
+    job = _job()
+    job.scheduled_for = datetime.utcnow() + timedelta(seconds=0.3)
+    await queue.enqueue(job)
+
+    assert await queue.dequeue("build") is None
+    assert (await queue.get_queue_stats("org-1"))["delayed"] == 1
+
+    started = time.monotonic()
+    leased = await queue.dequeue("build", timeout=2)
+    assert leased is not None and leased.id == job.id
+    assert 0.1 < time.monotonic() - started < 1.5
+
+
+@pytest.mark.asyncio
+async def test_blocking_dequeue_wakes_on_enqueue(queue):
+    await queue.enqueue(_job())
+    await queue.dequeue("build")
+    job = _job()
+
+    async def later():
+        await asyncio.sleep(0.2)
+        await queue.enqueue(job)
+
+    producer = asyncio.create_task(later())
+    leased = await queue.dequeue("build", timeout=2)
+    await producer
+    assert leased is not None and leased.id == job.id
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed_to_front(queue):
+    queue.lease_seconds = 0.1
+    stuck = _job()
+    waiting = _job()
+    await queue.enqueue(stuck)
+    await queue.enqueue(waiting)
+    assert (await queue.dequeue("build")).id == stuck.id
+
+    await asyncio.sleep(0.2)
+    assert await queue.heartbeat(stuck.id)  # lease still present until reclaimed
+    await asyncio.sleep(0.2)
+    assert await queue.reclaim_expired() == 1
+    assert not await queue.heartbeat(stuck.id)
+    assert (await queue.get_job(stuck.id)).status == JobStatus.PENDING
+    assert await _drain(queue) == [stuck.id, waiting.id]
+
+
+@pytest.mark.asyncio
+async def test_job_failing_its_worker_repeatedly_is_failed(queue):
+    queue.lease_seconds = 0.01
+    job = _job()
+    job.context.max_retries = 1
+    await queue.enqueue(job)
+
+    for _ in range(2):
+        assert (await queue.dequeue("build")).id == job.id
+        await asyncio.sleep(0.05)
+        assert await queue.reclaim_expired() == 1
+
+    assert (await queue.get_job(job.id)).status == JobStatus.FAILED
+    stats = await queue.get_queue_stats("org-1")
+    assert stats["failed"] == 1 and stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stats_track_job_lifecycle(queue):
+    done, dropped, waiting = _job(), _job(), _job()
+    for job in (done, dropped, waiting):
+        await queue.enqueue(job)
+    await queue.dequeue("build")
+    await queue.update_job_status(done.id, JobStatus.COMPLETED, result={"ok": 1})
+    await queue.update_job_status(dropped.id, JobStatus.CANCELLED)
+
+    stats = await queue.get_queue_stats("org-1")
+    assert stats == {
+        "pending": 1,
+        "delayed": 0,
+        "processing": 0,
+        "completed": 1,
+        "failed": 0,
+        "cancelled": 1,
+    }
+    assert (await queue.get_job(done.id)).result == {"ok": 1}
+    assert await _drain(queue) == [waiting.id]
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_jobs_concurrently(queue):
+    running = 0
+    peak = 0
+
+    async def handler(payload):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.1)
+        running -= 1
+        return {"n": payload["n"]}
+
+    jobs = [_job(n=i) for i in range(4)]
+    for job in jobs:
+        await queue.enqueue(job)
+    worker = BackgroundWorker(
+        queue, {"build": handler}, concurrency=4, poll_timeout=0.1
+    )
+    task = asyncio.create_task(worker.start())
+
+    for _ in range(50):
+        if (await queue.get_queue_stats("org-1"))["completed"] == 4:
+            break
+        await asyncio.sleep(0.05)
+    worker.stop()
+    await asyncio.wait_for(task, 2)
+
+    assert peak == 4
+    assert (await queue.get_job(jobs[2].id)).result == {"n": 2}
@@ -0,0 +1,147 @@
+"""Tests for counter-based sequence allocation, snapshots and the resume buffer."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.eventstore import service
+from backend.core.eventstore.buffer import RecentEventBuffer
+from backend.core.eventstore.models import PlanEvent, PlanEventCounter, PlanSnapshot
+from backend.core.settings import settings
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    for table in (
+        PlanEvent.__table__,
+        PlanEventCounter.__table__,
+        PlanSnapshot.__table__,
+    ):
+        table.create(bind=engine)
+    # Tables are created above; skip the shared-test-db reset hook
+    monkeypatch.setattr(service, "_prepare_sqlite_test_tables", lambda *a: None)
+    monkeypatch.setattr(
+        service,
+        "recent_events",
+        RecentEventBuffer(settings.PLAN_EVENT_BUFFER_SIZE, 16),
+    )
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _append(db, plan_id, n, type="step", org_key="org-1"):
+    return service.append_events(
+        db,
+        plan_id=plan_id,
+        events=[(type, {"n": i}) for i in range(n)],
+        user_sub="u-1",
+        org_key=org_key,
+    )
+
+
+def test_batch_append_allocates_contiguous_sequences(db):
+    first = service.append_event(
+        db, plan_id="p1", type="note", payload={}, user_sub=None, org_key=None
+    )
+    batch = _append(db, "p1", 3)
+    db.commit()
+
+    assert first.seq == 1
+    assert [e.seq for e in batch] == [2, 3, 4]
+    assert db.get(PlanEventCounter, "p1").last_seq == 4
+    assert service.get_plan_event_count(db, "p1") == 4
+
+
+def test_counter_is_seeded_from_existing_events(db):
+    db.add(PlanEvent(plan_id="p1", seq=7, type="step", payload={}))
+    db.commit()
+
+    assert _append(db, "p1", 1)[0].seq == 8
+
+
+def test_resume_is_served_from_buffer_after_commit(db, monkeypatch):
+    _append(db, "p1", 5)
+    db.commit()
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("resume should not query plan_events")
+
+    real_execute = db.execute
+    monkeypatch.setattr(
+        db,
+        "execute",
+        lambda stmt, *a, **kw: (
+            no_scan()
+            if "plan_events" in str(stmt) and "counters" not in str(stmt)
+            else real_execute(stmt, *a, **kw)
+        ),
+    )
+    events = service.replay(db, plan_id="p1", since_seq=2, org_key="org-1")
+    assert [e.seq for e in events] == [3, 4, 5]
+    assert events[0].payload == {"n": 2}
+
+
+def test_rolled_back_events_are_not_buffered(db):
+    _append(db, "p1", 2)
+    db.commit()
+    _append(db, "p1", 2)
+    db.rollback()
+
+    assert service.recent_events.since("p1", 0, 2) is not None
+    assert [e.seq for e in service.replay(db, plan_id="p1", since_seq=0)] == [1, 2]
+    assert _append(db, "p1", 1)[0].seq == 3
+
+
+def test_replay_falls_back_to_db_when_buffer_has_gap(db):
+    _append(db, "p1", 3)
+    db.commit()
+    service.recent_events.clear()
+
+    events = service.replay(db, plan_id="p1", since_seq=1)
+    assert [e.seq for e in events] == [2, 3]
+
+
+def test_replay_filters_buffered_events_by_org(db):
+    _append(db, "p1", 2, org_key="org-1")
+    db.commit()
+
+    assert service.replay(db, plan_id="p1", since_seq=0, org_key="org-2") == []
+
+
+def test_snapshot_written_every_interval(db, monkeypatch):
+    monkeypatch.setattr(settings, "PLAN_EVENT_SNAPSHOT_INTERVAL", 4)
+    _append(db, "p1", 3)
+    _append(db, "p1", 2)
+    service.append_event(
+        db, plan_id="p1", type="archive", payload={}, user_sub=None, org_key="org-1"
+    )
+    db.commit()
+
+    snap = service.latest_snapshot(db, "p1")
+    assert snap is not None and snap.seq == 5
+    assert len(snap.state["steps"]) == 5
+
+    state = service.plan_state(db, "p1", org_key="org-1")
+    assert state["seq"] == 6
+    assert state["archived"] is True
+    assert state["event_counts"] == {"step": 5, "archive": 1}
+
+
+def test_buffer_evicts_least_recently_written_plan():
+    buf = RecentEventBuffer(per_plan=2, max_plans=2)
+    for plan_id in ("a", "b", "c"):
+        buf.add([PlanEvent(plan_id=plan_id, seq=1, type="t", payload={})])
+
+    assert buf.since("a", 0, 1) is None
+    assert buf.since("c", 0, 1) is not None
+
+
+def test_buffer_keeps_only_newest_events_per_plan():
+    buf = RecentEventBuffer(per_plan=2, max_plans=4)
+    buf.add([PlanEvent(plan_id="a", seq=s, type="t", payload={}) for s in (3, 1, 2)])
+
+    assert buf.since("a", 0, 3) is None
+    assert [e.seq for e in buf.since("a", 1, 3)] == [2, 3]
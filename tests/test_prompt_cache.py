@@ -0,0 +1,185 @@
+"""Tests for prompt-cache breakpoints, adapter payloads and cache-token accounting."""
+
+import json
+
+import httpx
+import pytest
+
+from backend.services import http_client as hc
+from backend.services import prompt_cache
+from backend.services.llm_client import LLMClient, LLMMessage
+from backend.services.token_tracking import CostCalculator, TokenTracker, TokenUsage
+
+TOOLS = [
+    {"name": "write_file", "input_schema": {"type": "object"}},
+    {"name": "read_file", "input_schema": {"type": "object"}},
+]
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        if request.url.path.endswith("/messages"):
+            return httpx.Response(
+                200,
+                json={
+                    "content": [{"type": "text", "text": "ok"}],
+                    "stop_reason": "end_turn",
+                    "usage": {
+                        "input_tokens": 12,
+                        "output_tokens": 3,
+                        "cache_read_input_tokens": 2048,
+                        "cache_creation_input_tokens": 40,
+                    },
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": 3000,
+                    "completion_tokens": 5,
+                    "prompt_tokens_details": {"cached_tokens": 2944},
+                },
+            },
+        )
+
+    registry = hc.HttpClientRegistry(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(hc, "registry", registry)
+    return requests
+
+
+def test_breakpoints_on_tools_static_system_and_last_turn():
+    history = [
+        {"role": "user", "content": "fix the build"},
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "{}"}],
+        },
+    ]
+    parts = prompt_cache.anthropic_request_parts(
+        ["static prompt", "retrieved context"], TOOLS, history
+    )
+
+    assert [t["name"] for t in parts["tools"]] == ["read_file", "write_file"]
+    assert "cache_control" in parts["tools"][-1]
+    assert "cache_control" not in parts["tools"][0]
+    assert parts["system"][0]["cache_control"] == prompt_cache.EPHEMERAL
+    assert "cache_control" not in parts["system"][1]
+    assert parts["messages"][-1]["content"][-1]["cache_control"]
+    assert parts["messages"][0] is history[0]
+    # The caller's history never accumulates breakpoints
+    assert "cache_control" not in history[-1]["content"][-1]
+    assert "cache_control" not in TOOLS[0] and "cache_control" not in TOOLS[1]
+
+
+def test_string_content_becomes_a_marked_text_block():
+    marked = prompt_cache.anthropic_messages([{"role": "user", "content": "hi"}])
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "hi", "cache_control": prompt_cache.EPHEMERAL}
+    ]
+    assert prompt_cache.anthropic_messages([{"role": "user", "content": ""}]) == [
+        {"role": "user", "content": ""}
+    ]
+
+
+def test_prompt_cache_key_is_stable():
+    a = prompt_cache.prompt_cache_key("gpt-4o", "sys", [{"b": 1, "a": 2}])
+    b = prompt_cache.prompt_cache_key("gpt-4o", "sys", [{"a": 2, "b": 1}])
+    assert a == b
+    assert a != prompt_cache.prompt_cache_key("gpt-4o", "other", [])
+
+
+@pytest.mark.asyncio
+async def test_anthropic_adapter_sends_breakpoints_and_reports_cache_usage(captured):
+    client = LLMClient(
+        provider="anthropic",
+        model="claude-sonnet-4-20250514",
+        api_key="k",
+        prompt_cache=True,
+    )
+    tools = [
+        {"type": "function", "function": {"name": name, "parameters": {}}}
+        for name in ("search", "edit")
+    ]
+    response = await client.complete_with_tools(
+        [
+            LLMMessage(role="system", content="sys"),
+            LLMMessage(role="user", content="q"),
+        ],
+        tools,
+    )
+
+    payload = captured[0]
+    assert payload["system"] == [
+        {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert [t["name"] for t in payload["tools"]] == ["edit", "search"]
+    assert payload["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert payload["messages"][-1]["content"][-1]["cache_control"]
+    assert response.usage["cache_read_tokens"] == 2048
+    assert response.usage["cache_write_tokens"] == 40
+
+
+@pytest.mark.asyncio
+async def test_one_shot_calls_are_not_cached_by_default(captured):
+    client = LLMClient(
+        provider="anthropic",
+        model="claude-sonnet-4-20250514",
+        api_key="k",
+        system_prompt="sys",
+    )
+    await client.complete("q")
+
+    assert captured[0]["system"] == "sys"
+    assert "prompt_cache" not in captured[0]
+    assert captured[0]["messages"] == [{"role": "user", "content": "q"}]
+
+
+@pytest.mark.asyncio
+async def test_openai_adapter_sets_cache_key_and_reads_cached_tokens(captured):
+    client = LLMClient(
+        provider="openai",
+        model="gpt-4o",
+        api_key="k",
+        system_prompt="sys",
+        prompt_cache=True,
+    )
+    response = await client.complete("q")
+
+    assert len(captured[0]["prompt_cache_key"]) == 32
+    assert response.usage["cache_read_tokens"] == 2944
+
+
+def test_cache_tokens_are_priced_and_rolled_up(tmp_path):
+    usage = TokenUsage(
+        input_tokens=1_000_000, cache_read_tokens=1_000_000, cache_write_tokens=0
+    )
+    costs = CostCalculator.calculate("claude-3-5-sonnet-20241022", usage)
+    assert costs["input_cost"] == pytest.approx(3.00 + 0.30)
+    assert usage.total_tokens == 2_000_000
+
+    tracker = TokenTracker(storage_path=str(tmp_path))
+    try:
+        tracker.track(
+            "claude-3-5-sonnet-20241022",
+            "anthropic",
+            TokenUsage(input_tokens=10, cache_read_tokens=900, cache_write_tokens=50),
+            org_id="org-1",
+        )
+        tracker.flush()
+        reloaded = TokenTracker(storage_path=str(tmp_path))
+        try:
+            summary = reloaded.get_usage_summary(org_id="org-1")
+        finally:
+            reloaded.close()
+    finally:
+        tracker.close()
+
+    assert summary.total_cache_read_tokens == 900
+    assert summary.total_cache_write_tokens == 50
+    assert summary.total_tokens == 960
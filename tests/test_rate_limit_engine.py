@@ -0,0 +1,112 @@
+"""Tests for the atomic GCRA rate limiting script and its micro-batching."""
+
+import asyncio
+
+import pytest
+
+from backend.core.rate_limit.config import RateLimitCategory, RateLimitRule
+from backend.core.rate_limit.engine import GCRA_SCRIPT
+from backend.core.rate_limit.service import RateLimitService
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+class CountingRedis(fakeredis.aioredis.FakeRedis):
+    """FakeRedis that counts script round trips"""
+
+    script_calls = 0
+
+    async def evalsha(self, *args, **kwargs):
+        CountingRedis.script_calls += 1
+        return await super().evalsha(*args, **kwargs)
+
+
+@pytest.fixture
+async def service(monkeypatch):
+    CountingRedis.script_calls = 0
+    redis = CountingRedis(decode_responses=True)
+    await redis.script_load(GCRA_SCRIPT)
+    service = RateLimitService()
+
+    async def get_redis():
+        return redis
+
+    monkeypatch.setattr(service, "_get_redis", get_redis)
+    return service
+
+
+def _rule(rpm=5, burst=0, queue=100):
+    return RateLimitRule(
+        requests_per_minute=rpm,
+        requests_per_hour=rpm * 60,
+        burst_allowance=burst,
+        queue_depth_limit=queue,
+    )
+
+
+async def _check(service, rule, user="u1", org="o1"):
+    return await service.check_rate_limit(
+        user, org, RateLimitCategory.WRITE, override_rule=rule
+    )
+
+
+async def test_user_minute_limit_with_burst_is_one_round_trip_each(service):
+    rule = _rule(rpm=5, burst=2)
+
+    results = [await _check(service, rule) for _ in range(8)]
+
+    assert [r.allowed for r in results] == [True] * 7 + [False]
+    assert results[0].requests_remaining == 5
+    assert results[-1].retry_after >= 1
+    assert CountingRedis.script_calls == 8
+
+
+async def test_concurrent_checks_are_coalesced_and_exact(service):
+    rule = _rule(rpm=10)
+
+    results = await asyncio.gather(*[_check(service, rule) for _ in range(25)])
+
+    assert sum(r.allowed for r in results) == 10
+    assert [r.allowed for r in results[:10]] == [True] * 10
+    assert CountingRedis.script_calls == 1
+    remaining = [r.requests_remaining for r in results[:10]]
+    assert remaining == sorted(remaining, reverse=True)
+
+
+async def test_org_limit_scales_with_active_users(service, monkeypatch):
+    from backend.core.rate_limit.config import DEFAULT_RATE_LIMITS
+
+    # Org limit is 2/minute per active user, below the 4/minute user limit
+    monkeypatch.setattr(DEFAULT_RATE_LIMITS, "org_multiplier", 0.5)
+    rule = _rule(rpm=4)
+
+    alone = [await _check(service, rule, user="solo", org="small") for _ in range(4)]
+    assert [r.allowed for r in alone] == [True, True, False, False]
+
+    assert (await _check(service, rule, user="u1", org="team")).allowed
+    # Teammates seen via presence heartbeats raise the org's capacity
+    service.note_active_user("team", "u2")
+    service.note_active_user("team", "u3")
+    team = [await _check(service, rule, user="u1", org="team") for _ in range(4)]
+    assert [r.allowed for r in team] == [True, True, True, False]
+
+    redis = await service._get_redis()
+    current, _ = service._active_user_keys("team")
+    assert await redis.pfcount(current) == 3
+
+
+async def test_queue_depth_is_enforced_and_released_on_completion(service):
+    rule = _rule(rpm=100, queue=2)
+
+    first = [await _check(service, rule) for _ in range(3)]
+    assert [r.allowed for r in first] == [True, True, False]
+    assert first[1].queue_depth == 2
+
+    await service.record_request_completion("u1", "o1", RateLimitCategory.WRITE)
+    calls = CountingRedis.script_calls
+    result = await _check(service, rule)
+
+    assert result.allowed is True
+    # Completion was piggybacked on the next check, not a separate call
+    assert CountingRedis.script_calls == calls + 1
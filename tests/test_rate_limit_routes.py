@@ -0,0 +1,92 @@
+"""Tests for the precompiled route classifier used by RateLimitMiddleware."""
+
+from fastapi import FastAPI
+
+from backend.core.rate_limit.config import DEFAULT_RATE_LIMITS, RateLimitCategory
+from backend.core.rate_limit.routes import RouteClassifier, reload_overrides
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/api/plans/{plan_id}")
+    def get_plan(plan_id: str):
+        return {}
+
+    @app.get("/api/plans/search")
+    def search_plans():
+        return {}
+
+    @app.post("/api/plan/{plan_id}/presence/heartbeat")
+    def heartbeat(plan_id: str):
+        return {}
+
+    @app.get("/api/files/{path:path}")
+    def get_file(path: str):
+        return {}
+
+    @app.post("/api/feedback/{kind}")
+    def feedback(kind: str):
+        return {}
+
+    return app
+
+
+def _classifier(**kwargs):
+    classifier = RouteClassifier(**kwargs)
+    classifier.build(_app().routes)
+    return classifier
+
+
+def test_categories_come_from_route_templates():
+    routes = _classifier()
+
+    # A path parameter value cannot change the category of its route
+    assert routes.classify("GET", "/api/plans/export").category == (
+        RateLimitCategory.READ
+    )
+    # Literal segments win over parameters
+    assert routes.classify("GET", "/api/plans/search").category == (
+        RateLimitCategory.SEARCH
+    )
+    assert routes.classify("POST", "/api/plan/p1/presence/heartbeat").category == (
+        RateLimitCategory.PRESENCE
+    )
+    assert routes.classify("GET", "/api/files/a/b/report.txt").category == (
+        RateLimitCategory.UPLOAD
+    )
+
+
+def test_unmatched_paths_use_substring_rules():
+    routes = _classifier()
+
+    assert routes.classify("GET", "/health/live").skip
+    assert routes.classify("POST", "/auth/login").category == RateLimitCategory.AUTH
+    assert routes.classify("DELETE", "/unknown").category == RateLimitCategory.WRITE
+
+
+def test_concrete_path_cache_is_bounded():
+    routes = _classifier(cache_size=2)
+    for plan_id in ("a", "b", "c"):
+        routes.classify("GET", f"/api/plans/{plan_id}")
+
+    assert list(routes._cache) == [("GET", "/api/plans/b"), ("GET", "/api/plans/c")]
+
+
+def test_overrides_are_parsed_once_and_reloadable(monkeypatch):
+    monkeypatch.delenv("RL_FB_PM", raising=False)
+    monkeypatch.delenv("RL_FB_BURST", raising=False)
+    routes = _classifier()
+    rule = DEFAULT_RATE_LIMITS.user_rules[RateLimitCategory.WRITE]
+
+    before = routes.classify("POST", "/api/feedback/thumbs")
+    assert before.own_bucket and before.override.bucket_limit is None
+
+    monkeypatch.setenv("RL_FB_PM", "3")
+    monkeypatch.setenv("RL_FB_BURST", "1")
+    assert routes.classify("POST", "/api/feedback/thumbs") == before
+
+    reload_overrides()
+    after = routes.classify("POST", "/api/feedback/thumbs")
+    assert after.override.bucket_limit == 1
+    assert after.override.apply(rule).requests_per_minute == 1
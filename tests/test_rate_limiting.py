@@ -284,12 +284,11 @@ async def test_redis_integration():
         result = await service.check_rate_limit(user_id, org_id, category)
         assert result.allowed is True
 
-        # Verify request was recorded
+        # Verify request was recorded (key holds the GCRA arrival time)
         minute_user_key, _, _ = service._generate_keys(
             user_id, org_id, category, "minute"
         )
-        count = await redis.get(minute_user_key)
-        assert int(count or 0) >= 1
+        assert await redis.exists(minute_user_key)
 
     else:
         # Redis not available, test passed by using fallback
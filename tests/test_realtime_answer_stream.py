@@ -0,0 +1,132 @@
+"""Tests for push-based answer streaming (backfill + broadcaster publish)."""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.routers import realtime
+from backend.infra.broadcast import redis as redis_broadcast
+from backend.services import answers as asvc
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _row(answer_id, ts):
+    return {"id": answer_id, "created_at": ts, "answer": "a", "citations": []}
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    rows = []
+
+    @contextmanager
+    def fake_session():
+        yield None
+
+    def fake_recent(db, session_id, since_ts=None):
+        return [r for r in rows if since_ts is None or r["created_at"] >= since_ts]
+
+    monkeypatch.setattr(realtime, "db_session", fake_session)
+    monkeypatch.setattr(realtime.asvc, "recent_answers", fake_recent)
+    return rows
+
+
+def test_backfill_on_connect_returns_all_answers(answers):
+    answers += [_row("a1", "2026-01-01T00:00:01"), _row("a2", "2026-01-01T00:00:02")]
+    assert [r["id"] for r in realtime._backfill_answers("s1", None)] == ["a1", "a2"]
+
+
+def test_backfill_on_resume_excludes_last_seen_answer(answers):
+    answers += [
+        _row("a1", "2026-01-01T00:00:01"),
+        _row("a2", "2026-01-01T00:00:02"),
+        _row("a3", "2026-01-01T00:00:03"),
+    ]
+    rows = realtime._backfill_answers("s1", "2026-01-01T00:00:02")
+    assert [r["id"] for r in rows] == ["a3"]
+
+
+def test_backfill_skips_rows_without_timestamp(answers):
+    answers += [_row("a1", None), _row("a2", "2026-01-01T00:00:02")]
+    assert [r["id"] for r in realtime._backfill_answers("s1", None)] == ["a2"]
+
+
+def test_answer_event_uses_timestamp_as_event_id():
+    event = realtime._format_answer_event(_row("a1", "2026-01-01T00:00:01"))
+    assert event.startswith("id: 2026-01-01T00:00:01\n")
+    assert event.endswith("\n\n")
+
+
+def test_serialize_answer_matches_backfill_shape():
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    row = SimpleNamespace(
+        id="a1", created_at=created, answer="x", citations=None, confidence=0.6
+    )
+    data = json.loads(asvc.serialize_answer(row))
+    assert data == {
+        "id": "a1",
+        "created_at": created.isoformat(),
+        "answer": "x",
+        "citations": [],
+        "confidence": 0.6,
+    }
+
+
+def test_publish_sync_reaches_redis_subscribers(monkeypatch):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_broadcast, "_sync_client", lambda url: client)
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(asvc.answer_channel("s1"))
+
+    redis_broadcast.publish_sync("redis://fake", asvc.answer_channel("s1"), "hello")
+
+    message = None
+    for _ in range(10):
+        # The first read may consume the (ignored) subscribe confirmation
+        message = pubsub.get_message(timeout=0.1)
+        if message:
+            break
+    assert message is not None and message["data"] == "hello"
+
+
+async def test_answer_published_while_subscribing_is_streamed(monkeypatch):
+    server = fakeredis.FakeServer()
+    bc = redis_broadcast.RedisBroadcaster("redis://fake")
+    bc._pool = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(redis_broadcast, "_sync_client", lambda url: client)
+    monkeypatch.setattr(realtime, "get_answer_broadcaster", lambda: bc)
+
+    attach = bc._attach
+
+    async def slow_attach(channel, subscriber):
+        # Lock wait, connection checkout and the SUBSCRIBE round trip
+        await asyncio.sleep(0.05)
+        return await attach(channel, subscriber)
+
+    monkeypatch.setattr(bc, "_attach", slow_attach)
+
+    def backfill(session_id, since_ts):
+        # The worker saves a2 right after the backfill query and publishes it
+        channel = asvc.answer_channel(session_id)
+        late = json.dumps(_row("a2", "2026-01-01T00:00:02"))
+        redis_broadcast.publish_sync("redis://fake", channel, late)
+        return [_row("a1", "2026-01-01T00:00:01")]
+
+    monkeypatch.setattr(realtime, "_backfill_answers", backfill)
+
+    response = await realtime.stream_answers("s1", SimpleNamespace(headers={}))
+    events = response.body_iterator
+    try:
+        first = await asyncio.wait_for(events.__anext__(), timeout=5)
+        second = await asyncio.wait_for(events.__anext__(), timeout=5)
+    finally:
+        await events.aclose()
+        await bc.close()
+
+    assert '"id": "a1"' in first
+    assert '"id": "a2"' in second
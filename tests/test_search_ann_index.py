@@ -0,0 +1,169 @@
+"""Tests for the in-process ANN index used by the local-ann search backend."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from backend.core.config import settings
+from backend.search import ann_index, backends, indexer
+from backend.search.ann_index import OrgVectorIndex
+
+DIM = 8
+
+
+@pytest.fixture(autouse=True)
+def small_index(monkeypatch):
+    """Use small vectors and start every test with no resident indexes."""
+    monkeypatch.setattr(settings, "embed_dim", DIM)
+    ann_index.reset_indexes()
+    yield
+    ann_index.reset_indexes()
+
+
+def _random_vectors(n, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32)
+
+
+def _brute_force_top(vectors, query, k):
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normed @ (query / np.linalg.norm(query))
+    return list(np.argsort(-scores)[:k])
+
+
+def test_exact_search_matches_brute_force():
+    vectors = _random_vectors(500)
+    index = OrgVectorIndex(DIM)
+    index.add(list(range(500)), vectors.tolist(), ["jira"] * 500)
+
+    query = _random_vectors(1, seed=1)[0]
+    hits = index.search(query.tolist(), 10)
+
+    assert not index.is_trained
+    assert [cid for _, cid in hits] == _brute_force_top(vectors, query, 10)
+    assert hits == sorted(hits, key=lambda h: h[0], reverse=True)
+
+
+def test_ivf_search_finds_near_duplicate(monkeypatch):
+    monkeypatch.setattr(settings, "ann_ivf_threshold", 1000)
+    monkeypatch.setattr(settings, "ann_nprobe", 4)
+    vectors = _random_vectors(4000)
+    index = OrgVectorIndex(DIM)
+    index.add(list(range(4000)), vectors.tolist(), ["slack"] * 4000)
+
+    assert index.wait_for_training(timeout=30)
+    assert index.is_trained
+    target = 1234
+    query = vectors[target] + 0.01 * _random_vectors(1, seed=2)[0]
+    hits = index.search(query.tolist(), 5)
+
+    assert hits[0][1] == target
+    assert hits[0][0] == pytest.approx(1.0, abs=1e-3)
+
+
+def test_incremental_add_after_training_is_searchable(monkeypatch):
+    monkeypatch.setattr(settings, "ann_ivf_threshold", 200)
+    index = OrgVectorIndex(DIM)
+    vectors = _random_vectors(300)
+    index.add(list(range(300)), vectors.tolist(), ["jira"] * 300)
+    assert index.wait_for_training(timeout=30)
+    assert index.is_trained
+
+    new_vec = _random_vectors(1, seed=9)[0]
+    assert index.add([999], [new_vec.tolist()], ["jira"]) == 1
+    assert index.search(new_vec.tolist(), 1)[0][1] == 999
+
+
+def test_training_runs_without_blocking_adds_or_searches(monkeypatch):
+    monkeypatch.setattr(settings, "ann_ivf_threshold", 200)
+    release = threading.Event()
+    kmeans = ann_index._kmeans
+
+    def slow_kmeans(data, nlist):
+        release.wait(10)
+        return kmeans(data, nlist)
+
+    monkeypatch.setattr(ann_index, "_kmeans", slow_kmeans)
+    index = OrgVectorIndex(DIM)
+    vectors = _random_vectors(300)
+    index.add(list(range(300)), vectors.tolist(), ["jira"] * 300)
+
+    # Training is stuck in k-means; the index keeps serving exact results
+    new_vec = _random_vectors(1, seed=9)[0]
+    assert index.add([999], [new_vec.tolist()], ["jira"]) == 1
+    assert not index.is_trained
+    assert index.search(new_vec.tolist(), 1)[0][1] == 999
+
+    release.set()
+    assert index.wait_for_training(timeout=30)
+    assert index.is_trained
+    assert sum(len(rows) for rows in index._lists) == 301
+    assert index.search(new_vec.tolist(), 1)[0][1] == 999
+
+
+def test_source_filter_and_duplicate_ids():
+    index = OrgVectorIndex(DIM)
+    vectors = _random_vectors(4)
+    index.add([1, 2, 3, 4], vectors.tolist(), ["jira", "slack", "jira", "slack"])
+
+    # Re-adding existing ids is ignored
+    assert index.add([1, 2], vectors[:2].tolist(), ["jira", "slack"]) == 0
+    assert len(index) == 4
+
+    hits = index.search(vectors[1].tolist(), 10, sources=["slack"])
+    assert {cid for _, cid in hits} == {2, 4}
+    assert index.search(vectors[0].tolist(), 10, sources=["github"]) == []
+
+
+def test_local_ann_backend_stays_in_sync_with_indexer(memory_search_db, monkeypatch):
+    db = memory_search_db
+    monkeypatch.setattr(settings, "vector_backend", "local-ann")
+    vectors = {
+        "alpha": [1.0, 0, 0, 0, 0, 0, 0, 0],
+        "beta": [0, 1.0, 0, 0, 0, 0, 0, 0],
+        "gamma": [0, 0, 1.0, 0, 0, 0, 0, 0],
+    }
+    monkeypatch.setattr(
+        indexer, "embed_texts", lambda texts: [vectors[t] for t in texts]
+    )
+
+    indexer.upsert_memory_object(
+        db, "org1", "jira", "ENG-1", "Alpha", "u1", "en", {}, "alpha"
+    )
+    indexer.upsert_memory_object(
+        db, "org2", "jira", "ENG-2", "Beta", "u2", "en", {}, "beta"
+    )
+
+    results = backends.semantic(db, "org1", vectors["alpha"], None, 5)
+    assert [r["foreign_id"] for _, r in results] == ["ENG-1"]
+
+    # A chunk indexed after the org index is resident is picked up incrementally
+    indexer.upsert_memory_object(
+        db, "org1", "slack", "C1", "Gamma", "u3", "en", {}, "gamma"
+    )
+    results = backends.semantic(db, "org1", vectors["gamma"], None, 1)
+    assert results[0][1]["foreign_id"] == "C1"
+    assert results[0][0] == pytest.approx(1.0)
+
+
+def test_chunks_indexed_by_another_process_are_caught_up(memory_search_db, monkeypatch):
+    db = memory_search_db
+    monkeypatch.setattr(settings, "vector_backend", "local-ann")
+    vectors = {"alpha": [1.0, 0, 0, 0, 0, 0, 0, 0], "beta": [0, 1.0, 0, 0, 0, 0, 0, 0]}
+    monkeypatch.setattr(
+        indexer, "embed_texts", lambda texts: [vectors[t] for t in texts]
+    )
+    indexer.upsert_memory_object(
+        db, "org1", "jira", "ENG-1", "Alpha", "u1", "en", {}, "alpha"
+    )
+    assert backends.semantic(db, "org1", vectors["alpha"], None, 1)
+
+    # Another worker commits a chunk: this process's resident index is not told
+    monkeypatch.setattr(ann_index, "add_vectors", lambda *args, **kwargs: None)
+    indexer.upsert_memory_object(
+        db, "org1", "slack", "C1", "Beta", "u2", "en", {}, "beta"
+    )
+
+    results = backends.semantic(db, "org1", vectors["beta"], None, 1)
+    assert results[0][1]["foreign_id"] == "C1"
+    assert len(ann_index.get_org_index(db, "org1")) == 2
@@ -0,0 +1,145 @@
+"""Tests for the in-process BM25 index used for keyword scoring off PostgreSQL."""
+
+import math
+
+import pytest
+
+from backend.core.config import settings
+from backend.search import backends, bm25_index, indexer
+from backend.search.bm25_index import OrgKeywordIndex, tokenize
+
+DIM = 8
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes(monkeypatch):
+    monkeypatch.setattr(settings, "embed_dim", DIM)
+    bm25_index.reset_indexes()
+    yield
+    bm25_index.reset_indexes()
+
+
+def _bm25(tf, df, n, length, avg_length, k1=1.2, b=0.75):
+    idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+    return idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+
+
+def test_tokenize_drops_stop_words_and_punctuation():
+    assert tokenize("The Login-flow is BROKEN, again!") == [
+        "login",
+        "flow",
+        "broken",
+        "again",
+    ]
+
+
+def test_scores_match_okapi_bm25():
+    index = OrgKeywordIndex()
+    index.add(
+        [1, 2, 3],
+        ["oauth token refresh", "token token expiry", "database migration"],
+        [("jira", "A"), ("jira", "B"), ("jira", "C")],
+    )
+
+    hits = dict((key[1], score) for score, key in index.search("token", 10))
+
+    avg = 8 / 3
+    assert set(hits) == {"A", "B"}
+    assert hits["A"] == pytest.approx(_bm25(1, 2, 3, 3, avg))
+    assert hits["B"] == pytest.approx(_bm25(2, 2, 3, 3, avg))
+
+
+def test_length_normalization_prefers_shorter_chunks():
+    index = OrgKeywordIndex()
+    index.add(
+        [1, 2],
+        ["deploy failed", "deploy " + " ".join(f"word{i}" for i in range(50))],
+        [("slack", "short"), ("slack", "long")],
+    )
+
+    hits = index.search("deploy", 10)
+
+    assert [key[1] for _, key in hits] == ["short", "long"]
+    assert hits[0][0] > hits[1][0]
+
+
+def test_documents_score_as_best_chunk_with_source_filter():
+    index = OrgKeywordIndex()
+    index.add(
+        [1, 2, 3, 4],
+        ["cache", "cache cache eviction", "cache warmup", "unrelated"],
+        [("jira", "A"), ("jira", "A"), ("github", "B"), ("jira", "C")],
+    )
+    assert index.add([1], ["cache"], [("jira", "A")]) == 0
+
+    hits = index.search("cache eviction", 10)
+    assert [key for _, key in hits] == [("jira", "A"), ("github", "B")]
+    assert [key for _, key in index.search("cache", 10, ["github"])] == [
+        ("github", "B")
+    ]
+    assert index.search("cache", 10, ["confluence"]) == []
+    assert index.search("the", 10) == []
+
+
+def test_hybrid_search_uses_keyword_scores_on_sqlite(memory_search_db, monkeypatch):
+    db = memory_search_db
+    monkeypatch.setattr(settings, "vector_backend", "local-ann")
+    vectors = {
+        "rotate signing keys quarterly": [1.0, 0, 0, 0, 0, 0, 0, 0],
+        "team offsite agenda": [0, 1.0, 0, 0, 0, 0, 0, 0],
+    }
+    monkeypatch.setattr(
+        indexer, "embed_texts", lambda texts: [vectors[t] for t in texts]
+    )
+    monkeypatch.setattr(backends, "embed_texts", lambda texts: [[0.5] * DIM])
+
+    indexer.upsert_memory_object(
+        db,
+        "org1",
+        "jira",
+        "SEC-1",
+        "Keys",
+        "u1",
+        "en",
+        {},
+        "rotate signing keys quarterly",
+    )
+    scores = backends._ts_rank_score(db, "org1", "signing keys", None, 10)
+    assert set(scores) == {("jira", "SEC-1")}
+    assert 0.0 < scores[("jira", "SEC-1")] < 1.0
+
+    # Chunks indexed after the org index is resident are picked up incrementally
+    indexer.upsert_memory_object(
+        db, "org1", "slack", "C1", "Offsite", "u2", "en", {}, "team offsite agenda"
+    )
+    assert set(backends._ts_rank_score(db, "org1", "offsite", None, 10)) == {
+        ("slack", "C1")
+    }
+
+    # Keyword-only matches are still ranked when semantic search misses them
+    monkeypatch.setattr(backends, "semantic", lambda *args, **kwargs: [])
+    results = backends.hybrid_search(db, "org1", "offsite agenda", None, 5)
+    assert [r["foreign_id"] for r in results] == ["C1"]
+
+
+def test_chunks_indexed_by_another_process_are_caught_up(memory_search_db, monkeypatch):
+    db = memory_search_db
+    monkeypatch.setattr(
+        indexer, "embed_texts", lambda texts: [[0.5] * DIM] * len(texts)
+    )
+    indexer.upsert_memory_object(
+        db, "org1", "jira", "SEC-1", "Keys", "u1", "en", {}, "rotate signing keys"
+    )
+    assert set(backends._ts_rank_score(db, "org1", "signing", None, 10)) == {
+        ("jira", "SEC-1")
+    }
+
+    # Another worker commits a chunk: this process's resident index is not told
+    monkeypatch.setattr(bm25_index, "add_chunks", lambda *args, **kwargs: None)
+    indexer.upsert_memory_object(
+        db, "org1", "slack", "C1", "Offsite", "u2", "en", {}, "team offsite agenda"
+    )
+
+    assert set(backends._ts_rank_score(db, "org1", "offsite", None, 10)) == {
+        ("slack", "C1")
+    }
@@ -0,0 +1,113 @@
+"""Tests for batched memory ingestion through search.indexer.BulkIndexer."""
+
+import pytest
+from sqlalchemy import event, text
+
+from backend.search import indexer
+from backend.search.indexer import BulkIndexer, MemoryDocument
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    """Record embedding requests and return deterministic small vectors."""
+    calls = []
+
+    def fake_embed(texts):
+        calls.append(list(texts))
+        if any("poison" in t for t in texts):
+            raise RuntimeError("embedding provider rejected input")
+        return [[float(len(t)), 1.0, 0.0, 0.0] for t in texts]
+
+    monkeypatch.setattr(indexer, "embed_texts", fake_embed)
+    return calls
+
+
+def _doc(i, content=None):
+    return MemoryDocument(
+        "jira", f"ENG-{i}", f"Issue {i}", None, "en", {}, content or f"issue {i}"
+    )
+
+
+def _count(db, table):
+    return db.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar_one()
+
+
+def test_batches_embeddings_and_statements(memory_search_db, embed_calls):
+    db = memory_search_db
+    statements = []
+    event.listen(
+        db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *args: statements.append(stmt),
+    )
+
+    progress = []
+    with BulkIndexer(db, "org1", batch_size=50, on_progress=progress.append) as bulk:
+        for i in range(120):
+            bulk.add(_doc(i))
+
+    assert bulk.stats.documents == 120
+    assert bulk.stats.chunks_inserted == 120
+    assert bulk.stats.batches == 3
+    assert len(progress) == 3
+    # One embedding request per batch rather than one per document
+    assert len(embed_calls) == 3
+    # Object upsert, object lookup, hash lookup and chunk insert per batch
+    inserts = [s for s in statements if s.lstrip().startswith("INSERT")]
+    selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+    assert len(selects) == 6
+    assert len(inserts) == 6
+    assert _count(db, "memory_chunk") == 120
+
+
+def test_reindex_skips_existing_chunks_without_embedding(memory_search_db, embed_calls):
+    db = memory_search_db
+    BulkIndexer(db, "org1").add_all(_doc(i) for i in range(10))
+    embed_calls.clear()
+
+    stats = BulkIndexer(db, "org1").add_all(_doc(i) for i in range(10))
+
+    assert stats.chunks_inserted == 0
+    assert stats.chunks_skipped == 10
+    assert embed_calls == []
+    assert _count(db, "memory_object") == 10
+    assert _count(db, "memory_chunk") == 10
+
+
+def test_token_budget_splits_embedding_requests(memory_search_db, embed_calls):
+    # ~250 estimated tokens per 1000-char document
+    docs = [_doc(i, content=str(i) * 1000) for i in range(4)]
+
+    stats = BulkIndexer(memory_search_db, "org1", token_budget=600).add_all(docs)
+
+    assert stats.chunks_inserted == 4
+    assert all(sum(len(t) for t in call) <= 600 * 4 for call in embed_calls)
+    assert len(embed_calls) >= 2
+
+
+def test_failed_document_is_isolated(memory_search_db, embed_calls):
+    db = memory_search_db
+    committed = []
+    docs = [_doc(1), _doc(2, content="poison pill"), _doc(3)]
+
+    stats = BulkIndexer(db, "org1", on_commit=committed.extend).add_all(docs)
+
+    assert stats.failed == ["ENG-2"]
+    assert stats.documents == 2
+    assert [d.foreign_id for d in committed] == ["ENG-1", "ENG-3"]
+    assert _count(db, "memory_chunk") == 2
+
+
+def test_upsert_memory_object_returns_object_id(memory_search_db, embed_calls):
+    db = memory_search_db
+    obj_id = indexer.upsert_memory_object(
+        db, "org1", "wiki", "Guide", "Guide", None, "en", {}, "x" * 3000
+    )
+    again = indexer.upsert_memory_object(
+        db, "org1", "wiki", "Guide", "Guide", None, "en", {}, "x" * 3000
+    )
+
+    assert obj_id == again
+    # "x" * 3000 chunks into two identical 1200-char windows and one 900-char
+    # window; identical chunks are stored once per object
+    assert _count(db, "memory_chunk") == 2
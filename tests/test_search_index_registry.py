@@ -0,0 +1,88 @@
+"""Tests for catching per-org search indexes up with the database."""
+
+import threading
+
+import pytest
+
+from backend.search import index_registry
+from backend.search.index_registry import OrgIndexRegistry
+
+
+class FakeIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.ids = set()
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(index_registry, "time", fake)
+    monkeypatch.setattr(index_registry, "CATCHUP_COMMIT_LAG_SECONDS", 30.0)
+    monkeypatch.setattr(index_registry, "CATCHUP_RESCAN_INTERVAL_SECONDS", 5.0)
+    return fake
+
+
+def _registry(committed):
+    reads = []
+
+    def loader(db, org_id, index, after_id):
+        reads.append(after_id)
+        rows = sorted(i for i in committed if i > after_id)
+        index.ids.update(rows)
+        return rows[-1] if rows else after_id
+
+    return OrgIndexRegistry("fake", FakeIndex, loader), reads
+
+
+def test_chunk_committed_below_the_watermark_is_rescanned(clock):
+    committed = {1, 2}
+    registry, reads = _registry(committed)
+    index = registry.get(None, "o1")
+
+    # Id 4 commits first; id 3's transaction was still open
+    committed.add(4)
+    clock.now += 1
+    assert registry.get(None, "o1").ids == {1, 2, 4}
+    committed.add(3)
+    clock.now += 1
+    assert 3 not in registry.get(None, "o1").ids
+
+    # The first rescan after the build re-reads everything
+    clock.now += 30
+    assert registry.get(None, "o1") is index
+    assert index.ids == {1, 2, 3, 4}
+    assert reads[-1] == 0
+
+    # Later rescans only go back to the watermark from before the lag
+    committed.add(6)
+    clock.now += 1
+    registry.get(None, "o1")
+    clock.now += 40
+    committed.add(5)
+    registry.get(None, "o1")
+    assert 5 in index.ids
+    assert reads[-1] == 4
+
+
+def test_rescans_wait_for_the_interval(clock):
+    committed = {1}
+    registry, reads = _registry(committed)
+    registry.get(None, "o1")
+    clock.now += 31
+    registry.get(None, "o1")
+    clock.now += 1
+    registry.get(None, "o1")
+
+    assert reads == [0, 0, 1]
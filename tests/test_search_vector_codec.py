@@ -0,0 +1,93 @@
+"""Tests for the binary memory_chunk embedding codec and its backfill."""
+
+import json
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+
+from backend.search import vector_codec
+from backend.search.vector_codec import (
+    CODEC_FLOAT16,
+    CODEC_FLOAT32,
+    CODEC_INT8,
+    backfill_vector_codec,
+    decode,
+    encode,
+)
+
+VEC = np.random.default_rng(0).normal(size=1536).astype(np.float32)
+
+
+def test_float32_roundtrip_is_lossless_and_zero_copy():
+    data = encode(VEC, CODEC_FLOAT32)
+
+    assert data[0] == CODEC_FLOAT32
+    assert len(data) == 1 + 4 * len(VEC)
+    decoded = decode(memoryview(data))
+    np.testing.assert_array_equal(decoded, VEC)
+    # frombuffer view over the column bytes, not a copy
+    assert not decoded.flags.owndata
+
+
+@pytest.mark.parametrize(
+    "codec, size, tolerance",
+    [(CODEC_FLOAT16, 1 + 2 * 1536, 1e-2), (CODEC_INT8, 1 + 4 + 1536, 3e-2)],
+)
+def test_quantized_codecs(codec, size, tolerance):
+    data = encode(VEC, codec)
+
+    assert len(data) == size
+    decoded = decode(data)
+    assert decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded, VEC, atol=tolerance)
+
+
+def test_decodes_legacy_json_rows():
+    legacy = json.dumps(VEC[:4].tolist())
+
+    np.testing.assert_allclose(decode(legacy.encode("utf-8")), VEC[:4])
+    np.testing.assert_allclose(decode(memoryview(legacy.encode())), VEC[:4])
+    np.testing.assert_allclose(decode(legacy), VEC[:4])
+
+
+def test_rejects_unknown_header_and_types():
+    with pytest.raises(ValueError):
+        decode(b"\x7f\x00\x00")
+    with pytest.raises(TypeError):
+        decode({"vec": [1.0]})
+    with pytest.raises(ValueError):
+        vector_codec.codec_id("float64")
+
+
+def test_backfill_is_batched_and_resumable():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE memory_chunk (id INTEGER PRIMARY KEY, embedding BLOB, "
+                "vec_codec SMALLINT)"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO memory_chunk (id, embedding) VALUES (:id, :emb)"),
+            [
+                {"id": i, "emb": json.dumps([float(i), 1.0]).encode("utf-8")}
+                for i in range(1, 6)
+            ],
+        )
+
+    with engine.connect() as conn:
+        # Interrupted after the first batch
+        assert backfill_vector_codec(conn, batch_size=2, max_batches=1) == 2
+        conn.commit()
+        # Resume converts only the remaining rows
+        assert backfill_vector_codec(conn, batch_size=2, commit_each_batch=True) == 3
+
+        rows = conn.execute(
+            text("SELECT id, embedding, vec_codec FROM memory_chunk ORDER BY id")
+        ).all()
+
+    assert all(codec == CODEC_FLOAT32 for _, _, codec in rows)
+    for chunk_id, embedding, _ in rows:
+        np.testing.assert_array_equal(decode(embedding), [float(chunk_id), 1.0])
@@ -0,0 +1,175 @@
+"""Tests for the append-only token usage ledger and its hourly rollups."""
+
+import json
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from backend.services.token_tracking import TokenTracker, TokenUsage
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    t = TokenTracker(str(tmp_path), flush_interval_sec=60)
+    yield t
+    t.close()
+
+
+def _track(tracker, model="gpt-4o", user_id="u1", org_id="o1", tokens=(100, 50)):
+    return tracker.track(
+        model=model,
+        provider="openai",
+        usage=TokenUsage(input_tokens=tokens[0], output_tokens=tokens[1]),
+        org_id=org_id,
+        user_id=user_id,
+        latency_ms=10.0,
+    )
+
+
+def _today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def test_records_are_appended_as_jsonl(tracker, tmp_path):
+    first = _track(tracker)
+    tracker.flush()
+    second = _track(tracker)
+    tracker.flush()
+
+    lines = (tmp_path / f"usage_{_today()}.jsonl").read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [first.id, second.id]
+
+
+def test_summary_includes_unflushed_records(tracker):
+    _track(tracker)
+    summary = tracker.get_usage_summary()
+    assert summary.total_requests == 1
+    assert summary.total_tokens == 150
+
+
+def test_summary_reads_rollups_by_scope(tracker):
+    _track(tracker, user_id="u1")
+    _track(tracker, user_id="u2", model="gpt-4o-mini")
+    _track(tracker, user_id="u2", org_id="o2")
+    tracker.flush()
+
+    summary = tracker.get_usage_summary(org_id="o1")
+    assert summary.total_requests == 2
+    assert summary.by_model["gpt-4o"]["requests"] == 1
+    assert summary.by_model["gpt-4o-mini"]["requests"] == 1
+    assert set(summary.by_user) == {"u1", "u2"}
+    assert summary.avg_latency_ms == 10.0
+
+    assert tracker.get_usage_summary(user_id="u2").total_requests == 2
+
+
+def test_rollups_survive_restart(tmp_path, tracker):
+    _track(tracker)
+    _track(tracker)
+    tracker.close()
+
+    reopened = TokenTracker(str(tmp_path), flush_interval_sec=60)
+    try:
+        assert reopened.get_usage_summary().total_requests == 2
+        assert len(reopened.get_recent_usage(limit=10)) == 2
+    finally:
+        reopened.close()
+
+
+def test_segment_tail_past_rollup_offset_is_replayed(tmp_path, tracker):
+    record = _track(tracker)
+    tracker.close()
+    # Simulate a crash after the segment append but before the rollup write
+    with (tmp_path / f"usage_{_today()}.jsonl").open("a") as f:
+        f.write(json.dumps(record.to_dict()) + "\n")
+
+    reopened = TokenTracker(str(tmp_path), flush_interval_sec=60)
+    try:
+        assert reopened.get_usage_summary().total_requests == 2
+    finally:
+        reopened.close()
+
+
+def test_legacy_daily_file_is_rolled_up(tmp_path):
+    legacy = {
+        "date": _today(),
+        "records": [
+            {
+                "id": "abc",
+                "timestamp": datetime.now().isoformat(),
+                "model": "gpt-4o",
+                "provider": "openai",
+                "input_tokens": 10,
+                "output_tokens": 5,
+                "total_tokens": 15,
+                "input_cost": 0.0,
+                "output_cost": 0.0,
+                "total_cost": 0.0,
+                "org_id": "o1",
+            }
+        ],
+    }
+    (tmp_path / f"usage_{_today()}.json").write_text(json.dumps(legacy))
+
+    t = TokenTracker(str(tmp_path), flush_interval_sec=60)
+    try:
+        _track(t)
+        t.flush()
+        summary = t.get_usage_summary()
+        assert summary.total_requests == 2
+        assert summary.total_tokens == 165
+    finally:
+        t.close()
+
+
+def test_writers_sharing_a_ledger_keep_each_others_usage(tmp_path, tracker):
+    # Two trackers on one storage path stand in for two worker processes
+    other = TokenTracker(str(tmp_path), flush_interval_sec=60)
+    try:
+        _track(tracker)
+        tracker.flush()
+        _track(other)
+        _track(other)
+        other.flush()
+        _track(tracker)
+        tracker.flush()
+
+        assert tracker.get_usage_summary().total_requests == 4
+        assert other.get_usage_summary().total_requests == 4
+    finally:
+        other.close()
+
+    reopened = TokenTracker(str(tmp_path), flush_interval_sec=60)
+    try:
+        assert reopened.get_usage_summary().total_requests == 4
+    finally:
+        reopened.close()
+
+
+def test_tracking_does_not_wait_on_another_writers_flush(tmp_path, tracker):
+    fcntl = pytest.importorskip("fcntl")
+    _track(tracker)
+    tracker.flush()
+    _track(tracker)
+
+    # Another process holds the day's ledger lock while it appends
+    with (tmp_path / f"rollup_{_today()}.lock").open("a") as held:
+        fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+        flusher = threading.Thread(target=tracker.flush)
+        flusher.start()
+        try:
+            time.sleep(0.1)
+            assert flusher.is_alive()
+            _track(tracker)
+            assert tracker.get_usage_summary().total_requests == 3
+        finally:
+            fcntl.flock(held.fileno(), fcntl.LOCK_UN)
+            flusher.join(timeout=5)
+
+    assert tracker.get_usage_summary().total_requests == 3
+    tracker.flush()
+    assert tracker.get_usage_summary().total_requests == 3
+    lines = (tmp_path / f"usage_{_today()}.jsonl").read_text().splitlines()
+    assert len(lines) == 3
@@ -0,0 +1,124 @@
+"""Tests for the buffered, rotating NAVI trace store."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.services.trace_store import TraceStore, read_traces, rotated_segments
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def _make(**kwargs):
+        kwargs.setdefault("flush_interval_sec", 60)
+        kwargs.setdefault("rotate_bytes", 0)
+        kwargs.setdefault("rotate_interval_sec", 0)
+        store = TraceStore(tmp_path / "traces.jsonl", **kwargs)
+        stores.append(store)
+        return store
+
+    yield _make
+    for store in stores:
+        store.close()
+
+
+def test_append_only_enqueues_until_flush(make_store, tmp_path):
+    store = make_store()
+    store.append("route", {"endpoint": "/chat"})
+    assert not (tmp_path / "traces.jsonl").exists()
+
+    store.flush()
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    record = json.loads(lines[0])
+    assert record["event_type"] == "route"
+    assert record["endpoint"] == "/chat"
+
+
+def test_full_queue_drops_and_counts(make_store):
+    store = make_store(queue_size=2)
+    for i in range(5):
+        store.append("route", {"n": i})
+    assert store.dropped == 3
+
+    store.flush()
+    assert [r["n"] for r in store.query()] == [0, 1]
+
+
+def test_size_rotation_compresses_segments(make_store, tmp_path):
+    store = make_store(rotate_bytes=200, flush_batch_size=1, compression="gzip")
+    for i in range(10):
+        store.append("route", {"n": i, "pad": "x" * 50})
+    store.flush()
+
+    segments = rotated_segments(tmp_path / "traces.jsonl")
+    assert segments and all(p.suffix == ".gz" for p in segments)
+    with gzip.open(segments[0], "rt") as fh:
+        assert json.loads(fh.readline())["n"] == 0
+    assert [r["n"] for r in store.query()] == list(range(10))
+
+
+def test_max_segments_prunes_oldest(make_store, tmp_path):
+    store = make_store(
+        rotate_bytes=1, flush_batch_size=1, compression="none", max_segments=2
+    )
+    for i in range(4):
+        store.append("route", {"n": i})
+        store.flush()
+
+    assert len(rotated_segments(tmp_path / "traces.jsonl")) == 2
+    assert [r["n"] for r in store.query()] == [2, 3]
+
+
+def test_writers_sharing_a_segment_survive_each_others_rotation(make_store):
+    # Two stores on one path stand in for two worker processes
+    rotating = make_store(rotate_bytes=200, flush_batch_size=1, compression="gzip")
+    other = make_store()
+    for i in range(10):
+        rotating.append("route", {"n": i, "pad": "x" * 50})
+        rotating.flush()
+        other.append("route", {"n": 100 + i})
+        other.flush()
+
+    assert len(rotated_segments(rotating.trace_path)) > 1
+    ns = sorted(r["n"] for r in rotating.query())
+    assert ns == list(range(10)) + list(range(100, 110))
+
+
+def test_unserializable_payload_is_skipped(make_store):
+    store = make_store()
+    store.append("route", {"bad": object()})
+    store.append("route", {"n": 1})
+    store.flush()
+
+    assert [r.get("n") for r in store.query()] == [1]
+
+
+def test_read_traces_filters_by_time_and_type(tmp_path):
+    trace_path = tmp_path / "traces.jsonl"
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def ts(hours):
+        return (base + timedelta(hours=hours)).isoformat(timespec="microseconds")
+
+    old = tmp_path / "traces.20260101T000000000000Z-20260101T010000000000Z.jsonl"
+    old.write_text(json.dumps({"ts": ts(0), "event_type": "route"}) + "\n")
+    trace_path.write_text(
+        "".join(
+            json.dumps({"ts": ts(h), "event_type": t}) + "\n"
+            for h, t in ((2, "route"), (3, "outcome"), (4, "route"))
+        )
+    )
+
+    window = list(
+        read_traces(
+            trace_path, since=base + timedelta(hours=1), until=base + timedelta(hours=4)
+        )
+    )
+    assert [r["ts"] for r in window] == [ts(2), ts(3)]
+
+    routes = list(read_traces(trace_path, event_types=["route"]))
+    assert [r["ts"] for r in routes] == [ts(0), ts(2), ts(4)]
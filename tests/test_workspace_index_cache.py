@@ -0,0 +1,80 @@
+"""Tests for the memory-bounded resident workspace index cache."""
+
+import os
+
+from backend.core.config import settings
+from backend.services import workspace_rag
+from backend.services.workspace_rag import WorkspaceIndexCache, WorkspaceIndexer
+
+
+def _make_workspace(root, n_files):
+    os.makedirs(root, exist_ok=True)
+    for i in range(n_files):
+        with open(os.path.join(root, f"mod{i}.py"), "w") as f:
+            f.write(f"def func_{i}(x):\n    return x + {i}\n")
+    return root
+
+
+async def _index(root, n_files=3):
+    return await WorkspaceIndexer.index_workspace(
+        _make_workspace(root, n_files), generate_embeddings=True
+    )
+
+
+async def test_resident_bytes_follow_incremental_updates(tmp_path):
+    root = str(tmp_path / "ws")
+    index = await _index(root)
+    full = index.resident_bytes
+    assert full > 0
+
+    os.remove(os.path.join(root, "mod0.py"))
+    await WorkspaceIndexer.update_workspace(index)
+    assert 0 < index.resident_bytes < full
+
+    rebuilt = await WorkspaceIndexer.index_workspace(root)
+    assert index.resident_bytes == rebuilt.resident_bytes
+
+
+async def test_evicts_least_recently_used(tmp_path):
+    a, b, c = [await _index(str(tmp_path / name)) for name in "abc"]
+    cache = WorkspaceIndexCache(max_bytes=a.resident_bytes + b.resident_bytes + 1)
+    cache[a.workspace_path] = a
+    cache[b.workspace_path] = b
+    cache.get(a.workspace_path)  # b is now least recently used
+
+    cache[c.workspace_path] = c
+
+    assert set(cache.keys()) == {a.workspace_path, c.workspace_path}
+    assert cache.resident_bytes == a.resident_bytes + c.resident_bytes
+
+
+async def test_pinned_indexes_are_not_evicted(tmp_path):
+    a, b = [await _index(str(tmp_path / name)) for name in "ab"]
+    cache = WorkspaceIndexCache(max_bytes=a.resident_bytes)
+    cache[a.workspace_path] = a
+    cache.pin(a.workspace_path)
+
+    cache[b.workspace_path] = b
+    assert set(cache.keys()) == {a.workspace_path, b.workspace_path}
+
+    # Releasing the pin brings the cache back within budget
+    cache.unpin(a.workspace_path)
+    assert cache.keys() == [b.workspace_path]
+
+
+async def test_evicted_index_reloads_from_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "workspace_snapshot_dir", str(tmp_path / "snap"))
+    monkeypatch.setattr(workspace_rag, "_snapshot_seen", {})
+    cache = WorkspaceIndexCache(max_bytes=1)
+    monkeypatch.setattr(workspace_rag, "_workspace_indexes", cache)
+    first = _make_workspace(str(tmp_path / "first"), 3)
+    second = _make_workspace(str(tmp_path / "second"), 3)
+
+    await workspace_rag.index_workspace(first)
+    await workspace_rag.index_workspace(second)
+    assert cache.keys() == [second]
+
+    reloaded = workspace_rag.get_index(first)
+    assert reloaded is not None
+    assert reloaded.total_files == 3
+    assert cache.keys() == [first]
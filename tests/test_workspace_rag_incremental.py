@@ -0,0 +1,199 @@
+"""Tests for incremental workspace re-indexing in workspace_rag."""
+
+import os
+
+import pytest
+
+from backend.services import workspace_rag
+from backend.services.workspace_rag import CodeParser, WorkspaceIndexer
+
+
+def _write(workspace, name, content, mtime=None):
+    path = os.path.join(workspace, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = str(tmp_path)
+    _write(root, "auth.py", "import os\n\ndef login():\n    pass\n", mtime=1000)
+    _write(root, "db.py", "import sqlite3\n\ndef query():\n    pass\n", mtime=1000)
+    return root
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    original = CodeParser.parse_file.__func__
+
+    def counting_parse(cls, file_path, content):
+        calls.append(os.path.basename(file_path))
+        return original(cls, file_path, content)
+
+    monkeypatch.setattr(CodeParser, "parse_file", classmethod(counting_parse))
+    return calls
+
+
+async def _build(workspace):
+    return await WorkspaceIndexer.index_workspace(workspace, generate_embeddings=False)
+
+
+async def test_unchanged_tree_parses_nothing(workspace, parse_calls):
+    index = await _build(workspace)
+    parse_calls.clear()
+
+    stats = await WorkspaceIndexer.update_workspace(index, generate_embeddings=False)
+
+    assert stats == {"added": 0, "modified": 0, "removed": 0, "unchanged": 2}
+    assert parse_calls == []
+
+
+async def test_touched_but_identical_file_is_not_reparsed(workspace, parse_calls):
+    index = await _build(workspace)
+    parse_calls.clear()
+    os.utime(os.path.join(workspace, "auth.py"), (2000, 2000))
+
+    stats = await WorkspaceIndexer.update_workspace(index, generate_embeddings=False)
+
+    assert stats["unchanged"] == 2
+    assert parse_calls == []
+
+
+async def test_scan_patches_chunks_symbols_and_dependencies(workspace, parse_calls):
+    index = await _build(workspace)
+    parse_calls.clear()
+    _write(workspace, "auth.py", "import jwt\n\ndef signin():\n    pass\n", mtime=2000)
+    os.remove(os.path.join(workspace, "db.py"))
+    new_path = _write(workspace, "pkg/util.py", "def helper():\n    pass\n")
+
+    stats = await WorkspaceIndexer.update_workspace(index, generate_embeddings=False)
+
+    assert stats == {"added": 1, "modified": 1, "removed": 1, "unchanged": 0}
+    assert sorted(parse_calls) == ["auth.py", "util.py"]
+    assert "login" not in index.symbols and "query" not in index.symbols
+    assert index.symbols["signin"] == [os.path.join(workspace, "auth.py")]
+    assert index.symbols["helper"] == [new_path]
+    assert {d.target for d in index.dependencies} == {"import jwt"}
+    assert {c.file_path for c in index.chunks} == set(index.files)
+    assert index.total_files == 2
+    assert index.total_chunks == len(index.chunks)
+    assert index.total_lines == 6
+
+
+async def test_changed_files_api_only_touches_listed_files(workspace, parse_calls):
+    index = await _build(workspace)
+    parse_calls.clear()
+    _write(workspace, "auth.py", "def login(user):\n    pass\n", mtime=2000)
+    _write(workspace, "db.py", "def query(sql):\n    pass\n", mtime=2000)
+
+    stats = await WorkspaceIndexer.update_workspace(
+        index, changed_files=["auth.py", "missing.py"], generate_embeddings=False
+    )
+
+    assert stats["modified"] == 1
+    assert parse_calls == ["auth.py"]
+
+
+async def test_force_reindex_is_incremental(workspace, parse_calls, monkeypatch):
+    monkeypatch.setattr(
+        workspace_rag, "_workspace_indexes", workspace_rag.WorkspaceIndexCache(1 << 30)
+    )
+    await workspace_rag.index_workspace(workspace)
+    parse_calls.clear()
+    _write(workspace, "db.py", "def query(sql):\n    pass\n", mtime=2000)
+
+    result = await workspace_rag.index_workspace(workspace, force_reindex=True)
+
+    assert parse_calls == ["db.py"]
+    assert result["total_files"] == 2
+
+
+async def test_parallel_indexing_matches_sequential(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    for i in range(80):
+        _write(
+            root, f"pkg{i % 4}/mod{i}.py", f"import os\n\ndef func_{i}():\n    pass\n"
+        )
+    progress = []
+
+    async def on_progress(event):
+        progress.append(event)
+
+    monkeypatch.setattr(workspace_rag, "MAX_PARSE_WORKERS", 2)
+    monkeypatch.setattr(workspace_rag, "PARALLEL_MIN_FILES", 10)
+    try:
+        parallel = await WorkspaceIndexer.index_workspace(root, on_progress=on_progress)
+    finally:
+        workspace_rag._reset_parse_executor()
+
+    monkeypatch.setattr(workspace_rag, "PARALLEL_MIN_FILES", 10_000)
+    sequential = await WorkspaceIndexer.index_workspace(root)
+
+    assert parallel.total_files == 80
+    assert parallel.symbols == sequential.symbols
+    assert [c.id for c in parallel.chunks] == [c.id for c in sequential.chunks]
+    assert all(c.embedding for c in parallel.chunks)
+    assert progress[0] == {"type": "start", "total_files": 80}
+    assert progress[-1]["type"] == "complete"
+    assert sum(e["type"] == "progress" for e in progress) == 8
+
+
+async def test_remote_embeddings_batch_each_files_chunks(tmp_path, monkeypatch):
+    from contextlib import asynccontextmanager
+
+    from backend.core.config import settings
+    from backend.services import embedding_cache, http_client
+
+    root = str(tmp_path)
+    _write(root, "a.py", "def one():\n    pass\n\ndef two():\n    pass\n")
+    _write(root, "b.py", "def three():\n    pass\n")
+    requests = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def __init__(self, texts):
+            self.texts = texts
+
+        def json(self):
+            # Out of order, as the API only promises an index per item
+            return {
+                "data": [
+                    {"index": i, "embedding": [float(len(t)), 1.0]}
+                    for i, t in reversed(list(enumerate(self.texts)))
+                ]
+            }
+
+    class FakeClient:
+        async def post(self, url, headers, json, timeout):
+            requests.append(json["input"])
+            return FakeResponse(json["input"])
+
+    @asynccontextmanager
+    async def fake_http_client():
+        yield FakeClient()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(settings, "embedding_cache_db_url", "")
+    monkeypatch.setattr(settings, "embedding_cache_redis_enabled", False)
+    monkeypatch.setattr(http_client, "http_client", fake_http_client)
+    embedding_cache.reset_embedding_cache()
+    try:
+        first = await WorkspaceIndexer.index_workspace(
+            root, embedding_provider="openai"
+        )
+        second = await WorkspaceIndexer.index_workspace(
+            root, embedding_provider="openai"
+        )
+    finally:
+        embedding_cache.reset_embedding_cache()
+
+    assert sorted(len(batch) for batch in requests) == [1, 2]
+    for chunk in first.chunks + second.chunks:
+        text = workspace_rag._chunk_search_text(chunk)
+        assert list(chunk.embedding) == [float(len(text[:8000])), 1.0]
@@ -0,0 +1,95 @@
+"""Tests for the WorkspaceIndex secondary indexes used by SemanticSearch."""
+
+import os
+
+import pytest
+
+from backend.services.workspace_rag import (
+    CodeParser,
+    SemanticSearch,
+    WorkspaceIndexer,
+)
+
+FILES = {
+    "app/__init__.py": "",
+    "app/models.py": "class User:\n    pass\n\ndef load_user(uid):\n    return User()\n",
+    "app/views.py": (
+        "from .models import User, load_user\n\n"
+        "def show(uid):\n    return load_user(uid)\n\n"
+        "def show_all():\n    return load_user_list()\n"
+    ),
+    "main.py": "import app.views\n\ndef run():\n    return app.views.show(1)\n",
+    "web/api.js": "import { get } from './http';\n\nfunction fetchUser() {\n  return get();\n}\n",
+    "web/http.js": "function get() {\n  return 1;\n}\n",
+}
+
+
+def _write_files(root, files):
+    for name, content in files.items():
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+
+@pytest.fixture
+async def index(tmp_path):
+    _write_files(str(tmp_path), FILES)
+    return await WorkspaceIndexer.index_workspace(
+        str(tmp_path), generate_embeddings=False
+    )
+
+
+def _path(index, name):
+    return os.path.join(index.workspace_path, name)
+
+
+def test_resolve_imports():
+    assert CodeParser.resolve_imports(
+        ["from ..core import config as cfg", "import os.path, json"], "pkg/sub/mod.py"
+    ) == ["pkg/core", "pkg/core/config", "os/path", "json"]
+    assert CodeParser.resolve_imports(
+        ["import x from '../lib/util.js'", "const y = require('lodash')"],
+        "src/app/main.js",
+    ) == ["src/lib/util", "lodash"]
+    assert CodeParser.module_keys("pkg/__init__.py") == ["pkg/__init__", "pkg"]
+
+
+async def test_find_symbol_uses_name_index(index):
+    chunks = SemanticSearch.find_symbol("load_user", index)
+    assert [c.file_path for c in chunks] == [_path(index, "app/models.py")]
+    assert SemanticSearch.find_symbol("missing", index) == []
+
+
+async def test_find_references_matches_whole_identifiers(index):
+    refs = SemanticSearch.find_references("load_user", index)
+    # show_all only mentions load_user_list, which is a different identifier
+    assert [c.name for c in refs] == ["show"]
+    dotted = SemanticSearch.find_references("app.views.show", index)
+    assert [c.name for c in dotted] == ["run"]
+
+
+async def test_file_context_uses_resolved_import_graph(index):
+    models = SemanticSearch.get_file_context(_path(index, "app/models.py"), index)
+    views = SemanticSearch.get_file_context(_path(index, "app/views.py"), index)
+    http = SemanticSearch.get_file_context(_path(index, "web/http.js"), index)
+
+    assert models["imported_by"] == [_path(index, "app/views.py")]
+    assert views["resolved_imports"] == [_path(index, "app/models.py")]
+    assert views["imported_by"] == [_path(index, "main.py")]
+    assert http["imported_by"] == [_path(index, "web/api.js")]
+
+
+async def test_indexes_follow_incremental_updates(index):
+    with open(_path(index, "app/views.py"), "w") as f:
+        f.write("def show(uid):\n    return uid\n")
+
+    await WorkspaceIndexer.update_workspace(
+        index, changed_files=["app/views.py"], generate_embeddings=False
+    )
+
+    assert SemanticSearch.find_references("load_user", index) == []
+    assert SemanticSearch.find_symbol("show_all", index) == []
+    models = SemanticSearch.get_file_context(_path(index, "app/models.py"), index)
+    assert models["imported_by"] == []
+    assert set(index.chunks_by_id) == {c.id for c in index.chunks}
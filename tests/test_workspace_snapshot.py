@@ -0,0 +1,130 @@
+"""Tests for on-disk workspace index snapshots."""
+
+import os
+
+import numpy as np
+import pytest
+
+from backend.core.config import settings
+from backend.services import workspace_rag, workspace_snapshot
+from backend.services.workspace_rag import SemanticSearch, WorkspaceIndexer
+
+
+@pytest.fixture
+def snapshot_root(tmp_path, monkeypatch):
+    root = tmp_path / "snapshots"
+    monkeypatch.setattr(settings, "workspace_snapshot_dir", str(root))
+    monkeypatch.setattr(
+        workspace_rag, "_workspace_indexes", workspace_rag.WorkspaceIndexCache(1 << 30)
+    )
+    monkeypatch.setattr(workspace_rag, "_snapshot_seen", {})
+    return root
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "ws"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "auth.py").write_text(
+        'def login(user):\n    """Authenticate a user"""\n    return check(user)\n'
+    )
+    (root / "pkg" / "views.py").write_text(
+        "from pkg.auth import login\n\ndef home(user):\n    return login(user)\n"
+    )
+    (root / "README.md").write_text("# Demo\n\nUser login service.\n")
+    return str(root)
+
+
+async def test_round_trip_preserves_index(snapshot_root, workspace):
+    index = await WorkspaceIndexer.index_workspace(workspace)
+    workspace_snapshot.write_snapshot(index)
+
+    loaded = workspace_snapshot.load_snapshot(workspace)
+
+    assert loaded.total_files == index.total_files
+    assert loaded.total_lines == index.total_lines
+    assert loaded.symbols == index.symbols
+    assert sorted(c.id for c in loaded.chunks) == sorted(c.id for c in index.chunks)
+    original = {c.id: c for c in index.chunks}
+    for chunk in loaded.chunks:
+        assert isinstance(chunk.embedding, np.memmap)
+        assert chunk.embedding.tolist() == pytest.approx(original[chunk.id].embedding)
+        assert chunk.content == original[chunk.id].content
+
+    # Secondary indexes and search work on the restored index
+    auth = os.path.join(workspace, "pkg", "auth.py")
+    assert SemanticSearch.get_file_context(auth, loaded)["imported_by"] == [
+        os.path.join(workspace, "pkg", "views.py")
+    ]
+    expected = await SemanticSearch.search("login user", index, top_k=3)
+    results = await SemanticSearch.search("login user", loaded, top_k=3)
+    assert [(c.id, pytest.approx(score)) for c, score in results] == [
+        (c.id, score) for c, score in expected
+    ]
+    # Plain floats, not numpy scalars (np.float64 subclasses float)
+    assert all(
+        isinstance(score, float) and not isinstance(score, np.generic)
+        for _, score in results
+    )
+
+
+async def test_index_workspace_writes_snapshot_and_get_index_loads_it(
+    snapshot_root, workspace, monkeypatch
+):
+    await workspace_rag.index_workspace(workspace)
+    gen_dir = workspace_snapshot.snapshot_dir(workspace)
+    assert (gen_dir / "CURRENT").exists()
+
+    # A new process/worker starts with no resident indexes
+    monkeypatch.setattr(
+        workspace_rag, "_workspace_indexes", workspace_rag.WorkspaceIndexCache(1 << 30)
+    )
+    index = workspace_rag.get_index(workspace)
+
+    assert index is not None
+    assert index.total_files == 3
+
+
+async def test_get_index_picks_up_snapshots_written_by_other_workers(
+    snapshot_root, workspace
+):
+    # Nothing on disk yet: this worker misses
+    assert workspace_rag.get_index(workspace) is None
+
+    # Another worker indexes the workspace and publishes a snapshot
+    other = await WorkspaceIndexer.index_workspace(workspace)
+    workspace_snapshot.write_snapshot(other)
+    first = workspace_rag.get_index(workspace)
+    assert first is not None and "extra" not in first.symbols
+    assert workspace_rag.get_index(workspace) is first
+
+    # ... and later publishes a newer generation
+    with open(os.path.join(workspace, "pkg", "extra.py"), "w") as f:
+        f.write("def extra():\n    pass\n")
+    await WorkspaceIndexer.update_workspace(other)
+    workspace_snapshot.write_snapshot(other)
+    second = workspace_rag.get_index(workspace)
+    assert second is not first
+    assert "extra" in second.symbols
+
+
+async def test_updates_publish_new_generation_and_prune_old(snapshot_root, workspace):
+    await workspace_rag.index_workspace(workspace)
+    for i in range(3):
+        with open(os.path.join(workspace, "pkg", f"extra{i}.py"), "w") as f:
+            f.write(f"def extra_{i}():\n    pass\n")
+        await workspace_rag.update_workspace_index(workspace)
+
+    target = workspace_snapshot.snapshot_dir(workspace)
+    generations = [p for p in target.iterdir() if p.is_dir()]
+    current = (target / "CURRENT").read_text()
+
+    assert len(generations) == 2
+    assert current == max(p.name for p in generations)
+    assert "extra_2" in workspace_snapshot.load_snapshot(workspace).symbols
+
+
+def test_missing_or_disabled_snapshot(snapshot_root, workspace, monkeypatch):
+    assert workspace_snapshot.load_snapshot(workspace) is None
+    monkeypatch.setattr(settings, "workspace_snapshot_dir", "")
+    assert workspace_snapshot.snapshot_dir(workspace) is None